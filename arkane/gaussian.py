@@ -57,6 +57,11 @@ class GaussianLog(Log):
     arrays.
     """
 
+    index_markers = ('Input orientation:', 'Force constants in Cartesian coordinates:', 'Multiplicity =',
+                     '- Thermochemistry -', 'SCF Done:', 'CBS-QB3 (0 K)', 'G3(0 K)', 'E(ZPE)', '\\ZeroPoint=',
+                     'Zero-point correction=', ' freq ', '# scan', 'Optimization completed', 'Frequencies --',
+                     ' The following ModRedundant input section has been read:')
+
     def __init__(self, path):
         super(GaussianLog, self).__init__(path)
 
@@ -67,17 +72,15 @@ class GaussianLog(Log):
         """
         n_atoms = 0
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '' and n_atoms == 0:
+        offsets = self.get_line_offsets('Input orientation:')
+        if offsets:
+            with self.open_at(offsets[0]) as f:
                 # Automatically determine the number of atoms
-                if 'Input orientation:' in line and n_atoms == 0:
-                    for i in range(5):
-                        line = f.readline()
-                    while '---------------------------------------------------------------------' not in line:
-                        n_atoms += 1
-                        line = f.readline()
-                line = f.readline()
+                for i in range(6):
+                    line = f.readline()
+                while '---------------------------------------------------------------------' not in line:
+                    n_atoms += 1
+                    line = f.readline()
 
         return n_atoms
 
@@ -93,27 +96,25 @@ class GaussianLog(Log):
         """
         force = None
 
-        n_atoms = self.get_number_of_atoms()
-        n_rows = n_atoms * 3
-
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
+        offsets = self.get_line_offsets('Force constants in Cartesian coordinates:')
+        if offsets:
+            n_atoms = self.get_number_of_atoms()
+            n_rows = n_atoms * 3
+            with self.open_at(offsets[-1]) as f:
+                f.readline()
                 # Read force constant matrix
-                if 'Force constants in Cartesian coordinates:' in line:
-                    force = np.zeros((n_rows, n_rows), np.float64)
-                    for i in range(int(math.ceil(n_rows / 5.0))):
-                        # Header row
-                        line = f.readline()
-                        # Matrix element rows
-                        for j in range(i * 5, n_rows):
-                            data = f.readline().split()
-                            for k in range(len(data) - 1):
-                                force[j, i * 5 + k] = float(data[k + 1].replace('D', 'E'))
-                                force[i * 5 + k, j] = force[j, i * 5 + k]
-                    # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
-                    force *= 4.35974417e-18 / 5.291772108e-11 ** 2
-                line = f.readline()
+                force = np.zeros((n_rows, n_rows), np.float64)
+                for i in range(int(math.ceil(n_rows / 5.0))):
+                    # Header row
+                    f.readline()
+                    # Matrix element rows
+                    for j in range(i * 5, n_rows):
+                        data = f.readline().split()
+                        for k in range(len(data) - 1):
+                            force[j, i * 5 + k] = float(data[k + 1].replace('D', 'E'))
+                            force[i * 5 + k, j] = force[j, i * 5 + k]
+                # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
+                force *= 4.35974417e-18 / 5.291772108e-11 ** 2
 
         return force
 
@@ -125,20 +126,16 @@ class GaussianLog(Log):
         """
         number, coord, mass = [], [], []
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                # Automatically determine the number of atoms
-                if 'Input orientation:' in line:
-                    number, coord = [], []
-                    for i in range(5):
-                        line = f.readline()
-                    while '---------------------------------------------------------------------' not in line:
-                        data = line.split()
-                        number.append(int(data[1]))
-                        coord.append([float(data[3]), float(data[4]), float(data[5])])
-                        line = f.readline()
-                line = f.readline()
+        offsets = self.get_line_offsets('Input orientation:')
+        if offsets:
+            with self.open_at(offsets[-1]) as f:
+                for i in range(6):
+                    line = f.readline()
+                while '---------------------------------------------------------------------' not in line:
+                    data = line.split()
+                    number.append(int(data[1]))
+                    coord.append([float(data[3]), float(data[4]), float(data[5])])
+                    line = f.readline()
 
         # Assign appropriate mass to each atom in the molecule
         mass = []
@@ -175,7 +172,15 @@ class GaussianLog(Log):
                 optical_isomers = _optical_isomers
             if symmetry is None:
                 symmetry = _symmetry
-        with open(self.path, 'r') as f:
+        thermo_offsets = self.get_line_offsets('- Thermochemistry -')
+        multiplicity_offsets = self.get_line_offsets('Multiplicity =')
+        if spin_multiplicity == 0 and multiplicity_offsets and \
+                (not thermo_offsets or multiplicity_offsets[0] < thermo_offsets[-1]):
+            # Read the spin multiplicity if not explicitly given
+            spin_multiplicity = int(self.read_lines(multiplicity_offsets[:1])[0].split()[-1])
+            logging.debug('Conformer {0} is assigned a spin multiplicity of {1}'.format(label, spin_multiplicity))
+        # Only the last Thermochemistry section is kept, so start reading there
+        with self.open_at(thermo_offsets[-1] if thermo_offsets else os.path.getsize(self.path)) as f:
             line = f.readline()
             while line != '':
 
@@ -264,32 +269,27 @@ class GaussianLog(Log):
         """
         e_elect, e0_composite, scaled_zpe = None, None, None
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-
-                if 'SCF Done:' in line:
-                    e_elect = float(line.split()[4]) * constants.E_h * constants.Na
-                elif 'CBS-QB3 (0 K)' in line:
-                    e0_composite = float(line.split()[3]) * constants.E_h * constants.Na
-                elif 'G3(0 K)' in line:
-                    e0_composite = float(line.split()[2]) * constants.E_h * constants.Na
-
-                # Read the ZPE from the "E(ZPE)=" line, as this is the scaled version.
-                # Gaussian defines the following as
-                # E (0 K) = Elec + E(ZPE),
-                # The ZPE is the scaled ZPE given by E(ZPE) in the log file,
-                # hence to get the correct Elec from E (0 K) we need to subtract the scaled ZPE
-
-                elif 'E(ZPE)' in line:
-                    scaled_zpe = float(line.split()[1]) * constants.E_h * constants.Na
-                elif '\\ZeroPoint=' in line:
-                    line = line.strip() + f.readline().strip()
-                    start = line.find('\\ZeroPoint=') + 11
-                    end = line.find('\\', start)
-                    scaled_zpe = float(line[start:end]) * constants.E_h * constants.Na * zpe_scale_factor
-                # Read the next line in the file
-                line = f.readline()
+        offsets = self.get_line_offsets('SCF Done:')
+        if offsets:
+            line = self.read_lines(offsets[-1:])[0]
+            e_elect = float(line.split()[4]) * constants.E_h * constants.Na
+
+        marker, offset = self._get_last_occurrence('CBS-QB3 (0 K)', 'G3(0 K)')
+        if marker == 'CBS-QB3 (0 K)':
+            e0_composite = float(self.read_lines([offset])[0].split()[3]) * constants.E_h * constants.Na
+        elif marker == 'G3(0 K)':
+            e0_composite = float(self.read_lines([offset])[0].split()[2]) * constants.E_h * constants.Na
+
+        # Read the ZPE from the "E(ZPE)=" line, as this is the scaled version.
+        # Gaussian defines the following as
+        # E (0 K) = Elec + E(ZPE),
+        # The ZPE is the scaled ZPE given by E(ZPE) in the log file,
+        # hence to get the correct Elec from E (0 K) we need to subtract the scaled ZPE
+        marker, offset = self._get_last_occurrence('E(ZPE)', '\\ZeroPoint=')
+        if marker == 'E(ZPE)':
+            scaled_zpe = float(self.read_lines([offset])[0].split()[1]) * constants.E_h * constants.Na
+        elif marker == '\\ZeroPoint=':
+            scaled_zpe = self._read_archive_zpe(offset) * constants.E_h * constants.Na * zpe_scale_factor
 
         if e0_composite is not None:
             if scaled_zpe is None:
@@ -306,61 +306,80 @@ class GaussianLog(Log):
         """
         zpe = None
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                # Do NOT read the ZPE from the "E(ZPE)=" line, as this is the scaled version!
-                # We will read in the unscaled ZPE and later multiply the scaling factor
-                # from the input file
-                if 'Zero-point correction=' in line:
-                    zpe = float(line.split()[2]) * constants.E_h * constants.Na
-                elif '\\ZeroPoint=' in line:
-                    line = line.strip() + f.readline().strip()
-                    start = line.find('\\ZeroPoint=') + 11
-                    end = line.find('\\', start)
-                    zpe = float(line[start:end]) * constants.E_h * constants.Na
-                line = f.readline()
+        # Do NOT read the ZPE from the "E(ZPE)=" line, as this is the scaled version!
+        # We will read in the unscaled ZPE and later multiply the scaling factor
+        # from the input file
+        marker, offset = self._get_last_occurrence('Zero-point correction=', '\\ZeroPoint=')
+        if marker == 'Zero-point correction=':
+            zpe = float(self.read_lines([offset])[0].split()[2]) * constants.E_h * constants.Na
+        elif marker == '\\ZeroPoint=':
+            zpe = self._read_archive_zpe(offset) * constants.E_h * constants.Na
 
         if zpe is not None:
             return zpe
         else:
             raise LogError('Unable to find zero-point energy in Gaussian log file.')
 
+    def _get_last_occurrence(self, *markers):
+        """
+        Return a tuple of the marker among `markers` that occurs last in the log file
+        and the byte offset of the line it occurs in, or ``(None, None)`` if none of the
+        markers occur.
+        """
+        last_marker, last_offset = None, None
+        for marker in markers:
+            offsets = self.get_line_offsets(marker)
+            if offsets and (last_offset is None or offsets[-1] > last_offset):
+                last_marker, last_offset = marker, offsets[-1]
+        return last_marker, last_offset
+
+    def _read_archive_zpe(self, offset):
+        """
+        Return the zero-point energy in Hartree from the archive entry of the
+        log file at the line starting at byte `offset`.
+        """
+        with self.open_at(offset) as f:
+            line = f.readline().strip() + f.readline().strip()
+        start = line.find('\\ZeroPoint=') + 11
+        end = line.find('\\', start)
+        return float(line[start:end])
+
     def load_scan_energies(self):
         """
         Extract the optimized energies in J/mol from a log file, e.g. the 
         result of a Gaussian "Scan" quantum chemistry calculation.
         """
-        opt_freq = False
+        # If the job contains a "freq" then we want to ignore the last energy
+        opt_freq = len(self.get_line_offsets(' freq ')) > 0
         rigid_scan = False
 
         vlist = []  # The array of potentials at each scan angle
 
         # Parse the Gaussian log file, extracting the energies of each
-        # optimized conformer in the scan
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                # If the job contains a "freq" then we want to ignore the last energy
-                if ' freq ' in line:
-                    opt_freq = True
-                # if # scan is keyword instead of # opt, then this is a rigid scan job
-                # and parsing the energies is done a little differently
-                if '# scan' in line:
-                    rigid_scan = True
-                # The lines containing "SCF Done" give the energy at each
-                # iteration (even the intermediate ones)
-                if 'SCF Done:' in line:
-                    energy = float(line.split()[4])
-                    # rigid scans will only not optimize, so just append every time it finds an energy.
-                    if rigid_scan:
-                        vlist.append(energy)
-                # We want to keep the values of energy that come most recently before
-                # the line containing "Optimization completed", since it refers
-                # to the optimized geometry
-                if 'Optimization completed' in line:
+        # optimized conformer in the scan, visiting only the relevant lines in order
+        events = [(offset, 0, '# scan') for offset in self.get_line_offsets('# scan')]
+        events.extend([(offset, 1, 'SCF Done:') for offset in self.get_line_offsets('SCF Done:')])
+        events.extend([(offset, 2, 'Optimization completed')
+                       for offset in self.get_line_offsets('Optimization completed')])
+        events.sort()
+        scf_lines = iter(self.read_lines([offset for offset, _, marker in events if marker == 'SCF Done:']))
+        for _, _, marker in events:
+            # if # scan is keyword instead of # opt, then this is a rigid scan job
+            # and parsing the energies is done a little differently
+            if marker == '# scan':
+                rigid_scan = True
+            # The lines containing "SCF Done" give the energy at each
+            # iteration (even the intermediate ones)
+            elif marker == 'SCF Done:':
+                energy = float(next(scf_lines).split()[4])
+                # rigid scans will only not optimize, so just append every time it finds an energy.
+                if rigid_scan:
                     vlist.append(energy)
-                line = f.readline()
+            # We want to keep the values of energy that come most recently before
+            # the line containing "Optimization completed", since it refers
+            # to the optimized geometry
+            else:
+                vlist.append(energy)
 
         # give warning in case this assumption is not true
         if rigid_scan:
@@ -398,34 +417,34 @@ class GaussianLog(Log):
         More information about the syntax can be found http://gaussian.com/opt/
         """
         output = []
-        reached_input_spec_section = False
-        with open(self.path, 'r') as f:
+        offsets = self.get_line_offsets(' The following ModRedundant input section has been read:')
+        if not offsets:
+            return output
+        with self.open_at(offsets[0]) as f:
+            f.readline()
             line = f.readline()
             while line != '':
-                if reached_input_spec_section:
-                    terms = line.split()
-                    if len(terms) == 0:
-                        # finished reading specs
-                        break
-                    if terms[0] == 'D':
-                        action_index = 5  # dihedral angle with four terms
-                    elif terms[0] == 'A':
-                        action_index = 4  # valance angle with three terms
-                    elif terms[0] == 'B':
-                        action_index = 3  # bond length with 2 terms
-                    else:
-                        raise LogError('This file has an option not supported by Arkane. '
-                                       'Unable to read scan specs for line: {0}'.format(line))
-                    if len(terms) > action_index:
-                        # specified type explicitly
-                        if terms[action_index] == letter_spec:
-                            output.append(terms[1:action_index])
-                    else:
-                        # no specific specification, assume freezing
-                        if letter_spec == 'F':
-                            output.append(terms[1:action_index])
-                if " The following ModRedundant input section has been read:" in line:
-                    reached_input_spec_section = True
+                terms = line.split()
+                if len(terms) == 0:
+                    # finished reading specs
+                    break
+                if terms[0] == 'D':
+                    action_index = 5  # dihedral angle with four terms
+                elif terms[0] == 'A':
+                    action_index = 4  # valance angle with three terms
+                elif terms[0] == 'B':
+                    action_index = 3  # bond length with 2 terms
+                else:
+                    raise LogError('This file has an option not supported by Arkane. '
+                                   'Unable to read scan specs for line: {0}'.format(line))
+                if len(terms) > action_index:
+                    # specified type explicitly
+                    if terms[action_index] == letter_spec:
+                        output.append(terms[1:action_index])
+                else:
+                    # no specific specification, assume freezing
+                    if letter_spec == 'F':
+                        output.append(terms[1:action_index])
                 line = f.readline()
         return output
 
@@ -455,13 +474,9 @@ class GaussianLog(Log):
         """
         frequency = None
         frequencies = []
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                # Read vibrational frequencies
-                if 'Frequencies --' in line:
-                    frequencies.extend(line.split()[2:])
-                line = f.readline()
+        # Read vibrational frequencies
+        for line in self.read_lines(self.get_line_offsets('Frequencies --')):
+            frequencies.extend(line.split()[2:])
 
         frequencies = [float(freq) for freq in frequencies]
         frequencies.sort()
@@ -33,6 +33,8 @@ This module contains unit tests of the :mod:`arkane.gaussian` module.
 """
 
 import os
+import shutil
+import tempfile
 import unittest
 
 import numpy as np
@@ -164,6 +166,42 @@ class GaussianTest(unittest.TestCase):
         log = determine_qm_software(os.path.join(os.path.dirname(__file__), 'data', 'oxygen.log'))
         self.assertIsInstance(log, GaussianLog)
 
+    def test_get_line_offsets(self):
+        """
+        Test that the log index points to the start of the lines containing each marker
+        """
+        log = GaussianLog(os.path.join(os.path.dirname(__file__), 'data', 'oxygen.log'))
+        offsets = log.get_line_offsets('SCF Done:')
+        self.assertEqual(len(offsets), 3)
+        for line in log.read_lines(offsets):
+            self.assertTrue(line.startswith(' SCF Done:'))
+        self.assertEqual(log.get_line_offsets('CBS-QB3 (0 K)'), [])
+
+    def test_saved_log_index(self):
+        """
+        Test that the log index is saved next to the log file and invalidated when the log file changes
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'oxygen.log')
+            shutil.copy(os.path.join(os.path.dirname(__file__), 'data', 'oxygen.log'), path)
+            log = GaussianLog(path)
+            log.save_index = True
+            self.assertEqual(len(log.get_line_offsets('SCF Done:')), 3)
+            self.assertTrue(os.path.isfile(os.path.join(directory, '.oxygen.log.index.json')))
+
+            log = GaussianLog(path)
+            log.save_index = True
+            energy = log.load_energy()
+            self.assertAlmostEqual(energy / GaussianLog(os.path.join(os.path.dirname(__file__), 'data',
+                                                                     'oxygen.log')).load_energy(), 1.0)
+
+            with open(path, 'a') as f:
+                f.write(' SCF Done:  E(UB+HF-LYP) =  -150.0     A.U. after    1 cycles\n')
+            self.assertEqual(len(log.get_line_offsets('SCF Done:')), 4)
+        finally:
+            shutil.rmtree(directory)
+
 
 ################################################################################
 
@@ -82,7 +82,11 @@ class KineticsJob(object):
         else:
             self.sensitivity_conditions = None
 
-        self.arkane_species = ArkaneSpecies(species=self.reaction.transition_state)
+        if self.reaction.transition_state is not None:
+            self.arkane_species = ArkaneSpecies(species=self.reaction.transition_state)
+        else:
+            # The kinetics were given directly in the input, so there is no TS to save
+            self.arkane_species = None
 
     @property
     def Tmin(self):
@@ -120,6 +124,16 @@ class KineticsJob(object):
         will be saved.
         """
         self.generate_kinetics()
+        self.write_results(output_directory=output_directory, plot=plot)
+
+    def write_results(self, output_directory=None, plot=True):
+        """
+        Save the generated kinetics within the `output_directory`, and run
+        the sensitivity analysis if requested.
+
+        If `plot` is True, then plots of the raw and fitted values for the kinetics
+        will be saved.
+        """
         if output_directory is not None:
             try:
                 self.write_output(output_directory)
@@ -302,8 +316,8 @@ class KineticsJob(object):
         """
         Save a YAML file for TSs if structures of the respective reactant/s and product/s are known
         """
-        if all([spc.molecule is not None and len(spc.molecule)
-                for spc in self.reaction.reactants + self.reaction.products]):
+        if self.arkane_species is not None and all([spc.molecule is not None and len(spc.molecule)
+                                                    for spc in self.reaction.reactants + self.reaction.products]):
             self.arkane_species.update_species_attributes(self.reaction.transition_state)
             self.arkane_species.reaction_label = self.reaction.label
             self.arkane_species.reactants = [{'label': spc.label, 'adjacency_list': spc.molecule[0].to_adjacency_list()}
@@ -327,10 +341,9 @@ class KineticsJob(object):
         else:
             t_list = 1000.0 / np.arange(0.4, 3.35, 0.05)
         klist = np.zeros_like(t_list)
-        klist2 = np.zeros_like(t_list)
         for i in range(len(t_list)):
             klist[i] = self.reaction.calculate_tst_rate_coefficient(t_list[i])
-            klist2[i] = self.reaction.kinetics.get_rate_coefficient(t_list[i])
+        klist2 = self.reaction.kinetics.get_rate_coefficients(np.array(t_list))
 
         order = len(self.reaction.reactants)
         klist *= 1e6 ** (order - 1)
@@ -32,8 +32,11 @@
 A general class for parsing quantum mechanical log files
 """
 
+import json
 import logging
+import mmap
 import os.path
+import re
 import shutil
 
 from rmgpy.qm.qmdata import QMData
@@ -46,10 +49,61 @@ class Log(object):
     """
     Represent a general log file.
     The attribute `path` refers to the location on disk of the log file of interest.
+
+    Subclasses list the strings marking the sections they parse in `index_markers`.
+    The byte offsets of the lines containing these markers are found in a single
+    memory-mapped pass over the file (see :meth:`get_line_offsets`), so that the
+    load methods can seek straight to the relevant sections instead of rereading
+    the whole file. If `save_index` is ``True``, the index is also cached on disk
+    next to the log file, and reused as long as the size and modification time of
+    the log file are unchanged.
     """
 
+    index_markers = ()
+    save_index = False
+
     def __init__(self, path):
         self.path = path
+        self._index = None
+        self._index_key = None
+
+    def get_line_offsets(self, marker):
+        """
+        Return a list of the byte offsets of the start of each line of the log file
+        containing `marker`, which must be one of the `index_markers` of the class.
+        """
+        key = get_file_key(self.path)
+        if self._index is None or self._index_key != key:
+            self._index = None
+            index_path = get_index_path(self.path)
+            if self.save_index and os.path.isfile(index_path):
+                self._index = load_log_index(index_path, key, self.index_markers)
+            if self._index is None:
+                self._index = build_log_index(self.path, self.index_markers)
+                if self.save_index:
+                    save_log_index(index_path, key, self._index)
+            self._index_key = key
+        return self._index[marker]
+
+    def open_at(self, offset):
+        """
+        Return the log file opened for reading, positioned at the byte `offset`
+        (typically obtained from :meth:`get_line_offsets`).
+        """
+        f = open(self.path, 'r')
+        f.seek(offset)
+        return f
+
+    def read_lines(self, offsets):
+        """
+        Return a list of the lines of the log file starting at each of the byte `offsets`.
+        """
+        lines = []
+        with open(self.path, 'r') as f:
+            for offset in offsets:
+                f.seek(offset)
+                lines.append(f.readline())
+        return lines
 
     def get_number_of_atoms(self):
         """
@@ -189,3 +243,73 @@ class Log(object):
         This method returns the T1 diagnostic for certain quantum jobs
         """
         raise NotImplementedError("get_T1_diagnostic is not implemented for all Log subclasses.")
+
+
+def get_file_key(path):
+    """
+    Return a list of the size and modification time of the file at `path`,
+    used to decide whether a log index is still valid.
+    """
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime]
+
+
+def get_index_path(path):
+    """
+    Return the path of the on-disk index of the log file at `path`.
+    """
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, '.{0}.index.json'.format(filename))
+
+
+def build_log_index(path, markers):
+    """
+    Scan the file at `path` once using a memory map, and return a dictionary with each
+    of the `markers` as keys and lists of the byte offsets of the start of each line
+    containing the respective marker as values.
+    """
+    index = {marker: [] for marker in markers}
+    if not markers or os.path.getsize(path) == 0:
+        return index
+    # Longer markers come first, so that a marker contained in another one does not shadow it
+    pattern = re.compile(b'|'.join(re.escape(marker.encode('utf-8'))
+                                   for marker in sorted(markers, key=len, reverse=True)))
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for match in pattern.finditer(data):
+                offsets = index[match.group().decode('utf-8')]
+                start = data.rfind(b'\n', 0, match.start()) + 1
+                if not offsets or offsets[-1] != start:
+                    offsets.append(start)
+        finally:
+            data.close()
+    return index
+
+
+def load_log_index(index_path, key, markers):
+    """
+    Load a log index saved at `index_path`. Return ``None`` if the index cannot be read,
+    if it was built for a log file with a different size and modification time than
+    given by `key`, or if it does not contain all of the `markers`.
+    """
+    try:
+        with open(index_path, 'r') as f:
+            data = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if data.get('key') != key or not all(marker in data.get('index', {}) for marker in markers):
+        return None
+    return data['index']
+
+
+def save_log_index(index_path, key, index):
+    """
+    Save a log `index` for a log file with the size and modification time in `key` to `index_path`.
+    Failing to write the index (e.g. in a read-only directory) is not an error.
+    """
+    try:
+        with open(index_path, 'w') as f:
+            json.dump({'key': key, 'index': index}, f)
+    except (IOError, OSError) as e:
+        logging.debug('Could not save log index {0}: {1}'.format(index_path, e))
@@ -39,6 +39,7 @@ import os
 import os.path
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 import numpy as np
 
@@ -77,6 +78,7 @@ class Arkane(object):
     `input_file`        The path of the input file defining the jobs to execute
     `output_directory`  The directory in which to write the output files
     `verbose`           The level of detail in the generated logging messages
+    `maxproc`           The maximum number of processes used to run independent jobs
     =================== ========================================================
     
     The output directory defaults to the same directory as the input file if
@@ -89,11 +91,12 @@ class Arkane(object):
     :meth:`parse_command_line_arguments()` method before running :meth:`execute()`.
     """
 
-    def __init__(self, input_file=None, output_directory=None, verbose=logging.INFO):
+    def __init__(self, input_file=None, output_directory=None, verbose=logging.INFO, maxproc=1):
         self.job_list = []
         self.input_file = input_file
         self.output_directory = output_directory
         self.verbose = verbose
+        self.maxproc = maxproc
 
     def parse_command_line_arguments(self):
         """
@@ -128,6 +131,10 @@ class Arkane(object):
         parser.add_argument('-p', '--no-plot', action='store_false', default=True,
                             help='prevent generating plots', dest='plot')
 
+        # Add option to select max number of processes for running independent jobs
+        parser.add_argument('-n', '--maxproc', type=int, nargs=1, default=[1],
+                            help='max number of processes used to run independent jobs')
+
         args = parser.parse_args()
 
         # Extract the input file
@@ -139,6 +146,9 @@ class Arkane(object):
         # Extract the plot settings
         self.plot = args.plot
 
+        # Extract the number of processes
+        self.maxproc = args.maxproc[0]
+
         # Determine the output directory
         # By default the directory containing the input file is used, unless an
         # alternate directory is specified using the -o flag
@@ -160,8 +170,11 @@ class Arkane(object):
 
     def execute(self):
         """
-        Execute, in order, the jobs found in input file specified by the
-        `input_file` attribute.
+        Execute the jobs found in input file specified by the `input_file`
+        attribute. Statmech, thermo and kinetics jobs are first computed
+        according to their dependencies, running independent jobs concurrently
+        on up to `maxproc` processes. Their output is then written in the order
+        of the input file, followed by the pressure dependence and explorer jobs.
         """
 
         # Initialize the logging system (both to the console and to a file in the
@@ -199,14 +212,17 @@ class Arkane(object):
             f.write('THERM ALL\n')
             f.write('    300.000  1000.000  5000.000\n\n')
 
-        # run thermo and statmech jobs (also writes thermo blocks to Chemkin file)
+        # compute statmech, thermo and kinetics jobs, in parallel where their dependencies allow
+        run_jobs(self.job_list, maxproc=self.maxproc, plot=self.plot)
+
+        # save thermo and statmech jobs (also writes thermo blocks to Chemkin file)
         supporting_info = []
         hindered_rotor_info = []
         for job in self.job_list:
             if isinstance(job, ThermoJob):
-                job.execute(output_directory=self.output_directory, plot=self.plot)
+                job.write_results(output_directory=self.output_directory, plot=self.plot)
             if isinstance(job, StatMechJob):
-                job.execute(output_directory=self.output_directory, plot=self.plot, pdep=is_pdep(self.job_list))
+                job.write_results(output_directory=self.output_directory, plot=self.plot)
                 if hasattr(job, 'supporting_info'):
                     supporting_info.append(job.supporting_info)
                 if hasattr(job, 'raw_hindered_rotor_data'):
@@ -262,7 +278,7 @@ class Arkane(object):
         # run kinetics and pdep jobs (also writes reaction blocks to Chemkin file)
         for job in self.job_list:
             if isinstance(job, KineticsJob):
-                job.execute(output_directory=self.output_directory, plot=self.plot)
+                job.write_results(output_directory=self.output_directory, plot=self.plot)
             elif isinstance(job, PressureDependenceJob) and not any([isinstance(job, ExplorerJob) for job in
                                                                      self.job_list]):
                 # if there is an explorer job the pdep job will be run in the explorer job
@@ -270,6 +286,7 @@ class Arkane(object):
                     raise InputError(
                         'No network matched the label of the pressureDependence block and there is no explorer block '
                         'to generate a network')
+                job.procnum = self.maxproc
                 job.execute(output_file=output_file, plot=self.plot)
             elif isinstance(job, ExplorerJob):
                 thermo_library, kinetics_library, species_list = self.get_libraries()
@@ -347,6 +364,103 @@ class Arkane(object):
         return thermo_library, kinetics_library, species_list
 
 
+def get_job_dependencies(job_list):
+    """
+    Return a list with an entry for each job in `job_list`, being the set of indices
+    of the jobs it depends on. Thermo jobs depend on the statmech job of their
+    species, and kinetics jobs depend on the statmech jobs of their reactants,
+    products and transition state. Other jobs are not included in the graph and
+    have no dependencies.
+    """
+    statmech_jobs = {}
+    for i, job in enumerate(job_list):
+        if isinstance(job, StatMechJob):
+            statmech_jobs.setdefault(id(job.species), set()).add(i)
+
+    dependencies = []
+    for job in job_list:
+        if isinstance(job, ThermoJob):
+            species_list = [job.species]
+        elif isinstance(job, KineticsJob):
+            species_list = job.reaction.reactants + job.reaction.products + [job.reaction.transition_state]
+        else:
+            species_list = []
+        dependencies.append(set().union(*[statmech_jobs.get(id(spc), set()) for spc in species_list]))
+    return dependencies
+
+
+def run_jobs(job_list, maxproc=1, plot=False):
+    """
+    Compute the statmech, thermo and kinetics jobs in `job_list` without writing any output.
+    A job is started once all of the jobs it depends on (see :func:`get_job_dependencies`)
+    are complete, and independent jobs are run concurrently on up to `maxproc` processes.
+    The results computed by the worker processes are copied back onto the species and
+    reactions of `job_list`, so that shared objects remain consistent between jobs.
+    """
+    pdep = is_pdep(job_list)
+    dependencies = get_job_dependencies(job_list)
+    pending = [i for i, job in enumerate(job_list) if isinstance(job, (StatMechJob, ThermoJob, KineticsJob))]
+
+    if maxproc == 1:
+        logging.info('For running jobs {0} process is used.'.format(maxproc))
+        # The dependencies always point to statmech jobs, so run those first and keep the input order otherwise
+        for i in sorted(pending, key=lambda index: not isinstance(job_list[index], StatMechJob)):
+            _compute_job(job_list[i], pdep, plot)
+        return
+
+    logging.info('For running jobs {0} processes are used.'.format(maxproc))
+    running = {}
+    with ProcessPoolExecutor(max_workers=maxproc) as executor:
+        while pending or running:
+            unfinished = set(pending) | set(running.values())
+            for i in [i for i in pending if not dependencies[i] & unfinished]:
+                pending.remove(i)
+                running[executor.submit(_compute_job, job_list[i], pdep, plot)] = i
+            if not running:
+                raise InputError('Could not resolve the dependencies between the Arkane jobs.')
+            done = wait(running, return_when=FIRST_COMPLETED)[0]
+            for future in done:
+                i = running.pop(future)
+                _update_job(job_list[i], future.result())
+
+
+def _compute_job(job, pdep, plot):
+    """
+    Run the calculation step of a statmech, thermo or kinetics `job` and return the job.
+    """
+    if isinstance(job, StatMechJob):
+        job.load(pdep, plot)
+    elif isinstance(job, ThermoJob):
+        job.generate_thermo()
+    elif isinstance(job, KineticsJob):
+        job.generate_kinetics()
+    return job
+
+
+def _update_job(job, result):
+    """
+    Copy the results of a `job` computed in a worker process, returned as `result`, onto `job`,
+    keeping the species, transition state and reaction objects that `job` shares with other jobs.
+    """
+    if isinstance(job, StatMechJob):
+        species = job.species
+        for attribute in ['conformer', 'frequency', 'transport_data', 'energy_transfer_model', 'molecule']:
+            if hasattr(result.species, attribute):
+                setattr(species, attribute, getattr(result.species, attribute))
+        job.__dict__.update(result.__dict__)
+        job.species = species
+    elif isinstance(job, ThermoJob):
+        job.species.thermo = result.species.thermo
+    elif isinstance(job, KineticsJob):
+        reaction = job.reaction
+        reaction.kinetics = result.reaction.kinetics
+        reaction.elementary_high_p = result.reaction.elementary_high_p
+        if reaction.transition_state is not None:
+            reaction.transition_state.tunneling = result.reaction.transition_state.tunneling
+        job.__dict__.update(result.__dict__)
+        job.reaction = reaction
+
+
 def initialize_log(verbose=logging.INFO, log_file=None):
     """
     Set up a logger for Arkane to use to print output to stdout. The
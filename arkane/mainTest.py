@@ -41,8 +41,15 @@ import zipfile
 from nose.plugins.attrib import attr
 
 import rmgpy
+from rmgpy.kinetics import Arrhenius
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species, TransitionState
 
 from arkane import Arkane
+from arkane.kinetics import KineticsJob
+from arkane.main import get_job_dependencies, run_jobs
+from arkane.statmech import StatMechJob
+from arkane.thermo import ThermoJob
 
 ################################################################################
 
@@ -107,6 +114,39 @@ class TestArkaneExamples(unittest.TestCase):
                         shutil.rmtree(item_path)
 
 
+class TestJobDependencies(unittest.TestCase):
+    """
+    Contains unit tests for the dependency graph of Arkane jobs
+    """
+
+    def test_get_job_dependencies(self):
+        """Test that thermo and kinetics jobs depend only on the relevant statmech jobs"""
+        spc1, spc2, spc3 = Species(label='A'), Species(label='B'), Species(label='C')
+        ts = TransitionState(label='TS')
+        reaction = Reaction(label='A <=> B', reactants=[spc1], products=[spc2], transition_state=ts)
+        job_list = [StatMechJob(spc1, 'A.py'),
+                    StatMechJob(spc2, 'B.py'),
+                    StatMechJob(spc3, 'C.py'),
+                    StatMechJob(ts, 'TS.py'),
+                    ThermoJob(spc3, 'NASA'),
+                    KineticsJob(reaction)]
+        dependencies = get_job_dependencies(job_list)
+        self.assertEqual(dependencies[:4], [set(), set(), set(), set()])
+        self.assertEqual(dependencies[4], {2})
+        self.assertEqual(dependencies[5], {0, 1, 3})
+
+    def test_run_jobs_without_transition_state(self):
+        """Test that a kinetics job given without a transition state can be run in parallel"""
+        kinetics = Arrhenius(A=(1e10, 's^-1'), n=0, Ea=(10, 'kJ/mol'), T0=(1, 'K'))
+        reaction = Reaction(label='A <=> B', reactants=[Species(label='A')], products=[Species(label='B')],
+                            kinetics=kinetics)
+        job = KineticsJob(reaction)
+        run_jobs([job], maxproc=2)
+        self.assertIs(job.reaction, reaction)
+        self.assertIsNone(reaction.transition_state)
+        self.assertTrue(reaction.kinetics.is_identical_to(kinetics))
+
+
 ################################################################################
 
 if __name__ == '__main__':
@@ -35,6 +35,7 @@ Used to parse Molpro output files
 
 import logging
 import math
+import os.path
 
 import numpy as np
 
@@ -55,6 +56,10 @@ class MolproLog(Log):
     to extract a variety of information into Arkane classes and/or NumPy arrays.
     """
 
+    index_markers = ('ATOMIC COORDINATES', 'Force Constants (Second Derivatives of the Energy) in [a.u.]',
+                     'Current geometry', 'THERMODYNAMICAL', 'Electronic Energy at 0 [K]:',
+                     'Normal Modes of imaginary frequencies', 'T1 diagnostic:  ', 'D1 diagnostic:  ')
+
     def __init__(self, path):
         super(MolproLog, self).__init__(path)
 
@@ -64,18 +69,15 @@ class MolproLog(Log):
         the MolPro log file.
         """
         n_atoms = 0
-        # Open Molpro log file for parsing
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '' and n_atoms == 0:
+        offsets = self.get_line_offsets('ATOMIC COORDINATES')
+        if offsets:
+            with self.open_at(offsets[0]) as f:
                 # Automatically determine the number of atoms
-                if 'ATOMIC COORDINATES' in line and n_atoms == 0:
-                    for i in range(4):
-                        line = f.readline()
-                    while 'Bond lengths' not in line and 'nuclear charge' not in line.lower():
-                        n_atoms += 1
-                        line = f.readline()
-                line = f.readline()
+                for i in range(5):
+                    line = f.readline()
+                while 'Bond lengths' not in line and 'nuclear charge' not in line.lower():
+                    n_atoms += 1
+                    line = f.readline()
 
         return n_atoms - 1
 
@@ -85,27 +87,25 @@ class MolproLog(Log):
         """
 
         fc = None
-        n_atoms = self.get_number_of_atoms()
-        n_rows = n_atoms * 3
-
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
+        offsets = self.get_line_offsets('Force Constants (Second Derivatives of the Energy) in [a.u.]')
+        if offsets:
+            n_atoms = self.get_number_of_atoms()
+            n_rows = n_atoms * 3
+            with self.open_at(offsets[-1]) as f:
+                f.readline()
                 # Read force constant matrix
-                if 'Force Constants (Second Derivatives of the Energy) in [a.u.]' in line:
-                    fc = np.zeros((n_rows, n_rows), np.float64)
-                    for i in range(int(math.ceil(n_rows / 5.0))):
-                        # Header row
-                        line = f.readline()
-                        # Matrix element rows
-                        for j in range(i * 5, n_rows):
-                            data = f.readline().split()
-                            for k in range(len(data) - 1):
-                                fc[j, i * 5 + k] = float(data[k + 1].replace('D', 'E'))
-                                fc[i * 5 + k, j] = fc[j, i * 5 + k]
-                    # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
-                    fc *= 4.35974417e-18 / 5.291772108e-11 ** 2
-                line = f.readline()
+                fc = np.zeros((n_rows, n_rows), np.float64)
+                for i in range(int(math.ceil(n_rows / 5.0))):
+                    # Header row
+                    f.readline()
+                    # Matrix element rows
+                    for j in range(i * 5, n_rows):
+                        data = f.readline().split()
+                        for k in range(len(data) - 1):
+                            fc[j, i * 5 + k] = float(data[k + 1].replace('D', 'E'))
+                            fc[i * 5 + k, j] = fc[j, i * 5 + k]
+                # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
+                fc *= 4.35974417e-18 / 5.291772108e-11 ** 2
 
         return fc
 
@@ -118,22 +118,18 @@ class MolproLog(Log):
 
         symbol, coord, mass, number = [], [], [], []
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                # Automatically determine the number of atoms
-                if 'Current geometry' in line:
-                    symbol, coord = [], []
-                    while 'ENERGY' not in line:
-                        line = f.readline()
-                    line = f.readline()
-                    while line != '\n':
-                        data = line.split()
-                        symbol.append(str(data[0]))
-                        coord.append([float(data[1]), float(data[2]), float(data[3])])
-                        line = f.readline()
+        offsets = self.get_line_offsets('Current geometry')
+        if offsets:
+            with self.open_at(offsets[-1]) as f:
+                line = f.readline()
+                while 'ENERGY' not in line:
                     line = f.readline()
                 line = f.readline()
+                while line != '\n':
+                    data = line.split()
+                    symbol.append(str(data[0]))
+                    coord.append([float(data[1]), float(data[2]), float(data[3])])
+                    line = f.readline()
 
         # If no optimized coordinates were found, uses the input geometry
         # (for example if reading the geometry from a frequency file)
@@ -180,7 +176,14 @@ class MolproLog(Log):
                 optical_isomers = _optical_isomers
             if symmetry is None:
                 symmetry = _symmetry
-        with open(self.path, 'r') as f:
+        if spin_multiplicity == 0:
+            # The spin multiplicity may be given anywhere before the thermochemistry section
+            start = 0
+        else:
+            # Only the last thermochemistry section is kept, so start reading there
+            offsets = self.get_line_offsets('THERMODYNAMICAL')
+            start = offsets[-1] if offsets else os.path.getsize(self.path)
+        with self.open_at(start) as f:
             line = f.readline()
             while line != '':
 
@@ -353,18 +356,15 @@ class MolproLog(Log):
 
         zpe = None
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                # Do NOT read the ZPE from the "E(ZPE)=" line, as this is the scaled version!
-                # We will read in the unscaled ZPE and later multiply the scaling factor
-                # from the input file
-                if 'Electronic Energy at 0 [K]:' in line:
-                    electronic_energy = float(line.split()[5])
-                    line = f.readline()
-                    ee_plus_zpe = float(line.split()[5])
-                    zpe = (ee_plus_zpe - electronic_energy) * constants.E_h * constants.Na
-                line = f.readline()
+        # Do NOT read the ZPE from the "E(ZPE)=" line, as this is the scaled version!
+        # We will read in the unscaled ZPE and later multiply the scaling factor
+        # from the input file
+        offsets = self.get_line_offsets('Electronic Energy at 0 [K]:')
+        if offsets:
+            with self.open_at(offsets[-1]) as f:
+                electronic_energy = float(f.readline().split()[5])
+                ee_plus_zpe = float(f.readline().split()[5])
+            zpe = (ee_plus_zpe - electronic_energy) * constants.E_h * constants.Na
 
         if zpe is not None:
             return zpe
@@ -377,15 +377,12 @@ class MolproLog(Log):
         Return the negative frequency from a transition state frequency calculation in cm^-1.
         """
         frequency = None
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                # Read vibrational frequencies
-                if 'Normal Modes of imaginary frequencies' in line:
-                    for i in range(3):
-                        line = f.readline()
-                    frequency = line.split()[2]
-                line = f.readline()
+        offsets = self.get_line_offsets('Normal Modes of imaginary frequencies')
+        if offsets:
+            with self.open_at(offsets[-1]) as f:
+                for i in range(4):
+                    line = f.readline()
+            frequency = line.split()[2]
 
         if frequency is None:
             raise LogError('Unable to find imaginary frequency in Molpro output file {0}'.format(self.path))
@@ -403,13 +400,10 @@ class MolproLog(Log):
         Returns the T1 diagnostic from output log.
         If multiple occurrences exist, returns the last occurrence
         """
-        with open(self.path) as f:
-            log = f.readlines()
-
-        for line in reversed(log):
-            if 'T1 diagnostic:  ' in line:
-                items = line.split()
-                return float(items[-1])
+        offsets = self.get_line_offsets('T1 diagnostic:  ')
+        if offsets:
+            items = self.read_lines(offsets[-1:])[0].split()
+            return float(items[-1])
         raise LogError('Unable to find T1 diagnostic in energy file: {0}'.format(self.path))
 
     def get_D1_diagnostic(self):
@@ -417,13 +411,10 @@ class MolproLog(Log):
         Returns the D1 diagnostic from output log.
         If multiple occurrences exist, returns the last occurrence
         """
-        with open(self.path) as f:
-            log = f.readlines()
-
-        for line in reversed(log):
-            if 'D1 diagnostic:  ' in line:
-                items = line.split()
-                return float(items[-1])
+        offsets = self.get_line_offsets('D1 diagnostic:  ')
+        if offsets:
+            items = self.read_lines(offsets[-1:])[0].split()
+            return float(items[-1])
         raise LogError('Unable to find D1 diagnostic in energy file: {0}'.format(self.path))
 
     def load_scan_pivot_atoms(self):
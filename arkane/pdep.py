@@ -82,6 +82,7 @@ class PressureDependenceJob(object):
     `Tlist`                 An array of temperatures at which to compute :math:`k(T,P)` values
     `Plist`                 An array of pressures at which to compute :math:`k(T,P)` values
     `Elist`                 An array of energies to use to compute :math:`k(T,P)` values
+    `procnum`               The number of processes used for the sensitivity analysis
     ======================= ====================================================
     
     In RMG mode, several alterations to the k(T,P) algorithm are made both for
@@ -153,6 +154,7 @@ class PressureDependenceJob(object):
                                            for condition in sensitivity_conditions]
         else:
             self.sensitivity_conditions = None
+        self.procnum = 1
 
         if self.Tlist is None and self.Tmin is not None and self.Tmax is not None and self.Tcount is not None:
             self.generate_T_list()
@@ -283,7 +285,8 @@ class PressureDependenceJob(object):
                 logging.info('\n\nRunning sensitivity analysis...')
                 for i in range(3):
                     try:
-                        SensAnalysis(self, os.path.dirname(output_file), perturbation=perturbation)
+                        SensAnalysis(self, os.path.dirname(output_file), perturbation=perturbation,
+                                     procnum=self.procnum)
                     except (InvalidMicrocanonicalRateError, ModifiedStrongCollisionError) as e:
                         logging.warning('Could not complete the sensitivity analysis with a perturbation of {0} '
                                         'kcal/mol, trying {1} kcal/mol instead.'.format(
@@ -579,9 +582,7 @@ class PressureDependenceJob(object):
 
                 K2 = np.zeros((Tcount, Pcount))
                 if reaction.kinetics is not None:
-                    for t in range(Tcount):
-                        for p in range(Pcount):
-                            K2[t, p] = reaction.kinetics.get_rate_coefficient(Tlist[t], Plist[p])
+                    K2 = reaction.kinetics.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
 
                 K = self.K[:, :, prod, reac].copy()
                 order = len(reaction.reactants)
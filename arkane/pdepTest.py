@@ -117,7 +117,8 @@ class ArkaneTest(unittest.TestCase):
                 if '1000.0' in line:
                     break
         sa_coeff = line.split()[-2]
-        self.assertEquals(float(sa_coeff), -8.23e-6)
+        # coefficients are taken from the raw master equation rates rather than the fitted Chebyshev model
+        self.assertAlmostEqual(float(sa_coeff), -8.23e-6, delta=0.4e-6)
 
     @classmethod
     def tearDown(cls):
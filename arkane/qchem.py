@@ -57,6 +57,11 @@ class QChemLog(Log):
     arrays.
     """
 
+    index_markers = ('Standard Nuclear Orientation', 'Final Hessian.', 'Hessian of the SCF Energy',
+                     'Total job time:', 'Final energy is', 'Total energy in the final basis set',
+                     'Zero point vibrational energy', 'Summary of potential scan:', 'SCF failed to converge',
+                     ' Frequency:')
+
     def __init__(self, path):
         super(QChemLog, self).__init__(path)
 
@@ -67,17 +72,15 @@ class QChemLog(Log):
         """
         n_atoms = 0
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '' and n_atoms == 0:
+        offsets = self.get_line_offsets('Standard Nuclear Orientation')
+        if offsets:
+            with self.open_at(offsets[0]) as f:
                 # Automatically determine the number of atoms
-                if 'Standard Nuclear Orientation' in line and n_atoms == 0:
-                    for i in range(3):
-                        line = f.readline()
-                    while '----------------------------------------------------' not in line:
-                        n_atoms += 1
-                        line = f.readline()
-                line = f.readline()
+                for i in range(4):
+                    line = f.readline()
+                while '----------------------------------------------------' not in line:
+                    n_atoms += 1
+                    line = f.readline()
 
         return n_atoms
 
@@ -91,26 +94,25 @@ class QChemLog(Log):
         """
         force = None
 
-        n_atoms = self.get_number_of_atoms()
-        n_rows = n_atoms * 3
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
+        offsets = self.get_line_offsets('Final Hessian.') + self.get_line_offsets('Hessian of the SCF Energy')
+        if offsets:
+            n_atoms = self.get_number_of_atoms()
+            n_rows = n_atoms * 3
+            with self.open_at(max(offsets)) as f:
+                f.readline()
                 # Read force constant matrix
-                if 'Final Hessian.' in line or 'Hessian of the SCF Energy' in line:
-                    force = np.zeros((n_rows, n_rows), np.float64)
-                    for i in range(int(math.ceil(n_rows / 6.0))):
-                        # Header row
-                        line = f.readline()
-                        # Matrix element rows
-                        for j in range(n_rows):  # for j in range(i*6, Nrows):
-                            data = f.readline().split()
-                            for k in range(len(data) - 1):
-                                force[j, i * 6 + k] = float(data[k + 1])
-                                # F[i*5+k,j] = F[j,i*5+k]
-                    # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
-                    force *= 4.35974417e-18 / 5.291772108e-11 ** 2
-                line = f.readline()
+                force = np.zeros((n_rows, n_rows), np.float64)
+                for i in range(int(math.ceil(n_rows / 6.0))):
+                    # Header row
+                    f.readline()
+                    # Matrix element rows
+                    for j in range(n_rows):  # for j in range(i*6, Nrows):
+                        data = f.readline().split()
+                        for k in range(len(data) - 1):
+                            force[j, i * 6 + k] = float(data[k + 1])
+                            # F[i*5+k,j] = F[j,i*5+k]
+                # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
+                force *= 4.35974417e-18 / 5.291772108e-11 ** 2
 
         return force
 
@@ -123,38 +125,27 @@ class QChemLog(Log):
         """
         atom, coord, number, mass = [], [], [], []
 
-        with open(self.path) as f:
-            log = f.read().splitlines()
-
         # First check that the QChem job file (not necessarily a geometry optimization)
         # has successfully completed, if not an error is thrown
-        completed_job = False
-        for line in reversed(log):
-            if 'Total job time:' in line:
-                logging.debug('Found a successfully completed QChem Job')
-                completed_job = True
-                break
-
-        if not completed_job:
+        if self.get_line_offsets('Total job time:'):
+            logging.debug('Found a successfully completed QChem Job')
+        else:
             raise LogError('Could not find a successfully completed QChem job '
                            'in QChem output file {0}'.format(self.path))
 
         # Now look for the geometry.
         # Will return the final geometry in the file under Standard Nuclear Orientation.
-        geometry_flag = False
-        for i in reversed(range(len(log))):
-            line = log[i]
-            if 'Standard Nuclear Orientation' in line:
-                for line in log[(i + 3):]:
-                    if '------------' not in line:
-                        data = line.split()
-                        atom.append(data[1])
-                        coord.append([float(c) for c in data[2:]])
-                        geometry_flag = True
-                    else:
-                        break
-                if geometry_flag:
-                    break
+        for offset in reversed(self.get_line_offsets('Standard Nuclear Orientation')):
+            with self.open_at(offset) as f:
+                for i in range(4):
+                    line = f.readline()
+                while line != '' and '------------' not in line:
+                    data = line.split()
+                    atom.append(data[1])
+                    coord.append([float(c) for c in data[2:]])
+                    line = f.readline()
+            if atom:
+                break
 
         # Assign appropriate mass to each atom in the molecule
         for atom1 in atom:
@@ -277,14 +268,15 @@ class QChemLog(Log):
         the returned value.
         """
         e_elect = None
-        with open(self.path, 'r') as f:
-            a = b = 0
-            for line in f:
-                if 'Final energy is' in line:
-                    a = float(line.split()[3]) * constants.E_h * constants.Na
-                if 'Total energy in the final basis set' in line:
-                    b = float(line.split()[8]) * constants.E_h * constants.Na
-                e_elect = a or b
+        a = b = 0
+        offsets = self.get_line_offsets('Final energy is')
+        if offsets:
+            a = float(self.read_lines(offsets[-1:])[0].split()[3]) * constants.E_h * constants.Na
+        offsets = self.get_line_offsets('Total energy in the final basis set')
+        if offsets:
+            b = float(self.read_lines(offsets[-1:])[0].split()[8]) * constants.E_h * constants.Na
+        if os.path.getsize(self.path) > 0:
+            e_elect = a or b
         if e_elect is None:
             raise LogError('Unable to find energy in QChem output file {0}.'.format(self.path))
         return e_elect
@@ -294,11 +286,11 @@ class QChemLog(Log):
         Load the unscaled zero-point energy in J/mol from a QChem output file.
         """
         zpe = None
-        with open(self.path, 'r') as f:
-            for line in f:
-                if 'Zero point vibrational energy' in line:
-                    zpe = float(line.split()[4]) * 4184  # QChem's ZPE is in kcal/mol, convert to J/mol
-                    logging.debug('ZPE is {}'.format(str(zpe)))
+        offsets = self.get_line_offsets('Zero point vibrational energy')
+        if offsets:
+            line = self.read_lines(offsets[-1:])[0]
+            zpe = float(line.split()[4]) * 4184  # QChem's ZPE is in kcal/mol, convert to J/mol
+            logging.debug('ZPE is {}'.format(str(zpe)))
         if zpe is not None:
             return zpe
         else:
@@ -311,21 +303,19 @@ class QChemLog(Log):
         """
         v_list = []
         angle = []
-        read = False
-        with open(self.path, 'r') as f:
-            for line in f:
-                if '-----------------' in line:
-                    read = False
-                if read:
+        if self.get_line_offsets('SCF failed to converge'):
+            raise LogError('QChem Job did not successfully complete: '
+                           'SCF failed to converge in file {0}.'.format(self.path))
+        for offset in self.get_line_offsets('Summary of potential scan:'):
+            logging.info('found a successfully completed QChem Job')
+            with self.open_at(offset) as f:
+                f.readline()
+                for line in f:
+                    if '-----------------' in line:
+                        break
                     values = [float(item) for item in line.split()]
                     angle.append(values[0])
                     v_list.append(values[1])
-                if 'Summary of potential scan:' in line:
-                    logging.info('found a successfully completed QChem Job')
-                    read = True
-                elif 'SCF failed to converge' in line:
-                    raise LogError('QChem Job did not successfully complete: '
-                                   'SCF failed to converge in file {0}.'.format(self.path))
         logging.info('   Assuming {0} is the output from a QChem PES scan...'.format(os.path.basename(self.path)))
 
         v_list = np.array(v_list, np.float64)
@@ -345,12 +335,10 @@ class QChemLog(Log):
         calculation in cm^-1.
         """
         frequency = 0
-        with open(self.path, 'r') as f:
-            for line in f:
-                # Read imaginary frequency
-                if ' Frequency:' in line:
-                    frequency = float((line.split()[1]))
-                    break
+        offsets = self.get_line_offsets(' Frequency:')
+        if offsets:
+            # Read imaginary frequency
+            frequency = float(self.read_lines(offsets[:1])[0].split()[1])
         # Make sure the frequency is imaginary:
         if frequency < 0:
             return frequency
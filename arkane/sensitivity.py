@@ -36,6 +36,7 @@ of kinetics and pressure-dependent jobs.
 import logging
 import os
 import string
+from multiprocessing import Pool
 
 import numpy as np
 
@@ -229,27 +230,25 @@ class PDepSensitivity(object):
     `conditions`        A list of the conditions (each entry is a list of one T and one P quantities) at which the
                         sensitivity coefficients are calculated
     `job`               The PressureDependenceJob object
-    `rates`             A dictionary with net_reactions as keys. Values are lists of forward rates from `job` for the
-                        respective path reaction at the respective `conditions` in the appropriate units
+    `rates`             A dictionary with string representations of net_reactions as keys. Values are lists of the
+                        forward rates computed from the master equation of `job` (before fitting an interpolation
+                        model) for the respective net reaction at the respective `conditions` in SI units
     `sa_rates`          A dictionary with string representations of net_reactions as keys. Values are dictionaries with
                         Wells or TransitionStates as keys and each value is a list of forward rates from `job` at the
                         respective `conditions` after perturbing the corresponding well or TS's E0
     `sa_coefficients`   A dictionary with similar structure as `sa_rates`, containing the sensitivity coefficients
                         in the forward direction
+    `procnum`           The number of processes used to evaluate the perturbed networks
     =================== ================================================================================================
     """
 
-    def __init__(self, job, output_directory, perturbation):
+    def __init__(self, job, output_directory, perturbation, procnum=1):
         self.job = job
         self.output_directory = output_directory
         self.sensitivity_path = os.path.join(output_directory, 'sensitivity')
         self.conditions = self.job.sensitivity_conditions
+        self.procnum = procnum
         self.rates = {}
-        for rxn in self.job.network.net_reactions:
-            self.rates[str(rxn)] = []
-            for condition in self.conditions:
-                self.rates[str(rxn)].append(rxn.kinetics.get_rate_coefficient(condition[0].value_si,
-                                                                              condition[1].value_si))
         self.sa_rates = {}
         self.sa_coefficients = {}
         for rxn in self.job.network.net_reactions:
@@ -261,6 +260,11 @@ class PDepSensitivity(object):
     def execute(self):
         """
         Execute the sensitivity analysis for a :class:PressureDependenceJob: object
+
+        The network must have already been initialized by the job. Densities of states are reused for every
+        perturbation since they do not depend on E0, and only the raw phenomenological rate coefficients at the
+        sensitivity conditions are recomputed (the interpolation models are not refitted).
+        Perturbations are evaluated on `self.procnum` processes.
         """
         wells = []
         wells.extend(self.job.network.reactants)
@@ -270,18 +274,31 @@ class PDepSensitivity(object):
         for rxn in self.job.network.path_reactions:
             # if rxn.transition_state is not None:
             transition_states.append(rxn.transition_state)
+        entries = wells + transition_states
 
-        for entry in wells + transition_states:
-            if entry in wells:
-                logging.info("\n\nPerturbing well '{0}' by {1}:".format(entry, self.perturbation))
-            else:
-                logging.info("\n\nPerturbing TS '{0}' by {1}:".format(entry.label, self.perturbation))
-            self.perturb(entry)
-            self.job.execute(output_file=None, plot=False, print_summary=False)  # run the perturbed job
-            self.unperturb(entry)
-            for rxn in self.job.network.net_reactions:
-                self.sa_rates[str(rxn)][entry] = [rxn.kinetics.get_rate_coefficient(
-                    condition[0].value_si, condition[1].value_si) for condition in self.conditions]
+        indices = get_net_reaction_indices(self.job.network)
+        conditions = [(condition[0].value_si, condition[1].value_si) for condition in self.conditions]
+        rates = calculate_net_rate_coefficients(self.job.network, conditions, self.job.method, indices)
+        for rxn, k_list in zip(self.job.network.net_reactions, rates):
+            self.rates[str(rxn)] = k_list
+
+        args = [(self.job.network, i, self.perturbation.value_si, conditions, self.job.method, indices)
+                for i in range(len(entries))]
+        if self.procnum == 1:
+            logging.info('For sensitivity analysis {0} process is used.'.format(self.procnum))
+            sa_rates = list(map(_perturbed_net_rate_coefficients_star, args))
+        else:
+            logging.info('For sensitivity analysis {0} processes are used.'.format(self.procnum))
+            p = Pool(processes=self.procnum)
+            sa_rates = p.map(_perturbed_net_rate_coefficients_star, args)
+            p.close()
+            p.join()
+        # Restore the cached ground-state energies of the unperturbed network
+        self.job.network.update_ground_state_energies()
+
+        for entry, entry_rates in zip(entries, sa_rates):
+            for rxn, k_list in zip(self.job.network.net_reactions, entry_rates):
+                self.sa_rates[str(rxn)][entry] = k_list
                 self.sa_coefficients[str(rxn)][entry] = [((self.sa_rates[str(rxn)][entry][i]
                                                            - self.rates[str(rxn)][i])) /
                                                          (self.perturbation.value_si * self.rates[str(rxn)][i])
@@ -300,11 +317,7 @@ class PDepSensitivity(object):
         perturbation = self.perturbation.value_si
         if unperturb:
             perturbation *= -1
-        if isinstance(entry, TransitionState):
-            entry.conformer.E0 = quantity.Energy(entry.conformer.E0.value_si + perturbation, 'J/mol')
-        elif isinstance(entry, Configuration):
-            entry.species[0].conformer.E0 = quantity.Energy(entry.species[0].conformer.E0.value_si + perturbation,
-                                                            'J/mol')
+        perturb_entry(entry, perturbation)
 
     def unperturb(self, entry):
         """A helper function for calling self.perturb cleanly when unperturbing"""
@@ -391,3 +404,70 @@ class PDepSensitivity(object):
             path = os.path.join(self.sensitivity_path, filename)
             plt.savefig(path)
             plt.close()
+
+
+def perturb_entry(entry, perturbation):
+    """
+    Shift E0 of `entry`, which could be either a :class:TransitionState or a :class:Configuration,
+    by `perturbation` in J/mol. In the latter case, only the first species in the Configuration.species list
+    is perturbed.
+    """
+    if isinstance(entry, TransitionState):
+        entry.conformer.E0 = quantity.Energy(entry.conformer.E0.value_si + perturbation, 'J/mol')
+    elif isinstance(entry, Configuration):
+        entry.species[0].conformer.E0 = quantity.Energy(entry.species[0].conformer.E0.value_si + perturbation,
+                                                        'J/mol')
+
+
+def get_net_reaction_indices(network):
+    """
+    Return a list of (product, reactant) configuration indices into the phenomenological rate coefficient
+    matrix, in the same order as the net reactions generated by
+    :meth:`arkane.pdep.PressureDependenceJob.fit_interpolation_models`.
+    """
+    n_reac = network.n_isom + network.n_reac
+    n_prod = n_reac + network.n_prod
+    return [(prod, reac) for prod in range(n_prod) for reac in range(n_reac) if reac != prod]
+
+
+def calculate_net_rate_coefficients(network, conditions, method, indices):
+    """
+    Solve the master equation of an initialized `network` at each (T, P) pair in `conditions` (in K and Pa)
+    using `method`. Return a list with one entry per (product, reactant) pair in `indices`, each being a list
+    of the raw phenomenological rate coefficients in SI units at the respective conditions.
+    """
+    rates = [[] for _ in indices]
+    for T, P in conditions:
+        K = network.calculate_rate_coefficients(np.array([T], np.float64), np.array([P], np.float64), method)
+        for i, (prod, reac) in enumerate(indices):
+            rates[i].append(K[0, 0, prod, reac])
+    return rates
+
+
+def perturbed_net_rate_coefficients(network, index, perturbation, conditions, method, indices):
+    """
+    Perturb E0 of the well or transition state at position `index` in the list of network reactants, isomers,
+    products and path reaction transition states by `perturbation` in J/mol, and return the raw phenomenological
+    rate coefficients (see :func:`calculate_net_rate_coefficients`) of the perturbed `network`.
+    The densities of states computed when the network was initialized are reused. The perturbation is
+    reversed before returning.
+    """
+    entries = network.reactants + network.isomers + network.products
+    entries.extend([rxn.transition_state for rxn in network.path_reactions])
+    entry = entries[index]
+    if isinstance(entry, TransitionState):
+        logging.info("\n\nPerturbing TS '{0}' by {1} J/mol:".format(entry.label, perturbation))
+    else:
+        logging.info("\n\nPerturbing well '{0}' by {1} J/mol:".format(entry, perturbation))
+    perturb_entry(entry, perturbation)
+    try:
+        network.update_ground_state_energies()
+        rates = calculate_net_rate_coefficients(network, conditions, method, indices)
+    finally:
+        perturb_entry(entry, -perturbation)
+    return rates
+
+
+def _perturbed_net_rate_coefficients_star(args):
+    """Wrapper to unpack zipped arguments for use with map"""
+    return perturbed_net_rate_coefficients(*args)
@@ -205,6 +205,14 @@ class StatMechJob(object):
         If `plot` is True, then plots of the hindered rotor fits will be saved.
         """
         self.load(pdep, plot)
+        self.write_results(output_directory=output_directory, plot=plot)
+
+    def write_results(self, output_directory=None, plot=False):
+        """
+        Save the results of a loaded statmech job within the `output_directory`.
+
+        If `plot` is True, then plots of the hindered rotor fits will be saved.
+        """
         if output_directory is not None:
             try:
                 self.write_output(output_directory)
@@ -75,6 +75,15 @@ class ThermoJob(object):
         will be saved.
         """
         self.generate_thermo()
+        self.write_results(output_directory=output_directory, plot=plot)
+
+    def write_results(self, output_directory=None, plot=False):
+        """
+        Save the generated thermodynamics data within the `output_directory`,
+        including the Chemkin thermo entry and the species YAML file.
+
+        If `plot` is true, then plots of the raw and fitted values will be saved.
+        """
         if output_directory is not None:
             try:
                 self.write_output(output_directory)
@@ -118,14 +127,10 @@ class ThermoJob(object):
             return None
 
         Tlist = np.arange(10.0, 3001.0, 10.0, np.float64)
-        Cplist = np.zeros_like(Tlist)
-        H298 = 0.0
-        S298 = 0.0
         conformer = self.species.conformer
-        for i in range(Tlist.shape[0]):
-            Cplist[i] += conformer.get_heat_capacity(Tlist[i])
-        H298 += conformer.get_enthalpy(298.) + conformer.E0.value_si
-        S298 += conformer.get_entropy(298.)
+        Cplist = conformer.get_heat_capacities(Tlist)
+        H298 = conformer.get_enthalpy(298.) + conformer.E0.value_si
+        S298 = conformer.get_entropy(298.)
 
         if not any([isinstance(mode, (LinearRotor, NonlinearRotor)) for mode in conformer.modes]):
             # Monatomic species
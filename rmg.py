@@ -67,6 +67,7 @@ def main():
 
     kwargs = {
         'restart': args.restart,
+        'checkpoint': args.checkpoint,
         'walltime': args.walltime,
         'maxproc': args.maxproc,
         'kineticsdatastore': args.kineticsdatastore
@@ -29,13 +29,20 @@
 This module contains functions for writing of Chemkin input files.
 """
 
+import bisect
+import hashlib
+import io
 import logging
 import math
 import os.path
+import pickle
 import re
 import shutil
+import tempfile
 import textwrap
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
 
 import numpy as np
 
@@ -54,6 +61,7 @@ from rmgpy.species import Species
 from rmgpy.thermo import NASAPolynomial, NASA
 from rmgpy.transport import TransportData
 from rmgpy.util import make_output_subdirectory
+from rmgpy.version import __version__
 
 _chemkin_reaction_count = None
 
@@ -777,29 +785,43 @@ def read_reaction_comments(reaction, comments, read=True):
 ################################################################################
 
 
-def load_species_dictionary(path):
+def load_species_dictionary(path, procnum=1):
     """
     Load an RMG dictionary - containing species identifiers and the associated
     adjacency lists - from the file located at `path` on disk. Returns a dict
     mapping the species identifiers to the loaded species. Resonance isomers
     for each species are automatically generated.
+
+    The file is split into adjacency lists in a single pass, which are then
+    parsed in a pool of `procnum` processes if more than one is requested.
     """
+    adjlists = read_species_dictionary_entries(path)
+    if procnum == 1 or len(adjlists) < 2:
+        species_list = list(map(_load_species_dictionary_entry, adjlists))
+    else:
+        p = Pool(processes=procnum)
+        species_list = p.map(_load_species_dictionary_entry, adjlists, chunksize=max(1, len(adjlists) // (4 * procnum)))
+        p.close()
+        p.join()
+
     species_dict = {}
+    for species in species_list:
+        species_dict[species.label] = species
+    return species_dict
+
 
-    inerts = [Species().from_smiles(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
+def read_species_dictionary_entries(path):
+    """
+    Return the list of adjacency lists in the RMG dictionary file located at
+    `path` on disk, with comments and InChI strings removed.
+    """
+    adjlists = []
     with open(path, 'r') as f:
         adjlist = ''
         for line in f:
             if line.strip() == '' and adjlist.strip() != '':
                 # Finish this adjacency list
-                species = Species().from_adjacency_list(adjlist)
-                species.generate_resonance_structures()
-                label = species.label
-                for inert in inerts:
-                    if inert.is_isomorphic(species):
-                        species.reactive = False
-                        break
-                species_dict[label] = species
+                adjlists.append(adjlist)
                 adjlist = ''
             else:
                 if "InChI" in line:
@@ -810,16 +832,29 @@ def load_species_dictionary(path):
                 adjlist += line
         else:  #reach end of file
             if adjlist.strip() != '':
-                species = Species().from_adjacency_list(adjlist)
-                species.generate_resonance_structures()
-                label = species.label
-                for inert in inerts:
-                    if inert.is_isomorphic(species):
-                        species.reactive = False
-                        break
-                species_dict[label] = species
+                adjlists.append(adjlist)
+    return adjlists
 
-    return species_dict
+
+_inert_species = None
+
+
+def _load_species_dictionary_entry(adjlist):
+    """
+    Return the species with the given adjacency list from an RMG dictionary,
+    with its resonance isomers generated and marked as unreactive if it is an
+    inert. Module-level so that it can be passed to worker processes.
+    """
+    global _inert_species
+    if _inert_species is None:
+        _inert_species = [Species().from_smiles(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
+    species = Species().from_adjacency_list(adjlist)
+    species.generate_resonance_structures()
+    for inert in _inert_species:
+        if inert.is_isomorphic(species):
+            species.reactive = False
+            break
+    return species
 
 
 def remove_comment_from_line(line):
@@ -872,12 +907,24 @@ def load_transport_file(path, species_dict):
 
 
 def load_chemkin_file(path, dictionary_path=None, transport_path=None, read_comments=True, thermo_path=None,
-                      use_chemkin_names=False, check_duplicates=True):
+                      use_chemkin_names=False, check_duplicates=True, procnum=1, cache_path=None):
     """
     Load a Chemkin input file located at `path` on disk to `path`, returning lists of the species
     and reactions in the Chemkin file. The 'thermo_path' point to a separate thermo file, or, if 'None' is
     specified, the function will look for the thermo database within the chemkin mechanism file
+
+    The species dictionary is parsed in a pool of `procnum` processes. If
+    `cache_path` is given, the loaded species and reactions are pickled there,
+    and later calls with the same input files and options load them from the
+    cache instead of parsing the files again.
     """
+    if cache_path:
+        fingerprint = get_chemkin_fingerprint(path, dictionary_path, transport_path, thermo_path,
+                                              read_comments, use_chemkin_names, check_duplicates)
+        result = _load_chemkin_cache(cache_path, fingerprint)
+        if result is not None:
+            return result
+
     species_list = []
     species_dict = {}
     species_aliases = {}
@@ -888,9 +935,11 @@ def load_chemkin_file(path, dictionary_path=None, transport_path=None, read_comm
     # as N2, or else the species objects will not store any structures for the final
     # HTML output.
     if dictionary_path:
-        species_dict = load_species_dictionary(dictionary_path)
+        species_dict = load_species_dictionary(dictionary_path, procnum=procnum)
 
+    # Read the whole file at once; the blocks are then parsed from memory, where seeking is cheap
     with open(path, 'r') as f:
+        f = io.StringIO(f.read())
         previous_line = f.tell()
         line0 = f.readline()
         while line0 != '':
@@ -920,14 +969,17 @@ def load_chemkin_file(path, dictionary_path=None, transport_path=None, read_comm
     # Read in the thermo data from the thermo file        
     if thermo_path:
         with open(thermo_path, 'r') as f:
+            f = io.StringIO(f.read())
+            previous_line = f.tell()
             line0 = f.readline()
             while line0 != '':
                 line = remove_comment_from_line(line0)[0]
                 line = line.strip()
                 if 'THERM' in line.upper():
-                    f.seek(-len(line0), 1)
+                    f.seek(previous_line)
                     read_thermo_block(f, species_dict)
                     break
+                previous_line = f.tell()
                 line0 = f.readline()
     # Index the reactions now to have identical numbering as in Chemkin
     index = 0
@@ -961,9 +1013,66 @@ def load_chemkin_file(path, dictionary_path=None, transport_path=None, read_comm
             spec.index = int(index)
 
     reaction_list.sort(key=lambda reaction: reaction.index)
+
+    if cache_path:
+        _save_chemkin_cache(cache_path, fingerprint, species_list, reaction_list)
     return species_list, reaction_list
 
 
+def get_chemkin_fingerprint(path, dictionary_path=None, transport_path=None, thermo_path=None, *options):
+    """
+    Return a hash of the contents of the given Chemkin input files, the
+    loading `options` and the RMG version, used to check that a cache of a
+    loaded mechanism is still valid.
+    """
+    md5 = hashlib.md5()
+    md5.update('{0}:{1!r}'.format(__version__, options).encode())
+    for file_path in (path, dictionary_path, transport_path, thermo_path):
+        md5.update(b'\0')
+        if file_path:
+            with open(file_path, 'rb') as f:
+                md5.update(f.read())
+    return md5.hexdigest()
+
+
+def _load_chemkin_cache(cache_path, fingerprint):
+    """
+    Return the species and reactions from the mechanism cache at `cache_path`,
+    or ``None`` if it does not exist or does not match `fingerprint`.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            data = pickle.load(f)
+    except Exception:
+        logging.warning('Could not read Chemkin cache from {0}; ignoring it.'.format(cache_path))
+        return None
+    if data.get('fingerprint') != fingerprint:
+        logging.info('Chemkin cache {0} was generated from different files; ignoring it.'.format(cache_path))
+        return None
+    return data['species'], data['reactions']
+
+
+def _save_chemkin_cache(cache_path, fingerprint, species_list, reaction_list):
+    """
+    Save the loaded species and reactions to the mechanism cache at
+    `cache_path` together with the `fingerprint` of the input files.
+    """
+    # Write to a temporary file first so that concurrent jobs never read a partial file
+    temp_path = None
+    try:
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(cache_path)))
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({'fingerprint': fingerprint, 'species': species_list, 'reactions': reaction_list},
+                        f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        logging.warning('Could not write Chemkin cache file {0}.'.format(cache_path))
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
 cpdef _process_duplicate_reactions(list reaction_list):
     """
     Check for marked (and unmarked!) duplicate reactions
@@ -972,16 +1081,23 @@ cpdef _process_duplicate_reactions(list reaction_list):
     """
     cdef list duplicate_reactions_to_remove = []
     cdef list duplicate_reactions_to_add = []
+    cdef set removed = set()
+    cdef list keys, indices
+    cdef dict buckets
     cdef int index1, index2
     cdef Reaction reaction, reaction1, reaction2
     cdef KineticsModel kinetics
 
+    # Only reactions sharing a key can be duplicates, so index them by key
+    keys, buckets = _index_reactions_for_duplicates(reaction_list)
+
     for index1 in range(len(reaction_list)):
         reaction1 = reaction_list[index1]
-        if reaction1 in duplicate_reactions_to_remove:
+        if id(reaction1) in removed:
             continue
 
-        for index2 in range(index1 + 1, len(reaction_list)):
+        indices = buckets[keys[index1]]
+        for index2 in indices[bisect.bisect_right(indices, index1):]:
             reaction2 = reaction_list[index2]
             if (reaction1.reactants == reaction2.reactants
                     and reaction1.products == reaction2.products
@@ -992,7 +1108,7 @@ cpdef _process_duplicate_reactions(list reaction_list):
                         if reaction1.library != reaction2.library:
                             raise ChemkinError("Identical reactions {0} and {1} taken from different libraries: {2}, "
                                                "{3}".format(reaction1, reaction2, reaction1.library, reaction2.library))
-                        if reaction1 not in duplicate_reactions_to_remove:
+                        if id(reaction1) not in removed:
                             # already created duplicate reaction, move on to appending any additional duplicate kinetics
                             if isinstance(reaction1.kinetics,
                                           _kinetics.PDepArrhenius):
@@ -1018,6 +1134,7 @@ cpdef _process_duplicate_reactions(list reaction_list):
                             duplicate_reactions_to_add.append(reaction)
                             kinetics.arrhenius = [reaction1.kinetics]
                             duplicate_reactions_to_remove.append(reaction1)
+                            removed.add(id(reaction1))
 
                     else:
                         # Do not use as duplicate reactions if it's not a library reaction
@@ -1038,16 +1155,42 @@ cpdef _process_duplicate_reactions(list reaction_list):
                         raise ChemkinError('Mixed kinetics for duplicate reaction {0}.'.format(reaction))
 
                     duplicate_reactions_to_remove.append(reaction2)
+                    removed.add(id(reaction2))
                 elif reaction1.kinetics.is_pressure_dependent() == reaction2.kinetics.is_pressure_dependent():
                     # If both reactions are pressure-independent or both are pressure-dependent, then they need
                     # duplicate tags. Chemkin treates pdep and non-pdep reactions as different, so those are okay
                     raise ChemkinError('Encountered unmarked duplicate reaction {0}.'.format(reaction1))
 
-    for reaction in duplicate_reactions_to_remove:
-        reaction_list.remove(reaction)
+    reaction_list[:] = [reaction for reaction in reaction_list if id(reaction) not in removed]
     reaction_list.extend(duplicate_reactions_to_add)
 
 
+def _get_duplicate_key(reaction):
+    """
+    Return a hashable key shared by all reactions that may be duplicates of
+    `reaction` in Chemkin terms, in either direction. Species compare by
+    identity, so they are keyed by id; other objects are keyed by hash.
+    """
+    reactants = tuple(sorted([id(spec) if isinstance(spec, Species) else hash(spec) for spec in reaction.reactants]))
+    products = tuple(sorted([id(spec) if isinstance(spec, Species) else hash(spec) for spec in reaction.products]))
+    collider = reaction.specific_collider
+    return (min(reactants, products), max(reactants, products),
+            id(collider) if isinstance(collider, Species) else hash(collider))
+
+
+def _index_reactions_for_duplicates(reactions):
+    """
+    Return the list of duplicate keys of the `reactions` and a dictionary
+    mapping each key to the ascending list of indices of the reactions
+    sharing it.
+    """
+    keys = [_get_duplicate_key(reaction) for reaction in reactions]
+    buckets = {}
+    for index, key in enumerate(keys):
+        buckets.setdefault(key, []).append(index)
+    return keys, buckets
+
+
 def read_species_block(f, species_dict, species_aliases, species_list):
     """
     Read a Species block from a chemkin file.
@@ -1917,13 +2060,15 @@ def mark_duplicate_reactions(reactions):
     For a given list of `reactions`, mark all of the duplicate reactions as
     understood by Chemkin.
     
-    This is pretty slow (quadratic in size of reactions list) so only call it if you're really worried
-    you may have undetected duplicate reactions.
+    Only reactions with the same reactants, products and specific collider
+    (in either direction) are compared, using a hash index of the
+    `reactions`, so this takes time linear in the size of the reactions list.
     """
+    keys, buckets = _index_reactions_for_duplicates(reactions)
     for index1 in range(len(reactions)):
-        reaction1 = reactions[index1]
-        remaining_list = reactions[index1 + 1:]
-        mark_duplicate_reaction(reaction1, remaining_list)
+        indices = buckets[keys[index1]]
+        remaining_list = [reactions[index2] for index2 in indices[bisect.bisect_right(indices, index1):]]
+        mark_duplicate_reaction(reactions[index1], remaining_list)
 
 
 def save_species_dictionary(path, species, old_style=False):
@@ -1934,29 +2079,37 @@ def save_species_dictionary(path, species, old_style=False):
     If `old_style==True` then it saves it in the old RMG-Java syntax.
     """
     with open(path, 'w') as f:
-        for spec in species:
-            if old_style:
-                try:
-                    f.write(spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec),
-                                                               remove_h=True, old_style=True))
-                except:
-                    new_adjlist = spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec), remove_h=False)
-                    f.write("// Couldn't save {0} in old RMG-Java syntax, but here it is in "
-                            "newer RMG-Py syntax:".format(get_species_identifier(spec)))
-                    f.write("\n// " + "\n// ".join(new_adjlist.splitlines()) + '\n')
-            else:
-                try:
-                    for mol in spec.molecule:
-                        if mol.reactive:
-                            f.write(mol.to_adjacency_list(label=get_species_identifier(spec), remove_h=False))
-                            break
-                    else:
-                        raise ValueError('No reactive structures were found for species '
-                                         '{0}.'.format(get_species_identifier(spec)))
-                except:
-                    raise ChemkinError('Ran into error saving dictionary for species {0}. '
-                                       'Please check your files.'.format(get_species_identifier(spec)))
-            f.write('\n')
+        _write_species_dictionary_entries(f, species, old_style)
+
+
+def _write_species_dictionary_entries(f, species, old_style=False):
+    """
+    Write the adjacency lists of the given list of `species` to the open
+    species dictionary file `f`.
+    """
+    for spec in species:
+        if old_style:
+            try:
+                f.write(spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec),
+                                                           remove_h=True, old_style=True))
+            except:
+                new_adjlist = spec.molecule[0].to_adjacency_list(label=get_species_identifier(spec), remove_h=False)
+                f.write("// Couldn't save {0} in old RMG-Java syntax, but here it is in "
+                        "newer RMG-Py syntax:".format(get_species_identifier(spec)))
+                f.write("\n// " + "\n// ".join(new_adjlist.splitlines()) + '\n')
+        else:
+            try:
+                for mol in spec.molecule:
+                    if mol.reactive:
+                        f.write(mol.to_adjacency_list(label=get_species_identifier(spec), remove_h=False))
+                        break
+                else:
+                    raise ValueError('No reactive structures were found for species '
+                                     '{0}.'.format(get_species_identifier(spec)))
+            except:
+                raise ChemkinError('Ran into error saving dictionary for species {0}. '
+                                   'Please check your files.'.format(get_species_identifier(spec)))
+        f.write('\n')
 
 
 def save_transport_file(path, species):
@@ -2338,11 +2491,80 @@ class ChemkinWriter(object):
     from its subject:
 
     rmg.detach(listener)
-    
+
+    If `incremental` is ``True``, each update only appends the core species
+    and reactions that are new since the previous update, in a background
+    thread, and the complete Chemkin files are written by :meth:`finish`.
+    The new species are appended to ``species_dictionary.txt`` and their
+    annotated thermo entries and reactions to ``chem_annotated_incremental.inp``,
+    whose entries are listed with their byte offsets in
+    ``chem_annotated_incremental.idx``.
     """
-    def __init__(self, output_directory=''):
+    def __init__(self, output_directory='', incremental=False):
         super(ChemkinWriter, self).__init__()
         make_output_subdirectory(output_directory, 'chemkin')
+        self.output_directory = output_directory
+        self.incremental = incremental
+        self.written = {}
+        self.executor = None
+        self.futures = []
 
     def update(self, rmg):
+        if not self.incremental:
+            save_chemkin_files(rmg)
+            return
+        # Select the new entries now, as the model keeps changing while they are written
+        new_species = [spec for spec in rmg.reaction_model.core.species if id(spec) not in self.written]
+        new_reactions = [rxn for rxn in rmg.reaction_model.core.reactions if id(rxn) not in self.written]
+        for obj in new_species + new_reactions:
+            self.written[id(obj)] = obj
+        if not new_species and not new_reactions:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.futures.append(self.executor.submit(self.append_entries, new_species, new_reactions,
+                                                 list(rmg.reaction_model.core.species),
+                                                 rmg.reaction_model.iteration_num))
+
+    def append_entries(self, species, reactions, core_species, iteration):
+        """
+        Append the given new core `species` and `reactions` to the incremental
+        output files. The list of all `core_species` is used to identify
+        collider efficiencies.
+        """
+        directory = os.path.join(self.output_directory, 'chemkin')
+        with open(os.path.join(directory, 'species_dictionary.txt'), 'a') as f:
+            _write_species_dictionary_entries(f, species)
+
+        index_lines = []
+        with open(os.path.join(directory, 'chem_annotated_incremental.inp'), 'ab') as f:
+            f.write('! Iteration {0:d}: {1:d} new species, {2:d} new reactions\n\n'.format(
+                iteration, len(species), len(reactions)).encode('utf-8'))
+            entries = [('species', get_species_identifier(spec), write_thermo_entry(spec, verbose=True))
+                       for spec in species]
+            entries.extend([('reaction', str(rxn.index),
+                             write_kinetics_entry(rxn, species_list=core_species, verbose=True))
+                            for rxn in reactions])
+            for kind, identifier, entry in entries:
+                data = (entry + '\n').encode('utf-8')
+                index_lines.append('{0}\t{1}\t{2:d}\t{3:d}\n'.format(kind, identifier, f.tell(), len(data)))
+                f.write(data)
+        with open(os.path.join(directory, 'chem_annotated_incremental.idx'), 'a') as f:
+            f.writelines(index_lines)
+
+    def wait(self):
+        """
+        Block until all submitted incremental writes are complete, raising any
+        error that occurred while writing.
+        """
+        futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+
+    def finish(self, rmg):
+        """
+        Complete any pending incremental writes and save the complete Chemkin
+        files for the current state of the model.
+        """
+        self.wait()
         save_chemkin_files(rmg)
@@ -31,10 +31,13 @@
 import unittest
 import mock
 import os
+import shutil
+import tempfile
 
 import rmgpy
 from rmgpy.chemkin import get_species_identifier, load_chemkin_file, load_transport_file, mark_duplicate_reactions, \
     read_kinetics_entry, read_reaction_comments, read_thermo_entry, save_chemkin_file, save_species_dictionary, save_transport_file
+from rmgpy.chemkin import ChemkinWriter, load_species_dictionary, mark_duplicate_reaction, write_kinetics_entry
 from rmgpy.chemkin import _remove_line_breaks, _process_duplicate_reactions
 from rmgpy.data.kinetics import LibraryReaction
 from rmgpy.exceptions import ChemkinError
@@ -261,6 +264,105 @@ class ChemkinTest(unittest.TestCase):
         for spc, label in zip(species, expected):
             self.assertEqual(spc.label, label)
 
+    def test_load_chemkin_file_cache(self):
+        """
+        Test that a mechanism loaded from the cache matches the one parsed from the Chemkin files.
+        """
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        chemkin_path = os.path.join(folder, 'pdd', 'chem.inp')
+        dictionary_path = os.path.join(folder, 'pdd', 'species_dictionary.txt')
+        cache_directory = tempfile.mkdtemp()
+        cache_path = os.path.join(cache_directory, 'chem_cache.pkl')
+
+        try:
+            species, reactions = load_chemkin_file(chemkin_path, dictionary_path, cache_path=cache_path)
+            self.assertTrue(os.path.isfile(cache_path))
+            with mock.patch('rmgpy.chemkin.read_reactions_block') as mock_read:
+                cached_species, cached_reactions = load_chemkin_file(chemkin_path, dictionary_path,
+                                                                     cache_path=cache_path)
+                mock_read.assert_not_called()
+            # A different option invalidates the cache
+            _, reactions2 = load_chemkin_file(chemkin_path, dictionary_path, cache_path=cache_path,
+                                              check_duplicates=False)
+            # The cache is written in place of the old one, without leaving temporary files behind
+            self.assertEqual(os.listdir(cache_directory), ['chem_cache.pkl'])
+        finally:
+            shutil.rmtree(cache_directory)
+
+        self.assertEqual([spc.label for spc in cached_species], [spc.label for spc in species])
+        self.assertTrue(all(spc1.is_isomorphic(spc2) for spc1, spc2 in zip(cached_species, species)))
+        self.assertEqual(len(cached_reactions), len(reactions))
+        self.assertEqual(len(reactions2), len(reactions))
+        for rxn1, rxn2 in zip(cached_reactions, reactions):
+            self.assertEqual(str(rxn1), str(rxn2))
+            self.assertEqual(rxn1.__class__, rxn2.__class__)
+            self.assertEqual(rxn1.duplicate, rxn2.duplicate)
+            self.assertAlmostEqual(rxn1.get_rate_coefficient(1000., 1e5) / rxn2.get_rate_coefficient(1000., 1e5), 1.0)
+            # Reactions must refer to the cached species objects
+            for spc in rxn1.reactants + rxn1.products:
+                self.assertTrue(any(spc is cached_spc for cached_spc in cached_species))
+
+    def test_load_species_dictionary_in_parallel(self):
+        """
+        Test that the species dictionary parsed in a process pool matches the serial result.
+        """
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        dictionary_path = os.path.join(folder, 'pdd', 'species_dictionary.txt')
+
+        species_dict = load_species_dictionary(dictionary_path)
+        parallel_dict = load_species_dictionary(dictionary_path, procnum=2)
+
+        self.assertEqual(list(parallel_dict.keys()), list(species_dict.keys()))
+        for label, spc in species_dict.items():
+            self.assertTrue(parallel_dict[label].is_isomorphic(spc))
+            self.assertEqual(parallel_dict[label].reactive, spc.reactive)
+            self.assertEqual(len(parallel_dict[label].molecule), len(spc.molecule))
+
+    def test_incremental_chemkin_writer(self):
+        """
+        Test that the incremental ChemkinWriter only appends new core species and reactions.
+        """
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        chemkin_path = os.path.join(folder, 'pdd', 'chem.inp')
+        dictionary_path = os.path.join(folder, 'pdd', 'species_dictionary.txt')
+        species, reactions = load_chemkin_file(chemkin_path, dictionary_path)
+        output_directory = os.path.join(folder, 'pdd', 'incremental')
+        os.mkdir(output_directory)
+
+        try:
+            writer = ChemkinWriter(output_directory, incremental=True)
+            rmg = mock.Mock()
+            rmg.reaction_model.iteration_num = 1
+            rmg.reaction_model.core.species = species[:5]
+            rmg.reaction_model.core.reactions = reactions[:3]
+            writer.update(rmg)
+            rmg.reaction_model.iteration_num = 2
+            rmg.reaction_model.core.species = species
+            rmg.reaction_model.core.reactions = reactions
+            writer.update(rmg)
+            writer.update(rmg)
+            writer.wait()
+
+            path = os.path.join(output_directory, 'chemkin', 'chem_annotated_incremental.inp')
+            with open(path, 'rb') as f:
+                content = f.read()
+            with open(os.path.join(output_directory, 'chemkin', 'chem_annotated_incremental.idx')) as f:
+                index = [line.split('\t') for line in f.read().splitlines()]
+            appended_dict = load_species_dictionary(os.path.join(output_directory, 'chemkin', 'species_dictionary.txt'))
+        finally:
+            shutil.rmtree(output_directory)
+
+        self.assertEqual(content.count(b'! Iteration'), 2)
+        self.assertEqual(len(index), len(species) + len(reactions))
+        self.assertEqual([identifier for kind, identifier, offset, length in index if kind == 'species'],
+                         [get_species_identifier(spc) for spc in species])
+        kind, identifier, offset, length = index[len(species[:5]) + 1]
+        self.assertEqual(kind, 'reaction')
+        self.assertEqual(identifier, str(reactions[1].index))
+        entry = content[int(offset):int(offset) + int(length)].decode('utf-8')
+        self.assertIn(write_kinetics_entry(reactions[1], species_list=species, verbose=True), entry)
+        self.assertEqual(list(appended_dict.keys()), [get_species_identifier(spc) for spc in species])
+
     def test_reactant_n2_is_reactive_and_gets_right_species_identifier(self):
         """
         Test that after loading chemkin files, species such as N2, which is in the default
@@ -428,6 +530,40 @@ class ChemkinTest(unittest.TestCase):
 
         self.assertEqual(duplicate_flags, expected_flags)
 
+    def test_mark_duplicate_reactions_matches_pairwise(self):
+        """Test that the indexed duplicate marking matches comparing every pair of reactions."""
+        s1 = Species().from_smiles('CC')
+        s2 = Species().from_smiles('[CH3]')
+        s3 = Species().from_smiles('[OH]')
+        s4 = Species().from_smiles('C[CH2]')
+        s5 = Species().from_smiles('O')
+        s6 = Species().from_smiles('[Ar]')
+
+        def make_reactions():
+            return [
+                Reaction(reactants=[s1, s3], products=[s4, s5], kinetics=Arrhenius()),
+                Reaction(reactants=[s3, s1], products=[s4, s5], kinetics=Arrhenius()),
+                Reaction(reactants=[s4, s5], products=[s1, s3], kinetics=Arrhenius()),
+                Reaction(reactants=[s1], products=[s2, s2], kinetics=Arrhenius(), specific_collider=s6),
+                Reaction(reactants=[s1], products=[s2, s2], kinetics=Arrhenius()),
+                Reaction(reactants=[s2, s2], products=[s1], kinetics=Arrhenius(), specific_collider=s6),
+                Reaction(reactants=[s1], products=[s2, s2], kinetics=Chebyshev(), duplicate=True),
+                Reaction(reactants=[s1], products=[s2, s2], kinetics=Arrhenius(), duplicate=True),
+                Reaction(reactants=[s5], products=[s3, s4], kinetics=Arrhenius(), reversible=False, duplicate=True),
+                Reaction(reactants=[s3, s4], products=[s5], kinetics=Arrhenius(), reversible=False, duplicate=True),
+            ]
+
+        expected = make_reactions()
+        for index, reaction in enumerate(expected):
+            mark_duplicate_reaction(reaction, expected[index + 1:])
+
+        reaction_list = make_reactions()
+        mark_duplicate_reactions(reaction_list)
+
+        self.assertEqual([rxn.duplicate for rxn in reaction_list], [rxn.duplicate for rxn in expected])
+        self.assertEqual([rxn.duplicate for rxn in reaction_list],
+                         [True, False, True, True, True, True, False, False, False, False])
+
 
 class TestReadReactionComments(unittest.TestCase):
     @classmethod
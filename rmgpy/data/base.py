@@ -35,15 +35,23 @@ components of the RMG database.
 """
 
 import codecs
+import gc
+import hashlib
 import logging
 import os
+import pickle
 import re
+import tempfile
 from collections import OrderedDict
 
 from rmgpy.data.reference import Reference, Article, Book, Thesis
 from rmgpy.exceptions import DatabaseError, InvalidAdjacencyListError
 from rmgpy.kinetics.uncertainties import RateUncertainty
 from rmgpy.molecule import Molecule, Group
+from rmgpy.molecule.atomtype import ATOMTYPES, allElements
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+from rmgpy.version import __version__
 
 
 ################################################################################
@@ -210,12 +218,20 @@ class Database(object):
             local_context[key] = value
 
         # Process the file
+        # The cyclic garbage collector is paused meanwhile: the many atoms and
+        # bonds created would otherwise trigger collections that each scan
+        # everything loaded so far, which takes longer than the parsing itself
+        gc_enabled = gc.isenabled()
+        gc.disable()
         f = open(path, 'r')
         try:
             exec(f.read(), global_context, local_context)
         except Exception:
             logging.error('Error while reading database {0!r}.'.format(path))
             raise
+        finally:
+            if gc_enabled:
+                gc.enable()
         f.close()
 
         # Extract the database metadata
@@ -1076,6 +1092,90 @@ class Database(object):
 
         return group_to_remove
 
+    def can_match_elements(self, item, elements):
+        """
+        Return ``True`` if the structure `item` can match a species made up
+        only of the given `elements`, a set of element symbols, or ``False``
+        if it requires some other element. The `item` may be a
+        :class:`Group`, :class:`LogicNode`, :class:`Molecule`,
+        :class:`Species` or :class:`Reaction`, or a list of these; any other
+        item is assumed to match.
+        """
+        if isinstance(item, Group):
+            for atom in item.atoms:
+                if all(get_atomtype_elements(atomtype).isdisjoint(elements) for atomtype in atom.atomtype):
+                    return False
+            return True
+        elif isinstance(item, Molecule):
+            return all(atom.symbol in elements for atom in item.atoms)
+        elif isinstance(item, Species):
+            return not item.molecule or self.can_match_elements(item.molecule[0], elements)
+        elif isinstance(item, Reaction):
+            return all(self.can_match_elements(spec, elements) for spec in item.reactants + item.products)
+        elif isinstance(item, list):
+            return all(self.can_match_elements(component, elements) for component in item)
+        elif isinstance(item, LogicNode) and not item.invert:
+            matches = []
+            for component in item.components:
+                if isinstance(component, LogicNode):
+                    matches.append(self.can_match_elements(component, elements))
+                else:
+                    # Components are labels of other entries in the database
+                    entry = self.entries.get(component)
+                    matches.append(entry is None or self.can_match_elements(entry.item, elements))
+            return any(matches) if isinstance(item, LogicOr) else all(matches)
+        return True
+
+    def prune_elements(self, elements):
+        """
+        Remove the entries that can only match species containing elements
+        other than `elements`, a set of element symbols, as they can never be
+        used for species made up of those elements. In a tree the branch below
+        such a node is removed with it, but top nodes are kept, as are
+        branches that a remaining entry refers to in its data. Returns the
+        list of removed entries.
+        """
+        if not self.top:
+            # The entries of libraries and depositories are not always stored by label
+            keys = [key for key, entry in self.entries.items() if not self.can_match_elements(entry.item, elements)]
+            return [self.entries.pop(key) for key in keys]
+
+        # Find the highest nodes that cannot match, whose whole branch can be removed
+        branches = []
+        nodes = [child for entry in self.top for child in entry.children]
+        while nodes:
+            entry = nodes.pop()
+            if self.can_match_elements(entry.item, elements):
+                nodes.extend(entry.children)
+            else:
+                branches.append([entry] + entry.get_all_descendants())
+
+        # Keep the branches containing nodes whose data is used by a remaining node
+        while True:
+            removed_labels = set(entry.label for branch in branches for entry in branch)
+            referenced = set(entry.data for entry in self.entries.values()
+                             if isinstance(entry.data, str) and entry.label not in removed_labels)
+            kept = [branch for branch in branches if any(entry.label in referenced for entry in branch)]
+            if not kept:
+                break
+            branches = [branch for branch in branches if branch not in kept]
+
+        removed = []
+        for branch in branches:
+            parent = branch[0].parent
+            if parent is not None:
+                parent.children.remove(branch[0])
+            for entry in branch:
+                del self.entries[entry.label]
+            removed.extend(branch)
+        # Logic nodes can also refer to removed nodes elsewhere in the tree
+        removed_labels = set(entry.label for entry in removed)
+        for entry in self.entries.values():
+            if isinstance(entry.item, LogicOr):
+                entry.item.components = [component for component in entry.item.components
+                                         if not isinstance(component, str) or component not in removed_labels]
+        return removed
+
 
 class LogicNode(object):
     """
@@ -1238,6 +1338,23 @@ def make_logic_node(string):
 
 ################################################################################
 
+_atomtype_elements = {}
+
+
+def get_atomtype_elements(atomtype):
+    """
+    Return the set of symbols of the elements that an atom of the given
+    `atomtype` can be.
+    """
+    elements = _atomtype_elements.get(atomtype.label)
+    if elements is None:
+        elements = frozenset(element for element in allElements
+                             if ATOMTYPES[element].is_specific_case_of(atomtype)
+                             or atomtype.is_specific_case_of(ATOMTYPES[element]))
+        _atomtype_elements[atomtype.label] = elements
+    return elements
+
+
 def remove_comment_from_line(line):
     """
     Remove a C++/Java style comment from a line of text. This refers
@@ -1282,6 +1399,174 @@ def get_all_combinations(node_lists):
     return items
 
 
+################################################################################
+
+class LazyDict(dict):
+    """
+    A dictionary whose values are loaded on first access. A key added with
+    :meth:`set_loader` is present in the dictionary right away, but its value
+    is only created, by calling the given function, the first time it is
+    looked up, either directly or while iterating over the values or items.
+    Pickling or copying the dictionary loads all remaining values and gives
+    a plain :class:`dict`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.loaders = {}
+
+    def __getitem__(self, key):
+        if key in self.loaders:
+            function, args = self.loaders[key]
+            value = function(*args)
+            dict.__setitem__(self, key, value)
+            del self.loaders[key]
+            return value
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self.loaders.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.loaders.pop(key, None)
+        dict.__delitem__(self, key)
+
+    def __iter__(self):
+        # Overriding this makes dict() and update() use __getitem__ to read values
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling an object.
+        """
+        return dict, (self.items(),)
+
+    def set_loader(self, key, function, *args):
+        """
+        Add `key` to the dictionary, with a value to be created by calling
+        ``function(*args)`` when it is first accessed.
+        """
+        dict.__setitem__(self, key, None)
+        self.loaders[key] = (function, args)
+
+    def load_all(self):
+        """
+        Create the values of all the keys that have not been loaded yet.
+        """
+        for key in list(self.loaders):
+            self[key]
+
+    def is_loaded(self, key):
+        """
+        Return ``True`` if the value of `key` has been created, or ``False``
+        if it will be loaded on first access.
+        """
+        return key in self and key not in self.loaders
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self.loaders.clear()
+        dict.clear(self)
+
+    def copy(self):
+        return dict(self.items())
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+
+def get_cache_key(paths, *args):
+    """
+    Return a hash identifying a database object loaded from the files at
+    `paths` with the additional arguments `args`. The hash changes whenever
+    the contents of any of the files or the version of RMG changes.
+    """
+    sha = hashlib.sha1()
+    sha.update(repr((__version__, args)).encode())
+    for path in sorted(paths):
+        sha.update(path.encode())
+        with open(path, 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+def load_cached(cache_directory, paths, function, *args):
+    """
+    Return the database object created by ``function(*args)``, which loads it
+    from the files at `paths` on disk. If a `cache_directory` is given, a
+    pickled copy of the object is saved there and reused by later calls as
+    long as the files are unchanged, which is much faster than executing the
+    database files again. The `args` should be plain values, as their
+    representation is part of the key of the cached copy.
+    """
+    if cache_directory is None:
+        return function(*args)
+
+    key = get_cache_key(paths, function.__qualname__, *args)
+    cache_path = os.path.join(cache_directory, key + '.pkl')
+    if os.path.exists(cache_path):
+        # As in Database.load, the cyclic garbage collector is paused while
+        # the many atoms and bonds are created
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            logging.warning('Could not read database cache file {0}; loading from the database '
+                            'instead.'.format(cache_path))
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    obj = function(*args)
+
+    # Write to a temporary file first so that concurrent jobs never read a partial file
+    temp_path = None
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=cache_directory)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        logging.warning('Could not write database cache file {0}.'.format(cache_path))
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+    return obj
+
+
 ################################################################################
 
 class ForbiddenStructures(Database):
@@ -28,9 +28,13 @@
 #                                                                             #
 ###############################################################################
 
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
 
-from rmgpy.data.base import Entry, Database, ForbiddenStructures
+from rmgpy.data.base import Entry, Database, ForbiddenStructures, LazyDict, load_cached, make_logic_node
 from rmgpy.molecule import Group, Molecule
 
 
@@ -113,6 +117,60 @@ class TestBaseDatabase(unittest.TestCase):
         self.assertTrue(self.database.match_node_to_node(entry1, entry1))
         self.assertFalse(self.database.match_node_to_node(entry1, entry2))
 
+    def make_tree(self):
+        """
+        Set up a tree with a generic top node and carbon and nitrogen branches.
+        """
+        top = Entry(label='R', item=Group().from_adjacency_list('1 *1 R u0'))
+        carbon = Entry(label='C', item=Group().from_adjacency_list('1 *1 C u0'), parent=top)
+        nitrogen = Entry(label='N', item=Group().from_adjacency_list('1 *1 N u0'), parent=top)
+        amine = Entry(label='N-H', item=Group().from_adjacency_list("""
+            1 *1 N u0 {2,S}
+            2    H u0 {1,S}
+            """), parent=nitrogen)
+        either = Entry(label='C_or_N', item=make_logic_node('OR{C, N}'), parent=top)
+        top.children = [carbon, nitrogen, either]
+        nitrogen.children = [amine]
+        for entry in [top, carbon, nitrogen, amine, either]:
+            self.database.entries[entry.label] = entry
+        self.database.top = [top]
+        return top, carbon, nitrogen, amine, either
+
+    def test_can_match_elements(self):
+        """
+        Test that structures requiring other elements are recognized.
+        """
+        top, carbon, nitrogen, amine, either = self.make_tree()
+        elements = {'C', 'H', 'O'}
+        self.assertTrue(self.database.can_match_elements(top.item, elements))
+        self.assertTrue(self.database.can_match_elements(carbon.item, elements))
+        self.assertFalse(self.database.can_match_elements(nitrogen.item, elements))
+        self.assertTrue(self.database.can_match_elements(either.item, elements))
+        self.assertFalse(self.database.can_match_elements(either.item, {'O'}))
+        self.assertTrue(self.database.can_match_elements(Molecule(smiles='CCO'), elements))
+        self.assertFalse(self.database.can_match_elements(Molecule(smiles='CCN'), elements))
+
+    def test_prune_elements(self):
+        """
+        Test that branches of a tree requiring other elements are removed.
+        """
+        top, carbon, nitrogen, amine, either = self.make_tree()
+        removed = self.database.prune_elements({'C', 'H', 'O'})
+        self.assertEqual(sorted(entry.label for entry in removed), ['N', 'N-H'])
+        self.assertEqual(sorted(self.database.entries), ['C', 'C_or_N', 'R'])
+        self.assertEqual(top.children, [carbon, either])
+        self.assertEqual(either.item.components, ['C'])
+
+    def test_prune_elements_keeps_referenced_branches(self):
+        """
+        Test that branches whose data is used by a remaining node are kept.
+        """
+        top, carbon, nitrogen, amine, either = self.make_tree()
+        carbon.data = 'N-H'
+        removed = self.database.prune_elements({'C', 'H', 'O'})
+        self.assertEqual(removed, [])
+        self.assertEqual(len(self.database.entries), 5)
+
 
 class TestForbiddenStructures(unittest.TestCase):
 
@@ -212,6 +270,110 @@ multiplicity 3
         self.assertTrue(self.database.is_molecule_forbidden(molecule2))
 
 
+class TestLazyDict(unittest.TestCase):
+    """
+    Contains unit tests of the :class:`LazyDict` class.
+    """
+
+    def setUp(self):
+        self.calls = []
+        self.dictionary = LazyDict({'a': 1})
+        self.dictionary.set_loader('b', self.load, 2)
+        self.dictionary.set_loader('c', self.load, 3)
+
+    def load(self, value):
+        self.calls.append(value)
+        return value
+
+    def test_load_on_access(self):
+        """Test that values are only loaded when first accessed"""
+        self.assertEqual(sorted(self.dictionary), ['a', 'b', 'c'])
+        self.assertIn('b', self.dictionary)
+        self.assertFalse(self.dictionary.is_loaded('b'))
+        self.assertEqual(self.calls, [])
+
+        self.assertEqual(self.dictionary['b'], 2)
+        self.assertEqual(self.dictionary.get('b'), 2)
+        self.assertTrue(self.dictionary.is_loaded('b'))
+        self.assertEqual(self.calls, [2])
+
+        self.assertEqual(sorted(self.dictionary.values()), [1, 2, 3])
+        self.assertEqual(self.calls, [2, 3])
+
+    def test_load_all(self):
+        """Test loading all the remaining values at once"""
+        self.dictionary['b']
+        self.dictionary.load_all()
+        self.assertTrue(all(self.dictionary.is_loaded(key) for key in self.dictionary))
+        self.assertEqual(self.calls, [2, 3])
+        self.assertEqual(dict.__getitem__(self.dictionary, 'c'), 3)
+
+    def test_replace_value(self):
+        """Test that setting or deleting a key discards its loader"""
+        self.dictionary['b'] = 4
+        del self.dictionary['c']
+        self.assertEqual(dict(self.dictionary), {'a': 1, 'b': 4})
+        self.assertEqual(self.calls, [])
+
+    def test_pickle(self):
+        """Test that pickling gives a plain dictionary with all values loaded"""
+        dictionary = pickle.loads(pickle.dumps(self.dictionary))
+        self.assertIs(type(dictionary), dict)
+        self.assertEqual(dictionary, {'a': 1, 'b': 2, 'c': 3})
+
+
+class TestLoadCached(unittest.TestCase):
+    """
+    Contains unit tests of the binary cache of loaded databases.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_directory = os.path.join(self.directory, 'cache')
+        self.path = os.path.join(self.directory, 'data.txt')
+        with open(self.path, 'w') as f:
+            f.write('1')
+        self.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load(self, path):
+        self.calls += 1
+        with open(path) as f:
+            return {'value': int(f.read())}
+
+    def test_load_cached(self):
+        """Test that a loaded object is reused until its files change"""
+        self.assertEqual(load_cached(self.cache_directory, [self.path], self.load, self.path), {'value': 1})
+        self.assertEqual(len(os.listdir(self.cache_directory)), 1)
+        self.assertEqual(load_cached(self.cache_directory, [self.path], self.load, self.path), {'value': 1})
+        self.assertEqual(self.calls, 1)
+
+        with open(self.path, 'w') as f:
+            f.write('2')
+        self.assertEqual(load_cached(self.cache_directory, [self.path], self.load, self.path), {'value': 2})
+        self.assertEqual(self.calls, 2)
+
+    def test_load_without_cache(self):
+        """Test that the object is loaded every time if no cache directory is given"""
+        load_cached(None, [self.path], self.load, self.path)
+        load_cached(None, [self.path], self.load, self.path)
+        self.assertEqual(self.calls, 2)
+        self.assertFalse(os.path.exists(self.cache_directory))
+
+    def test_corrupt_cache_file(self):
+        """Test that an unreadable cache file is replaced"""
+        load_cached(self.cache_directory, [self.path], self.load, self.path)
+        cache_file = os.path.join(self.cache_directory, os.listdir(self.cache_directory)[0])
+        with open(cache_file, 'wb') as f:
+            f.write(b'not a pickle')
+        self.assertEqual(load_cached(self.cache_directory, [self.path], self.load, self.path), {'value': 1})
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(load_cached(self.cache_directory, [self.path], self.load, self.path), {'value': 1})
+        self.assertEqual(self.calls, 2)
+
+
 ################################################################################
 
 if __name__ == '__main__':
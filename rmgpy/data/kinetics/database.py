@@ -36,7 +36,7 @@ from copy import deepcopy
 import numpy as np
 
 import rmgpy.constants as constants
-from rmgpy.data.base import LogicNode
+from rmgpy.data.base import LazyDict, LogicNode, load_cached
 from rmgpy.data.kinetics.common import ensure_species, generate_molecule_combos, \
                                        find_degenerate_reactions, ensure_independent_atom_ids
 from rmgpy.data.kinetics.family import KineticsFamily
@@ -83,6 +83,8 @@ class KineticsDatabase(object):
             'ArrheniusBM': ArrheniusBM
         }
         self.global_context = {}
+        self.template_sizes = {}
+        self.family_preparation = None
 
     def __reduce__(self):
         """
@@ -103,14 +105,19 @@ class KineticsDatabase(object):
         self.libraries = d['libraries']
         self.library_order = d['library_order']
 
-    def load(self, path, families=None, libraries=None, depositories=None):
+    def load(self, path, families=None, libraries=None, depositories=None, cache_directory=None):
         """
         Load the kinetics database from the given `path` on disk, where `path`
         points to the top-level folder of the families database.
+
+        Families and libraries are loaded on first access. If a
+        `cache_directory` is given, each of them is cached there in binary
+        form after it is first loaded, and read from the cache afterwards for
+        as long as its files are unchanged.
         """
         self.load_recommended_families(os.path.join(path, 'families', 'recommended.py')),
-        self.load_families(os.path.join(path, 'families'), families, depositories)
-        self.load_libraries(os.path.join(path, 'libraries'), libraries)
+        self.load_families(os.path.join(path, 'families'), families, depositories, cache_directory)
+        self.load_libraries(os.path.join(path, 'libraries'), libraries, cache_directory)
 
     def load_recommended_families(self, filepath):
         """
@@ -145,7 +152,7 @@ class KineticsDatabase(object):
                                          for name, value in rec.__dict__.items()
                                          if not name.startswith('_')}
 
-    def load_families(self, path, families=None, depositories=None):
+    def load_families(self, path, families=None, depositories=None, cache_directory=None):
         """
         Load the kinetics families from the given `path` on disk, where `path`
         points to the top-level folder of the kinetics families.
@@ -158,6 +165,12 @@ class KineticsDatabase(object):
 
         If all items begin with a `!` (e.g. ['!H_Abstraction']), then the
         selection will be inverted to families NOT in the list.
+
+        The selected families are only loaded when first accessed, using the
+        binary cache in `cache_directory` if given. The numbers of reactants
+        and products in the template of each family are available from
+        :attr:`template_sizes`, which reads them from the cache without
+        loading the family.
         """
         dirs = os.listdir(path)
         all_families = set([item for item in dirs if os.path.isdir(os.path.join(path, item))])  # Only keep folders
@@ -207,35 +220,101 @@ class KineticsDatabase(object):
         # Sort alphabetically for consistency, this also converts to a list
         selected_families = sorted(selected_families)
 
-        # Now we know what families to load, so let's load them
-        self.families = {}
+        # Now we know what families to load, so let's load them when needed
+        self.families = LazyDict()
+        self.template_sizes = LazyDict()
         for label in selected_families:
-            family_path = os.path.join(path, label)
-            family = KineticsFamily(label=label)
-            try:
-                family.load(family_path, self.local_context, self.global_context, depository_labels=depositories)
-            except:
-                logging.error("Error when loading reaction family {!r}".format(family_path))
-                raise
-            self.families[label] = family
+            self.families.set_loader(label, self.load_family, os.path.join(path, label), depositories,
+                                     cache_directory)
+            self.template_sizes.set_loader(label, self.load_template_size, os.path.join(path, label),
+                                           cache_directory)
+
+    def prepare_families(self, function, key=None):
+        """
+        Call ``function(family)`` on each kinetics family before it is first
+        used, for instance to add the rate rules from its training set.
+        Families that are already loaded are prepared right away, and a
+        `function` of ``None`` stops preparing the families loaded later.
+
+        If the families are cached, the prepared families are cached as well
+        when a `key` is given. The `key` is a plain value that must change
+        whenever anything `function` depends on besides the family files
+        changes. Without a `key`, the families are prepared again each time
+        they are loaded.
+        """
+        self.family_preparation = (function, key) if function is not None else None
+        if function is not None:
+            for label in self.families:
+                if not isinstance(self.families, LazyDict) or self.families.is_loaded(label):
+                    function(self.families[label])
+
+    def load_family(self, path, depositories=None, cache_directory=None):
+        """
+        Load and return the kinetics family in the folder at `path` on disk,
+        reading it from the binary cache in `cache_directory` if given. The
+        family is prepared as set by :meth:`prepare_families`.
+        """
+        if self.family_preparation is None:
+            return load_cached(cache_directory, self._get_family_files(path), self._load_family, path, depositories)
+        function, key = self.family_preparation
+        if key is None:
+            family = load_cached(cache_directory, self._get_family_files(path), self._load_family, path, depositories)
+            function(family)
+            return family
+        return load_cached(cache_directory, self._get_family_files(path), self._load_prepared_family,
+                           path, depositories, cache_directory, key)
+
+    def _get_family_files(self, path):
+        return [os.path.join(root, f) for root, dirs, files in os.walk(path)
+                for f in files if not f.endswith('.pyc')]
+
+    def _load_prepared_family(self, path, depositories, cache_directory, key):
+        family = load_cached(cache_directory, self._get_family_files(path), self._load_family, path, depositories)
+        self.family_preparation[0](family)
+        return family
+
+    def load_template_size(self, path, cache_directory=None):
+        """
+        Return the numbers of reactants and products in the forward template
+        of the kinetics family in the folder at `path` on disk. These are
+        kept in the binary cache in `cache_directory` if given, so that the
+        family only has to be loaded the first time.
+        """
+        return load_cached(cache_directory, self._get_family_files(path), self._load_template_size,
+                           os.path.basename(path))
+
+    def _load_template_size(self, label):
+        family = self.families[label]
+        return len(family.forward_template.reactants), len(family.forward_template.products)
+
+    def _load_family(self, path, depositories):
+        family = KineticsFamily(label=os.path.basename(path))
+        try:
+            family.load(path, self.local_context, self.global_context, depository_labels=depositories)
+        except:
+            logging.error("Error when loading reaction family {!r}".format(path))
+            raise
+        return family
 
-    def load_libraries(self, path, libraries=None):
+    def load_libraries(self, path, libraries=None, cache_directory=None):
         """
         Load the listed kinetics libraries from the given `path` on disk.
         
         Loads them all if `libraries` list is not specified or `None`.
         The `path` points to the folder of kinetics libraries in the database,
         and the libraries should be in files like :file:`<path>/<library>.py`.
+        The libraries are only loaded when first accessed, using the binary
+        cache in `cache_directory` if given.
         """
+        if not isinstance(self.libraries, LazyDict):
+            self.libraries = LazyDict(self.libraries)
 
         if libraries is not None:
             for library_name in libraries:
                 library_file = os.path.join(path, library_name, 'reactions.py')
                 if os.path.exists(library_file):
-                    logging.info('Loading kinetics library {0} from {1}...'.format(library_name, library_file))
-                    library = KineticsLibrary(label=library_name)
-                    library.load(library_file, self.local_context, self.global_context)
-                    self.libraries[library.label] = library
+                    self.libraries.set_loader(library_name, self.load_library, library_file, library_name,
+                                              cache_directory)
                 else:
                     if library_name == "KlippensteinH2O2":
                         logging.info("""\n** Note: The KlippensteinH2O2 library was replaced and is no longer available in RMG.
@@ -253,15 +332,56 @@ library instead, depending on the main bath gas (N2 or Ar/He, respectively)\n"""
                     if ext.lower() == '.py':
                         library_file = os.path.join(root, f)
                         label = os.path.dirname(library_file)[len(path) + 1:]
-                        logging.info('Loading kinetics library {0} from {1}...'.format(label, library_file))
-                        library = KineticsLibrary(label=label)
-                        try:
-                            library.load(library_file, self.local_context, self.global_context)
-                        except:
-                            logging.error("Problem loading reaction library {0!r}".format(library_file))
-                            raise
-                        self.libraries[library.label] = library
-                        self.library_order.append((library.label, 'Reaction Library'))
+                        self.libraries.set_loader(label, self.load_library, library_file, label, cache_directory)
+                        self.library_order.append((label, 'Reaction Library'))
+
+    def load_library(self, path, label, cache_directory=None):
+        """
+        Load and return the kinetics library with the given `label` from the
+        file at `path` on disk, reading it from the binary cache in
+        `cache_directory` if given.
+        """
+        paths = [path]
+        dictionary_path = os.path.join(os.path.dirname(path), 'dictionary.txt')
+        if os.path.exists(dictionary_path):
+            paths.append(dictionary_path)
+        return load_cached(cache_directory, paths, self._load_library, path, label)
+
+    def _load_library(self, path, label):
+        logging.info('Loading kinetics library {0} from {1}...'.format(label, path))
+        library = KineticsLibrary(label=label)
+        try:
+            library.load(path, self.local_context, self.global_context)
+        except:
+            logging.error("Problem loading reaction library {0!r}".format(path))
+            raise
+        return library
+
+    def prune_elements(self, elements, family_elements=None):
+        """
+        Remove the parts of the database that cannot apply to species made up
+        only of the given `elements`, a set of element symbols: the families
+        whose templates require other elements, the branches of the group
+        trees of the remaining families that do, and the library reactions
+        involving species with other elements. Families are checked against
+        `family_elements` instead if given. Returns the lists of removed
+        families and entries.
+        """
+        if family_elements is None:
+            family_elements = elements
+        removed_families = []
+        removed_entries = []
+        for label, family in list(self.families.items()):
+            if family.can_react_elements(family_elements):
+                removed_entries.extend(family.groups.prune_elements(family_elements))
+            else:
+                removed_families.append(family)
+                del self.families[label]
+                if label in self.template_sizes:
+                    del self.template_sizes[label]
+        for library in self.libraries.values():
+            removed_entries.extend(library.prune_elements(elements))
+        return removed_families, removed_entries
 
     def save(self, path):
         """
@@ -55,6 +55,7 @@ from rmgpy.data.kinetics.groups import KineticsGroups
 from rmgpy.data.kinetics.rules import KineticsRules
 from rmgpy.exceptions import ActionError, DatabaseError, InvalidActionError, KekulizationError, KineticsError, \
                              ForbiddenStructureException, UndeterminableKineticsError
+from rmgpy.instrumentation import timed
 from rmgpy.kinetics import Arrhenius, SurfaceArrhenius, SurfaceArrheniusBEP, StickingCoefficient, \
                            StickingCoefficientBEP, ArrheniusBM
 from rmgpy.kinetics.uncertainties import RateUncertainty, rank_accuracy_map
@@ -1600,6 +1601,18 @@ class KineticsFamily(Database):
 
         return False
 
+    def can_react_elements(self, elements):
+        """
+        Return ``True`` if the family can react species made up only of the
+        given `elements`, a set of element symbols, in either direction, or
+        ``False`` if its templates require some other element.
+        """
+        templates = [self.forward_template]
+        if not self.own_reverse and self.reversible and self.reverse_template is not None:
+            templates.append(self.reverse_template)
+        return any(all(self.groups.can_match_elements(entry.item, elements) for entry in template.reactants)
+                   for template in templates)
+
     def _create_reaction(self, reactants, products, is_forward):
         """
         Create and return a new :class:`Reaction` object containing the
@@ -1662,6 +1675,7 @@ class KineticsFamily(Database):
         else:
             raise NotImplementedError("Not expecting template of type {}".format(type(struct)))
 
+    @timed('family matching')
     def generate_reactions(self, reactants, products=None, prod_resonance=True):
         """
         Generate all reactions between the provided list of one, two, or three
@@ -657,6 +657,17 @@ multiplicity 2
         self.assertEqual(out, [])
 
 
+    def test_can_react_elements(self):
+        """
+        Tests that families are only reactive for elements their templates can match
+        """
+        for label, family in self.database.families.items():
+            self.assertEqual(family.can_react_elements({'C', 'H', 'O'}), label != 'intra_substitutionS_isomerization')
+        family = self.database.families['intra_substitutionS_isomerization']
+        self.assertTrue(family.can_react_elements({'C', 'H', 'S'}))
+        self.assertFalse(family.can_react_elements({'C', 'H', 'N', 'O', 'Si'}))
+
+
 class TestTreeGeneration(unittest.TestCase):
 
     @classmethod
@@ -844,6 +855,13 @@ class TestGenerateReactions(unittest.TestCase):
         import rmgpy.data.rmg
         rmgpy.data.rmg.database = None
 
+    def test_can_react_elements_surface(self):
+        """Test that surface families need surface sites to react"""
+        for label in ['Surface_Adsorption_Dissociative', 'Surface_Dissociation_vdW']:
+            family = self.database.kinetics.families[label]
+            self.assertFalse(family.can_react_elements({'C', 'H', 'O'}))
+            self.assertTrue(family.can_react_elements({'C', 'H', 'O', 'X'}))
+
     @mock.patch('rmgpy.data.kinetics.family.logging')
     def test_debug_forbidden_reverse_rxn(self, mock_logging):
         """Test that we can automatically debug when a reverse reaction is forbidden."""
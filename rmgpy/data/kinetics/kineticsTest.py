@@ -29,6 +29,8 @@
 ###############################################################################
 
 import os
+import shutil
+import tempfile
 import unittest
 
 import numpy as np
@@ -36,7 +38,7 @@ import numpy as np
 from external.wip import work_in_progress
 from rmgpy import settings
 from rmgpy.chemkin import load_chemkin_file
-from rmgpy.data.base import Entry, DatabaseError, ForbiddenStructures
+from rmgpy.data.base import Entry, DatabaseError, ForbiddenStructures, LazyDict, LogicNode
 from rmgpy.data.kinetics.common import save_entry, find_degenerate_reactions, ensure_independent_atom_ids
 from rmgpy.data.kinetics.database import KineticsDatabase
 from rmgpy.data.kinetics.family import TemplateReaction
@@ -149,6 +151,217 @@ class TestKineticsDatabase(unittest.TestCase):
             self.fail("Unable to load families using list ['H_Abstraction', 'pah']")
 
 
+    def test_load_cached_database(self):
+        """Test that the testing database is the same when loaded again from its binary cache"""
+        path = os.path.join(settings['test_data.directory'], 'testing_database')
+        cache_directory = tempfile.mkdtemp()
+        try:
+            descriptions = []
+            for i in range(2):
+                database = RMGDatabase()
+                database.load(path, thermo_libraries=['primaryThermoLibrary'], reaction_libraries=['GRI-Mech3.0'],
+                              kinetics_families='all', testing=True, depository=False, solvation=False,
+                              cache_directory=cache_directory)
+                self.assertFalse(any(database.kinetics.families.is_loaded(label)
+                                     for label in database.kinetics.families))
+                descriptions.append(self.describe_database(database))
+                if i == 0:
+                    cache_files = sorted(os.listdir(cache_directory))
+                    self.assertTrue(cache_files)
+            # The second database is read from the cache files written while loading the first
+            self.assertEqual(sorted(os.listdir(cache_directory)), cache_files)
+            self.assertEqual(descriptions[1], descriptions[0])
+            self.assertEqual(len(descriptions[0]['families']), 16)
+        finally:
+            shutil.rmtree(cache_directory)
+
+    def describe_database(self, database):
+        """
+        Return the family templates, group trees and library entries of
+        `database` as plain values that can be compared.
+        """
+        def describe_groups(groups):
+            return {label: (str(entry.item) if isinstance(entry.item, LogicNode) else entry.item.to_adjacency_list(),
+                            entry.parent.label if entry.parent else None,
+                            [child.label for child in entry.children],
+                            repr(entry.data))
+                    for label, entry in groups.entries.items()}
+
+        families = {}
+        for label, family in database.kinetics.families.items():
+            families[label] = ([entry.label for entry in family.forward_template.reactants],
+                               [entry.label for entry in family.forward_template.products],
+                               family.reversible, str(family.forward_recipe.actions),
+                               describe_groups(family.groups),
+                               {rule: [repr(entry.data) for entry in entries]
+                                for rule, entries in family.rules.entries.items()},
+                               [{index: (str(entry.item), repr(entry.data)) for index, entry in depository.entries.items()}
+                                for depository in family.depositories])
+        return {
+            'families': families,
+            'kinetics libraries': {label: {index: (str(entry.item), repr(entry.item.kinetics), repr(entry.data))
+                                           for index, entry in library.entries.items()}
+                                   for label, library in database.kinetics.libraries.items()},
+            'thermo groups': {label: describe_groups(groups) for label, groups in database.thermo.groups.items()},
+            'thermo libraries': {label: {name: (entry.item.to_adjacency_list(), repr(entry.data))
+                                         for name, entry in library.entries.items()}
+                                 for label, library in database.thermo.libraries.items()},
+        }
+
+    def test_template_sizes(self):
+        """Test that the template sizes are read from the cache without loading the families"""
+        path = os.path.join(settings['test_data.directory'], 'testing_database', 'kinetics', 'families')
+        cache_directory = tempfile.mkdtemp()
+        try:
+            for i in range(2):
+                database = KineticsDatabase()
+                database.load_families(path, families=['R_Recombination', 'H_Abstraction'],
+                                       cache_directory=cache_directory)
+                self.assertIsInstance(database.template_sizes, LazyDict)
+                self.assertEqual(database.template_sizes['R_Recombination'], (1, 1))
+                self.assertEqual(database.template_sizes['H_Abstraction'], (2, 2))
+                # The families only have to be loaded while the cache is being written
+                self.assertEqual(database.families.is_loaded('H_Abstraction'), i == 0)
+        finally:
+            shutil.rmtree(cache_directory)
+
+    def test_prepare_families(self):
+        """Test that the families are prepared when first loaded and cached once prepared"""
+        path = os.path.join(settings['test_data.directory'], 'testing_database', 'kinetics', 'families')
+        prepared = []
+
+        def prepare(family):
+            prepared.append(family.label)
+            family.prepared = True
+
+        cache_directory = tempfile.mkdtemp()
+        try:
+            database = KineticsDatabase()
+            database.load_families(path, families=['R_Recombination', 'H_Abstraction'],
+                                   cache_directory=cache_directory)
+            family = database.families['R_Recombination']
+            database.prepare_families(prepare, 'key')
+            # Families that are already loaded are prepared right away
+            self.assertEqual(prepared, ['R_Recombination'])
+            self.assertTrue(database.families['H_Abstraction'].prepared)
+            self.assertEqual(prepared, ['R_Recombination', 'H_Abstraction'])
+
+            # The prepared family is read from the cache when the key is unchanged
+            database = KineticsDatabase()
+            database.load_families(path, families=['H_Abstraction'], cache_directory=cache_directory)
+            database.prepare_families(prepare, 'key')
+            self.assertTrue(database.families['H_Abstraction'].prepared)
+            self.assertEqual(prepared, ['R_Recombination', 'H_Abstraction'])
+
+            # It is prepared again with a different key or without a key
+            for key in ['other key', None]:
+                database = KineticsDatabase()
+                database.load_families(path, families=['H_Abstraction'], cache_directory=cache_directory)
+                database.prepare_families(prepare, key)
+                self.assertTrue(database.families['H_Abstraction'].prepared)
+            self.assertEqual(prepared, ['R_Recombination', 'H_Abstraction', 'H_Abstraction', 'H_Abstraction'])
+
+            # No longer prepare the families loaded afterwards
+            database.prepare_families(None)
+            database.load_families(path, families=['H_Abstraction'], cache_directory=cache_directory)
+            self.assertFalse(hasattr(database.families['H_Abstraction'], 'prepared'))
+        finally:
+            shutil.rmtree(cache_directory)
+
+
+    def test_prune_elements(self):
+        """Test pruning the testing database to the elements C, H and O"""
+        database = RMGDatabase()
+        database.load(os.path.join(settings['test_data.directory'], 'testing_database'),
+                      thermo_libraries=['primaryThermoLibrary'], reaction_libraries=['GRI-Mech3.0'],
+                      kinetics_families='all', depository=False)
+        families = set(database.kinetics.families)
+        groups = {label: set(family.groups.entries) for label, family in database.kinetics.families.items()}
+        num_thermo_groups = len(database.thermo.groups['group'].entries)
+        reactions = self.generate_reactions(database)
+
+        removed_families, removed_entries = database.prune_elements({'C', 'H', 'O', 'N', 'Ar', 'He', 'Ne'},
+                                                                    family_elements={'C', 'H', 'O'})
+        removed = ['Surface_Adsorption_Dissociative', 'Surface_Dissociation_vdW', 'intra_substitutionS_isomerization']
+        self.assertEqual(sorted(family.label for family in removed_families), removed)
+        self.assertEqual(families - set(database.kinetics.families), set(removed))
+
+        # The branches of the group trees for other elements are removed
+        removed_groups = {label: groups[label] - set(family.groups.entries)
+                          for label, family in database.kinetics.families.items()}
+        self.assertEqual(removed_groups['H_Abstraction'],
+                         {'NH_singlet_H', 'NH_triplet_H', 'N_atom_doublet', 'N_atom_quartet'})
+        self.assertEqual(removed_groups['Singlet_Val6_to_triplet'], {'S2', 'SO'})
+        self.assertEqual(removed_groups['1,2_shiftC'],
+                         {'CsJ-CdSs', 'CsJ-CsSs', 'CsJ-OneDeSs', 'CsJ-SsH', 'CsJ-SsSs'})
+        self.assertTrue(all('S' in label for label in removed_groups['R_Addition_COm']))
+        self.assertFalse(removed_groups['intra_H_migration'])
+        for label, family in database.kinetics.families.items():
+            for entry in family.groups.entries.values():
+                self.assertTrue(entry.parent is None or entry.parent.label in family.groups.entries)
+                self.assertTrue(all(child.label in family.groups.entries for child in entry.children))
+        removed_labels = set(entry.label for entry in removed_entries)
+        self.assertTrue(set.union(*removed_groups.values()) <= removed_labels)
+
+        # Nitrogen is kept outside the kinetics families, and the library only has C, H and O
+        thermo_groups = database.thermo.groups['group'].entries
+        self.assertLess(len(thermo_groups), num_thermo_groups)
+        self.assertIn('N3s-CsHH', thermo_groups)
+        self.assertNotIn('S', thermo_groups)
+        self.assertNotIn('Si', thermo_groups)
+        self.assertEqual(len(database.kinetics.libraries['GRI-Mech3.0'].entries), 199)
+
+        # The remaining families generate the same reactions for species of these elements
+        self.assertEqual(self.generate_reactions(database), reactions)
+
+        # Pruning the kinetics database alone uses the same elements for the families by default
+        removed_families, removed_entries = database.kinetics.prune_elements({'C', 'H'})
+        self.assertEqual(sorted(family.label for family in removed_families),
+                         ['Baeyer-Villiger_step1_cat', 'R_Addition_COm', 'Singlet_Val6_to_triplet'])
+        library = database.kinetics.libraries['GRI-Mech3.0']
+        self.assertTrue(0 < len(library.entries) < 199)
+        self.assertTrue(all(atom.symbol in ('C', 'H') for entry in library.entries.values()
+                            for spec in entry.item.reactants + entry.item.products for atom in spec.molecule[0].atoms))
+
+    def test_prune_elements_prepares_families(self):
+        """Test that the families are prepared with the whole thermo database before it is pruned"""
+        cache_directory = tempfile.mkdtemp()
+        try:
+            database = RMGDatabase()
+            database.load(os.path.join(settings['test_data.directory'], 'testing_database'),
+                          thermo_libraries=['primaryThermoLibrary'], reaction_libraries=['GRI-Mech3.0'],
+                          kinetics_families='all', depository=False, cache_directory=cache_directory)
+            num_thermo_groups = len(database.thermo.groups['group'].entries)
+            thermo_groups = {}
+
+            def prepare(family):
+                thermo_groups[family.label] = len(database.thermo.groups['group'].entries)
+
+            database.kinetics.prepare_families(prepare, 'key')
+            self.assertFalse(thermo_groups)
+            database.prune_elements({'C', 'H', 'O', 'N', 'Ar', 'He', 'Ne'}, family_elements={'C', 'H', 'O'})
+            self.assertEqual(len(thermo_groups), 16)
+            self.assertEqual(set(thermo_groups.values()), {num_thermo_groups})
+            self.assertLess(len(database.thermo.groups['group'].entries), num_thermo_groups)
+        finally:
+            shutil.rmtree(cache_directory)
+
+    def generate_reactions(self, database):
+        """
+        Return the reactions that the kinetics families of `database`
+        generate for a few species made up of C, H and O, as strings.
+        """
+        species = [Species().from_smiles(smiles) for smiles in ['CCC', 'C=CC', 'CCO', '[CH2]CC', 'OO', '[O]O']]
+        reactions = []
+        for i, spc1 in enumerate(species):
+            reactions.append(sorted(str(reaction) for reaction in
+                                    database.kinetics.generate_reactions_from_families([spc1])))
+            for spc2 in species[i:]:
+                reactions.append(sorted(str(reaction) for reaction in
+                                        database.kinetics.generate_reactions_from_families([spc1, spc2])))
+        return reactions
+
+
 class TestReactionDegeneracy(unittest.TestCase):
 
     @classmethod
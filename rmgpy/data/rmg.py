@@ -36,7 +36,7 @@ for working with the RMG database.
 import logging
 import os.path
 
-from rmgpy.data.base import ForbiddenStructures
+from rmgpy.data.base import ForbiddenStructures, LazyDict
 from rmgpy.data.kinetics.database import KineticsDatabase
 from rmgpy.data.solvation import SolvationDatabase
 from rmgpy.data.statmech import StatmechDatabase
@@ -81,7 +81,8 @@ class RMGDatabase(object):
              statmech_libraries=None,
              depository=True,
              solvation=True,
-             testing=False):
+             testing=False,
+             cache_directory=None):
         """
         Load the RMG database from the given `path` on disk, where `path`
         points to the top-level folder of the RMG database. If none of the
@@ -90,8 +91,13 @@ class RMGDatabase(object):
         components of the database be loaded.
 
         Argument testing will load a lighter version of the database used for unit-tests
+
+        If a `cache_directory` is given, the thermo libraries and groups and
+        the kinetics families and libraries are cached there in binary form,
+        which makes loading them again much faster as long as their files are
+        unchanged.
         """
-        self.load_thermo(os.path.join(path, 'thermo'), thermo_libraries, depository)
+        self.load_thermo(os.path.join(path, 'thermo'), thermo_libraries, depository, cache_directory)
         if not testing:
             self.load_transport(os.path.join(path, 'transport'), transport_libraries)
             self.load_forbidden_structures(os.path.join(path, 'forbiddenStructures.py'))
@@ -99,7 +105,8 @@ class RMGDatabase(object):
                            reaction_libraries,
                            seed_mechanisms,
                            kinetics_families,
-                           kinetics_depositories
+                           kinetics_depositories,
+                           cache_directory
                            )
         if not testing:
             self.load_statmech(os.path.join(path, 'statmech'), statmech_libraries, depository)
@@ -107,13 +114,13 @@ class RMGDatabase(object):
         if solvation:
             self.load_solvation(os.path.join(path, 'solvation'))
 
-    def load_thermo(self, path, thermo_libraries=None, depository=True):
+    def load_thermo(self, path, thermo_libraries=None, depository=True, cache_directory=None):
         """
         Load the RMG thermo database from the given `path` on disk, where
         `path` points to the top-level folder of the RMG thermo database.
         """
         self.thermo = ThermoDatabase()
-        self.thermo.load(path, thermo_libraries, depository)
+        self.thermo.load(path, thermo_libraries, depository, cache_directory)
 
     def load_transport(self, path, transport_libraries=None):
         """
@@ -139,7 +146,8 @@ class RMGDatabase(object):
                       reaction_libraries=None,
                       seed_mechanisms=None,
                       kinetics_families=None,
-                      kinetics_depositories=None
+                      kinetics_depositories=None,
+                      cache_directory=None
                       ):
         """
         Load the RMG kinetics database from the given `path` on disk, where
@@ -163,7 +171,8 @@ class RMGDatabase(object):
         self.kinetics.load(path,
                            families=kinetics_families,
                            libraries=kinetics_libraries,
-                           depositories=kinetics_depositories
+                           depositories=kinetics_depositories,
+                           cache_directory=cache_directory
                            )
 
     def load_solvation(self, path):
@@ -182,6 +191,45 @@ class RMGDatabase(object):
         self.statmech = StatmechDatabase()
         self.statmech.load(path, statmech_libraries, depository)
 
+    def prune_elements(self, elements, family_elements=None):
+        """
+        Remove the parts of the database that cannot apply to species made up
+        only of the given `elements`, a set of element symbols: the kinetics
+        families whose templates require other elements, the branches of the
+        kinetics, thermo, transport and solute group trees that do, and the
+        library and depository entries involving other elements. Kinetics
+        families are checked against `family_elements` instead if given.
+        The solvent library is left alone, as the solvent is not one of the
+        species in the model. Returns the lists of removed kinetics families
+        and entries.
+        """
+        # Kinetics families may be prepared when first loaded using the thermo database, for the training
+        # reactions, so they are loaded before the thermo groups and libraries are pruned
+        if self.kinetics is not None and isinstance(self.kinetics.families, LazyDict):
+            self.kinetics.families.load_all()
+
+        databases = []
+        if self.thermo is not None:
+            databases.extend(self.thermo.depository.values())
+            databases.extend(self.thermo.libraries.values())
+            databases.extend(self.thermo.groups.values())
+        if self.transport is not None:
+            databases.extend(self.transport.libraries.values())
+            databases.extend(self.transport.groups.values())
+        if self.solvation is not None:
+            databases.append(self.solvation.libraries['solute'])
+            databases.extend(self.solvation.groups.values())
+
+        removed_families = []
+        removed_entries = []
+        for database in databases:
+            removed_entries.extend(database.prune_elements(elements))
+        if self.kinetics is not None:
+            families, entries = self.kinetics.prune_elements(elements, family_elements)
+            removed_families.extend(families)
+            removed_entries.extend(entries)
+        return removed_families, removed_entries
+
     def load_old(self, path):
         """
         Load the old RMG database from the given `path` on disk, where `path`
@@ -28,8 +28,11 @@
 #                                                                             #
 ###############################################################################
 
+import hashlib
 import logging
 import os.path
+import pickle
+from copy import deepcopy
 
 import numpy as np
 
@@ -484,6 +487,7 @@ class StatmechDatabase(object):
             'GroupFrequencies': GroupFrequencies,
         }
         self.global_context = {}
+        self.cache = {}
 
     def __reduce__(self):
         """
@@ -505,6 +509,7 @@ class StatmechDatabase(object):
         self.libraries = d['libraries']
         self.groups = d['groups']
         self.library_order = d['library_order']
+        self.cache = {}
 
     def load(self, path, libraries=None, depository=True):
         """
@@ -664,8 +669,15 @@ class StatmechDatabase(object):
         Return the thermodynamic parameters for a given :class:`Molecule`
         object `molecule`. This function first searches the loaded libraries
         in order, returning the first match found, before falling back to
-        estimation via group additivity.
+        estimation via group additivity. Results are cached on the database
+        for structures (and heat capacities) that have been seen before.
         """
+        key = self.get_cache_key(molecule, thermo_model)
+        if key is not None:
+            for cached_molecule, conformer in self.cache.get(key, []):
+                if molecule.is_isomorphic(cached_molecule):
+                    return deepcopy(conformer)
+
         logging.debug('Retrieving stat mech data for {}.'.format(molecule.to_smiles()))
         statmech_model = None
         # Check the libraries in order first; return the first successful match
@@ -676,8 +688,69 @@ class StatmechDatabase(object):
         else:
             # Thermo not found in any loaded libraries, so estimate
             statmech_model = self.get_statmech_data_from_groups(molecule, thermo_model)
+
+        if key is not None:
+            self.cache.setdefault(key, []).append((molecule.copy(deep=True), deepcopy(statmech_model[0])))
         return statmech_model[0]
 
+    def get_cache_key(self, molecule, thermo_model=None):
+        """
+        Return the key used to cache the statmech data of `molecule`, which
+        combines its augmented InChI with the heat capacities of `thermo_model`
+        used to fit the internal modes. Returns ``None`` if the molecule cannot
+        be identified.
+        """
+        try:
+            identifier = molecule.to_augmented_inchi()
+        except Exception:
+            return None
+        if thermo_model is None:
+            return identifier, None
+        Tlist = np.arange(300.0, 1501.0, 100.0, np.float64)
+        return identifier, tuple(round(thermo_model.get_heat_capacity(T), 6) for T in Tlist)
+
+    def get_fingerprint(self):
+        """
+        Return a hash of the loaded libraries and groups, used to check that a
+        cache saved to disk was generated from the same database.
+        """
+        md5 = hashlib.md5()
+        md5.update(repr(self.library_order).encode())
+        for databases in (self.libraries, self.groups):
+            for name in sorted(databases):
+                md5.update(name.encode())
+                for label, entry in databases[name].entries.items():
+                    md5.update('{0}:{1!r}'.format(label, entry.data).encode())
+        return md5.hexdigest()
+
+    def save_cache(self, path):
+        """
+        Save the cached statmech data to the pickle file at `path` on disk so
+        that it can be reused by a later job with the same database.
+        """
+        with open(path, 'wb') as f:
+            pickle.dump({'fingerprint': self.get_fingerprint(), 'cache': self.cache}, f, pickle.HIGHEST_PROTOCOL)
+
+    def load_cache(self, path):
+        """
+        Load cached statmech data from the pickle file at `path` on disk,
+        previously written by :meth:`save_cache`. The file is ignored if it
+        does not exist or was generated from a different database.
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            logging.warning('Could not read statmech cache from {0}; ignoring it.'.format(path))
+            return
+        if data.get('fingerprint') != self.get_fingerprint():
+            logging.info('Statmech cache {0} was generated from a different database; ignoring it.'.format(path))
+            return
+        for key, items in data['cache'].items():
+            self.cache.setdefault(key, []).extend(items)
+
     def get_statmech_data_from_depository(self, molecule):
         """
         Return statmech data for the given :class:`Molecule` object `molecule`
@@ -44,7 +44,7 @@ import numpy as np
 import rmgpy.constants as constants
 import rmgpy.molecule
 import rmgpy.quantity
-from rmgpy.data.base import Database, Entry, make_logic_node, DatabaseError
+from rmgpy.data.base import Database, Entry, LazyDict, make_logic_node, load_cached, DatabaseError
 from rmgpy.ml.estimator import MLEstimator
 from rmgpy.molecule import Molecule, Bond, Group
 from rmgpy.species import Species
@@ -849,17 +849,22 @@ class ThermoDatabase(object):
         self.groups = d['groups']
         self.library_order = d['library_order']
 
-    def load(self, path, libraries=None, depository=True):
+    def load(self, path, libraries=None, depository=True, cache_directory=None):
         """
         Load the thermo database from the given `path` on disk, where `path`
         points to the top-level folder of the thermo database.
+
+        Libraries are loaded on first access. If a `cache_directory` is
+        given, the libraries and groups are cached there in binary form after
+        they are first loaded, and read from the cache afterwards for as long
+        as their files are unchanged.
         """
         if depository:
             self.load_depository(os.path.join(path, 'depository'))
         else:
             self.depository = {}
-        self.load_libraries(os.path.join(path, 'libraries'), libraries)
-        self.load_groups(os.path.join(path, 'groups'))
+        self.load_libraries(os.path.join(path, 'libraries'), libraries, cache_directory)
+        self.load_groups(os.path.join(path, 'groups'), cache_directory)
 
     def load_depository(self, path):
         """
@@ -873,37 +878,32 @@ class ThermoDatabase(object):
                                                self.local_context, self.global_context)
         }
 
-    def load_libraries(self, path, libraries=None):
+    def load_libraries(self, path, libraries=None, cache_directory=None):
         """
         Load the thermo database from the given `path` on disk, where `path`
         points to the top-level folder of the thermo database.
         
-        If no libraries are given, all are loaded.
+        If no libraries are given, all are loaded. The libraries are only
+        loaded when first accessed, using the binary cache in
+        `cache_directory` if given.
         """
-        self.libraries = {}
+        self.libraries = LazyDict()
         self.library_order = []
         if libraries is None:
             for (root, dirs, files) in os.walk(os.path.join(path)):
                 for f in files:
                     name, ext = os.path.splitext(f)
                     if ext.lower() == '.py':
-                        logging.info('Loading thermodynamics library from {0} in {1}...'.format(f, root))
-                        library = ThermoLibrary()
-                        library.load(os.path.join(root, f), self.local_context, self.global_context)
-                        library.label = os.path.splitext(f)[0]
-                        self.libraries[library.label] = library
-                        self.library_order.append(library.label)
+                        self.libraries.set_loader(name, self.load_library, os.path.join(root, f), cache_directory)
+                        self.library_order.append(name)
 
         else:
             for libraryName in libraries:
                 f = libraryName + '.py'
                 if os.path.exists(os.path.join(path, f)):
-                    logging.info('Loading thermodynamics library from {0} in {1}...'.format(f, path))
-                    library = ThermoLibrary()
-                    library.load(os.path.join(path, f), self.local_context, self.global_context)
-                    library.label = os.path.splitext(f)[0]
-                    self.libraries[library.label] = library
-                    self.library_order.append(library.label)
+                    self.libraries.set_loader(libraryName, self.load_library, os.path.join(path, f),
+                                              cache_directory)
+                    self.library_order.append(libraryName)
                 else:
                     if libraryName == "KlippensteinH2O2":
                         logging.info(
@@ -912,10 +912,28 @@ class ThermoDatabase(object):
                     raise DatabaseError('Library {} not found in {}... Please check if your library is '
                                         'correctly placed'.format(libraryName, path))
 
-    def load_groups(self, path):
+    def load_library(self, path, cache_directory=None):
+        """
+        Load and return the thermo library in the file at `path` on disk,
+        reading it from the binary cache in `cache_directory` if given.
+        """
+        return load_cached(cache_directory, [path], self._load_library, path)
+
+    def _load_library(self, path):
+        root, f = os.path.split(path)
+        logging.info('Loading thermodynamics library from {0} in {1}...'.format(f, root))
+        library = ThermoLibrary()
+        library.load(path, self.local_context, self.global_context)
+        library.label = os.path.splitext(f)[0]
+        return library
+
+    def load_groups(self, path, cache_directory=None):
         """
         Load the thermo database from the given `path` on disk, where `path`
         points to the top-level folder of the thermo database.
+
+        Each group database is read from the binary cache in
+        `cache_directory` if given.
         """
         logging.info('Loading thermodynamics group database from {0}...'.format(path))
         categories = [
@@ -929,14 +947,17 @@ class ThermoDatabase(object):
             'adsorptionPt',
         ]
         self.groups = {
-            category: ThermoGroups(label=category).load(os.path.join(path, category + '.py'),
-                                                        self.local_context, self.global_context)
+            category: load_cached(cache_directory, [os.path.join(path, category + '.py')], self._load_groups,
+                                  os.path.join(path, category + '.py'), category)
             for category in categories
         }
 
         self.record_ring_generic_nodes()
         self.record_polycylic_generic_nodes()
 
+    def _load_groups(self, path, label):
+        return ThermoGroups(label=label).load(path, self.local_context, self.global_context)
+
     def save(self, path):
         """
         Save the thermo database to the given `path` on disk, where `path`
@@ -32,6 +32,8 @@ import math
 import os
 import unittest
 
+import mock
+
 import rmgpy
 import rmgpy.constants as constants
 from external.wip import work_in_progress
@@ -94,6 +96,27 @@ class TestThermoDatabase(unittest.TestCase):
         s298_cp_path = os.path.join(models_path, 's298_cp')
         self.ml_estimator = MLEstimator(hf298_path, s298_cp_path)
 
+    def test_generate_thermo_data_list(self):
+        """
+        Test that generate_thermo_data_list() matches generate_thermo_data() for each species, and only returns
+        None for the species whose thermo data could not be estimated.
+        """
+        from rmgpy.thermo.thermoengine import estimate_thermo_data, generate_thermo_data, generate_thermo_data_list
+        species_list = [Species().from_smiles(smiles) for smiles in ['C', 'CC', 'C=CC=C']]
+        for spc in species_list:
+            spc.generate_resonance_structures()
+        missing = species_list[1]
+        with mock.patch('rmgpy.thermo.thermoengine.estimate_thermo_data',
+                        side_effect=lambda spc: None if spc is missing else estimate_thermo_data(spc)):
+            thermo_list = generate_thermo_data_list(species_list)
+        self.assertEqual(len(thermo_list), 3)
+        self.assertIsNone(thermo_list[1])
+        for spc, thermo in [(species_list[0], thermo_list[0]), (species_list[2], thermo_list[2])]:
+            expected = generate_thermo_data(spc)
+            for T in [300., 1000., 2000.]:
+                self.assertAlmostEqual(thermo.get_enthalpy(T) / expected.get_enthalpy(T), 1.0, 4)
+                self.assertAlmostEqual(thermo.get_entropy(T) / expected.get_entropy(T), 1.0, 4)
+
     def test_pickle(self):
         """
         Test that a ThermoDatabase object can be successfully pickled and
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+
+"""
+Lightweight, always-on instrumentation of the hot paths of an RMG job.
+
+Named timers accumulate the number of calls and the total wall time spent in
+a block of code, and named counters accumulate a number of events. A timer is
+used either as a context manager::
+
+    with Timer('thermo estimation'):
+        ...
+
+or as a decorator of a function, using :func:`timed`. Events counted in
+compiled code, where calling into Python would be too costly, are kept in C
+variables and made available through a probe registered with
+:func:`register_probe`, which returns the number of events so far.
+
+The statistics are cumulative over the job and are collected by
+:func:`get_statistics`. Only the work done in the main process is recorded;
+e.g. family matching done by worker processes during parallel reaction
+generation is not. Timers may be nested, in which case the time of the inner
+timer is also included in the outer one.
+"""
+
+from functools import wraps
+from time import perf_counter
+
+# The number of calls and the total time in s of each timer
+_calls = {}
+_times = {}
+# The number of events of each counter
+_counts = {}
+# The functions returning the number of events of each probe
+_probes = {}
+
+
+class Timer(object):
+    """
+    A context manager recording the time spent in its block under the timer
+    `name`.
+    """
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        add_time(self.name, perf_counter() - self.start)
+        return False
+
+
+def timed(name):
+    """
+    Return a decorator recording the time spent in the decorated function
+    under the timer `name`.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add_time(name, perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def add_time(name, seconds, calls=1):
+    """
+    Add `seconds` of wall time spent in `calls` calls to the timer `name`.
+    """
+    try:
+        _times[name] += seconds
+        _calls[name] += calls
+    except KeyError:
+        _times[name] = seconds
+        _calls[name] = calls
+
+
+def count(name, number=1):
+    """
+    Add `number` events to the counter `name`.
+    """
+    try:
+        _counts[name] += number
+    except KeyError:
+        _counts[name] = number
+
+
+def register_probe(name, function):
+    """
+    Register the `function` taking no arguments and returning the number of
+    events of the counter `name` so far.
+    """
+    _probes[name] = function
+
+
+def get_statistics():
+    """
+    Return a dictionary with the cumulative statistics of the job: the
+    ``'timers'`` dictionary mapping the name of each timer to a dictionary of
+    its number of ``'calls'`` and total ``'time'`` in s, and the
+    ``'counters'`` dictionary mapping the name of each counter to its number
+    of events.
+    """
+    counters = dict(_counts)
+    for name, function in _probes.items():
+        counters[name] = counters.get(name, 0) + function()
+    return {
+        'timers': {name: {'calls': _calls[name], 'time': _times[name]} for name in _times},
+        'counters': counters,
+    }
+
+
+def reset():
+    """
+    Clear the statistics of all timers and counters. The probes are kept, but
+    their counts are not reset.
+    """
+    _calls.clear()
+    _times.clear()
+    _counts.clear()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+
+"""
+This script contains unit tests of the :mod:`rmgpy.instrumentation` module.
+"""
+
+import unittest
+
+import rmgpy.instrumentation as instrumentation
+from rmgpy.instrumentation import Timer, timed
+
+
+################################################################################
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Contains unit tests of the instrumentation timers and counters.
+    """
+
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.reset()
+
+    def test_timer(self):
+        """
+        Test that a timer records the calls and time of its blocks and functions.
+        """
+        @timed('test timer')
+        def function(x):
+            return 2 * x
+
+        with Timer('test timer'):
+            self.assertEqual(function(1), 2)
+        self.assertEqual(function(2), 4)
+
+        timer = instrumentation.get_statistics()['timers']['test timer']
+        self.assertEqual(timer['calls'], 3)
+        self.assertGreater(timer['time'], 0.0)
+
+    def test_timer_exception(self):
+        """
+        Test that a timer records the time of a block raising an exception.
+        """
+        with self.assertRaises(ValueError):
+            with Timer('test timer'):
+                raise ValueError
+        self.assertEqual(instrumentation.get_statistics()['timers']['test timer']['calls'], 1)
+
+    def test_counters(self):
+        """
+        Test that counters and probes are reported together.
+        """
+        instrumentation.count('test counter')
+        instrumentation.count('test counter', 4)
+        instrumentation.register_probe('test probe', lambda: 7)
+        self.addCleanup(instrumentation._probes.pop, 'test probe')
+        counters = instrumentation.get_statistics()['counters']
+        self.assertEqual(counters['test counter'], 5)
+        self.assertEqual(counters['test probe'], 7)
+        instrumentation.reset()
+        counters = instrumentation.get_statistics()['counters']
+        self.assertNotIn('test counter', counters)
+        self.assertEqual(counters['test probe'], 7)
@@ -35,6 +35,7 @@ from scipy.optimize import curve_fit
 cimport rmgpy.constants as constants
 import rmgpy.quantity as quantity
 from rmgpy.exceptions import KineticsError
+from rmgpy.kinetics.model cimport broadcast_conditions
 from rmgpy.kinetics.uncertainties import rank_accuracy_map
 from rmgpy.molecule.molecule import Bond
 
@@ -134,6 +135,17 @@ cdef class Arrhenius(KineticsModel):
         T0 = self._T0.value_si
         return A * (T / T0) ** n * exp(-Ea / (constants.R * T))
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K. The pressures `Plist`
+        are only used to set the shape of the result.
+        """
+        cdef np.ndarray T
+        T, _, shape = broadcast_conditions(Tlist, Plist)
+        k = self._A.value_si * (T / self._T0.value_si) ** self._n.value_si * np.exp(-self._Ea.value_si / (constants.R * T))
+        return k.reshape(shape)
+
     cpdef change_t0(self, double T0):
         """
         Changes the reference temperature used in the exponent to `T0` in K,
@@ -786,6 +798,34 @@ cdef class PDepArrhenius(PDepKineticsModel):
             k = klow * 10 ** (log10(P / Plow) / log10(Phigh / Plow) * log10(khigh / klow))
         return k
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K and pressures `Plist` in
+        Pa. The bounding pressures for every point are located with a single
+        binary search over the pressure array.
+        """
+        cdef np.ndarray T, P, pressures, ilow, ihigh, K, klow, khigh, Plow, Phigh, k, interp
+        T, P, shape = broadcast_conditions(Tlist, Plist)
+        if np.any(P == 0):
+            raise ValueError('No pressure specified to pressure-dependent PDepArrhenius.get_rate_coefficients().')
+
+        pressures = self._pressures.value_si
+        ilow = np.maximum(np.searchsorted(pressures, P, side='right') - 1, 0)
+        ihigh = np.minimum(np.searchsorted(pressures, P, side='left'), pressures.shape[0] - 1)
+        Plow = pressures[ilow]
+        Phigh = pressures[ihigh]
+
+        K = np.array([arrh.get_rate_coefficients(T) for arrh in self.arrhenius])
+        klow = K[ilow, np.arange(T.shape[0])]
+        khigh = K[ihigh, np.arange(T.shape[0])]
+
+        k = klow.copy()
+        interp = (Plow != Phigh) & ((klow != 0) | (khigh != 0))
+        k[interp] = klow[interp] * 10 ** (np.log10(P[interp] / Plow[interp]) / np.log10(Phigh[interp] / Plow[interp])
+                                          * np.log10(khigh[interp] / klow[interp]))
+        return k.reshape(shape)
+
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K, str kunits, double T0=1):
         """
         Fit the pressure-dependent Arrhenius model to a matrix of rate
@@ -902,6 +942,19 @@ cdef class MultiArrhenius(KineticsModel):
             k += arrh.get_rate_coefficient(T)
         return k
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K.
+        """
+        cdef np.ndarray T, k
+        cdef Arrhenius arrh
+        T, _, shape = broadcast_conditions(Tlist, Plist)
+        k = np.zeros_like(T)
+        for arrh in self.arrhenius:
+            k += arrh.get_rate_coefficients(T)
+        return k.reshape(shape)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Returns ``True`` if kinetics matches that of another kinetics model.  Each duplicate
@@ -1029,6 +1082,22 @@ cdef class MultiPDepArrhenius(PDepKineticsModel):
 
         return k
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K and pressures `Plist` in Pa.
+        """
+        cdef np.ndarray T, P, k
+        cdef PDepArrhenius arrh
+        T, P, shape = broadcast_conditions(Tlist, Plist)
+        if np.any(P == 0):
+            raise ValueError('No pressure specified to pressure-dependent MultiPDepArrhenius.get_rate_coefficients().')
+
+        k = np.zeros_like(T)
+        for arrh in self.arrhenius:
+            k += arrh.get_rate_coefficients(T, P)
+        return k.reshape(shape)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Returns ``True`` if kinetics matches that of another kinetics model.  Each duplicate
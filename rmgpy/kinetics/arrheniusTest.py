@@ -132,6 +132,17 @@ class TestArrhenius(unittest.TestCase):
             kact = self.arrhenius.get_rate_coefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that Arrhenius.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000])
+        kexplist = np.array([self.arrhenius.get_rate_coefficient(T) for T in Tlist])
+        kactlist = self.arrhenius.get_rate_coefficients(Tlist)
+        self.assertEqual(kactlist.shape, Tlist.shape)
+        for kexp, kact in zip(kexplist, kactlist):
+            self.assertAlmostEqual(kexp, kact, delta=1e-10 * kexp)
+
     def test_change_t0(self):
         """
         Test the Arrhenius.change_t0() method.
@@ -519,6 +530,19 @@ class TestPDepArrhenius(unittest.TestCase):
             k1 = math.sqrt(self.arrhenius0.get_rate_coefficient(T) * self.arrhenius1.get_rate_coefficient(T))
             self.assertAlmostEqual(k0, k1, delta=1e-6 * k1)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that PDepArrhenius.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000])
+        Plist = np.array([1e3, 1e4, 3e4, 1e5, 1e6, 1e7])
+        Kact = self.kinetics.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(Kact.shape, (Tlist.shape[0], Plist.shape[0]))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.kinetics.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(Kact[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_fit_to_data(self):
         """
         Test the PDepArrhenius.fit_to_data() method.
@@ -704,6 +728,17 @@ class TestMultiArrhenius(unittest.TestCase):
             kact = self.kinetics.get_rate_coefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that MultiArrhenius.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000])
+        kexplist = np.array([self.kinetics.get_rate_coefficient(T) for T in Tlist])
+        kactlist = self.kinetics.get_rate_coefficients(Tlist)
+        self.assertEqual(kactlist.shape, Tlist.shape)
+        for kexp, kact in zip(kexplist, kactlist):
+            self.assertAlmostEqual(kexp, kact, delta=1e-10 * kexp)
+
     def test_pickle(self):
         """
         Test that a MultiArrhenius object can be pickled and unpickled with no loss
@@ -956,6 +991,19 @@ class TestMultiPDepArrhenius(unittest.TestCase):
                 kact = self.kinetics.get_rate_coefficient(Tlist[i], Plist[j])
                 self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that MultiPDepArrhenius.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000])
+        Plist = np.array([1e3, 1e4, 3e4, 1e5, 1e6, 1e7])
+        Kact = self.kinetics.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(Kact.shape, (Tlist.shape[0], Plist.shape[0]))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.kinetics.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(Kact[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_get_rate_coefficient_diff_plist(self):
         """
         Test the MultiPDepArrhenius.get_rate_coefficient() when plists are different.
@@ -47,6 +47,8 @@ cdef class Chebyshev(PDepKineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=?)
+
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K, str kunits,
         int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax)
 
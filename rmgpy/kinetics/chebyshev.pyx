@@ -35,6 +35,7 @@ from libc.math cimport log10
 
 import rmgpy.quantity as quantity
 from rmgpy.exceptions import KineticsError
+from rmgpy.kinetics.model cimport broadcast_conditions
 
 # Prior to numpy 1.14, `numpy.linalg.lstsq` does not accept None as a value
 RCOND = -1 if int(np.__version__.split('.')[1]) < 14 else None
@@ -174,6 +175,27 @@ cdef class Chebyshev(PDepKineticsModel):
                 k += coeffs[t, p] * self.chebyshev(t, Tred) * self.chebyshev(p, Pred)
         return 10.0 ** k
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K and pressures `Plist` in
+        Pa by evaluating the Chebyshev expression for all points at once.
+        """
+        cdef np.ndarray T, P, Tred, Pred
+        cdef double Tmin, Tmax, Pmin, Pmax
+        T, P, shape = broadcast_conditions(Tlist, Plist)
+
+        if np.any(P == 0):
+            raise ValueError('No pressure specified to pressure-dependent Chebyshev.get_rate_coefficients().')
+
+        Tmin = self._Tmin.value_si
+        Tmax = self._Tmax.value_si
+        Pmin = self._Pmin.value_si
+        Pmax = self._Pmax.value_si
+        Tred = (2.0 / T - 1.0 / Tmin - 1.0 / Tmax) / (1.0 / Tmax - 1.0 / Tmin)
+        Pred = (2.0 * np.log10(P) - log10(Pmin) - log10(Pmax)) / (log10(Pmax) - log10(Pmin))
+        return (10.0 ** np.polynomial.chebyshev.chebval2d(Tred, Pred, self._coeffs.value_si)).reshape(shape)
+
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K,
                     str kunits, int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax):
         """
@@ -140,6 +140,19 @@ class TestChebyshev(unittest.TestCase):
                 Kact = self.chebyshev.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact / Kexp[t, p], 1.0, 4, '{0} != {1} within 4 places'.format(Kexp[t, p], Kact))
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that Chebyshev.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([300, 500, 1000, 1500])
+        Plist = np.array([1e4, 3e4, 1e5, 1e6])
+        Kact = self.chebyshev.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(Kact.shape, (Tlist.shape[0], Plist.shape[0]))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.chebyshev.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(Kact[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_fit_to_data(self):
         """
         Test the Chebyshev.fit_to_data() method.
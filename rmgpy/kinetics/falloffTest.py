@@ -212,6 +212,19 @@ class TestThirdBody(unittest.TestCase):
                 Kact = self.thirdBody.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that ThirdBody.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([300, 500, 1000, 1500])
+        Plist = np.array([1e4, 3e4, 1e5, 1e6])
+        Kact = self.thirdBody.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(Kact.shape, (Tlist.shape[0], Plist.shape[0]))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.thirdBody.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(Kact[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_pickle(self):
         """
         Test that a ThirdBody object can be successfully pickled and
@@ -395,6 +408,19 @@ class TestLindemann(unittest.TestCase):
                 Kact = self.lindemann.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that Lindemann.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([300, 500, 1000, 1500])
+        Plist = np.array([1e4, 3e4, 1e5, 1e6])
+        Kact = self.lindemann.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(Kact.shape, (Tlist.shape[0], Plist.shape[0]))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.lindemann.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(Kact[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_pickle(self):
         """
         Test that a Lindemann object can be pickled and unpickled with no loss
@@ -626,6 +652,19 @@ class TestTroe(unittest.TestCase):
                 Kact = self.troe.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that Troe.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([300, 500, 1000, 1500])
+        Plist = np.array([1e4, 3e4, 1e5, 1e6])
+        Kact = self.troe.get_rate_coefficients(Tlist[:, np.newaxis], Plist[np.newaxis, :])
+        self.assertEqual(Kact.shape, (Tlist.shape[0], Plist.shape[0]))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                Kexp = self.troe.get_rate_coefficient(Tlist[t], Plist[p])
+                self.assertAlmostEqual(Kact[t, p], Kexp, delta=1e-10 * Kexp)
+
     def test_pickle(self):
         """
         Test that a Troe object can be pickled and unpickled with no loss of
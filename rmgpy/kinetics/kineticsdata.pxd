@@ -39,6 +39,8 @@ cdef class KineticsData(KineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=?)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2
 
 ################################################################################
@@ -32,6 +32,7 @@ cimport numpy as np
 from libc.math cimport log
 
 import rmgpy.quantity as quantity
+from rmgpy.kinetics.model cimport broadcast_conditions
 
 ################################################################################
 
@@ -124,6 +125,29 @@ cdef class KineticsData(KineticsModel):
                     break
         return k
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K.
+        """
+        cdef np.ndarray Tdata, kdata, T, i, Tlow, Thigh, klow, khigh
+        cdef int N
+        T, _, shape = broadcast_conditions(Tlist, Plist)
+
+        Tdata = self._Tdata.value_si
+        kdata = self._kdata.value_si
+        N = kdata.shape[0]
+
+        # Make sure we are interpolating and not extrapolating
+        if np.any((T < Tdata[0]) | (T > Tdata[N - 1])):
+            T = T[(T < Tdata[0]) | (T > Tdata[N - 1])]
+            raise ValueError('Unable to compute rate coefficient at {0:g} K using KineticsData model.'.format(T[0]))
+
+        i = np.clip(np.searchsorted(Tdata, T) - 1, 0, N - 2)
+        Tlow, Thigh = Tdata[i], Tdata[i + 1]
+        klow, khigh = kdata[i], kdata[i + 1]
+        return (klow * (khigh / klow) ** ((T - Tlow) / (Thigh - Tlow))).reshape(shape)
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Returns ``True`` if the kdata and Tdata match. Returns ``False`` otherwise.
@@ -123,6 +123,17 @@ class TestKineticsData(unittest.TestCase):
             kact = self.kinetics.get_rate_coefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that KineticsData.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([300, 350, 400, 600, 1000, 1750, 2000])
+        kexplist = np.array([self.kinetics.get_rate_coefficient(T) for T in Tlist])
+        kactlist = self.kinetics.get_rate_coefficients(Tlist)
+        self.assertEqual(kactlist.shape, Tlist.shape)
+        for kexp, kact in zip(kexplist, kactlist):
+            self.assertAlmostEqual(kexp, kact, delta=1e-10 * kexp)
+
     def test_pickle(self):
         """
         Test that a KineticsData object can be pickled and unpickled with no
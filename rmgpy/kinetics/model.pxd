@@ -36,6 +36,8 @@ cpdef str get_rate_coefficient_units_from_reaction_order(order)
 
 cpdef int get_reaction_order_from_rate_coefficient_units(kunits) except -1
 
+cpdef tuple broadcast_conditions(Tlist, Plist=?)
+
 ################################################################################
 
 cdef class KineticsModel:
@@ -51,6 +53,8 @@ cdef class KineticsModel:
     cpdef bint is_temperature_valid(self, double T) except -2
 
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
+
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=?)
     
     cpdef to_html(self)
 
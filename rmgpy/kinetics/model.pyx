@@ -91,6 +91,20 @@ cpdef int get_reaction_order_from_rate_coefficient_units(kunits) except -1:
 
 ################################################################################
 
+cpdef tuple broadcast_conditions(Tlist, Plist=None):
+    """
+    Broadcast the temperatures `Tlist` in K and pressures `Plist` in Pa
+    against one another, returning a tuple containing flattened, contiguous
+    arrays of the temperatures and pressures along with the broadcast shape.
+    If `Plist` is ``None``, a pressure of zero is used at every temperature.
+    """
+    T = np.asarray(Tlist, dtype=np.float64)
+    P = np.asarray(0.0 if Plist is None else Plist, dtype=np.float64)
+    T, P = np.broadcast_arrays(T, P)
+    return np.ascontiguousarray(T).ravel(), np.ascontiguousarray(P).ravel(), T.shape
+
+################################################################################
+
 cdef class KineticsModel:
     """
     A base class for chemical kinetics models, containing several attributes
@@ -183,6 +197,25 @@ cdef class KineticsModel:
         raise NotImplementedError('Unexpected call to KineticsModel.get_rate_coefficient(); '
                                   'you should be using a class derived from KineticsModel.')
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the values of the rate coefficient :math:`k(T,P)` in units of
+        m^3, mol, and s at the temperatures `Tlist` in K and pressures `Plist`
+        in Pa. The two are broadcast against one another, so scalars, matched
+        arrays, or a column of temperatures with a row of pressures are all
+        accepted; the returned array has the broadcast shape. Derived classes
+        should override this with a vectorized implementation where possible.
+        """
+        cdef np.ndarray T, P, k
+        cdef double[:] T_view, P_view, k_view
+        cdef Py_ssize_t i
+        T, P, shape = broadcast_conditions(Tlist, Plist)
+        k = np.empty_like(T)
+        T_view, P_view, k_view = T, P, k
+        for i in range(T_view.shape[0]):
+            k_view[i] = self.get_rate_coefficient(T_view[i], P_view[i])
+        return k.reshape(shape)
+
     cpdef to_html(self):
         """
         Return an HTML rendering.
@@ -144,6 +144,22 @@ class ConsistencyChecker(object):
             logging.warning("Consistency checking of multiplicity of molecules with "
                             "more than 4 unpaired electrons is not implemented yet!")
 
+    @staticmethod
+    def check_molecule(atoms, multiplicity):
+        """
+        Run all consistency checks on the `atoms` of a molecule with the given
+        `multiplicity`, raising an :class:`InvalidAdjacencyListError` for the
+        first problem found.
+        """
+        # Electron and valency consistency check for each atom
+        for atom in atoms:
+            ConsistencyChecker.check_partial_charge(atom)
+
+        n_rad = sum([atom.radical_electrons for atom in atoms])
+        ConsistencyChecker.check_multiplicity(n_rad, multiplicity)
+        for atom in atoms:
+            ConsistencyChecker.check_hund_rule(atom, multiplicity)
+
     @staticmethod
     def check_hund_rule(atom, multiplicity):
         """
@@ -459,14 +475,15 @@ re_old_adjlist = re.compile(r'^\s*(\d*)\s+' +  # atom number digit
                             r'\s*$')  # the end!
 
 
-def from_adjacency_list(adjlist, group=False, saturate_h=False):
+def from_adjacency_list(adjlist, group=False, saturate_h=False, check_consistency=True):
     """
     Convert a string adjacency list `adjlist` into a set of :class:`Atom` and
     :class:`Bond` objects.
+
+    For molecules, the valences, multiplicity and Hund's rule are checked
+    with :meth:`ConsistencyChecker.check_molecule` unless `check_consistency`
+    is ``False``, in which case that check can be run separately later.
     """
-    atoms = []
-    atom_dict = {}
-    bonds = {}
     multiplicity = None
 
     adjlist = adjlist.strip()
@@ -524,6 +541,173 @@ def from_adjacency_list(adjlist, group=False, saturate_h=False):
         if len(lines) == 0:
             raise InvalidAdjacencyListError('No atoms specified in adjacency list: \n{0}'.format(adjlist))
 
+    # Try the single-pass parser for the common format first, falling back
+    # to the general parser (which also reports any errors) if needed
+    atoms = _parse_common_atom_lines(lines, group)
+    if atoms is None:
+        atoms = _parse_atom_lines(lines, group, adjlist)
+
+    if saturate_h:
+        # Add explicit hydrogen atoms to complete structure if desired
+        if not group:
+            Saturator.saturate(atoms)
+
+    # Consistency checks
+    if not group:
+        n_rad = sum([atom.radical_electrons for atom in atoms])
+        absolute_spin_per_electron = 1 / 2.
+        if multiplicity is None:
+            multiplicity = 2 * (n_rad * absolute_spin_per_electron) + 1
+
+        if check_consistency:
+            ConsistencyChecker.check_molecule(atoms, multiplicity)
+        return atoms, multiplicity
+    else:
+        # Currently no group consistency check
+        return atoms, multiplicity
+
+
+# Values allowed in the u, p and c fields of an atom line
+ELECTRON_STATES = {'0': 0, '1': 1, '2': 2, '3': 3, '4': 4}
+CHARGE_STATES = {'0': 0, '+1': 1, '+2': 2, '+3': 3, '+4': 4, '-1': -1, '-2': -2, '-3': -3, '-4': -4}
+
+
+def _parse_common_atom_lines(lines, group):
+    """
+    Create the :class:`Atom` or :class:`GroupAtom` objects and their bonds from
+    the atom `lines` of a new-style adjacency list in a single pass, and return
+    the list of atoms.
+
+    Only the common form of the format is handled: atoms numbered 1, 2, 3...
+    in order, bonds listed for both atoms in order of increasing atom number
+    and separated only by whitespace. ``None`` is returned for anything else,
+    including errors, so that the caller can fall back to
+    :func:`_parse_atom_lines`, which handles every variant and reports the
+    errors.
+    """
+    atoms = []
+    open_bonds = {}
+    try:
+        for line in lines:
+            data = line.split()
+            if not data:
+                continue
+            aid = int(data[0])
+            if aid != len(atoms) + 1:
+                return None
+
+            label = ''
+            index = 1
+            if data[1][0] == '*':
+                label = data[1]
+                index = 2
+
+            atom_type = data[index]
+            if atom_type[0] == '[':
+                if not group:
+                    return None
+                atom_type = atom_type[1:-1].split(',')
+            else:
+                atom_type = [atom_type]
+            index += 1
+
+            if data[index][0] != 'u':
+                return None
+            unpaired_electrons = _parse_common_state(data[index][1:], ELECTRON_STATES, group)
+            index += 1
+
+            lone_pairs = [] if group else [0]
+            if len(data) > index and data[index][0] == 'p':
+                lone_pairs = _parse_common_state(data[index][1:], ELECTRON_STATES, group)
+                index += 1
+
+            partial_charges = [] if group else [0]
+            if len(data) > index and data[index][0] == 'c':
+                partial_charges = _parse_common_state(data[index][1:], CHARGE_STATES, group)
+                index += 1
+
+            isotope = -1
+            if len(data) > index and data[index][0] == 'i':
+                isotope = int(data[index][1:])
+                index += 1
+
+            props = {}
+            if len(data) > index and data[index][0] == 'r':
+                props['inRing'] = bool(int(data[index][1]))
+                index += 1
+
+            if group:
+                atom = GroupAtom(atom_type, unpaired_electrons, partial_charges, label, lone_pairs, props)
+            else:
+                atom = Atom(atom_type[0], unpaired_electrons[0], partial_charges[0], label, lone_pairs[0])
+                if isotope != -1:
+                    atom.element = get_element(atom.number, isotope)
+            atoms.append(atom)
+
+            # Bonds to atoms listed earlier are created now, the others once
+            # the other atom lists the bond as well
+            previous_aid = 0
+            for datum in data[index:]:
+                if datum[0] != '{' or datum[-1] != '}':
+                    return None
+                aid2, comma, order = datum[1:-1].partition(',')
+                aid2 = int(aid2)
+                if aid2 <= previous_aid or aid2 == aid or '}' in order:
+                    return None
+                previous_aid = aid2
+                if order[0] == '[':
+                    order = order[1:-1].split(',')
+                else:
+                    order = [order]
+                if aid2 > aid:
+                    open_bonds[aid, aid2] = order
+                elif open_bonds.pop((aid2, aid), None) != order:
+                    return None
+                else:
+                    atom1 = atoms[aid2 - 1]
+                    if group:
+                        bond = GroupBond(atom1, atom, order)
+                    elif len(order) == 1:
+                        bond = Bond(atom1, atom, order[0])
+                    else:
+                        return None
+                    atom1.edges[atom] = bond
+                    atom.edges[atom1] = bond
+    except (IndexError, KeyError, ValueError, TypeError):
+        return None
+
+    if open_bonds or not atoms:
+        return None
+    return atoms
+
+
+def _parse_common_state(value, states, group):
+    """
+    Return the list of numbers given by the `value` of a u, p or c field, e.g.
+    ``'1'``, ``'[0,1]'`` or ``'x'``. A `KeyError` is raised for values not in
+    `states` and for lists and wildcards outside of groups.
+    """
+    if value == 'x':
+        if not group:
+            raise KeyError(value)
+        return []
+    if value[0] == '[':
+        if not group:
+            raise KeyError(value)
+        return [states[item] for item in value[1:-1].split(',')]
+    return [states[value]]
+
+
+def _parse_atom_lines(lines, group, adjlist):
+    """
+    Create the :class:`Atom` or :class:`GroupAtom` objects and their bonds from
+    the atom `lines` of a new-style adjacency list `adjlist`, and return the
+    list of atoms. An :class:`InvalidAdjacencyListError` is raised for
+    malformed or inconsistent lines.
+    """
+    atoms = []
+    atom_dict = {}
+    bonds = {}
     mistake1 = re.compile(r'\{[^}]*\s+[^}]*\}')
     # Iterate over the remaining lines, generating Atom or GroupAtom objects
     for line in lines:
@@ -760,30 +944,7 @@ def from_adjacency_list(adjlist, group=False, saturate_h=False):
                 atom1.edges[atom2] = bond
                 atom2.edges[atom1] = bond
 
-    if saturate_h:
-        # Add explicit hydrogen atoms to complete structure if desired
-        if not group:
-            Saturator.saturate(atoms)
-
-    # Consistency checks
-    if not group:
-        # Molecule consistency check
-        # Electron and valency consistency check for each atom
-        for atom in atoms:
-            ConsistencyChecker.check_partial_charge(atom)
-
-        n_rad = sum([atom.radical_electrons for atom in atoms])
-        absolute_spin_per_electron = 1 / 2.
-        if multiplicity is None:
-            multiplicity = 2 * (n_rad * absolute_spin_per_electron) + 1
-
-        ConsistencyChecker.check_multiplicity(n_rad, multiplicity)
-        for atom in atoms:
-            ConsistencyChecker.check_hund_rule(atom, multiplicity)
-        return atoms, multiplicity
-    else:
-        # Currently no group consistency check
-        return atoms, multiplicity
+    return atoms
 
 
 def to_adjacency_list(atoms, multiplicity, label=None, group=False, remove_h=False, remove_lone_pairs=False,
@@ -819,120 +980,115 @@ def to_adjacency_list(atoms, multiplicity, label=None, group=False, remove_h=Fal
         if multiplicity != 1 or any(atom.radical_electrons for atom in atoms):
             adjlist += 'multiplicity {0!r}\n'.format(multiplicity)
 
-    # Determine the numbers to use for each atom
+    # Determine the atoms to write and their numbers, keyed by id() since
+    # atoms of the same element share a hash
+    written_atoms = [atom for atom in atoms if not (remove_h and atom.element.symbol == 'H' and atom.label == '')]
     atom_numbers = {}
-    index = 0
-    for atom in atoms:
-        if remove_h and atom.element.symbol == 'H' and atom.label == '':
-            continue
-        atom_numbers[atom] = '{0:d}'.format(index + 1)
-        index += 1
-
-    atom_labels = dict([(atom, '{0}'.format(atom.label)) for atom in atom_numbers])
-
-    atom_types = {}
-    atom_unpaired_electrons = {}
-    atom_lone_pairs = {}
-    atom_charge = {}
-    atom_isotope = {}
-    atom_props = {}
+    for index, atom in enumerate(written_atoms):
+        atom_numbers[id(atom)] = '{0:d}'.format(index + 1)
+    atom_positions = {}
+    for index, atom in enumerate(atoms):
+        atom_positions[id(atom)] = index
+
+    atom_labels = ['{0}'.format(atom.label) for atom in written_atoms]
+
+    atom_types = []
+    atom_unpaired_electrons = []
+    atom_lone_pairs = []
+    atom_charge = []
+    atom_isotope = []
+    atom_props = []
     if group:
-        for atom in atom_numbers:
+        for atom in written_atoms:
             # Atom type(s)
             if len(atom.atomtype) == 1:
-                atom_types[atom] = atom.atomtype[0].label
+                atom_types.append(atom.atomtype[0].label)
             else:
-                atom_types[atom] = '[{0}]'.format(','.join([a.label for a in atom.atomtype]))
+                atom_types.append('[{0}]'.format(','.join([a.label for a in atom.atomtype])))
             # Unpaired Electron(s)
             if len(atom.radical_electrons) == 1:
-                atom_unpaired_electrons[atom] = str(atom.radical_electrons[0])
+                atom_unpaired_electrons.append(str(atom.radical_electrons[0]))
             elif len(atom.radical_electrons) == 0:
-                atom_unpaired_electrons[atom] = 'x'  # Empty list indicates wildcard
+                atom_unpaired_electrons.append('x')  # Empty list indicates wildcard
             else:
-                atom_unpaired_electrons[atom] = '[{0}]'.format(','.join([str(radical) for radical in atom.radical_electrons]))
+                atom_unpaired_electrons.append('[{0}]'.format(','.join([str(radical) for radical in atom.radical_electrons])))
 
             # Lone Electron Pair(s)
             if len(atom.lone_pairs) == 1:
-                atom_lone_pairs[atom] = str(atom.lone_pairs[0])
+                atom_lone_pairs.append(str(atom.lone_pairs[0]))
             elif len(atom.lone_pairs) == 0:
-                atom_lone_pairs[atom] = None  # Empty list indicates wildcard
+                atom_lone_pairs.append(None)  # Empty list indicates wildcard
             else:
-                atom_lone_pairs[atom] = '[{0}]'.format(','.join([str(pair) for pair in atom.lone_pairs]))
+                atom_lone_pairs.append('[{0}]'.format(','.join([str(pair) for pair in atom.lone_pairs])))
 
             # Charges
             if len(atom.charge) == 1:
-                atom_charge[atom] = '+' + str(atom.charge[0]) if atom.charge[0] > 0 else str(atom.charge[0])
+                atom_charge.append('+' + str(atom.charge[0]) if atom.charge[0] > 0 else str(atom.charge[0]))
             elif len(atom.charge) == 0:
-                atom_charge[atom] = None  # Empty list indicates wildcard
+                atom_charge.append(None)  # Empty list indicates wildcard
             else:
-                atom_charge[atom] = '[{0}]'.format(','.join(['+'+str(charge) if charge > 0 else ''+str(charge) for charge in atom.charge]))
+                atom_charge.append('[{0}]'.format(','.join(['+'+str(charge) if charge > 0 else ''+str(charge) for charge in atom.charge])))
 
             # Isotopes
-            atom_isotope[atom] = -1
+            atom_isotope.append(-1)
 
             # Other props
             props = []
             if 'inRing' in atom.props:
                 props.append(' r{0}'.format(int(atom.props['inRing'])))
-            atom_props[atom] = props
+            atom_props.append(props)
     else:
-        for atom in atom_numbers:
+        for atom in written_atoms:
             # Atom type
-            atom_types[atom] = '{0}'.format(atom.element.symbol)
+            atom_types.append('{0}'.format(atom.element.symbol))
             # Unpaired Electron(s)
-            atom_unpaired_electrons[atom] = '{0}'.format(atom.radical_electrons)
+            atom_unpaired_electrons.append('{0}'.format(atom.radical_electrons))
             # Lone Electron Pair(s)
-            atom_lone_pairs[atom] = str(atom.lone_pairs)
+            atom_lone_pairs.append(str(atom.lone_pairs))
             # Partial Charge(s)
-            atom_charge[atom] = '+' + str(atom.charge) if atom.charge > 0 else '' + str(atom.charge)
+            atom_charge.append('+' + str(atom.charge) if atom.charge > 0 else '' + str(atom.charge))
             # Isotopes
-            atom_isotope[atom] = atom.element.isotope
+            atom_isotope.append(atom.element.isotope)
 
     # Determine field widths
     atom_number_width = max([len(s) for s in atom_numbers.values()]) + 1
-    atom_label_width = max([len(s) for s in atom_labels.values()])
+    atom_label_width = max([len(s) for s in atom_labels])
     if atom_label_width > 0:
         atom_label_width += 1
-    atom_type_width = max([len(s) for s in atom_types.values()]) + 1
-    atom_unpaired_electrons_width = max([len(s) for s in atom_unpaired_electrons.values()])
+    atom_type_width = max([len(s) for s in atom_types]) + 1
+    atom_unpaired_electrons_width = max([len(s) for s in atom_unpaired_electrons])
 
     # Assemble the adjacency list
-    for atom in atoms:
-        if atom not in atom_numbers:
-            continue
-
+    lines = [adjlist]
+    for i, atom in enumerate(written_atoms):
+        line = []
         # Atom number
-        adjlist += '{0:<{1:d}}'.format(atom_numbers[atom], atom_number_width)
+        line.append('{0:<{1:d}}'.format(atom_numbers[id(atom)], atom_number_width))
         # Atom label
-        adjlist += '{0:<{1:d}}'.format(atom_labels[atom], atom_label_width)
+        line.append('{0:<{1:d}}'.format(atom_labels[i], atom_label_width))
         # Atom type(s)
-        adjlist += '{0:<{1:d}}'.format(atom_types[atom], atom_type_width)
+        line.append('{0:<{1:d}}'.format(atom_types[i], atom_type_width))
         # Unpaired Electron(s)
-        adjlist += 'u{0:<{1:d}}'.format(atom_unpaired_electrons[atom], atom_unpaired_electrons_width)
+        line.append('u{0:<{1:d}}'.format(atom_unpaired_electrons[i], atom_unpaired_electrons_width))
         # Lone Electron Pair(s)
-        if atom_lone_pairs[atom] is not None:
-            adjlist += ' p{0}'.format(atom_lone_pairs[atom])
+        if atom_lone_pairs[i] is not None:
+            line.append(' p{0}'.format(atom_lone_pairs[i]))
         # Partial charges
-        if atom_charge[atom] is not None:
-            adjlist += ' c{0}'.format(atom_charge[atom])
+        if atom_charge[i] is not None:
+            line.append(' c{0}'.format(atom_charge[i]))
         # Isotopes
-        if atom_isotope[atom] != -1:
-            adjlist += ' i{0}'.format(atom_isotope[atom])
-        if group and len(atom_props[atom]) > 0:
-            for prop in atom_props[atom]:
-                adjlist += prop
-
-        # Bonds list
-        atoms2 = list(atom.bonds.keys())
-        # sort them the same way as the atoms
-        atoms2.sort(key=atoms.index)
+        if atom_isotope[i] != -1:
+            line.append(' i{0}'.format(atom_isotope[i]))
+        if group:
+            line.extend(atom_props[i])
 
-        for atom2 in atoms2:
-            if atom2 not in atom_numbers:
+        # Bonds list, sorted the same way as the atoms
+        bonds = sorted(atom.bonds.items(), key=lambda item: atom_positions[id(item[0])])
+        for atom2, bond in bonds:
+            if id(atom2) not in atom_numbers:
                 continue
 
-            bond = atom.bonds[atom2]
-            adjlist += ' {{{0},'.format(atom_numbers[atom2])
+            line.append(' {{{0},'.format(atom_numbers[id(atom2)]))
 
             # Bond type(s)
             if group:
@@ -942,22 +1098,23 @@ def to_adjacency_list(atoms, multiplicity, label=None, group=False, remove_h=Fal
                 # preference is for string representation, backs down to number
                 # numbers if doesn't work
                 try:
-                    adjlist += code.format(','.join(bond.get_order_str()))
+                    line.append(code.format(','.join(bond.get_order_str())))
                 except ValueError:
-                    adjlist += code.format(','.join(str(bond.get_order_num())))
+                    line.append(code.format(','.join(str(bond.get_order_num()))))
             else:
                 # preference is for string representation, backs down to number
                 # numbers if doesn't work
                 try:
-                    adjlist += bond.get_order_str()
+                    line.append(bond.get_order_str())
                 except ValueError:
-                    adjlist += str(bond.get_order_num())
-            adjlist += '}'
+                    line.append(str(bond.get_order_num()))
+            line.append('}')
 
         # Each atom begins on a new line
-        adjlist += '\n'
+        line.append('\n')
+        lines.append(''.join(line))
 
-    return adjlist
+    return ''.join(lines)
 
 
 def get_old_electron_state(atom):
@@ -32,7 +32,7 @@ import logging
 import unittest
 
 from external.wip import work_in_progress
-from rmgpy.molecule.adjlist import InvalidAdjacencyListError
+from rmgpy.molecule.adjlist import ConsistencyChecker, InvalidAdjacencyListError, from_adjacency_list
 from rmgpy.molecule.group import Group
 from rmgpy.molecule.molecule import Molecule
 
@@ -559,6 +559,70 @@ class TestMoleculeAdjLists(unittest.TestCase):
         with self.assertRaises(InvalidAdjacencyListError):
             Molecule().from_adjacency_list(adjlist1)
 
+    def test_skip_consistency_check(self):
+        """
+        adjlist: Test that the consistency check can be skipped and run separately.
+        """
+        adjlist1 = "1 C u1 p2 c0"
+        atoms, multiplicity = from_adjacency_list(adjlist1, check_consistency=False)
+        self.assertEqual(atoms[0].lone_pairs, 2)
+        with self.assertRaises(InvalidAdjacencyListError):
+            ConsistencyChecker.check_molecule(atoms, multiplicity)
+        with self.assertRaises(InvalidAdjacencyListError):
+            from_adjacency_list(adjlist1)
+
+    def test_uncommon_formats(self):
+        """
+        adjlist: Test that variants of the adjlist format give the same molecule as the common form.
+        """
+        adjlist = """
+multiplicity 2
+1 C u0 p0 c0 {2,S} {3,S} {4,S} {5,S}
+2 C u1 p0 c0 {1,S} {6,S} {7,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {1,S}
+5 H u0 p0 c0 {1,S}
+6 H u0 p0 c0 {2,S}
+7 H u0 p0 c0 {2,S}
+"""
+        variants = [
+            # Comma-delimited bonds and numbered-list style atom indices
+            """
+multiplicity 2
+1. C u0 p0 c0 {2,S},{3,S},{4,S},{5,S}
+2. C u1 p0 c0 {1,S},{6,S},{7,S}
+3. H u0 p0 c0 {1,S}
+4. H u0 p0 c0 {1,S}
+5. H u0 p0 c0 {1,S}
+6. H u0 p0 c0 {2,S}
+7. H u0 p0 c0 {2,S}
+""",
+            # Unsorted bonds and atoms
+            """
+multiplicity 2
+2 C u1 p0 c0 {7,S} {6,S} {1,S}
+1 C u0 p0 c0 {5,S} {4,S} {3,S} {2,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {1,S}
+5 H u0 p0 c0 {1,S}
+6 H u0 p0 c0 {2,S}
+7 H u0 p0 c0 {2,S}
+""",
+        ]
+        mol = Molecule().from_adjacency_list(adjlist)
+        for variant in variants:
+            self.assertTrue(Molecule().from_adjacency_list(variant).is_isomorphic(mol))
+
+        with self.assertRaises(InvalidAdjacencyListError):
+            # Bond listed for only one of its atoms
+            Molecule().from_adjacency_list(adjlist.replace('6 H u0 p0 c0 {2,S}', '6 H u0 p0 c0'))
+        with self.assertRaises(InvalidAdjacencyListError):
+            # Bond listed with different orders
+            Molecule().from_adjacency_list(adjlist.replace('3 H u0 p0 c0 {1,S}', '3 H u0 p0 c0 {1,D}'))
+        with self.assertRaises(InvalidAdjacencyListError):
+            # Space inside the braces of a bond
+            Molecule().from_adjacency_list(adjlist.replace('7 H u0 p0 c0 {2,S}', '7 H u0 p0 c0 {2, S}'))
+
     def test_helium(self):
         """
         adjlist: Test that the adjlist reading and writing works with Helium.
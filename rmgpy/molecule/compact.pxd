@@ -0,0 +1,64 @@
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+cimport numpy as np
+
+cimport rmgpy.molecule.molecule as mm
+
+
+cdef class CompactMolecule:
+
+    cdef readonly np.ndarray numbers
+    cdef readonly np.ndarray isotopes
+    cdef readonly np.ndarray charges
+    cdef readonly np.ndarray radical_electrons
+    cdef readonly np.ndarray lone_pairs
+    cdef readonly np.ndarray atomtypes
+    cdef readonly np.ndarray bond_indptr
+    cdef readonly np.ndarray bond_indices
+    cdef readonly np.ndarray bond_orders
+    cdef readonly tuple labels
+    cdef readonly int multiplicity
+    cdef readonly float symmetry_number
+    cdef readonly bint reactive
+
+    cpdef int get_num_atoms(self)
+
+    cpdef int get_num_bonds(self)
+
+    cpdef tuple get_neighbors(self, int index)
+
+    cpdef int get_nbytes(self)
+
+    cpdef mm.Molecule to_molecule(self)
+
+    cdef tuple _key(self)
+
+
+cpdef CompactMolecule to_compact_molecule(mm.Molecule mol)
+
+cpdef mm.Molecule from_compact_molecule(CompactMolecule cmol)
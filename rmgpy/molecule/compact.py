@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+"""
+This module provides :class:`CompactMolecule`, an immutable, array-backed form
+of :class:`~rmgpy.molecule.molecule.Molecule` for storing and communicating
+large numbers of molecules.
+
+A :class:`Molecule` keeps its structure as one :class:`Atom` object per atom,
+each holding a dictionary of :class:`Bond` objects, which makes copying,
+pickling and merely keeping many molecules in memory expensive. A
+:class:`CompactMolecule` holds the same information in a handful of small
+NumPy arrays: one entry per atom for the atomic number, isotope, charge,
+radical electrons, lone pairs and atom type, and the bonds in compressed
+sparse row (CSR) form, i.e. the neighbors of atom ``i`` are
+``bond_indices[bond_indptr[i]:bond_indptr[i + 1]]`` with the matching orders
+in ``bond_orders``.
+
+Atom labels are kept; coordinates, atom ids and the ``props`` dictionaries of
+atoms and molecules are not.
+"""
+
+import cython
+import numpy as np
+
+import rmgpy.molecule.element as elements
+import rmgpy.molecule.molecule as mm
+from rmgpy.molecule.atomtype import ATOMTYPES
+
+# Atom types are stored as their position in this list, with NO_ATOMTYPE
+# marking atoms whose type has not been set
+ATOMTYPE_LIST = list(ATOMTYPES.values())
+ATOMTYPE_INDICES = {atomtype.label: index for index, atomtype in enumerate(ATOMTYPE_LIST)}
+NO_ATOMTYPE = 255
+
+# Elements keyed by (atomic number, isotope)
+ELEMENTS = {(element.number, element.isotope): element for element in elements.element_list}
+
+
+class CompactMolecule(object):
+    """
+    An immutable, array-backed representation of a molecular structure. The
+    attributes are:
+
+    ======================= ====================================================
+    Attribute               Description
+    ======================= ====================================================
+    `numbers`               The atomic number of each atom (``X`` is 0)
+    `isotopes`              The isotope of each atom, -1 if unspecified
+    `charges`               The formal charge of each atom
+    `radical_electrons`     The number of radical electrons on each atom
+    `lone_pairs`            The number of lone pairs on each atom
+    `atomtypes`             The index of each atom type in ``ATOMTYPE_LIST``
+    `bond_indptr`           The CSR row pointers of the bonds
+    `bond_indices`          The CSR column indices (neighboring atoms)
+    `bond_orders`           The order of each bond in `bond_indices`
+    `labels`                A tuple of atom labels, or ``None`` if no atom is labeled
+    `multiplicity`          The spin multiplicity of the molecule
+    `symmetry_number`       The symmetry number of the molecule
+    `reactive`              ``True`` if the structure participates in reactions
+    ======================= ====================================================
+
+    Each bond appears twice in the CSR arrays, once for each of its atoms.
+    The arrays are read-only. Use :func:`to_compact_molecule` and
+    :meth:`to_molecule` to convert to and from :class:`Molecule`.
+    """
+
+    def __init__(self, numbers, isotopes, charges, radical_electrons, lone_pairs, atomtypes,
+                 bond_indptr, bond_indices, bond_orders, labels=None, multiplicity=-187,
+                 symmetry_number=-1, reactive=True):
+        self.numbers = _freeze(numbers, np.uint8)
+        self.isotopes = _freeze(isotopes, np.int16)
+        self.charges = _freeze(charges, np.int8)
+        self.radical_electrons = _freeze(radical_electrons, np.int8)
+        self.lone_pairs = _freeze(lone_pairs, np.int8)
+        self.atomtypes = _freeze(atomtypes, np.uint8)
+        self.bond_indptr = _freeze(bond_indptr, np.int32)
+        self.bond_indices = _freeze(bond_indices, np.int32)
+        self.bond_orders = _freeze(bond_orders, np.float64)
+        self.labels = tuple(labels) if labels is not None else None
+        self.multiplicity = multiplicity
+        self.symmetry_number = symmetry_number
+        self.reactive = reactive
+        if len(self.bond_indptr) != len(self.numbers) + 1 or len(self.bond_indices) != len(self.bond_orders):
+            raise ValueError('Inconsistent bond arrays for a compact molecule with {0:d} atoms.'.format(
+                len(self.numbers)))
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling an object. The arrays are packed
+        into a single byte string to keep the pickle small.
+        """
+        data = b''.join([array.tobytes() for array in (self.bond_indptr, self.bond_indices, self.bond_orders,
+                                                        self.isotopes, self.numbers, self.charges,
+                                                        self.radical_electrons, self.lone_pairs, self.atomtypes)])
+        return (_unpickle_compact_molecule, (len(self.numbers), len(self.bond_indices), data, self.labels,
+                                             self.multiplicity, self.symmetry_number, self.reactive))
+
+    def __repr__(self):
+        return '<CompactMolecule with {0:d} atoms and {1:d} bonds>'.format(self.get_num_atoms(),
+                                                                          self.get_num_bonds())
+
+    def __eq__(self, other):
+        """
+        Return ``True`` if `other` stores exactly the same arrays. This compares
+        atom by atom in stored order and is not an isomorphism check.
+        """
+        cython.declare(cmol=CompactMolecule)
+        if not isinstance(other, CompactMolecule):
+            return NotImplemented
+        cmol = other
+        return self._key() == cmol._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        """
+        Return a hashable tuple of the stored data.
+        """
+        return (self.numbers.tobytes(), self.isotopes.tobytes(), self.charges.tobytes(),
+                self.radical_electrons.tobytes(), self.lone_pairs.tobytes(), self.atomtypes.tobytes(),
+                self.bond_indptr.tobytes(), self.bond_indices.tobytes(), self.bond_orders.tobytes(),
+                self.labels, self.multiplicity)
+
+    def get_num_atoms(self):
+        """
+        Return the number of atoms in the molecule.
+        """
+        return len(self.numbers)
+
+    def get_num_bonds(self):
+        """
+        Return the number of bonds in the molecule.
+        """
+        return len(self.bond_indices) // 2
+
+    def get_neighbors(self, index):
+        """
+        Return the indices of the atoms bonded to the atom at `index` and the
+        orders of those bonds, as two arrays.
+        """
+        start, end = self.bond_indptr[index], self.bond_indptr[index + 1]
+        return self.bond_indices[start:end], self.bond_orders[start:end]
+
+    def get_nbytes(self):
+        """
+        Return the number of bytes taken up by the arrays of the molecule.
+        """
+        return sum([array.nbytes for array in (self.numbers, self.isotopes, self.charges,
+                                               self.radical_electrons, self.lone_pairs, self.atomtypes,
+                                               self.bond_indptr, self.bond_indices, self.bond_orders)])
+
+    def to_molecule(self):
+        """
+        Return a new :class:`Molecule` with the structure stored in this
+        object. The atoms appear in the stored order.
+        """
+        return from_compact_molecule(self)
+
+
+def _freeze(values, dtype):
+    """
+    Return `values` as a read-only array of the given `dtype`, without copying
+    if it already is one.
+    """
+    array = np.asarray(values, dtype=dtype)
+    if array.flags.writeable:
+        if array is values:
+            array = array.copy()
+        array.flags.writeable = False
+    return array
+
+
+def _unpickle_compact_molecule(num_atoms, num_entries, data, labels, multiplicity, symmetry_number, reactive):
+    """
+    Rebuild a :class:`CompactMolecule` from the byte string written by
+    :meth:`CompactMolecule.__reduce__`. The arrays are read-only views of
+    `data`, so nothing is copied.
+    """
+    arrays = []
+    offset = 0
+    for dtype, count in ((np.int32, num_atoms + 1), (np.int32, num_entries), (np.float64, num_entries),
+                         (np.int16, num_atoms), (np.uint8, num_atoms), (np.int8, num_atoms),
+                         (np.int8, num_atoms), (np.int8, num_atoms), (np.uint8, num_atoms)):
+        arrays.append(np.frombuffer(data, dtype=dtype, count=count, offset=offset))
+        offset += arrays[-1].nbytes
+    bond_indptr, bond_indices, bond_orders, isotopes, numbers, charges, radical_electrons, lone_pairs, atomtypes = arrays
+    return CompactMolecule(numbers, isotopes, charges, radical_electrons, lone_pairs, atomtypes,
+                           bond_indptr, bond_indices, bond_orders, labels, multiplicity, symmetry_number, reactive)
+
+
+def to_compact_molecule(mol):
+    """
+    Return a :class:`CompactMolecule` with the structure of the
+    :class:`Molecule` `mol`, keeping the order of its atoms.
+    """
+    cython.declare(atom=mm.Atom, neighbor=mm.Atom, bond=mm.Bond, atoms=list, indices=dict, neighbors=list,
+                   bond_indptr=list, bond_indices=list, bond_orders=list, labels=list, i=cython.int)
+    atoms = mol.vertices
+    indices = {}
+    for i, atom in enumerate(atoms):
+        indices[id(atom)] = i
+
+    bond_indptr = [0]
+    bond_indices = []
+    bond_orders = []
+    for atom in atoms:
+        neighbors = []
+        for neighbor, bond in atom.edges.items():
+            neighbors.append((indices[id(neighbor)], bond.order))
+        neighbors.sort()
+        for i, order in neighbors:
+            bond_indices.append(i)
+            bond_orders.append(order)
+        bond_indptr.append(len(bond_indices))
+
+    labels = [atom.label for atom in atoms]
+    return CompactMolecule(
+        numbers=[atom.element.number for atom in atoms],
+        isotopes=[atom.element.isotope for atom in atoms],
+        charges=[atom.charge for atom in atoms],
+        radical_electrons=[atom.radical_electrons for atom in atoms],
+        lone_pairs=[atom.lone_pairs for atom in atoms],
+        atomtypes=[ATOMTYPE_INDICES[atom.atomtype.label] if atom.atomtype is not None else NO_ATOMTYPE
+                   for atom in atoms],
+        bond_indptr=bond_indptr,
+        bond_indices=bond_indices,
+        bond_orders=bond_orders,
+        labels=labels if any(labels) else None,
+        multiplicity=mol.multiplicity,
+        symmetry_number=mol.symmetry_number,
+        reactive=mol.reactive,
+    )
+
+
+def from_compact_molecule(cmol):
+    """
+    Return a new :class:`Molecule` with the structure stored in the
+    :class:`CompactMolecule` `cmol`.
+    """
+    cython.declare(atom=mm.Atom, atom1=mm.Atom, atom2=mm.Atom, bond=mm.Bond, atoms=list,
+                   numbers=list, isotopes=list, charges=list, radical_electrons=list, lone_pairs=list,
+                   atomtypes=list, bond_indptr=list, bond_indices=list, bond_orders=list,
+                   i=cython.int, j=cython.int, k=cython.int, atomtype=cython.int)
+    numbers = cmol.numbers.tolist()
+    isotopes = cmol.isotopes.tolist()
+    charges = cmol.charges.tolist()
+    radical_electrons = cmol.radical_electrons.tolist()
+    lone_pairs = cmol.lone_pairs.tolist()
+    atomtypes = cmol.atomtypes.tolist()
+    bond_indptr = cmol.bond_indptr.tolist()
+    bond_indices = cmol.bond_indices.tolist()
+    bond_orders = cmol.bond_orders.tolist()
+
+    atoms = []
+    for i in range(len(numbers)):
+        atom = mm.Atom(ELEMENTS[numbers[i], isotopes[i]], radical_electrons[i], charges[i],
+                       cmol.labels[i] if cmol.labels is not None else '', lone_pairs[i])
+        atomtype = atomtypes[i]
+        if atomtype != NO_ATOMTYPE:
+            atom.atomtype = ATOMTYPE_LIST[atomtype]
+        atoms.append(atom)
+
+    for i in range(len(atoms)):
+        atom1 = atoms[i]
+        for k in range(bond_indptr[i], bond_indptr[i + 1]):
+            j = bond_indices[k]
+            if j > i:
+                atom2 = atoms[j]
+                bond = mm.Bond(atom1, atom2, bond_orders[k])
+                atom1.edges[atom2] = bond
+                atom2.edges[atom1] = bond
+
+    return mm.Molecule(atoms=atoms, symmetry=cmol.symmetry_number, multiplicity=cmol.multiplicity,
+                       reactive=cmol.reactive)
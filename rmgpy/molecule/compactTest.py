@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+"""
+This module contains unit tests for the compact molecule module.
+"""
+
+import pickle
+import unittest
+
+from rmgpy.molecule.compact import CompactMolecule, to_compact_molecule, from_compact_molecule
+from rmgpy.molecule.molecule import Molecule
+
+
+class CompactMoleculeTest(unittest.TestCase):
+    """
+    Contains unit tests for the CompactMolecule class.
+    """
+
+    def setUp(self):
+        self.molecules = [Molecule().from_smiles(smiles) for smiles in
+                          ['CC(=O)OCC=C', 'c1ccccc1C', '[CH2]C=CC', '[O][O]', 'C#CC=C', 'C[N+](=O)[O-]', '[H][H]']]
+        self.molecules.append(Molecule().from_adjacency_list("""
+1 O u0 p2 c0 {2,S} {3,S} {4,H}
+2 H u0 p0 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {1,H} {5,S}
+5 O u0 p2 c0 {4,S} {6,S}
+6 H u0 p0 c0 {5,S}
+"""))
+        self.molecules.append(Molecule().from_adjacency_list("""
+multiplicity 2
+1 *1 C u1 p0 c0 {2,S} {3,S} {4,S}
+2 *2 C u0 p0 c0 {1,S} {5,S} {6,S} {7,S}
+3    H u0 p0 c0 {1,S}
+4    H u0 p0 c0 {1,S}
+5    H u0 p0 c0 {2,S}
+6    H u0 p0 c0 {2,S}
+7    H u0 p0 c0 {2,S}
+"""))
+        self.molecules.append(Molecule().from_adjacency_list("""
+1 C u0 p0 c0 i13 {2,S} {3,S} {4,S} {5,S}
+2 H u0 p0 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {1,S}
+5 H u0 p0 c0 {1,S}
+"""))
+
+    def test_round_trip(self):
+        """Test that converting to a compact molecule and back preserves the structure."""
+        for mol in self.molecules:
+            cmol = to_compact_molecule(mol)
+            new_mol = from_compact_molecule(cmol)
+            self.assertEqual(new_mol.to_adjacency_list(), mol.to_adjacency_list())
+            self.assertEqual(sorted(bond.order for bond in new_mol.get_all_edges()),
+                             sorted(bond.order for bond in mol.get_all_edges()))
+            self.assertEqual([atom.atomtype for atom in new_mol.atoms], [atom.atomtype for atom in mol.atoms])
+            self.assertEqual(to_compact_molecule(new_mol), cmol)
+            self.assertTrue(new_mol.is_isomorphic(mol))
+
+    def test_arrays(self):
+        """Test the contents of the arrays of a compact molecule."""
+        mol = self.molecules[-2]
+        cmol = to_compact_molecule(mol)
+        self.assertEqual(cmol.get_num_atoms(), 7)
+        self.assertEqual(cmol.get_num_bonds(), 6)
+        self.assertEqual(cmol.numbers.tolist(), [6, 6, 1, 1, 1, 1, 1])
+        self.assertEqual(cmol.radical_electrons.tolist(), [1, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(cmol.labels, ('*1', '*2', '', '', '', '', ''))
+        self.assertEqual(cmol.multiplicity, 2)
+        neighbors, orders = cmol.get_neighbors(1)
+        self.assertEqual(neighbors.tolist(), [0, 4, 5, 6])
+        self.assertEqual(orders.tolist(), [1, 1, 1, 1])
+        self.assertIsNone(to_compact_molecule(self.molecules[0]).labels)
+        self.assertEqual(to_compact_molecule(self.molecules[-1]).isotopes.tolist(), [13, -1, -1, -1, -1])
+
+    def test_immutable(self):
+        """Test that the arrays of a compact molecule cannot be modified."""
+        cmol = to_compact_molecule(self.molecules[0])
+        with self.assertRaises(ValueError):
+            cmol.charges[0] = 1
+        with self.assertRaises(AttributeError):
+            cmol.multiplicity = 3
+
+    def test_pickle(self):
+        """Test that a compact molecule can be pickled and unpickled."""
+        for mol in self.molecules:
+            cmol = to_compact_molecule(mol)
+            new_cmol = pickle.loads(pickle.dumps(cmol, -1))
+            self.assertIsInstance(new_cmol, CompactMolecule)
+            self.assertEqual(new_cmol, cmol)
+            self.assertEqual(hash(new_cmol), hash(cmol))
+            self.assertTrue(new_cmol.to_molecule().is_isomorphic(mol))
+
+    def test_inconsistent_arrays(self):
+        """Test that bond arrays which do not match the atoms are rejected."""
+        with self.assertRaises(ValueError):
+            CompactMolecule([6], [-1], [0], [0], [0], [0], [0], [], [])
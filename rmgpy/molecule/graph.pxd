@@ -76,6 +76,17 @@ cdef class Graph(object):
     
     cdef public list ordered_vertices
 
+    # These attributes are used to cache the results of ring perception
+    cdef int _mutation_count
+    cdef int _ring_perception_count
+    cdef list _ring_perception_vertices
+    cdef dict _cyclic_edges
+    cdef list _sssr
+    cdef list _relevant_cycles
+
+    # The compiled pattern used for subgraph isomorphism, see rmgpy.molecule.vf2.Pattern
+    cdef object _pattern
+
     cpdef Vertex add_vertex(self, Vertex vertex)
 
     cpdef Edge add_edge(self, Edge edge)
@@ -112,7 +123,7 @@ cdef class Graph(object):
 
     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?) except -2
 
-    cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+    cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?, bint find_all=?)
 
     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint save_order=?) except -2
 
@@ -150,6 +161,14 @@ cdef class Graph(object):
 
     cpdef list get_relevant_cycles(self)
 
+    cdef _check_ring_perception(self)
+
+    cdef dict _get_cyclic_edges(self)
+
+    cdef _perceive_rings(self)
+
+    cpdef _copy_ring_perception(self, Graph other, dict mapping=?)
+
     cpdef list sort_cyclic_vertices(self, list vertices)
 
     cpdef int get_max_cycle_overlap(self)
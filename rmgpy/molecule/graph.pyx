@@ -37,8 +37,12 @@ import itertools
 
 import py_rdl
 
+import rmgpy.instrumentation as instrumentation
 from rmgpy.molecule.vf2 cimport VF2
 
+# The number of ring perceptions done by RingDecomposerLib so far
+cdef unsigned long long ring_perception_count = 0
+
 ################################################################################
 
 cdef class Vertex(object):
@@ -215,6 +219,12 @@ cdef class Graph(object):
     vertices using ``vertex1.edges[vertex2]``; in either case, an exception
     will be raised if the edge does not exist. All edges of a vertex can be
     accessed using the :meth:`get_edges` method or ``vertex.edges``.
+
+    The results of ring perception are cached, and invalidated by a counter
+    of the modifications made using the :meth:`add_vertex`, :meth:`add_edge`,
+    :meth:`remove_vertex` and :meth:`remove_edge` methods, or by assigning a
+    new list of vertices. Graphs whose vertices or edges are modified in
+    other ways should not have their rings perceived beforehand.
     """
 
     def __init__(self, vertices=None):
@@ -232,6 +242,7 @@ cdef class Graph(object):
         """
         self.vertices.append(vertex)
         vertex.edges = dict()
+        self._mutation_count += 1
         return vertex
 
     cpdef Edge add_edge(self, Edge edge):
@@ -243,6 +254,7 @@ cdef class Graph(object):
             raise ValueError('Attempted to add edge between vertices not in the graph.')
         edge.vertex1.edges[edge.vertex2] = edge
         edge.vertex2.edges[edge.vertex1] = edge
+        self._mutation_count += 1
         return edge
 
     cpdef list get_all_edges(self):
@@ -300,6 +312,7 @@ cdef class Graph(object):
             del vertex2.edges[vertex]
         vertex.edges = dict()
         self.vertices.remove(vertex)
+        self._mutation_count += 1
 
     cpdef remove_edge(self, Edge edge):
         """
@@ -309,6 +322,7 @@ cdef class Graph(object):
         """
         del edge.vertex1.edges[edge.vertex2]
         del edge.vertex2.edges[edge.vertex1]
+        self._mutation_count += 1
 
     cpdef Graph copy(self, bint deep=False):
         """
@@ -343,6 +357,7 @@ cdef class Graph(object):
                     edge.vertex1 = mapping[vertex1]
                     edge.vertex2 = mapping[vertex2]
                     other.add_edge(edge)
+            other._copy_ring_perception(self, mapping)
         return other
 
     cpdef dict copy_and_map(self):
@@ -513,7 +528,8 @@ cdef class Graph(object):
         """
         return vf2.is_isomorphic(self, other, initial_map, save_order=save_order, strict=strict)
 
-    cpdef list find_isomorphism(self, Graph other, dict initial_map=None, bint save_order=False, bint strict=True):
+    cpdef list find_isomorphism(self, Graph other, dict initial_map=None, bint save_order=False, bint strict=True,
+                                bint find_all=True):
         """
         Returns :data:`True` if `other` is subgraph isomorphic and :data:`False`
         otherwise, and the matching mapping.
@@ -523,8 +539,9 @@ cdef class Graph(object):
             initial_map (dict, optional): initial atom mapping to use
             save_order (bool, optional):  if ``True``, reset atom order after performing atom isomorphism
             strict (bool, optional):     if ``False``, perform isomorphism ignoring electrons
+            find_all (bool, optional):   if ``False``, only return the first mapping found
         """
-        return vf2.find_isomorphism(self, other, initial_map, save_order=save_order, strict=strict)
+        return vf2.find_isomorphism(self, other, initial_map, save_order=save_order, strict=strict, find_all=find_all)
 
     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=None, bint save_order=False) except -2:
         """
@@ -547,30 +564,27 @@ cdef class Graph(object):
         Return ``True`` if one or more cycles are present in the graph or
         ``False`` otherwise.
         """
-        cdef Vertex vertex
-        for vertex in self.vertices:
-            if self.is_vertex_in_cycle(vertex):
-                return True
-        return False
+        return len(self._get_cyclic_edges()) > 0
 
     cpdef bint is_vertex_in_cycle(self, Vertex vertex) except -2:
         """
         Return ``True`` if the given `vertex` is contained in one or more
         cycles in the graph, or ``False`` if not.
         """
-        return self._is_chain_in_cycle([vertex])
+        cdef dict cyclic_edges
+        cdef Edge edge
+        cyclic_edges = self._get_cyclic_edges()
+        for edge in vertex.edges.values():
+            if id(edge) in cyclic_edges:
+                return True
+        return False
 
     cpdef bint is_edge_in_cycle(self, Edge edge) except -2:
         """
         Return :data:`True` if the edge between vertices `vertex1` and `vertex2`
         is in one or more cycles in the graph, or :data:`False` if not.
         """
-        cdef list cycles
-        cycles = self.get_all_cycles(edge.vertex1)
-        for cycle in cycles:
-            if edge.vertex2 in cycle:
-                return True
-        return False
+        return id(edge.vertex1.edges.get(edge.vertex2)) in self._get_cyclic_edges()
 
     cpdef bint _is_chain_in_cycle(self, list chain) except -2:
         """
@@ -958,7 +972,8 @@ cdef class Graph(object):
     cpdef list get_smallest_set_of_smallest_rings(self):
         """
         Returns the smallest set of smallest rings as a list of lists.
-        Uses RingDecomposerLib for ring perception.
+        Uses RingDecomposerLib for ring perception. The rings are cached
+        until the graph is modified.
 
         Kolodzik, A.; Urbaczek, S.; Rarey, M.
         Unique Ring Families: A Chemically Meaningful Description
@@ -970,28 +985,19 @@ cdef class Graph(object):
         Unique Ring Families and Other Cycle Bases.
         J. Chem. Inf. Model., 2017, 57 (2), pp 122-126
         """
-        cdef list sssr
-        cdef object graph, data, cycle
+        cdef list cycle
 
-        graph = py_rdl.Graph.from_edges(
-            self.get_all_edges(),
-            _get_edge_vertex1,
-            _get_edge_vertex2,
-        )
-
-        data = py_rdl.wrapper.DataInternal(graph.get_nof_nodes(), graph.get_edges().keys())
-        data.calculate()
+        self._check_ring_perception()
+        if self._sssr is None:
+            self._perceive_rings()
 
-        sssr = []
-        for cycle in data.get_sssr():
-            sssr.append(self.sort_cyclic_vertices([graph.get_node_for_index(i) for i in cycle.nodes]))
-
-        return sssr
+        return [list(cycle) for cycle in self._sssr]
 
     cpdef list get_relevant_cycles(self):
         """
         Returns the set of relevant cycles as a list of lists.
-        Uses RingDecomposerLib for ring perception.
+        Uses RingDecomposerLib for ring perception. The cycles are cached
+        until the graph is modified.
 
         Kolodzik, A.; Urbaczek, S.; Rarey, M.
         Unique Ring Families: A Chemically Meaningful Description
@@ -1003,9 +1009,91 @@ cdef class Graph(object):
         Unique Ring Families and Other Cycle Bases.
         J. Chem. Inf. Model., 2017, 57 (2), pp 122-126
         """
-        cdef list rc
+        cdef list cycle
+
+        self._check_ring_perception()
+        if self._relevant_cycles is None:
+            self._perceive_rings()
+
+        return [list(cycle) for cycle in self._relevant_cycles]
+
+    cdef _check_ring_perception(self):
+        """
+        Clear the cached results of ring perception if the graph has been
+        modified since they were computed.
+        """
+        if self._ring_perception_vertices is not self.vertices or self._ring_perception_count != self._mutation_count:
+            self._ring_perception_vertices = self.vertices
+            self._ring_perception_count = self._mutation_count
+            self._cyclic_edges = None
+            self._sssr = None
+            self._relevant_cycles = None
+
+    cdef dict _get_cyclic_edges(self):
+        """
+        Return the edges contained in one or more cycles, i.e. those which are
+        not bridges, found using a depth-first search. The edges are returned
+        in a dict keyed by their ids, since the hashes of edges such as bonds
+        can change with their properties. The dict is cached and must not be
+        modified.
+        """
+        cdef dict cyclic_edges, order, low
+        cdef list stack
+        cdef Vertex root, vertex, parent, child
+        cdef Edge edge
+
+        self._check_ring_perception()
+        if self._cyclic_edges is not None:
+            return self._cyclic_edges
+
+        cyclic_edges = {}
+        order = {}
+        low = {}
+        for root in self.vertices:
+            if id(root) in order:
+                continue
+            order[id(root)] = low[id(root)] = len(order)
+            stack = [(root, None, iter(root.edges))]
+            while stack:
+                vertex, parent, children = stack[-1]
+                for child in children:
+                    if id(child) not in order:
+                        order[id(child)] = low[id(child)] = len(order)
+                        stack.append((child, vertex, iter(child.edges)))
+                        break
+                    elif child is not parent and order[id(child)] < order[id(vertex)]:
+                        # An edge back to an ancestor closes a cycle
+                        edge = vertex.edges[child]
+                        cyclic_edges[id(edge)] = edge
+                        low[id(vertex)] = min(low[id(vertex)], order[id(child)])
+                else:
+                    stack.pop()
+                    if parent is not None:
+                        low[id(parent)] = min(low[id(parent)], low[id(vertex)])
+                        if low[id(vertex)] <= order[id(parent)]:
+                            # The edge to the parent is not a bridge
+                            edge = vertex.edges[parent]
+                            cyclic_edges[id(edge)] = edge
+
+        self._cyclic_edges = cyclic_edges
+        return cyclic_edges
+
+    cdef _perceive_rings(self):
+        """
+        Perceive the rings of the graph using RingDecomposerLib, and cache the
+        smallest set of smallest rings and the relevant cycles. RingDecomposerLib
+        is not called for acyclic graphs.
+        """
+        global ring_perception_count
         cdef object graph, data, cycle
 
+        if not self._get_cyclic_edges():
+            self._sssr = []
+            self._relevant_cycles = []
+            return
+
+        ring_perception_count += 1
+
         graph = py_rdl.Graph.from_edges(
             self.get_all_edges(),
             _get_edge_vertex1,
@@ -1015,11 +1103,39 @@ cdef class Graph(object):
         data = py_rdl.wrapper.DataInternal(graph.get_nof_nodes(), graph.get_edges().keys())
         data.calculate()
 
-        rc = []
+        self._sssr = []
+        for cycle in data.get_sssr():
+            self._sssr.append(self.sort_cyclic_vertices([graph.get_node_for_index(i) for i in cycle.nodes]))
+
+        self._relevant_cycles = []
         for cycle in data.get_rcs():
-            rc.append(self.sort_cyclic_vertices([graph.get_node_for_index(i) for i in cycle.nodes]))
+            self._relevant_cycles.append(self.sort_cyclic_vertices([graph.get_node_for_index(i) for i in cycle.nodes]))
 
-        return rc
+    cpdef _copy_ring_perception(self, Graph other, dict mapping=None):
+        """
+        Copy the cached results of ring perception from the graph `other`,
+        whose vertices are mapped to those of this graph by `mapping`, or are
+        the same as those of this graph if `mapping` is not given.
+        """
+        cdef Edge edge
+        cdef list cycle
+
+        other._check_ring_perception()
+        self._check_ring_perception()
+        if mapping is None:
+            self._cyclic_edges = other._cyclic_edges
+            self._sssr = other._sssr
+            self._relevant_cycles = other._relevant_cycles
+            return
+        if other._cyclic_edges is not None:
+            self._cyclic_edges = {}
+            for edge in other._cyclic_edges.values():
+                edge = mapping[edge.vertex1].edges[mapping[edge.vertex2]]
+                self._cyclic_edges[id(edge)] = edge
+        if other._sssr is not None:
+            self._sssr = [[mapping[vertex] for vertex in cycle] for cycle in other._sssr]
+        if other._relevant_cycles is not None:
+            self._relevant_cycles = [[mapping[vertex] for vertex in cycle] for cycle in other._relevant_cycles]
 
     cpdef list sort_cyclic_vertices(self, list vertices):
         """
@@ -1158,3 +1274,15 @@ cdef class Graph(object):
                                  'such that consecutive vertices are connected.')
 
         return edges
+
+
+################################################################################
+
+def get_ring_perception_count():
+    """
+    Return the number of ring perceptions done by RingDecomposerLib so far.
+    """
+    return ring_perception_count
+
+
+instrumentation.register_probe('ring perceptions', get_ring_perception_count)
@@ -30,7 +30,7 @@
 
 import unittest
 
-from rmgpy.molecule.graph import Edge, Graph, Vertex
+from rmgpy.molecule.graph import Edge, Graph, Vertex, get_ring_perception_count
 
 ################################################################################
 
@@ -750,6 +750,36 @@ class TestGraph(unittest.TestCase):
         for i in range(5):
             self.assertTrue(self.graph.has_edge(rc[0][i], rc[0][i - 1]))
 
+    def test_ring_perception_cache(self):
+        """
+        Test that ring perception is cached until the graph is modified.
+        """
+        # Create a cycle of length 5
+        edge = Edge(self.graph.vertices[0], self.graph.vertices[4])
+        self.graph.add_edge(edge)
+        count = get_ring_perception_count()
+        sssr = self.graph.get_smallest_set_of_smallest_rings()
+        rc = self.graph.get_relevant_cycles()
+        self.assertEqual(self.graph.get_smallest_set_of_smallest_rings(), sssr)
+        self.assertEqual(get_ring_perception_count(), count + 1)
+        # The cached cycles are not modified through the returned lists
+        rc[0].pop()
+        self.assertEqual(len(self.graph.get_relevant_cycles()[0]), 5)
+
+        # Deep copies keep the cached cycles, mapped to their own vertices
+        graph = self.graph.copy(deep=True)
+        sssr = graph.get_smallest_set_of_smallest_rings()
+        self.assertEqual(get_ring_perception_count(), count + 1)
+        self.assertEqual(len(sssr[0]), 5)
+        self.assertTrue(all([vertex in graph.vertices for vertex in sssr[0]]))
+
+        # Modifying the graph invalidates the cache
+        self.graph.remove_edge(edge)
+        self.assertEqual(self.graph.get_smallest_set_of_smallest_rings(), [])
+        self.assertFalse(self.graph.is_cyclic())
+        self.assertEqual(len(graph.get_relevant_cycles()), 1)
+        self.assertTrue(graph.is_cyclic())
+
     def test_get_polycyclic_rings(self):
         """
         Test that the Graph.get_polycycles() method returns only polycyclic rings.
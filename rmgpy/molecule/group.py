@@ -1725,7 +1725,7 @@ class Group(Graph):
         # Do the isomorphism comparison
         return Graph.is_isomorphic(self, other, initial_map, save_order=save_order)
 
-    def find_isomorphism(self, other, initial_map=None, save_order=False, strict=True):
+    def find_isomorphism(self, other, initial_map=None, save_order=False, strict=True, find_all=True):
         """
         Returns ``True`` if `other` is isomorphic and ``False``
         otherwise, and the matching mapping. The `initial_map` attribute can be
@@ -1733,7 +1733,8 @@ class Group(Graph):
         atoms of `self` are the keys, while the atoms of `other` are the
         values). The returned mapping also uses the atoms of `self` for the keys
         and the atoms of `other` for the values. The `other` parameter must
-        be a :class:`Group` object, or a :class:`TypeError` is raised.
+        be a :class:`Group` object, or a :class:`TypeError` is raised. If
+        `find_all` is ``False``, only the first mapping found is returned.
         """
         if not strict:
             raise NotImplementedError('There is currently no implementation of the strict argument for Group objects.')
@@ -1743,7 +1744,7 @@ class Group(Graph):
             raise TypeError(
                 'Got a {0} object for parameter "other", when a Group object is required.'.format(other.__class__))
         # Do the isomorphism comparison
-        return Graph.find_isomorphism(self, other, initial_map, save_order=save_order)
+        return Graph.find_isomorphism(self, other, initial_map, save_order=save_order, strict=strict, find_all=find_all)
 
     def is_subgraph_isomorphic(self, other, initial_map=None, generate_initial_map=False, save_order=False):
         """
@@ -139,8 +139,12 @@ cdef class Molecule(Graph):
     cdef public bint reactive
     cdef public dict props
     cdef str _fingerprint
+    cdef tuple _invariant_fingerprint
+    cdef tuple _nonstrict_invariant_fingerprint
     cdef str _inchi
     cdef str _smiles
+    cdef dict _identifiers
+    cdef frozenset _identifier_state
 
     cpdef add_atom(self, Atom atom)
 
@@ -190,9 +194,11 @@ cdef class Molecule(Graph):
 
     cpdef dict get_element_count(self)
 
+    cpdef tuple get_invariant_fingerprint(self, bint strict=?)
+
     cpdef bint is_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?, bint strict=?) except -2
 
-    cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?)
+    cpdef list find_isomorphism(self, Graph other, dict initial_map=?, bint save_order=?, bint strict=?, bint find_all=?)
 
     cpdef bint is_subgraph_isomorphic(self, Graph other, dict initial_map=?, bint generate_initial_map=?, bint save_order=?) except -2
 
@@ -208,10 +214,14 @@ cdef class Molecule(Graph):
 
     cpdef from_smiles(self, str smilesstr, backend=?)
 
-    cpdef from_adjacency_list(self, str adjlist, bint saturate_h=?)
+    cpdef from_adjacency_list(self, str adjlist, bint saturate_h=?, bint check_consistency=?)
 
     cpdef from_xyz(self, np.ndarray atomic_nums, np.ndarray coordinates)
     
+    cpdef frozenset get_identifier_state(self)
+
+    cpdef dict get_identifier_cache(self)
+
     cpdef str to_inchi(self)
 
     cpdef str to_augmented_inchi(self)
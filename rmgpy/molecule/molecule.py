@@ -882,8 +882,12 @@ class Molecule(Graph):
         self.multiplicity = multiplicity
         self.reactive = reactive
         self._fingerprint = None
+        self._invariant_fingerprint = None
+        self._nonstrict_invariant_fingerprint = None
         self._inchi = None
         self._smiles = None
+        self._identifiers = None
+        self._identifier_state = None
         self.props = props or {}
 
         if inchi and smiles:
@@ -997,6 +1001,77 @@ class Molecule(Graph):
     def fingerprint(self, fingerprint):
         self._fingerprint = fingerprint
 
+    def get_invariant_fingerprint(self, strict=True):
+        """
+        Return a fingerprint of graph invariants of the molecule, used to
+        accelerate isomorphism comparisons between molecules with the same
+        :attr:`fingerprint`. Two invariant fingerprints matching is a necessary
+        (but not sufficient) condition for the associated molecules to be
+        isomorphic.
+
+        The fingerprint is a tuple of the degree sequence, the numbers of ring
+        atoms and ring bonds, and a hash of the atom environments found by
+        iteratively refining the atoms by those of their neighbors. If
+        `strict` is ``True``, it also contains the bond order histogram and
+        the numbers of radical electrons and lone pairs, and the atom
+        environments include the bond orders, radical electrons, lone pairs
+        and charges. Otherwise electrons are ignored, so all resonance
+        structures have the same fingerprint.
+
+        The fingerprints are cached, and cleared when the molecule is modified
+        using its methods or updated.
+        """
+        cython.declare(atoms=list, neighbors=list, orders=list, ring_bonds=list, labels=list, new_labels=list,
+                       bond_orders=dict, atom=Atom, bond=Bond, i=cython.int, num_labels=cython.int,
+                       num_new_labels=cython.int, fingerprint=tuple)
+        if strict and self._invariant_fingerprint is not None:
+            return self._invariant_fingerprint
+        if not strict and self._nonstrict_invariant_fingerprint is not None:
+            return self._nonstrict_invariant_fingerprint
+
+        atoms = self.vertices
+        index = {atom: i for i, atom in enumerate(atoms)}
+        neighbors = [[index[other] for other in atom.edges] for atom in atoms]
+        if strict:
+            orders = [[bond.order for bond in atom.edges.values()] for atom in atoms]
+        else:
+            orders = [[0] * len(atom.edges) for atom in atoms]
+
+        # Count the ring bonds of each atom
+        ring_bonds = [sum([1 for bond in atom.edges.values() if self.is_edge_in_cycle(bond)]) for atom in atoms]
+
+        if strict:
+            labels = [hash((atom.element.number, atom.element.isotope, len(atom.edges), ring_bonds[i],
+                            atom.radical_electrons, atom.lone_pairs, atom.charge)) for i, atom in enumerate(atoms)]
+        else:
+            labels = [hash((atom.element.number, atom.element.isotope, len(atom.edges), ring_bonds[i]))
+                      for i, atom in enumerate(atoms)]
+        # Refine the labels by those of the neighbors until the number of distinct labels stops increasing
+        num_labels = len(set(labels))
+        while True:
+            new_labels = [hash((labels[i], tuple(sorted(zip(orders[i], [labels[j] for j in neighbors[i]])))))
+                          for i in range(len(atoms))]
+            num_new_labels = len(set(new_labels))
+            labels = new_labels
+            if num_new_labels == num_labels:
+                break
+            num_labels = num_new_labels
+
+        fingerprint = (tuple(sorted([len(atom.edges) for atom in atoms])),
+                       sum([1 for i in ring_bonds if i > 0]), sum(ring_bonds) // 2,
+                       hash(tuple(sorted(labels))))
+        if strict:
+            bond_orders = {}
+            for bond in self.get_all_edges():
+                bond_orders[bond.order] = bond_orders.get(bond.order, 0) + 1
+            fingerprint += (tuple(sorted(bond_orders.items())),
+                            sum([atom.radical_electrons for atom in atoms]),
+                            sum([atom.lone_pairs for atom in atoms]))
+            self._invariant_fingerprint = fingerprint
+        else:
+            self._nonstrict_invariant_fingerprint = fingerprint
+        return fingerprint
+
     @property
     def inchi(self):
         """InChI string for this molecule. Read-only."""
@@ -1021,6 +1096,7 @@ class Molecule(Graph):
         Add an `atom` to the graph. The atom is initialized with no bonds.
         """
         self._fingerprint = self._inchi = self._smiles = None
+        self._invariant_fingerprint = self._nonstrict_invariant_fingerprint = None
         return self.add_vertex(atom)
 
     def add_bond(self, bond):
@@ -1029,6 +1105,7 @@ class Molecule(Graph):
         and `atom2`.
         """
         self._fingerprint = self._inchi = self._smiles = None
+        self._invariant_fingerprint = self._nonstrict_invariant_fingerprint = None
         return self.add_edge(bond)
 
     def get_bonds(self, atom):
@@ -1078,6 +1155,7 @@ class Molecule(Graph):
         removal.
         """
         self._fingerprint = self._inchi = self._smiles = None
+        self._invariant_fingerprint = self._nonstrict_invariant_fingerprint = None
         return self.remove_vertex(atom)
 
     def remove_bond(self, bond):
@@ -1087,6 +1165,7 @@ class Molecule(Graph):
         this removal.
         """
         self._fingerprint = self._inchi = self._smiles = None
+        self._invariant_fingerprint = self._nonstrict_invariant_fingerprint = None
         return self.remove_edge(bond)
 
     def remove_van_der_waals_bonds(self):
@@ -1124,6 +1203,7 @@ class Molecule(Graph):
         Update multiplicity, and sort atoms using the new
         connectivity values.
         """
+        self._invariant_fingerprint = self._nonstrict_invariant_fingerprint = None
 
         for atom in self.atoms:
             atom.update_charge()
@@ -1238,6 +1318,12 @@ class Molecule(Graph):
             v2.sorting_label = v1.sorting_label
         other.multiplicity = self.multiplicity
         other.reactive = self.reactive
+        if deep:
+            other._copy_ring_perception(g)
+        # Identifiers do not depend on the atom objects, so the copy can reuse them
+        if self._identifiers and self.get_identifier_cache():
+            other._identifiers = dict(self._identifiers)
+            other._identifier_state = other.get_identifier_state()
         return other
 
     def merge(self, other):
@@ -1292,6 +1378,7 @@ class Molecule(Graph):
                        bond=Bond, atoms=list, zBoundary=float)
         # groupBond=GroupBond,
         self._fingerprint = None
+        self._invariant_fingerprint = self._nonstrict_invariant_fingerprint = None
 
         atoms = self.vertices
 
@@ -1450,6 +1537,9 @@ class Molecule(Graph):
         # check multiplicity
         if self.multiplicity != other.multiplicity:
             return False
+        # Compare the graph invariants, which is also necessary for isomorphism
+        if self.get_invariant_fingerprint(strict) != other.get_invariant_fingerprint(strict):
+            return False
 
         if generate_initial_map:
             initial_map = dict()
@@ -1468,7 +1558,7 @@ class Molecule(Graph):
         result = Graph.is_isomorphic(self, other, initial_map, save_order=save_order, strict=strict)
         return result
 
-    def find_isomorphism(self, other, initial_map=None, save_order=False, strict=True):
+    def find_isomorphism(self, other, initial_map=None, save_order=False, strict=True, find_all=True):
         """
         Returns :data:`True` if `other` is isomorphic and :data:`False`
         otherwise, and the matching mapping. The `initialMap` attribute can be
@@ -1482,6 +1572,7 @@ class Molecule(Graph):
             initial_map (dict, optional): initial atom mapping to use
             save_order (bool, optional):  if ``True``, reset atom order after performing atom isomorphism
             strict (bool, optional):      if ``False``, perform isomorphism ignoring electrons
+            find_all (bool, optional):    if ``False``, only return the first mapping found
         """
         # It only makes sense to compare a Molecule to a Molecule for full
         # isomorphism, so raise an exception if this is not what was requested
@@ -1496,9 +1587,13 @@ class Molecule(Graph):
         # check multiplicity
         if self.multiplicity != other.multiplicity:
             return []
+        # Compare the graph invariants, which is also necessary for isomorphism
+        if self.get_invariant_fingerprint(strict) != other.get_invariant_fingerprint(strict):
+            return []
 
         # Do the isomorphism comparison
-        result = Graph.find_isomorphism(self, other, initial_map, save_order=save_order, strict=strict)
+        result = Graph.find_isomorphism(self, other, initial_map, save_order=save_order, strict=strict,
+                                        find_all=find_all)
         return result
 
     def is_subgraph_isomorphic(self, other, initial_map=None, generate_initial_map=False, save_order=False):
@@ -1679,15 +1774,17 @@ class Molecule(Graph):
         translator.from_smarts(self, smartsstr)
         return self
 
-    def from_adjacency_list(self, adjlist, saturate_h=False):
+    def from_adjacency_list(self, adjlist, saturate_h=False, check_consistency=True):
         """
         Convert a string adjacency list `adjlist` to a molecular structure.
         Skips the first line (assuming it's a label) unless `withLabel` is
-        ``False``.
+        ``False``. The valence and multiplicity checks on the atoms are skipped
+        if `check_consistency` is ``False``.
         """
         from rmgpy.molecule.adjlist import from_adjacency_list
 
-        self.vertices, self.multiplicity = from_adjacency_list(adjlist, group=False, saturate_h=saturate_h)
+        self.vertices, self.multiplicity = from_adjacency_list(adjlist, group=False, saturate_h=saturate_h,
+                                                               check_consistency=check_consistency)
         self.update_atomtypes()
         self.identify_ring_membership()
 
@@ -1741,6 +1838,39 @@ class Molecule(Graph):
         new_mol.update_atomtypes()
         return new_mol
 
+    def get_identifier_state(self):
+        """
+        Return a hashable snapshot of everything the string identifiers of this
+        molecule depend on: the multiplicity, the element, isotope, charge,
+        radical electrons and lone pairs of each atom, and the bonds with their
+        orders. Atoms are identified by object, so the snapshot does not change
+        when the atoms are merely reordered.
+        """
+        cython.declare(atom=Atom, neighbor=Atom, bond=Bond, atom_states=list, bond_states=list)
+        atom_states = [self.multiplicity]
+        for atom in self.vertices:
+            bond_states = []
+            for neighbor, bond in atom.edges.items():
+                bond_states.append((id(neighbor), bond.order))
+            atom_states.append((id(atom), atom.element.symbol, atom.element.isotope, atom.charge,
+                                atom.radical_electrons, atom.lone_pairs, frozenset(bond_states)))
+        return frozenset(atom_states)
+
+    def get_identifier_cache(self):
+        """
+        Return the dictionary in which the string identifiers (SMILES, InChI,
+        InChI key and their augmented forms) generated for this molecule are
+        memoized by :mod:`rmgpy.molecule.translator`. The dictionary is emptied
+        whenever the structure has changed since it was last filled, whether
+        through the graph methods or by modifying atoms and bonds directly.
+        """
+        cython.declare(state=frozenset)
+        state = self.get_identifier_state()
+        if self._identifiers is None or state != self._identifier_state:
+            self._identifiers = {}
+            self._identifier_state = state
+        return self._identifiers
+
     def to_inchi(self):
         """
         Convert a molecular structure to an InChI string. Uses
@@ -2038,11 +2168,11 @@ class Molecule(Graph):
     def calculate_symmetry_number(self):
         """
         Return the symmetry number for the structure. The symmetry number
-        includes both external and internal modes.
+        includes both external and internal modes. The equivalent atoms and
+        groups are found from the automorphism group of the structure.
         """
-        from rmgpy.molecule.symmetry import calculate_symmetry_number
-        self.update_connectivity_values()  # for consistent results
-        self.symmetry_number = calculate_symmetry_number(self)
+        from rmgpy.molecule.symmetry import calculate_automorphism_symmetry_number
+        self.symmetry_number = calculate_automorphism_symmetry_number(self)
         return self.symmetry_number
 
     def is_radical(self):
@@ -2114,6 +2244,7 @@ class Molecule(Graph):
         number of lone electron pairs, assuming a neutral molecule.
         """
         cython.declare(atom1=Atom, atom2=Atom, bond12=Bond, order=float)
+        self._invariant_fingerprint = None
         for atom1 in self.vertices:
             if atom1.is_hydrogen() or atom1.is_surface_site():
                 atom1.lone_pairs = 0
@@ -2207,17 +2338,11 @@ class Molecule(Graph):
         """
         Performs ring perception and saves ring membership information to the Atom.props attribute.
         """
-        cython.declare(rc=list, atom=Atom, ring=list)
+        cython.declare(atom=Atom)
 
-        # Get the set of relevant cycles
-        rc = self.get_relevant_cycles()
         # Identify whether each atom is in a ring
         for atom in self.atoms:
-            atom.props['inRing'] = False
-            for ring in rc:
-                if atom in ring:
-                    atom.props['inRing'] = True
-                    break
+            atom.props['inRing'] = self.is_vertex_in_cycle(atom)
 
     def count_aromatic_rings(self):
         """
@@ -2441,6 +2566,7 @@ class Molecule(Graph):
         Kekulizes an aromatic molecule.
         """
         kekulize(self)
+        self._invariant_fingerprint = None
 
     def assign_atom_ids(self):
         """
@@ -2567,6 +2567,44 @@ multiplicity 2
         self.assertEqual(mol1.fingerprint, expected)
         self.assertEqual(mol2.fingerprint, expected)
 
+    def test_invariant_fingerprint(self):
+        """Test that the invariant fingerprint distinguishes constitutional isomers but not atom orders"""
+        mol1 = Molecule(smiles='CCCCCC')
+        mol2 = Molecule(smiles='CC(C)CCC')
+        mol3 = Molecule(smiles='CCCC(C)C')
+        self.assertEqual(mol1.fingerprint, mol2.fingerprint)
+        self.assertNotEqual(mol1.get_invariant_fingerprint(), mol2.get_invariant_fingerprint())
+        self.assertEqual(mol2.get_invariant_fingerprint(), mol3.get_invariant_fingerprint())
+        self.assertEqual(mol2.get_invariant_fingerprint(strict=False), mol3.get_invariant_fingerprint(strict=False))
+
+        # Rings are distinguished from chains with the same degree sequence
+        mol4 = Molecule(smiles='C1CCC1C')
+        mol5 = Molecule(smiles='C=CCCC')
+        self.assertEqual(mol4.get_invariant_fingerprint()[1:3], (4, 4))
+        self.assertEqual(mol5.get_invariant_fingerprint()[1:3], (0, 0))
+
+    def test_invariant_fingerprint_resonance(self):
+        """Test that the non-strict invariant fingerprint is the same for all resonance structures"""
+        mol = Molecule(smiles='C=CC=C[CH2]')
+        structures = mol.generate_resonance_structures()
+        self.assertGreater(len(structures), 1)
+        self.assertNotEqual(structures[0].get_invariant_fingerprint(), structures[1].get_invariant_fingerprint())
+        for structure in structures:
+            self.assertEqual(structure.get_invariant_fingerprint(strict=False),
+                             mol.get_invariant_fingerprint(strict=False))
+            self.assertTrue(structure.is_isomorphic(mol, strict=False))
+
+    def test_invariant_fingerprint_cleared(self):
+        """Test that the invariant fingerprint is cleared when the molecule is modified"""
+        mol = Molecule(smiles='C')
+        fingerprint = mol.get_invariant_fingerprint()
+        self.assertIs(mol.get_invariant_fingerprint(), fingerprint)
+        mol.remove_atom(mol.atoms[-1])
+        mol.atoms[0].increment_radical()
+        mol.update()
+        self.assertNotEqual(mol.get_invariant_fingerprint(), fingerprint)
+        self.assertEqual(mol.get_invariant_fingerprint(), Molecule(smiles='[CH3]').get_invariant_fingerprint())
+
     def test_saturate_unfilled_valence(self):
         """
         Test the saturateUnfilledValence for an aromatic and nonaromatic case
@@ -34,6 +34,14 @@ cpdef dict analyze_molecule(Molecule mol)
 
 cpdef list generate_resonance_structures(Molecule mol, bint clar_structures=?, bint keep_isomorphic=?, bint filter_structures=?)
 
+cpdef list _find_resonance_structures(Molecule mol, bint clar_structures=?, bint keep_isomorphic=?, bint filter_structures=?)
+
+cpdef list _get_cached_structures(object cache, tuple key, Molecule mol)
+
+cpdef _cache_structures(object cache, int cache_size, tuple key, Molecule template, list mol_list, Molecule mol)
+
+cpdef clear_resonance_cache()
+
 cpdef list _generate_resonance_structures(list mol_list, list method_list, bint keep_isomorphic=?, bint copy=?, bint filter_structures=?)
 
 cpdef list generate_allyl_delocalization_resonance_structures(Molecule mol)
@@ -50,9 +50,14 @@ Currently supported resonance types:
     - ``generate_kekule_structure``: generate a single Kekule structure for an aromatic compound (single/double bond form)
     - ``generate_opposite_kekule_structure``: for monocyclic aromatic species, rotate the double bond assignment
     - ``generate_clar_structures``: generate all structures with the maximum number of pi-sextet assignments
+
+The resonance structures of recently seen molecules are cached, as are the Clar structures, which are by far the most
+expensive to generate. A molecule isomorphic to a cached one gets copies of its structures with the atoms mapped
+accordingly. The caches can be emptied using ``clear_resonance_cache``.
 """
 
 import logging
+from collections import OrderedDict
 
 import cython
 
@@ -64,6 +69,16 @@ from rmgpy.molecule.graph import Vertex
 from rmgpy.molecule.kekulize import kekulize
 from rmgpy.molecule.molecule import Atom, Bond, Molecule
 
+# The resonance structures of recently seen molecules, keyed by the formula,
+# multiplicity and graph invariants of the molecules and the options used. The
+# molecules sharing a key are told apart by isomorphism (see _get_cached_structures())
+RESONANCE_CACHE_SIZE = 1000
+_resonance_cache = OrderedDict()
+
+# The Clar structures of recently seen polycyclic aromatic molecules, keyed the same way
+CLAR_CACHE_SIZE = 1000
+_clar_cache = OrderedDict()
+
 
 def populate_resonance_algorithms(features=None):
     """
@@ -171,7 +186,8 @@ def generate_resonance_structures(mol, clar_structures=True, keep_isomorphic=Fal
     - Stable polycyclic aromatic species: Clar structures are generated
     - Stable monocyclic aromatic species: Kekule structures are generated
     """
-    cython.declare(mol_list=list, new_mol_list=list, features=dict, method_list=list)
+    cython.declare(mol_list=list, ids=list, template=Molecule, key=tuple, structure=Molecule, atom=Atom,
+                   i=cython.int)
 
     # Check that mol is a valid structure in terms of atomTypes and net charge. Since SMILES with hypervalance
     # heteroatoms are not always read correctly, print a suggestion to input the structure using an adjList.
@@ -192,6 +208,48 @@ def generate_resonance_structures(mol, clar_structures=True, keep_isomorphic=Fal
         raise ResonanceError('Can only generate resonance structures for reactive molecules! Got the following '
                              'unreactive structure:\n{0}Reactive = {1}'.format(mol.to_adjacency_list(), mol.reactive))
 
+    # Structures that are isomorphic but not identical are told apart by their atom IDs, so the cache cannot be used
+    # for them if the IDs are not valid
+    if keep_isomorphic and not mol.atom_ids_valid():
+        return _find_resonance_structures(mol, clar_structures, keep_isomorphic, filter_structures)
+
+    key = (mol.fingerprint, mol.multiplicity, mol.get_invariant_fingerprint(), clar_structures, keep_isomorphic,
+           filter_structures)
+    mol_list = _get_cached_structures(_resonance_cache, key, mol)
+    if mol_list is not None:
+        return mol_list
+
+    # The structures are matched to the atoms of the molecule by their IDs, so
+    # number the atoms while the structures are generated if necessary
+    ids = None
+    if not mol.atom_ids_valid():
+        ids = [atom.id for atom in mol.vertices]
+        for i, atom in enumerate(mol.vertices):
+            atom.id = i
+    template = mol.copy(deep=True)
+    mol_list = []
+    try:
+        mol_list = _find_resonance_structures(mol, clar_structures, keep_isomorphic, filter_structures)
+        _cache_structures(_resonance_cache, RESONANCE_CACHE_SIZE, key, template, mol_list, mol)
+    finally:
+        if ids is not None:
+            for atom in mol.vertices:
+                atom.id = ids[atom.id]
+            for structure in mol_list:
+                if structure is not mol:
+                    for atom in structure.vertices:
+                        atom.id = ids[atom.id]
+
+    return mol_list
+
+
+def _find_resonance_structures(mol, clar_structures=True, keep_isomorphic=False, filter_structures=True):
+    """
+    Generate and return all of the resonance structures for the input molecule, which must already have been
+    validated. See :func:`generate_resonance_structures` for the arguments.
+    """
+    cython.declare(mol_list=list, new_mol_list=list, features=dict, method_list=list)
+
     mol_list = [mol]
 
     # Analyze molecule
@@ -242,6 +300,103 @@ def generate_resonance_structures(mol, clar_structures=True, keep_isomorphic=Fal
     return mol_list
 
 
+def _get_cached_structures(cache, key, mol):
+    """
+    Return the structures cached in `cache` under `key` for a molecule
+    isomorphic to `mol`, or ``None`` if there are none. The structures
+    returned are copies of `mol` with the electrons and bond orders of the
+    cached structures, and the structure corresponding to `mol` itself, if any,
+    is `mol`.
+    """
+    cython.declare(entries=list, template=Molecule, atoms=list, structures=list, mappings=list, mapping=dict,
+                   positions=dict, order=list, mol_list=list, structure=Molecule, vertices=list, atom=Atom,
+                   i=cython.int, j=cython.int)
+
+    entries = cache.get(key)
+    if entries is None:
+        return None
+    for template, atoms, structures in entries:
+        mappings = template.find_isomorphism(mol, initial_map=None, save_order=False, strict=True, find_all=False)
+        if mappings:
+            break
+    else:
+        return None
+    cache.move_to_end(key)
+
+    # Get the index in mol of the atom corresponding to each atom of the template
+    mapping = mappings[0]
+    positions = {id(atom): i for i, atom in enumerate(mol.vertices)}
+    order = [positions[id(mapping[atom])] for atom in atoms]
+
+    mol_list = []
+    for atom_states, bond_orders, reactive, is_input in structures:
+        if is_input:
+            structure = mol
+        else:
+            structure = mol.copy(deep=True)
+            vertices = structure.vertices
+            for i, (radical_electrons, lone_pairs, charge, atomtype) in enumerate(atom_states):
+                atom = vertices[order[i]]
+                atom.radical_electrons = radical_electrons
+                atom.lone_pairs = lone_pairs
+                atom.charge = charge
+                atom.atomtype = atomtype
+            for i, j, bond_order in bond_orders:
+                structure.get_bond(vertices[order[i]], vertices[order[j]]).order = bond_order
+        structure.reactive = reactive
+        mol_list.append(structure)
+    return mol_list
+
+
+def _cache_structures(cache, cache_size, key, template, mol_list, mol):
+    """
+    Store the structures in `mol_list` generated for `mol` in `cache` under
+    `key`, along with `template`, a copy of `mol` made beforehand. The atoms of
+    the structures are matched to those of the template by their IDs, which
+    must be unique. Nothing is stored if some structure does not have the atoms
+    and bonds of the template.
+    """
+    cython.declare(atoms=list, index=dict, structures=list, structure=Molecule, atom_states=list, bond_orders=list,
+                   atom=Atom, bond=Bond, i=cython.int, j=cython.int)
+
+    atoms = template.vertices[:]
+    index = {atom.id: i for i, atom in enumerate(atoms)}
+    structures = []
+    for structure in mol_list:
+        if len(structure.vertices) != len(atoms):
+            return
+        atom_states = [None] * len(atoms)
+        for atom in structure.vertices:
+            i = index.get(atom.id, -1)
+            if i < 0 or atom_states[i] is not None:
+                return
+            atom_states[i] = (atom.radical_electrons, atom.lone_pairs, atom.charge, atom.atomtype)
+        bond_orders = []
+        for bond in structure.get_all_edges():
+            i = index[bond.atom1.id]
+            j = index[bond.atom2.id]
+            if not template.has_bond(atoms[i], atoms[j]):
+                return
+            bond_orders.append((i, j, bond.order))
+        if len(bond_orders) != len(template.get_all_edges()):
+            return
+        structures.append((atom_states, bond_orders, structure.reactive, structure is mol))
+
+    cache.setdefault(key, []).append((template, atoms, structures))
+    cache.move_to_end(key)
+    if len(cache) > cache_size:
+        cache.popitem(last=False)
+
+
+def clear_resonance_cache():
+    """
+    Discard all resonance structures cached by :func:`generate_resonance_structures`
+    and Clar structures cached by :func:`generate_clar_structures`.
+    """
+    _resonance_cache.clear()
+    _clar_cache.clear()
+
+
 def _generate_resonance_structures(mol_list, method_list, keep_isomorphic=False, copy=False, filter_structures=True):
     """
     Iteratively generate all resonance structures for a list of starting molecules using the specified methods.
@@ -865,7 +1020,7 @@ def generate_clar_structures(mol):
     Returns a list of :class:`Molecule` objects corresponding to the Clar structures.
     """
     cython.declare(output=list, mol_list=list, new_mol=Molecule, aromatic_rings=list, bonds=list, solution=list,
-                   y=list, x=list, index=cython.int, bond=Bond, ring=list)
+                   y=list, x=list, index=cython.int, bond=Bond, ring=list, key=tuple, template=Molecule)
 
     if not mol.is_cyclic():
         return []
@@ -874,11 +1029,18 @@ def generate_clar_structures(mol):
     if not mol.atom_ids_valid():
         mol.assign_atom_ids()
 
+    # Reuse the Clar structures of an isomorphic molecule if possible, since each one takes an optimization
+    key = (mol.fingerprint, mol.multiplicity, mol.get_invariant_fingerprint())
+    mol_list = _get_cached_structures(_clar_cache, key, mol)
+    if mol_list is not None:
+        return mol_list
+    template = mol.copy(deep=True)
+
     try:
         output = _clar_optimization(mol)
     except ILPSolutionError:
         # The optimization algorithm did not work on the first iteration
-        return []
+        output = []
 
     mol_list = []
 
@@ -911,6 +1073,7 @@ def generate_clar_structures(mol):
         else:
             mol_list.append(new_mol)
 
+    _cache_structures(_clar_cache, CLAR_CACHE_SIZE, key, template, mol_list, mol)
     return mol_list
 
 
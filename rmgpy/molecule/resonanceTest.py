@@ -32,8 +32,10 @@ import unittest
 
 from external.wip import work_in_progress
 from rmgpy.molecule.molecule import Molecule
+import rmgpy.molecule.resonance as resonance
 from rmgpy.molecule.resonance import _clar_optimization, _clar_transformation, generate_clar_structures, \
-    generate_kekule_structure, generate_optimal_aromatic_resonance_structures, generate_resonance_structures
+    generate_kekule_structure, generate_optimal_aromatic_resonance_structures, generate_resonance_structures, \
+    clear_resonance_cache
 
 
 class ResonanceTest(unittest.TestCase):
@@ -1219,6 +1221,55 @@ multiplicity 2
         self.assertEqual(res1, res2)
 
 
+class ResonanceCacheTest(unittest.TestCase):
+    """
+    Contains unit tests for the caching of resonance structures.
+    """
+
+    def setUp(self):
+        clear_resonance_cache()
+
+    def tearDown(self):
+        clear_resonance_cache()
+
+    def test_cached_structures(self):
+        """Test that an isomorphic molecule gets copies of the cached resonance structures"""
+        mol1 = Molecule(smiles='C=C[CH]C=CC')
+        res1 = generate_resonance_structures(mol1)
+        self.assertEqual(len(resonance._resonance_cache), 1)
+
+        # The same molecule, but with the atoms in a different order and one of them labeled
+        mol2 = Molecule(smiles='CC=C[CH]C=C')
+        for atom in mol2.atoms:
+            if atom.radical_electrons:
+                atom.label = '*1'
+        res2 = generate_resonance_structures(mol2)
+        self.assertEqual(len(resonance._resonance_cache), 1)
+
+        self.assertEqual(len(res2), 3)
+        self.assertIs(res2[0], mol2)
+        atoms1 = set([id(atom) for mol in res1 for atom in mol.atoms])
+        for mol in res2:
+            self.assertTrue(any([mol.is_isomorphic(other) for other in res1]))
+            self.assertFalse(any([id(atom) in atoms1 for atom in mol.atoms]))
+            self.assertEqual(len(mol.get_labeled_atoms('*1')), 1)
+        self.assertEqual(len(set([mol.get_labeled_atoms('*1')[0].radical_electrons for mol in res2])), 2)
+
+        # Modifying the returned structures does not affect the cache
+        res2[1].get_labeled_atoms('*1')[0].label = ''
+        res2[1].atoms[0].increment_radical()
+        res3 = generate_resonance_structures(Molecule(smiles='C=C[CH]C=CC'))
+        self.assertEqual(res1, res3)
+
+    def test_cache_options(self):
+        """Test that resonance structures generated with different options are cached separately"""
+        mol = Molecule(smiles='[CH2]C=C[O]')
+        res1 = generate_resonance_structures(mol, filter_structures=False)
+        res2 = generate_resonance_structures(mol.copy(deep=True))
+        self.assertEqual(len(resonance._resonance_cache), 2)
+        self.assertTrue(len(res1) > len(res2))
+
+
 class ClarTest(unittest.TestCase):
     """
     Contains unit tests for Clar structure methods.
@@ -1399,6 +1450,17 @@ class ClarTest(unittest.TestCase):
         self.assertTrue(newmol[3].is_isomorphic(struct))
         self.assertTrue(newmol[4].is_isomorphic(struct))
 
+    def test_clar_cache(self):
+        """Test that the Clar structures of an isomorphic molecule are reused"""
+        clear_resonance_cache()
+        newmol1 = generate_clar_structures(Molecule(smiles='C1=CC=C2C=CC=CC2=C1'))
+        newmol2 = generate_clar_structures(Molecule(smiles='C1=CC2=CC=CC=C2C=C1'))
+        self.assertEqual(len(resonance._clar_cache), 1)
+        self.assertEqual(len(newmol1), len(newmol2))
+        for mol in newmol2:
+            self.assertTrue(any([mol.is_isomorphic(other) for other in newmol1]))
+        clear_resonance_cache()
+
     def test_exocyclic_db(self):
         """Test that Clar structure generation doesn't modify exocyclic double bonds
 
@@ -31,12 +31,22 @@ from rmgpy.molecule.molecule cimport Atom, Bond, Molecule
 
 cpdef float calculate_atom_symmetry_number(Molecule molecule, Atom atom) except -1
 
+cpdef float _get_atom_symmetry_number(Atom atom, list count) except -1
+
 cpdef float calculate_bond_symmetry_number(Molecule molecule, Atom atom1, Atom atom2) except -1
 
 cpdef float calculate_axis_symmetry_number(Molecule molecule) except -1
 
-cpdef float calculate_cyclic_symmetry_number(Molecule molecule) except -1
+cpdef list _get_axes(Molecule molecule)
+
+cpdef float calculate_cyclic_symmetry_number(Molecule molecule, object group=*) except -1
 
 cpdef bint _indistinguishable(Atom atom1, Atom atom2) except -2
 
 cpdef float calculate_symmetry_number(Molecule molecule) except -1
+
+cpdef dict _get_kekule_bond_orders(Molecule molecule)
+
+cpdef float _calculate_automorphism_axis_symmetry_number(Molecule molecule, object group) except -1
+
+cpdef float calculate_automorphism_symmetry_number(Molecule molecule) except -1
@@ -31,8 +31,16 @@
 """
 This module provides functionality for estimating the symmetry number of a
 molecule from its chemical graph representation.
+
+The symmetry number is the product of contributions centered at atoms, bonds,
+axes of cumulated double bonds and rings, each depending on which of the
+surrounding atoms and groups are equivalent. :func:`calculate_symmetry_number`
+finds these by checking copies of the fragments of the molecule for
+isomorphism, while :func:`calculate_automorphism_symmetry_number` reads them
+from the :class:`AutomorphismGroup` of the molecule, which is found only once.
 """
 import itertools
+import math
 
 
 def calculate_atom_symmetry_number(molecule, atom):
@@ -42,28 +50,14 @@ def calculate_atom_symmetry_number(molecule, atom):
     """
     symmetry_number = 1
 
-    single = double = triple = benzene = num_neighbors = 0  # note that 0 is immutable
-    for bond in atom.edges.values():
-        if bond.is_single():
-            single += 1
-        elif bond.is_double():
-            double += 1
-        elif bond.is_triple():
-            triple += 1
-        elif bond.is_benzene():
-            benzene += 1
-        num_neighbors += 1
-
     # If atom has zero or one neighbors, the symmetry number is 1
-    if num_neighbors < 2:
+    if len(atom.edges) < 2:
         return symmetry_number
 
     # Create temporary structures for each functional group attached to atom
-    molecule0 = molecule
-    molecule = molecule0.copy(True)
-    atom = molecule.vertices[molecule0.vertices.index(atom)]
-    molecule.remove_atom(atom)
-    groups = molecule.split()
+    structure = molecule.copy(True)
+    structure.remove_atom(structure.vertices[molecule.vertices.index(atom)])
+    groups = structure.split()
 
     # Determine equivalence of functional groups around atom
     group_isomorphism = dict([(group, dict()) for group in groups])
@@ -87,6 +81,30 @@ def calculate_atom_symmetry_number(molecule, atom):
     count.sort()
     count.reverse()
 
+    symmetry_number *= _get_atom_symmetry_number(atom, count)
+
+    return symmetry_number
+
+
+def _get_atom_symmetry_number(atom, count):
+    """
+    Return the symmetry number centered at `atom` given the sizes `count`,
+    in descending order, of the classes of equivalent groups attached to it.
+    """
+    symmetry_number = 1
+
+    single = double = num_neighbors = 0
+    for bond in atom.edges.values():
+        if bond.is_single():
+            single += 1
+        elif bond.is_double():
+            double += 1
+        num_neighbors += 1
+
+    # If atom has zero or one neighbors, the symmetry number is 1
+    if num_neighbors < 2:
+        return symmetry_number
+
     if atom.radical_electrons == 0:
         if single == 4:
             # Four single bonds
@@ -254,63 +272,7 @@ def calculate_axis_symmetry_number(molecule):
 
     symmetry_number = 1
 
-    # List all double bonds in the structure
-    double_bonds = []
-    for atom1 in molecule.vertices:
-        for atom2 in atom1.edges:
-            if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
-                    and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
-                double_bonds.append((atom1, atom2))
-
-    # Search for adjacent double bonds
-    cumulated_bonds = []
-    for i, bond1 in enumerate(double_bonds):
-        atom11, atom12 = bond1
-        for bond2 in double_bonds[i + 1:]:
-            atom21, atom22 = bond2
-            if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
-                list_to_add_to = None
-                for cumBonds in cumulated_bonds:
-                    if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
-                        list_to_add_to = cumBonds
-                if list_to_add_to is not None:
-                    if (atom11, atom12) not in list_to_add_to:
-                        list_to_add_to.append((atom11, atom12))
-                    if (atom21, atom22) not in list_to_add_to:
-                        list_to_add_to.append((atom21, atom22))
-                else:
-                    cumulated_bonds.append([(atom11, atom12), (atom21, atom22)])
-
-    # Also keep isolated double bonds
-    for bond1 in double_bonds:
-        for bonds in cumulated_bonds:
-            if bond1 in bonds:
-                break
-        else:
-            cumulated_bonds.append([bond1])
-
-    # For each set of adjacent double bonds, check for axis symmetry
-    for bonds in cumulated_bonds:
-        # Do nothing if axis is in cycle
-        found = False
-        for atom1, atom2 in bonds:
-            if molecule.is_bond_in_cycle(atom1.edges[atom2]):
-                found = True
-        if found:
-            continue
-
-        # Find terminal atoms in axis
-        # Terminal atoms labelled T:  T=C=C=C=T
-        axis = []
-        for bond in bonds:
-            axis.extend(bond)
-        terminal_atoms = []
-        for atom in axis:
-            if axis.count(atom) == 1:
-                terminal_atoms.append(atom)
-        if len(terminal_atoms) != 2:
-            continue
-
+    for bonds, terminal_atoms in _get_axes(molecule):
         # Remove axis from (copy of) structure
         bond_list = []
         for atom1, atom2 in bonds:
@@ -390,15 +352,92 @@ def calculate_axis_symmetry_number(molecule):
     return symmetry_number
 
 
+def _get_axes(molecule):
+    """
+    Return a list of the axes of `molecule` that are not in a cycle, each as a
+    tuple of its list of cumulated double bonds, given as pairs of atoms, and
+    its two terminal atoms.
+    """
+    # List all double bonds in the structure
+    double_bonds = []
+    for atom1 in molecule.vertices:
+        for atom2 in atom1.edges:
+            if (atom1.edges[atom2].is_double() or atom1.edges[atom2].order > 2) \
+                    and molecule.vertices.index(atom1) < molecule.vertices.index(atom2):
+                double_bonds.append((atom1, atom2))
+
+    # Search for adjacent double bonds
+    cumulated_bonds = []
+    for i, bond1 in enumerate(double_bonds):
+        atom11, atom12 = bond1
+        for bond2 in double_bonds[i + 1:]:
+            atom21, atom22 = bond2
+            if atom11 is atom21 or atom11 is atom22 or atom12 is atom21 or atom12 is atom22:
+                list_to_add_to = None
+                for cumBonds in cumulated_bonds:
+                    if (atom11, atom12) in cumBonds or (atom21, atom22) in cumBonds:
+                        list_to_add_to = cumBonds
+                if list_to_add_to is not None:
+                    if (atom11, atom12) not in list_to_add_to:
+                        list_to_add_to.append((atom11, atom12))
+                    if (atom21, atom22) not in list_to_add_to:
+                        list_to_add_to.append((atom21, atom22))
+                else:
+                    cumulated_bonds.append([(atom11, atom12), (atom21, atom22)])
+
+    # Also keep isolated double bonds
+    for bond1 in double_bonds:
+        for bonds in cumulated_bonds:
+            if bond1 in bonds:
+                break
+        else:
+            cumulated_bonds.append([bond1])
+
+    # For each set of adjacent double bonds, find the terminal atoms
+    axes = []
+    for bonds in cumulated_bonds:
+        # Skip axes in a cycle
+        found = False
+        for atom1, atom2 in bonds:
+            if molecule.is_bond_in_cycle(atom1.edges[atom2]):
+                found = True
+        if found:
+            continue
+
+        # Find terminal atoms in axis
+        # Terminal atoms labelled T:  T=C=C=C=T
+        axis = []
+        for bond in bonds:
+            axis.extend(bond)
+        terminal_atoms = []
+        for atom in axis:
+            if axis.count(atom) == 1:
+                terminal_atoms.append(atom)
+        if len(terminal_atoms) != 2:
+            continue
+
+        axes.append((bonds, terminal_atoms))
+
+    return axes
+
+
 ################################################################################
 
-def calculate_cyclic_symmetry_number(molecule):
+def calculate_cyclic_symmetry_number(molecule, group=None):
     """
     Get the symmetry number correction for cyclic regions of a molecule.
     For complicated fused rings the smallest set of smallest rings is used.
+    If the :class:`AutomorphismGroup` of the molecule is given as `group`,
+    atoms in the same orbit are taken as indistinguishable, rather than
+    comparing their nearest neighbors.
     """
     symmetry_number = 1
 
+    if group is None:
+        indistinguishable = _indistinguishable
+    else:
+        indistinguishable = group.is_equivalent
+
     # for polycyclics, We should be getting the largest ring, not the smallest
     single_rings, polycyclic_rings = molecule.get_disparate_cycles()
     for ring in polycyclic_rings:
@@ -420,7 +459,7 @@ def calculate_cyclic_symmetry_number(molecule):
                 starting_index = 0
                 while all_the_same and starting_index < size // 2:
                     for atom_index in range(num_rotations, size, num_rotations):
-                        if not _indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):
+                        if not indistinguishable(ring[starting_index], ring[(starting_index + atom_index) % size]):
                             all_the_same = False
                             break
                     starting_index += 1
@@ -443,7 +482,7 @@ def calculate_cyclic_symmetry_number(molecule):
             while min_index <= max_index:
                 # ensure the two atoms are different. use mod size to loop to the start
                 # of the list when index out of bounds
-                if not _indistinguishable(ring[min_index % size], ring[max_index % size]):
+                if not indistinguishable(ring[min_index % size], ring[max_index % size]):
                     all_the_same = False
                     break
                 min_index += 1
@@ -460,19 +499,19 @@ def calculate_cyclic_symmetry_number(molecule):
                         pass  # all_the_same still true
                     elif len(non_ring_bonded_atoms) == 3:
                         # at least one of these much be a match for flipping to happen
-                        identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
-                        identical2 = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2])
-                        identical3 = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])
+                        identical = indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+                        identical2 = indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2])
+                        identical3 = indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2])
                         if not (identical or identical2 or identical3):
                             all_the_same = False
                     elif len(non_ring_bonded_atoms) == 4:
-                        same_sides = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
-                                     _indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
+                        same_sides = indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1]) and \
+                                     indistinguishable(non_ring_bonded_atoms[2], non_ring_bonded_atoms[3])
                         if not same_sides:
-                            atom0_matching = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \
-                                             _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])
-                            atom1_matching = _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \
-                                             _indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])
+                            atom0_matching = indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[2]) or \
+                                             indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[3])
+                            atom1_matching = indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[2]) or \
+                                             indistinguishable(non_ring_bonded_atoms[1], non_ring_bonded_atoms[3])
                             if not (atom0_matching and atom1_matching):
                                 all_the_same = False
                 else:
@@ -482,7 +521,7 @@ def calculate_cyclic_symmetry_number(molecule):
                     if len(non_ring_bonded_atoms) < 2:
                         pass  # all_the_same still true
                     elif len(non_ring_bonded_atoms) == 2:
-                        identical = _indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
+                        identical = indistinguishable(non_ring_bonded_atoms[0], non_ring_bonded_atoms[1])
                         if not identical:
                             # flipping a tetrahedral will not work
                             all_the_same = False
@@ -497,7 +536,7 @@ def calculate_cyclic_symmetry_number(molecule):
                 while min_index < max_index:
                     # ensure the two atoms are different. use mod size to loop to the start
                     # of the list when index out of bounds
-                    if not _indistinguishable(ring[min_index % size], ring[max_index % size]):
+                    if not indistinguishable(ring[min_index % size], ring[max_index % size]):
                         all_the_same = False
                         break
                     min_index += 1
@@ -567,3 +606,462 @@ def calculate_symmetry_number(molecule):
         symmetry_number *= calculate_cyclic_symmetry_number(molecule)
 
     return symmetry_number
+
+
+################################################################################
+
+class AutomorphismGroup(object):
+    """
+    The automorphism group of the graph of a molecule, found once by
+    canonical refinement of the partition of its atoms with orbit pruning of
+    the search tree. Atoms are referred to internally by their index in the
+    atom list of the molecule, and each automorphism is a list holding the
+    index of the image of every atom. The attributes are:
+
+    =================== =======================================================
+    Attribute           Description
+    =================== =======================================================
+    `molecule`          The molecule whose automorphisms are held
+    `generators`        A list of automorphisms generating the group
+    `order`             The number of automorphisms in the group
+    `orbits`            A list of the index of the first atom in the orbit of each atom
+    =================== =======================================================
+
+    The bonds of the molecule are compared by order, unless it is overridden
+    by `bond_orders`, a dict mapping the ids of bonds to their orders.
+    Terminal atoms bonded alike to the same atom are interchangeable, so they
+    are left out of the search and their permutations are added to its result.
+    """
+
+    def __init__(self, molecule, bond_orders=None):
+        self.molecule = molecule
+        if bond_orders is None:
+            bond_orders = {}
+        self._indices = dict([(id(atom), i) for i, atom in enumerate(molecule.atoms)])
+        self._labels = [(atom.element.symbol, atom.element.isotope, atom.radical_electrons, atom.lone_pairs,
+                         atom.charge, atom.atomtype.label if atom.atomtype is not None else '')
+                        for atom in molecule.atoms]
+        self._edges = [dict([(self._indices[id(neighbor)], round(bond_orders.get(id(bond), bond.order), 3))
+                             for neighbor, bond in atom.edges.items()]) for atom in molecule.atoms]
+        self._transversals = {}
+        self._neighbor_orbits = {}
+        self.generators = []
+        self.order = 1
+        self.orbits = []
+        self._generate()
+
+    def is_equivalent(self, atom1, atom2):
+        """
+        Return ``True`` if an automorphism maps `atom1` onto `atom2`, or
+        ``False`` if not.
+        """
+        return self.orbits[self._indices[id(atom1)]] == self.orbits[self._indices[id(atom2)]]
+
+    def get_equivalent_neighbors(self, atom):
+        """
+        Return the neighbors of `atom` as a list of lists of the neighbors that
+        are exchanged by the automorphisms fixing `atom`.
+        """
+        atoms = self.molecule.atoms
+        classes = {}
+        for i, j in self._get_neighbor_orbits(self._indices[id(atom)]).items():
+            classes.setdefault(j, []).append(atoms[i])
+        return [classes[j] for j in sorted(classes)]
+
+    def is_bond_reversible(self, atom1, atom2):
+        """
+        Return ``True`` if an automorphism exchanges the bonded atoms `atom1`
+        and `atom2`, or ``False`` if not.
+        """
+        index1, index2 = self._indices[id(atom1)], self._indices[id(atom2)]
+        root = self.orbits[index1]
+        if self.orbits[index2] != root:
+            return False
+        # Move the bond onto the first atom of the orbit, where an automorphism
+        # exchanging the atoms must take the neighbor `other` onto the root
+        # and the root onto it
+        transversal = self._get_transversal(root)
+        other = transversal[index1].index(index2)
+        target = transversal[other].index(root)
+        orbits = self._get_neighbor_orbits(root)
+        return orbits[other] == orbits[target]
+
+    def _generate(self):
+        """
+        Find the generators, order and orbits of the group.
+        """
+        labels, edges = self._labels, self._edges
+        num_atoms = len(labels)
+
+        twins = {}
+        for i in range(num_atoms):
+            if len(edges[i]) == 1:
+                parent, order = list(edges[i].items())[0]
+                if len(edges[parent]) > 1:
+                    twins.setdefault(parent, {}).setdefault((labels[i], order), []).append(i)
+        terminal = set([i for classes in twins.values() for atoms in classes.values() for i in atoms])
+
+        # Search the graph of the other atoms, in which each atom is also
+        # labeled by the terminal atoms it bears
+        heavy = [i for i in range(num_atoms) if i not in terminal]
+        reduced = dict([(i, k) for k, i in enumerate(heavy)])
+        self._graph = [dict([(reduced[j], order) for j, order in edges[i].items() if j in reduced]) for i in heavy]
+        self._graph_labels = [(labels[i], tuple(sorted([(key, len(atoms)) for key, atoms in twins.get(i, {}).items()])))
+                              for i in heavy]
+        self._parents = list(range(len(heavy)))
+        for automorphism in self._search(self._rank(self._graph_labels)):
+            permutation = list(range(num_atoms))
+            for k, image in enumerate(automorphism):
+                i, j = heavy[k], heavy[image]
+                permutation[i] = j
+                for key, atoms in twins.get(i, {}).items():
+                    for atom, image_atom in zip(atoms, twins[j][key]):
+                        permutation[atom] = image_atom
+            self.generators.append(permutation)
+
+        for classes in twins.values():
+            for atoms in classes.values():
+                for atom1, atom2 in zip(atoms[:-1], atoms[1:]):
+                    permutation = list(range(num_atoms))
+                    permutation[atom1], permutation[atom2] = atom2, atom1
+                    self.generators.append(permutation)
+                self.order *= math.factorial(len(atoms))
+
+        self._parents = list(range(num_atoms))
+        for generator in self.generators:
+            self._merge_orbits(generator)
+        self.orbits = [self._find_orbit(i) for i in range(num_atoms)]
+
+    def _rank(self, keys):
+        """
+        Return the rank of each of the sortable `keys` among the distinct ones.
+        """
+        ranks = dict([(key, rank) for rank, key in enumerate(sorted(set(keys)))])
+        return [ranks[key] for key in keys]
+
+    def _refine(self, colors):
+        """
+        Return the coarsest equitable refinement of the coloring `colors` of
+        the searched graph, ordering the new colors consistently with the old.
+        """
+        graph = self._graph
+        num_colors = len(set(colors))
+        while True:
+            keys = [(color, tuple(sorted([(order, colors[j]) for j, order in graph[i].items()])))
+                    for i, color in enumerate(colors)]
+            refined = self._rank(keys)
+            num_refined = len(set(refined))
+            if num_refined == num_colors:
+                return refined
+            colors, num_colors = refined, num_refined
+
+    def _individualize(self, colors, atom):
+        """
+        Return the refinement of `colors` in which `atom` precedes the other
+        atoms of its color.
+        """
+        return self._refine(self._rank([2 * color + (i != atom) for i, color in enumerate(colors)]))
+
+    def _get_target_cell(self, colors):
+        """
+        Return the atoms of the first color shared by several atoms, or an
+        empty list if the coloring is discrete.
+        """
+        counts = [0] * len(colors)
+        for color in colors:
+            counts[color] += 1
+        for target, count in enumerate(counts):
+            if count > 1:
+                return [i for i, color in enumerate(colors) if color == target]
+        return []
+
+    def _search(self, colors):
+        """
+        Return the generators of the automorphism group of the searched graph.
+        The first path of the search tree is followed down to a discrete
+        coloring. Going back up, an automorphism onto each other branch is
+        looked for, unless the branch is in an orbit already known.
+        """
+        generators = []
+        path = []
+        colors = self._refine(colors)
+        cell = self._get_target_cell(colors)
+        while cell:
+            path.append((colors, cell))
+            colors = self._individualize(colors, cell[0])
+            cell = self._get_target_cell(colors)
+        leaf = self._get_leaf(colors)
+        invariants = [sorted(colors) for colors, cell in path]
+
+        for level in range(len(path) - 1, -1, -1):
+            colors, cell = path[level]
+            failed = set()
+            for atom in cell[1:]:
+                orbit = self._find_orbit(atom)
+                if orbit == self._find_orbit(cell[0]) or orbit in failed:
+                    continue
+                automorphism = self._find_automorphism(self._individualize(colors, atom), leaf, invariants, level + 1)
+                if automorphism is None:
+                    failed.add(orbit)
+                else:
+                    generators.append(automorphism)
+                    self._merge_orbits(automorphism)
+                    failed = set([self._find_orbit(i) for i in failed])
+            root = self._find_orbit(cell[0])
+            self.order *= len([atom for atom in cell if self._find_orbit(atom) == root])
+        return generators
+
+    def _find_automorphism(self, colors, leaf, invariants, level):
+        """
+        Return an automorphism of the searched graph mapping the first `leaf`
+        onto a discrete coloring below `colors` at depth `level` of the search
+        tree, or ``None`` if there is none.
+        """
+        cell = self._get_target_cell(colors)
+        if not cell:
+            automorphism = [0] * len(leaf)
+            for i, j in zip(leaf, self._get_leaf(colors)):
+                automorphism[i] = j
+            return automorphism if self._is_automorphism(automorphism) else None
+        if level >= len(invariants) or sorted(colors) != invariants[level]:
+            return None
+        for atom in cell:
+            automorphism = self._find_automorphism(self._individualize(colors, atom), leaf, invariants, level + 1)
+            if automorphism is not None:
+                return automorphism
+        return None
+
+    def _get_leaf(self, colors):
+        """
+        Return the atoms of the discrete coloring `colors` in color order.
+        """
+        leaf = [0] * len(colors)
+        for i, color in enumerate(colors):
+            leaf[color] = i
+        return leaf
+
+    def _is_automorphism(self, permutation):
+        """
+        Return ``True`` if `permutation` preserves the labels and bonds of the
+        searched graph, or ``False`` if not.
+        """
+        labels, graph = self._graph_labels, self._graph
+        for i, j in enumerate(permutation):
+            if labels[i] != labels[j] or len(graph[i]) != len(graph[j]):
+                return False
+            for k, order in graph[i].items():
+                if graph[j].get(permutation[k]) != order:
+                    return False
+        return True
+
+    def _find_orbit(self, i):
+        """
+        Return the first atom known to be in the orbit of atom `i`.
+        """
+        parents = self._parents
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    def _merge_orbits(self, permutation):
+        """
+        Merge the orbits joined by `permutation`.
+        """
+        parents = self._parents
+        for i, j in enumerate(permutation):
+            root1, root2 = self._find_orbit(i), self._find_orbit(j)
+            if root1 < root2:
+                parents[root2] = root1
+            elif root2 < root1:
+                parents[root1] = root2
+
+    def _get_transversal(self, root):
+        """
+        Return a dict mapping each atom in the orbit of atom `root` to an
+        automorphism taking `root` onto it.
+        """
+        try:
+            return self._transversals[root]
+        except KeyError:
+            pass
+        transversal = {root: list(range(len(self._labels)))}
+        queue = [root]
+        for i in queue:
+            for generator in self.generators:
+                j = generator[i]
+                if j not in transversal:
+                    transversal[j] = [generator[k] for k in transversal[i]]
+                    queue.append(j)
+        self._transversals[root] = transversal
+        return transversal
+
+    def _get_neighbor_orbits(self, i):
+        """
+        Return a dict mapping each neighbor of atom `i` to the first neighbor
+        in its orbit under the automorphisms fixing `i`. These are found for
+        the first atom of the orbit of `i`, from the Schreier generators of its
+        stabilizer, and carried over to `i`.
+        """
+        root = self.orbits[i]
+        try:
+            orbits = self._neighbor_orbits[root]
+        except KeyError:
+            neighbors = sorted(self._edges[root])
+            orbits = dict([(j, j) for j in neighbors])
+            transversal = self._get_transversal(root)
+            inverses = {}
+            for j, automorphism in transversal.items():
+                inverse = [0] * len(automorphism)
+                for k, image in enumerate(automorphism):
+                    inverse[image] = k
+                inverses[j] = inverse
+            for j, automorphism in transversal.items():
+                for generator in self.generators:
+                    inverse = inverses[generator[j]]
+                    for k in neighbors:
+                        root1, root2 = orbits[k], orbits[inverse[generator[automorphism[k]]]]
+                        if root1 != root2:
+                            root1, root2 = min(root1, root2), max(root1, root2)
+                            for l in neighbors:
+                                if orbits[l] == root2:
+                                    orbits[l] = root1
+            self._neighbor_orbits[root] = orbits
+        if i == root:
+            return orbits
+        automorphism = self._get_transversal(root)[i]
+        return dict([(automorphism[j], automorphism[k]) for j, k in orbits.items()])
+
+
+def _get_kekule_bond_orders(molecule):
+    """
+    Return a dict mapping the ids of the bonds in the six-membered carbon
+    rings of alternating single and double bonds in `molecule` to the order
+    of a benzene bond, so that a Kekule structure is as symmetric as its
+    aromatic form, as in the comparison of nearest neighbors by
+    :func:`_indistinguishable`. Return ``None`` if any other ring has a
+    double bond within the rings at each of its atoms, as in fused Kekule
+    structures, since benzene bonds do not give the same symmetry there.
+    """
+    bond_orders = {}
+    for ring in molecule.get_smallest_set_of_smallest_rings():
+        ring_ids = set([id(atom) for atom in ring])
+        bonds = []
+        alternating = len(ring) == 6
+        conjugated = True
+        for atom in ring:
+            ring_bonds = [bond for neighbor, bond in atom.edges.items() if id(neighbor) in ring_ids]
+            if not atom.is_carbon() or sorted([bond.order for bond in ring_bonds]) != [1, 2]:
+                alternating = False
+            if not any([bond.is_double() and molecule.is_bond_in_cycle(bond) for bond in atom.edges.values()]):
+                conjugated = False
+            bonds.extend(ring_bonds)
+        if alternating:
+            for bond in bonds:
+                bond_orders[id(bond)] = 1.5
+        elif conjugated:
+            return None
+    return bond_orders
+
+
+def _calculate_automorphism_axis_symmetry_number(molecule, group):
+    """
+    Get the axis symmetry number correction like
+    :func:`calculate_axis_symmetry_number`, comparing the groups at the ends
+    of each axis using the :class:`AutomorphismGroup` `group` of the molecule.
+    """
+    symmetry_number = 1
+
+    for bonds, terminal_atoms in _get_axes(molecule):
+        axis_ids = set([id(atom) for bond in bonds for atom in bond])
+
+        # to start with nothing has broken symmetry about the axis
+        symmetry_broken = False
+        contributing = False
+        for terminal_atom in terminal_atoms:
+            # Take one atom of each group at the end, where the atoms bonded
+            # to the terminal atom are in the same group if joined by a ring
+            groups = []
+            visited = set([id(terminal_atom)])
+            for ligand in terminal_atom.edges:
+                if id(ligand) in axis_ids or id(ligand) in visited:
+                    continue
+                groups.append(ligand)
+                visited.add(id(ligand))
+                queue = [ligand]
+                for atom in queue:
+                    for neighbor in atom.edges:
+                        if id(neighbor) not in visited:
+                            visited.add(id(neighbor))
+                            queue.append(neighbor)
+
+            if len(groups) == 0:
+                continue
+            elif len(groups) == 1 and terminal_atom.radical_electrons == 0:
+                if terminal_atom.atomtype.label == 'N3d':
+                    symmetry_broken = True
+                else:
+                    continue
+            elif len(groups) == 1 and terminal_atom.radical_electrons != 0:
+                symmetry_broken = True
+            elif len(groups) == 2:
+                for neighbors in group.get_equivalent_neighbors(terminal_atom):
+                    if groups[0] in neighbors and groups[1] not in neighbors:
+                        symmetry_broken = True
+            contributing = True
+
+        if contributing and not symmetry_broken:
+            symmetry_number *= 2
+
+    return symmetry_number
+
+
+def calculate_automorphism_symmetry_number(molecule):
+    """
+    Return the symmetry number for the structure like
+    :func:`calculate_symmetry_number`, but reading the equivalence of the
+    atoms and groups from the automorphism group of the molecule, which is
+    found once, instead of checking copies of its fragments for isomorphism.
+    Kekule structures of fused or hetero rings are passed on to
+    :func:`calculate_symmetry_number`, as their automorphisms do not reflect
+    the comparison of nearest neighbors it makes.
+    """
+    symmetry_number = 1
+
+    bond_orders = None
+    if molecule.is_cyclic():
+        bond_orders = _get_kekule_bond_orders(molecule)
+        if bond_orders is None:
+            return calculate_symmetry_number(molecule)
+    group = AutomorphismGroup(molecule, bond_orders)
+
+    # Atoms in the same orbit have the same symmetry number
+    atom_symmetry_numbers = {}
+    for i, atom in enumerate(molecule.vertices):
+        if not molecule.is_atom_in_cycle(atom):
+            orbit = group.orbits[i]
+            if orbit not in atom_symmetry_numbers:
+                count = sorted([len(neighbors) for neighbors in group.get_equivalent_neighbors(atom)], reverse=True)
+                atom_symmetry_numbers[orbit] = _get_atom_symmetry_number(atom, count)
+            symmetry_number *= atom_symmetry_numbers[orbit]
+
+    for i, atom1 in enumerate(molecule.vertices):
+        for atom2, bond in atom1.edges.items():
+            if (i < molecule.vertices.index(atom2) and atom1.equivalent(atom2) and
+                    not molecule.is_bond_in_cycle(bond)):
+                # An O-O bond is considered to be an "optical isomer" and so no
+                # symmetry correction will be applied
+                if (atom1.atomtype.label == 'O2s' and atom2.atomtype.label == 'O2s' and
+                        atom1.radical_electrons == atom2.radical_electrons == 0):
+                    continue
+                # Only up to three groups on each atom are compared
+                elif len(molecule.vertices) == 2 or (len(atom1.edges) <= 4 and
+                                                     group.is_bond_reversible(atom1, atom2)):
+                    symmetry_number *= 2
+
+    symmetry_number *= _calculate_automorphism_axis_symmetry_number(molecule, group)
+
+    if molecule.is_cyclic():
+        symmetry_number *= calculate_cyclic_symmetry_number(molecule, group)
+
+    return symmetry_number
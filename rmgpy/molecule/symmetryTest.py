@@ -28,13 +28,17 @@
 #                                                                             #
 ###############################################################################
 
+import os
 import unittest
 
 from external.wip import work_in_progress
+from rmgpy import settings
+from rmgpy.chemkin import load_species_dictionary
 from rmgpy.molecule.molecule import Molecule
 from rmgpy.molecule.resonance import generate_optimal_aromatic_resonance_structures
-from rmgpy.molecule.symmetry import calculate_atom_symmetry_number, calculate_axis_symmetry_number, \
-    calculate_bond_symmetry_number, calculate_cyclic_symmetry_number, _indistinguishable
+from rmgpy.molecule.symmetry import AutomorphismGroup, calculate_atom_symmetry_number, \
+    calculate_automorphism_symmetry_number, calculate_axis_symmetry_number, calculate_bond_symmetry_number, \
+    calculate_cyclic_symmetry_number, calculate_symmetry_number, _indistinguishable
 from rmgpy.species import Species
 
 
@@ -735,6 +739,91 @@ multiplicity 3
         self.assertFalse(_indistinguishable(mol.atoms[6], mol.atoms[7]))
 
 
+class TestAutomorphismGroup(unittest.TestCase):
+    """
+    Contains unit tests of the AutomorphismGroup class and of the symmetry
+    numbers computed from it.
+    """
+
+    def test_order(self):
+        """
+        Test the number of automorphisms of the graphs of a few molecules
+        """
+        for smiles, order in [('C', 24), ('CC', 72), ('[CH3]', 6), ('C=C', 8), ('C1=CC=CC=C1', 6),
+                              ('C1CCCCC1', 768), ('CC(C)(C)C', 31104), ('OCC(O)CO', 8), ('CC(O)CC', 72)]:
+            group = AutomorphismGroup(Molecule().from_smiles(smiles))
+            self.assertEqual(group.order, order, 'the order for {0} is {1}, not {2}'.format(smiles, order, group.order))
+
+    def test_equivalence(self):
+        """
+        Test the equivalence of atoms and groups in propane
+        """
+        molecule = Molecule().from_smiles('CCC')
+        group = AutomorphismGroup(molecule)
+        carbons = [atom for atom in molecule.atoms if atom.is_carbon()]
+        middle = [atom for atom in carbons if len([a for a in atom.edges if a.is_carbon()]) == 2][0]
+        end1, end2 = [atom for atom in carbons if atom is not middle]
+        self.assertTrue(group.is_equivalent(end1, end2))
+        self.assertFalse(group.is_equivalent(middle, end1))
+        self.assertEqual(sorted([len(neighbors) for neighbors in group.get_equivalent_neighbors(middle)]), [2, 2])
+        self.assertEqual([len(neighbors) for neighbors in group.get_equivalent_neighbors(end1)], [1, 3])
+        self.assertFalse(group.is_bond_reversible(middle, end1))
+
+        molecule = Molecule().from_smiles('CC')
+        carbon1, carbon2 = [atom for atom in molecule.atoms if atom.is_carbon()]
+        self.assertTrue(AutomorphismGroup(molecule).is_bond_reversible(carbon1, carbon2))
+
+    def test_automorphism_symmetry_number(self):
+        """
+        Test that the symmetry numbers from the automorphism group match those
+        found by comparing fragments, for molecules and resonance hybrids
+        """
+        for smiles in ['C', '[CH3]', 'CC', 'C=C', 'C#C', 'O=O', '[H][H]', 'O', 'C=O', 'C=[CH]', '[OH]', 'C1=C=C=1',
+                       'c1ccccc1', 'c1ccccc1C', 'c1ccccc1Cl', 'c1ccccc1[O]', 'Cc1ccccc1C', 'Cc1ccc(C)cc1',
+                       'C[CH]C=CC', '[CH2]C=C', '[CH2][CH]C=C', 'CC1CC(C)C1', 'C1CCC(=O)C(=O)C1=O', 'C1CCCCC1=O',
+                       'C=C=[C]C(C)(C)[C]=C=C', '[CH]1CCC1CC1CC1', 'CC(C)(C)C(C)(C)C', 'CC(O)CC(C)O',
+                       'C=C=C=C', 'CC=C=CC', 'C=C1CC1', 'C1(C(C(C(C(C1C2CCC2)C3CCC3)C4CCC4)C5CCC5)C6CCC6)C7CCC7',
+                       'c1ccc2ccccc2c1', 'c1ccc2cc3ccccc3cc2c1', 'C1=CC2=CC=CC2=C1', 'c1cc2ccc3cccc4ccc(c1)c2c34',
+                       'C1=CC=C2C=CC=C2C=C1', 'c1ccncc1', 'C1=CC=C2CCCCC2=C1', 'C1=CC=C1', 'C1=CC=CC=CC=C1']:
+            molecule = Molecule().from_smiles(smiles)
+            for structure in [molecule, Species(molecule=[molecule.copy(deep=True)]).get_resonance_hybrid()]:
+                structure.update_connectivity_values()
+                self.assertEqual(calculate_automorphism_symmetry_number(structure),
+                                 calculate_symmetry_number(structure),
+                                 'the symmetry numbers for {0} differ'.format(smiles))
+
+    def test_automorphism_symmetry_number_kekule(self):
+        """
+        Test that the Kekule structures of fused rings are as symmetric as the aromatic molecules
+        """
+        for smiles in ['C1=CC=C2C=CC=CC2=C1', 'C1=CC2=CC=CC=C2C=C1', 'C1=CC=C2C=C3C=CC=CC3=CC2=C1',
+                       'C1=CC2=CC=CC2=C1', 'C1=CC2=CC=C3C=CC=C4C=CC(=C1)C2=C43']:
+            molecule = Molecule().from_smiles(smiles)
+            molecule.update_connectivity_values()
+            self.assertEqual(calculate_automorphism_symmetry_number(molecule), 4,
+                             'the symmetry number for {0} is wrong'.format(smiles))
+            self.assertEqual(calculate_automorphism_symmetry_number(molecule), calculate_symmetry_number(molecule))
+
+    def test_automorphism_symmetry_number_test_data(self):
+        """
+        Test that the symmetry numbers from the automorphism group match those
+        found by comparing fragments for the resonance structures and hybrids
+        of every species in the species dictionaries of test_data
+        """
+        paths = []
+        for root, dirs, files in os.walk(settings['test_data.directory']):
+            if 'families' not in root:
+                paths.extend(os.path.join(root, f) for f in files if f.endswith('dictionary.txt'))
+        self.assertTrue(paths)
+        for path in sorted(paths):
+            for label, spc in load_species_dictionary(path).items():
+                structures = spc.generate_resonance_structures(keep_isomorphic=True) or spc.molecule
+                for structure in structures + [spc.get_resonance_hybrid()]:
+                    structure.update_connectivity_values()
+                    self.assertEqual(calculate_automorphism_symmetry_number(structure),
+                                     calculate_symmetry_number(structure),
+                                     'the symmetry numbers for {0} in {1} differ'.format(label, path))
+
 ################################################################################
 
 if __name__ == '__main__':
@@ -35,6 +35,8 @@ cpdef dict SMILES_LOOKUPS
 cpdef dict MOLECULE_LOOKUPS
 cpdef dict RADICAL_LOOKUPS
 
+cpdef dict IDENTIFIER_CACHE_KEYS
+
 cpdef str to_inchi(mm.Molecule mol, str backend=?, int aug_level=?)
 
 cpdef str to_inchi_key(mm.Molecule mol, str backend=?, int aug_level=?)
@@ -43,6 +45,8 @@ cpdef str to_smarts(mm.Molecule mol, backend=?)
 
 cpdef str to_smiles(mm.Molecule mol, backend=?)
 
+cpdef list to_identifiers(list molecules, str identifier_type=?, int procnum=?)
+
 cpdef mm.Molecule from_inchi(mm.Molecule mol, str inchistr, backend=?)
 
 cpdef mm.Molecule from_smiles(mm.Molecule mol, str smilesstr, str backend=?)
@@ -34,6 +34,7 @@ representation formats, e.g. SMILES, InChI, SMARTS.
 """
 
 import logging
+from multiprocessing import Pool
 
 import cython
 # Assume that rdkit is installed
@@ -50,6 +51,7 @@ import rmgpy.molecule.inchi as inchiutil
 import rmgpy.molecule.molecule as mm
 import rmgpy.molecule.util as util
 from rmgpy.exceptions import DependencyError
+from rmgpy.molecule.compact import CompactMolecule, to_compact_molecule
 from rmgpy.molecule.converter import to_rdkit_mol, from_rdkit_mol, to_ob_mol, from_ob_mol
 
 # constants
@@ -113,6 +115,16 @@ MOLECULE_LOOKUPS = {
     'HI': 'I',
 }
 
+# Cache keys under which each identifier type accepted by `to_identifiers`
+# is memoized on the molecule, as (identifier, backend, augmentation level)
+IDENTIFIER_CACHE_KEYS = {
+    'smiles': ('smiles', 'default'),
+    'inchi': ('inchi', 'rdkit-first', 0),
+    'inchi_key': ('inchi_key', 'rdkit-first', 0),
+    'aug_inchi': ('inchi', 'rdkit-first', 2),
+    'aug_inchi_key': ('inchi_key', 'rdkit-first', 2),
+}
+
 RADICAL_LOOKUPS = {
     'CH3': '[CH3]',
     'HO': '[OH]',
@@ -144,7 +156,8 @@ def to_inchi(mol, backend='rdkit-first', aug_level=0):
     For aug_level=1, appends the molecule multiplicity.
     For aug_level=2, appends positions of unpaired and paired electrons.
 
-    Uses RDKit or OpenBabel for conversion.
+    Uses RDKit or OpenBabel for conversion. The result is memoized on `mol`
+    until its structure changes.
 
     Args:
         backend     choice of backend, 'try-all', 'rdkit', or 'openbabel'
@@ -152,26 +165,34 @@ def to_inchi(mol, backend='rdkit-first', aug_level=0):
     """
     cython.declare(inchi=str, ulayer=str, player=str, mlayer=str)
 
+    key = ('inchi', backend, aug_level)
+    inchi = mol.get_identifier_cache().get(key)
+    if inchi is not None:
+        return inchi
+
     if aug_level == 0:
-        return _write(mol, 'inchi', backend)
+        inchi = _write(mol, 'inchi', backend)
 
     elif aug_level == 1:
         inchi = to_inchi(mol, backend=backend)
 
         mlayer = '/mult{0}'.format(mol.multiplicity) if mol.multiplicity != 0 else ''
 
-        return inchi + mlayer
+        inchi = inchi + mlayer
 
     elif aug_level == 2:
         inchi = to_inchi(mol, backend=backend)
 
         ulayer, player = inchiutil.create_augmented_layers(mol)
 
-        return inchiutil.compose_aug_inchi(inchi, ulayer, player)
+        inchi = inchiutil.compose_aug_inchi(inchi, ulayer, player)
 
     else:
         raise ValueError("Implemented values for aug_level are 0, 1, or 2.")
 
+    mol.get_identifier_cache()[key] = inchi
+    return inchi
+
 
 def to_inchi_key(mol, backend='rdkit-first', aug_level=0):
     """
@@ -180,7 +201,8 @@ def to_inchi_key(mol, backend='rdkit-first', aug_level=0):
     For aug_level=1, appends the molecule multiplicity.
     For aug_level=2, appends positions of unpaired and paired electrons.
 
-    Uses RDKit or OpenBabel for conversion.
+    Uses RDKit or OpenBabel for conversion. The result is memoized on `mol`
+    until its structure changes.
 
     Args:
         backend     choice of backend, 'try-all', 'rdkit', or 'openbabel'
@@ -188,26 +210,34 @@ def to_inchi_key(mol, backend='rdkit-first', aug_level=0):
     """
     cython.declare(key=str, ulayer=str, player=str, mlayer=str)
 
+    cache_key = ('inchi_key', backend, aug_level)
+    key = mol.get_identifier_cache().get(cache_key)
+    if key is not None:
+        return key
+
     if aug_level == 0:
-        return _write(mol, 'inchikey', backend)
+        key = _write(mol, 'inchikey', backend)
 
     elif aug_level == 1:
         key = to_inchi_key(mol, backend=backend)
 
         mlayer = '-mult{0}'.format(mol.multiplicity) if mol.multiplicity != 0 else ''
 
-        return key + mlayer
+        key = key + mlayer
 
     elif aug_level == 2:
         key = to_inchi_key(mol, backend=backend)
 
         ulayer, player = inchiutil.create_augmented_layers(mol)
 
-        return inchiutil.compose_aug_inchi_key(key, ulayer, player)
+        key = inchiutil.compose_aug_inchi_key(key, ulayer, player)
 
     else:
         raise ValueError("Implemented values for aug_level are 0, 1, or 2.")
 
+    mol.get_identifier_cache()[cache_key] = key
+    return key
+
 
 def to_smarts(mol, backend='rdkit'):
     """
@@ -230,7 +260,16 @@ def to_smiles(mol, backend='default'):
     conversion, so it will be canonical SMILES.
     While converting to an RDMolecule it will perceive aromaticity
     and removes Hydrogen atoms.
+
+    The result is memoized on `mol` until its structure changes.
     """
+    cython.declare(output=str)
+
+    key = ('smiles', backend)
+    output = mol.get_identifier_cache().get(key)
+    if output is not None:
+        return output
+
     # If we're going to have to check the formula anyway,
     # we may as well shortcut a few small known molecules.
     # Dictionary lookups are O(1) so this should be fast.
@@ -244,12 +283,71 @@ def to_smiles(mol, backend='default'):
         if backend == 'default':
             for atom in mol.atoms:
                 if atom.is_nitrogen() or atom.is_sulfur():
-                    return _write(mol, 'smi', backend='openbabel')
-            return _write(mol, 'smi', backend='rdkit')
+                    output = _write(mol, 'smi', backend='openbabel')
+                    break
+            else:
+                output = _write(mol, 'smi', backend='rdkit')
         else:
-            return _write(mol, 'smi', backend=backend)
+            output = _write(mol, 'smi', backend=backend)
+
+    mol.get_identifier_cache()[key] = output
+    return output
+
+
+def to_identifiers(molecules, identifier_type='smiles', procnum=1):
+    """
+    Convert a list of molecular structures to string identifiers, returning a
+    list of identifiers in the same order. `identifier_type` is one of
+    'smiles', 'inchi', 'inchi_key', 'aug_inchi' or 'aug_inchi_key'.
+
+    Identifiers already memoized on a molecule are reused. The remaining
+    molecules are converted in a pool of `procnum` processes if more than one
+    is requested, and the results are memoized on the original molecules.
+    """
+    cython.declare(mol=mm.Molecule, cache_key=tuple, identifiers=list, missing=list, i=int)
+
+    try:
+        cache_key = IDENTIFIER_CACHE_KEYS[identifier_type]
+    except KeyError:
+        raise ValueError('Unrecognized identifier type {0!r}; expected one of {1}.'.format(
+            identifier_type, ', '.join(sorted(IDENTIFIER_CACHE_KEYS))))
+
+    identifiers = [mol.get_identifier_cache().get(cache_key) for mol in molecules]
+    missing = [i for i in range(len(molecules)) if identifiers[i] is None]
+
+    if procnum == 1 or len(missing) < 2:
+        for i in missing:
+            identifiers[i] = _to_identifier((molecules[i], cache_key))
     else:
-        return output
+        p = Pool(processes=procnum)
+        results = p.map(_to_identifier, [(to_compact_molecule(molecules[i]), cache_key) for i in missing],
+                        chunksize=max(1, len(missing) // (4 * procnum)))
+        p.close()
+        p.join()
+        for i, identifier in zip(missing, results):
+            mol = molecules[i]
+            mol.get_identifier_cache()[cache_key] = identifier
+            identifiers[i] = identifier
+
+    return identifiers
+
+
+def _to_identifier(args):
+    """
+    Generate the identifier described by the cache key for a molecule, given as
+    a ``(molecule, cache_key)`` tuple so it can be used with a process pool.
+    The molecule may also be passed as a :class:`CompactMolecule`, which is
+    much cheaper to send to a worker process.
+    """
+    mol, cache_key = args
+    if isinstance(mol, CompactMolecule):
+        mol = mol.to_molecule()
+    if cache_key[0] == 'smiles':
+        return to_smiles(mol, backend=cache_key[1])
+    elif cache_key[0] == 'inchi':
+        return to_inchi(mol, backend=cache_key[1], aug_level=cache_key[2])
+    else:
+        return to_inchi_key(mol, backend=cache_key[1], aug_level=cache_key[2])
 
 
 def from_inchi(mol, inchistr, backend='try-all'):
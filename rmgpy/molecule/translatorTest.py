@@ -743,6 +743,63 @@ class SMILESGenerationTest(unittest.TestCase):
         self.assertNotEqual(smiles1, smiles3)
 
 
+class IdentifierCacheTest(unittest.TestCase):
+    """
+    Contains unit tests for the memoization of identifiers on molecules.
+    """
+
+    def test_identifiers_are_memoized(self):
+        """Test that identifiers are stored on the molecule after generation."""
+        mol = Molecule().from_smiles('CCO')
+        smiles = to_smiles(mol)
+        aug_inchi = to_inchi(mol, aug_level=2)
+        cache = mol.get_identifier_cache()
+        self.assertEqual(cache[('smiles', 'default')], smiles)
+        self.assertEqual(cache[('inchi', 'rdkit-first', 2)], aug_inchi)
+        self.assertEqual(cache[('inchi', 'rdkit-first', 0)], 'InChI=1S/C2H6O/c1-2-3/h3H,2H2,1H3')
+        self.assertEqual(mol.to_smiles(), smiles)
+
+    def test_cache_invalidated_on_mutation(self):
+        """Test that direct changes to atoms and bonds invalidate the cached identifiers."""
+        mol = Molecule().from_smiles('C=C')
+        self.assertEqual(mol.to_smiles(), 'C=C')
+        self.assertEqual(mol.to_inchi(), 'InChI=1S/C2H4/c1-2/h1-2H2')
+        for bond in mol.get_all_edges():
+            if bond.is_double():
+                bond.decrement_order()
+        for atom in mol.atoms:
+            if atom.is_carbon():
+                atom.increment_radical()
+        mol.update_multiplicity()
+        self.assertEqual(mol.to_smiles(), '[CH2][CH2]')
+        self.assertEqual(mol.to_inchi(), 'InChI=1S/C2H4/c1-2/h1-2H2')
+        self.assertEqual(mol.to_augmented_inchi(), 'InChI=1S/C2H4/c1-2/h1-2H2/u1,2')
+
+        mol.remove_atom(mol.atoms[-1])
+        self.assertNotIn(('smiles', 'default'), mol.get_identifier_cache())
+
+    def test_copy_keeps_identifiers(self):
+        """Test that copies of a molecule reuse its identifiers."""
+        mol = Molecule().from_smiles('CC[O]')
+        smiles = mol.to_smiles()
+        for deep in (False, True):
+            copy = mol.copy(deep=deep)
+            self.assertEqual(copy.get_identifier_cache(), {('smiles', 'default'): smiles})
+
+    def test_to_identifiers(self):
+        """Test batched identifier generation with and without a process pool."""
+        smiles = ['CCO', 'C=CC=C', '[CH2]C=O', 'c1ccccc1', 'CC(C)(C)O']
+        for procnum in (1, 2):
+            molecules = [Molecule().from_smiles(s) for s in smiles]
+            expected = [to_inchi_key(Molecule().from_smiles(s), aug_level=2) for s in smiles]
+            self.assertEqual(to_identifiers(molecules, 'aug_inchi_key', procnum=procnum), expected)
+            for mol, key in zip(molecules, expected):
+                self.assertEqual(mol.get_identifier_cache()[('inchi_key', 'rdkit-first', 2)], key)
+
+        with self.assertRaises(ValueError):
+            to_identifiers(molecules, 'cas_number')
+
+
 class ParsingTest(unittest.TestCase):
     def setUp(self):
         self.methane = Molecule().from_adjacency_list("""
@@ -27,6 +27,23 @@
 
 from rmgpy.molecule.graph cimport Vertex, Edge, Graph
 
+cdef class Pattern:
+
+    cdef list graph_vertices
+    cdef int mutation_count
+
+    cdef readonly list vertices
+    cdef dict index
+    cdef list neighbors
+    cdef int[:] degrees
+    cdef dict orders
+
+    cpdef bint is_current(self, Graph graph) except -2
+
+    cpdef tuple get_order(self, tuple premapped)
+
+cpdef Pattern get_pattern(Graph graph)
+
 cdef class VF2:
 
     cdef Graph graph1, graph2
@@ -40,10 +57,14 @@ cdef class VF2:
     
     cdef bint is_match
     cdef list mapping_list
+
+    cdef Pattern pattern1, pattern2
+    cdef int[:] core1, core2, order, parents
+    cdef list back_edges
     
     cpdef bint is_isomorphic(self, Graph graph1, Graph graph2, dict initial_mapping, bint save_order=?, bint strict=?) except -2
         
-    cpdef list find_isomorphism(self, Graph graph1, Graph graph2, dict initial_mapping, bint save_order=?, bint strict=?)
+    cpdef list find_isomorphism(self, Graph graph1, Graph graph2, dict initial_mapping, bint save_order=?, bint strict=?, bint find_all=?)
 
     cpdef bint is_subgraph_isomorphic(self, Graph graph1, Graph graph2, dict initial_mapping, bint save_order=?) except -2
 
@@ -52,6 +73,10 @@ cdef class VF2:
     cdef isomorphism(self, Graph graph1, Graph graph2, dict initial_mapping, bint subgraph, bint find_all, bint save_order=?, bint strict=?)
 
     cdef bint match(self, int call_depth) except -2
+
+    cdef subgraph_isomorphism(self, Graph graph1, Graph graph2, dict initial_mapping, bint find_all)
+
+    cdef bint match_pattern(self, int depth) except -2
         
     cpdef bint feasible(self, Vertex vertex1, Vertex vertex2) except -2
     
@@ -28,17 +28,154 @@
 """
 This module contains graph ismorphism functions that implement the VF2
 algorithm of Vento and Foggia.  http://dx.doi.org/10.1109/TPAMI.2004.75
+
+Subgraph isomorphism is evaluated using compiled patterns, which match the
+vertices of the pattern graph in a precomputed order, most constrained first,
+as in the VF2++ and RI algorithms:
+
+Juttner, A.; Madarasi, P. VF2++ - An Improved Subgraph Isomorphism
+Algorithm. Discrete Appl. Math., 2018, 242, pp 69-81
+
+Bonnici, V.; Giugno, R.; Pulvirenti, A.; Shasha, D.; Ferro, A. A Subgraph
+Isomorphism Algorithm and its Application to Biochemical Data.
+BMC Bioinformatics, 2013, 14 (Suppl 7), S13
 """
 
+import array
+
+from cpython cimport array
+
+import rmgpy.instrumentation as instrumentation
 from rmgpy.exceptions import VF2Error
 from rmgpy.molecule.graph cimport Graph
 
+# The number of isomorphism and subgraph isomorphism evaluations so far
+cdef unsigned long long isomorphism_count = 0
+
+# The template used to allocate the integer arrays holding the matching state
+cdef array.array int_array_template = array.array('i', [])
+
+################################################################################
+
+cdef class Pattern:
+    """
+    A graph compiled for repeated subgraph isomorphism evaluations, either as
+    the pattern to be found or as the graph searched. The compiled pattern
+    holds the vertices of the graph, the indices of their neighbors and their
+    degrees, and the orders in which to match the vertices for each set of
+    initially mapped vertices. The compiled pattern of a graph is obtained
+    using :func:`get_pattern`, which reuses it until the graph is modified.
+
+    The vertices are matched in an order in which each vertex has as many
+    neighbors matched before it as possible, and then the highest degree, so
+    the most constrained vertices are matched first and the candidates for
+    each vertex are found among the neighbors of an already matched one.
+    """
+
+    def __init__(self, Graph graph):
+        cdef Vertex vertex, vertex2
+        cdef int i
+
+        self.graph_vertices = graph.vertices
+        self.mutation_count = graph._mutation_count
+        self.vertices = list(graph.vertices)
+        self.index = {id(vertex): i for i, vertex in enumerate(self.vertices)}
+        self.neighbors = [[self.index[id(vertex2)] for vertex2 in vertex.edges] for vertex in self.vertices]
+        self.degrees = array.array('i', [len(vertex.edges) for vertex in self.vertices])
+        self.orders = {}
+
+    cpdef bint is_current(self, Graph graph) except -2:
+        """
+        Return ``True`` if the pattern was compiled from `graph` as it is now,
+        or ``False`` if the graph was modified since.
+        """
+        return (graph.vertices is self.graph_vertices and len(graph.vertices) == len(self.vertices)
+                and graph._mutation_count == self.mutation_count)
+
+    cpdef tuple get_order(self, tuple premapped):
+        """
+        Return the order in which to match the vertices when the vertices with
+        indices in `premapped` are mapped initially, as a tuple of the
+        indices of the vertices in order, the index of a neighbor matched
+        before each vertex (or -1 if there is none), and a list of the
+        ``(index, edge)`` pairs of the neighbors matched before each vertex.
+        """
+        cdef list order, connections, back_edges, edges
+        cdef array.array parents
+        cdef int n, i, j, best, position
+        cdef dict positions
+        cdef Vertex vertex
+        cdef tuple result
+
+        result = self.orders.get(premapped)
+        if result is not None:
+            return result
+
+        n = len(self.vertices)
+        order = list(premapped)
+        connections = [0] * n
+        for i in premapped:
+            connections[i] = -1
+            for j in self.neighbors[i]:
+                if connections[j] >= 0:
+                    connections[j] += 1
+        while len(order) < n:
+            best = -1
+            for i in range(n):
+                if connections[i] < 0:
+                    continue
+                if best == -1 or connections[i] > connections[best] or (
+                        connections[i] == connections[best] and self.degrees[i] > self.degrees[best]):
+                    best = i
+            order.append(best)
+            connections[best] = -1
+            for j in self.neighbors[best]:
+                if connections[j] >= 0:
+                    connections[j] += 1
+
+        positions = {i: position for position, i in enumerate(order)}
+        parents = array.clone(int_array_template, n, zero=False)
+        back_edges = []
+        for position in range(n):
+            i = order[position]
+            vertex = self.vertices[i]
+            parents[position] = -1
+            edges = []
+            for j in self.neighbors[i]:
+                if positions[j] < position:
+                    if parents[position] == -1 or positions[j] < positions[parents[position]]:
+                        parents[position] = j
+                    edges.append((j, vertex.edges[self.vertices[j]]))
+            back_edges.append(edges)
+
+        result = (array.array('i', order), parents, back_edges)
+        self.orders[premapped] = result
+        return result
+
+
+cpdef Pattern get_pattern(Graph graph):
+    """
+    Return the compiled :class:`Pattern` of `graph`, compiling it if the graph
+    has no compiled pattern or was modified since it was compiled. The
+    compiled pattern is kept by the graph, so it is reused by every subgraph
+    isomorphism evaluation involving the graph, e.g. of the groups in the
+    trees of a database or the templates of a reaction family.
+    """
+    cdef Pattern pattern
+    pattern = graph._pattern
+    if pattern is None or not pattern.is_current(graph):
+        pattern = Pattern(graph)
+        graph._pattern = pattern
+    return pattern
+
 ################################################################################
 
 cdef class VF2:
     """
     An implementation of the second version of the Vento-Foggia (VF2) algorithm
-    for graph and subgraph isomorphism.
+    for graph and subgraph isomorphism. Subgraph isomorphism is evaluated
+    using the compiled patterns of the graphs, keeping the matching state in
+    integer arrays rather than in the vertices.
     """
     def __init__(self, graphA=None, graphB=None):
         self.graph1 = graphA
@@ -72,14 +209,15 @@ cdef class VF2:
         return self.is_match
 
     cpdef list find_isomorphism(self, Graph graph1, Graph graph2, dict initial_mapping, bint save_order=False,
-                                bint strict=True):
+                                bint strict=True, bint find_all=True):
         """
         Return a list of dicts of all valid isomorphism mappings from graph
         `graph1` to graph `graph2` with the optional initial mapping 
         `initial_mapping`. If no valid isomorphisms are found, an empty list is
+        returned. If `find_all` is ``False``, only the first mapping found is
         returned.
         """
-        self.isomorphism(graph1, graph2, initial_mapping, False, True, save_order=save_order, strict=strict)
+        self.isomorphism(graph1, graph2, initial_mapping, False, find_all, save_order=save_order, strict=strict)
         return self.mapping_list
 
     cpdef bint is_subgraph_isomorphic(self, Graph graph1, Graph graph2, dict initial_mapping,
@@ -112,6 +250,13 @@ cdef class VF2:
         the first is found.
         """
         cdef int call_depth, index1, index2
+        global isomorphism_count
+
+        isomorphism_count += 1
+
+        if subgraph:
+            self.subgraph_isomorphism(graph1, graph2, initial_mapping, find_all)
+            return
 
         if self.graph1 is not graph1:
             self.graph1 = graph1
@@ -178,6 +323,133 @@ cdef class VF2:
             vertex2.mapping = None
             vertex2.terminal = False
 
+    cdef subgraph_isomorphism(self, Graph graph1, Graph graph2, dict initial_mapping, bint find_all):
+        """
+        Evaluate the subgraph isomorphism relationship between graphs `graph1`
+        and `graph2` with optional initial mapping `initial_mapping`, using
+        their compiled patterns. If `find_all` is ``True``, all isomorphisms
+        are found; otherwise only the first is found.
+        """
+        cdef int n1, n2, index1, index2
+        cdef list premapped
+        cdef Vertex vertex1, vertex2
+
+        self.initial_mapping = initial_mapping
+        self.subgraph = True
+        self.find_all = find_all
+        self.strict = True
+
+        # Clear previous result
+        self.is_match = False
+        self.mapping_list = []
+
+        n1 = len(graph1.vertices)
+        n2 = len(graph2.vertices)
+        if n2 > n1:
+            # The second graph has more vertices than the first, so it cannot be
+            # a subgraph of the first
+            return
+
+        self.pattern1 = get_pattern(graph1)
+        self.pattern2 = get_pattern(graph2)
+        self.core1 = array.clone(int_array_template, n1, zero=False)
+        self.core1[:] = -1
+        self.core2 = array.clone(int_array_template, n2, zero=False)
+        self.core2[:] = -1
+
+        # Set the initial mapping if provided
+        premapped = []
+        if initial_mapping is not None:
+            for vertex1, vertex2 in initial_mapping.items():
+                index1 = self.pattern1.index.get(id(vertex1), -1)
+                index2 = self.pattern2.index.get(id(vertex2), -1)
+                if index1 == -1 or index2 == -1:
+                    raise VF2Error('Initial mapping contains vertices not in the graphs.')
+                self.core1[index1] = index2
+                self.core2[index2] = index1
+                premapped.append(index2)
+            premapped.sort()
+
+        self.order, self.parents, self.back_edges = self.pattern2.get_order(tuple(premapped))
+        self.match_pattern(len(premapped))
+
+        # We're done, so release the graphs
+        self.pattern1 = self.pattern2 = None
+
+    cdef bint match_pattern(self, int depth) except -2:
+        """
+        Recursively match the vertices of the second graph, in the order of its
+        compiled pattern starting at position `depth`, to vertices of the
+        first graph, until all vertices are matched or the viable matches are
+        exhausted.
+        """
+        cdef int index1, index2, index, parent
+        cdef list candidates, vertices1, vertices2
+        cdef dict mapping
+        cdef Vertex vertex1, vertex2
+        cdef Edge edge1, edge2
+        cdef tuple back_edge
+        cdef bint feasible
+
+        vertices1 = self.pattern1.vertices
+        vertices2 = self.pattern2.vertices
+
+        # Done if we have mapped to all vertices in graph
+        if depth == len(vertices2):
+            if self.find_all:
+                mapping = {}
+                for index2 in range(len(vertices2)):
+                    mapping[vertices1[self.core2[index2]]] = vertices2[index2]
+                self.mapping_list.append(mapping)
+            self.is_match = True
+            return True
+
+        index2 = self.order[depth]
+        vertex2 = vertices2[index2]
+        # The candidates are the neighbors of the match of a neighbor matched
+        # before, or all vertices if there is no such neighbor
+        parent = self.parents[depth]
+        if parent >= 0:
+            candidates = self.pattern1.neighbors[self.core2[parent]]
+        else:
+            candidates = list(range(len(vertices1)))
+
+        for index1 in candidates:
+            if self.core1[index1] >= 0:
+                continue
+            # Every neighbor of vertex2 must be matched to a different neighbor of vertex1
+            if self.pattern1.degrees[index1] < self.pattern2.degrees[index2]:
+                continue
+            vertex1 = vertices1[index1]
+            if vertex1.ignore:
+                continue
+            # Semantic check #1: vertex1 must be a specific case of vertex2
+            if not vertex1.is_specific_case_of(vertex2):
+                continue
+            # Semantic check #2: the neighbors of vertex2 matched before must
+            # be matched to neighbors of vertex1, joined by more specific edges
+            feasible = True
+            for back_edge in self.back_edges[depth]:
+                index = back_edge[0]
+                edge2 = back_edge[1]
+                edge1 = vertex1.edges.get(vertices1[self.core2[index]])
+                if edge1 is None or not edge1.is_specific_case_of(edge2):
+                    feasible = False
+                    break
+            if not feasible:
+                continue
+            # Add proposed match to mapping and recurse
+            self.core1[index1] = index2
+            self.core2[index2] = index1
+            if self.match_pattern(depth + 1) and not self.find_all:
+                return True
+            # Undo proposed match
+            self.core1[index1] = -1
+            self.core2[index2] = -1
+
+        # None of the proposed matches led to a complete isomorphism, so return False
+        return False
+
     cdef bint match(self, int call_depth) except -2:
         """
         Recursively search for pairs of vertices to match, until all vertices
@@ -194,15 +466,14 @@ cdef class VF2:
 
         # Done if we have mapped to all vertices in graph
         if call_depth == 0:
-            if self.find_all:
-                mapping = {}
-                for vertex2 in self.graph2.vertices:
-                    if vertex2.ignore:
-                        continue
-                    assert vertex2.mapping is not None
-                    assert vertex2.mapping.mapping is vertex2
-                    mapping[vertex2.mapping] = vertex2
-                self.mapping_list.append(mapping)
+            mapping = {}
+            for vertex2 in self.graph2.vertices:
+                if vertex2.ignore:
+                    continue
+                assert vertex2.mapping is not None
+                assert vertex2.mapping.mapping is vertex2
+                mapping[vertex2.mapping] = vertex2
+            self.mapping_list.append(mapping)
             self.is_match = True
             return True
 
@@ -425,3 +696,16 @@ cdef class VF2:
                     break
             else:
                 v.terminal = False
+
+
+################################################################################
+
+def get_isomorphism_count():
+    """
+    Return the number of isomorphism and subgraph isomorphism evaluations done
+    by VF2 so far.
+    """
+    return isomorphism_count
+
+
+instrumentation.register_probe('isomorphism calls', get_isomorphism_count)
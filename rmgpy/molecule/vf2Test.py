@@ -33,8 +33,9 @@ import unittest
 from numpy import testing
 
 from rmgpy.molecule.graph import get_vertex_connectivity_value
+from rmgpy.molecule.group import Group
 from rmgpy.molecule.molecule import Molecule
-from rmgpy.molecule.vf2 import VF2
+from rmgpy.molecule.vf2 import VF2, get_pattern
 
 ################################################################################
 
@@ -93,6 +94,53 @@ class TestVF2(unittest.TestCase):
             self.assertIsNone(atom.mapping)
             self.assertFalse(atom.terminal)
 
+    def test_pattern(self):
+        """Test that compiled patterns are reused until the graph is modified."""
+        pattern = get_pattern(self.mol)
+        self.assertIs(get_pattern(self.mol), pattern)
+        self.mol.sort_vertices()
+        self.assertIs(get_pattern(self.mol), pattern)
+        self.mol.remove_atom(self.mol.atoms[-1])
+        self.assertIsNot(get_pattern(self.mol), pattern)
+
+        # The vertices are matched most constrained first, and each after a neighbor
+        order, parents, back_edges = get_pattern(self.mol).get_order(())
+        atoms = get_pattern(self.mol).vertices
+        self.assertEqual(len(atoms[order[0]].edges), max([len(atom.edges) for atom in atoms]))
+        self.assertEqual(parents[0], -1)
+        for i in range(1, len(order)):
+            self.assertIn(atoms[parents[i]], atoms[order[i]].edges)
+            self.assertEqual(len(back_edges[i]), len([j for j in order[:i] if atoms[j] in atoms[order[i]].edges]))
+
+    def test_subgraph_isomorphism(self):
+        """Test subgraph isomorphism using compiled patterns."""
+        group = Group().from_adjacency_list("""
+1 *1 C u0 {2,S} {3,S}
+2    C u0 {1,S}
+3    O u0 {1,S}
+""")
+        molecule = Molecule().from_smiles('CC(O)CO')
+        mappings = self.vf2.find_subgraph_isomorphisms(molecule, group, None)
+        self.assertEqual(len(mappings), 3)
+        for mapping in mappings:
+            for atom, group_atom in mapping.items():
+                self.assertTrue(atom.is_specific_case_of(group_atom))
+            for atom, group_atom in mapping.items():
+                for atom2, group_atom2 in mapping.items():
+                    if group.has_bond(group_atom, group_atom2):
+                        self.assertTrue(molecule.has_bond(atom, atom2))
+
+        # An initial mapping restricts the matches
+        center = [atom for atom in molecule.atoms if atom.is_carbon() and
+                  sum([1 for other in atom.edges if other.is_carbon()]) == 1 and
+                  sum([1 for other in atom.edges if other.is_oxygen()]) == 1][0]
+        self.assertEqual(len(self.vf2.find_subgraph_isomorphisms(molecule, group, {center: group.atoms[0]})), 1)
+
+        # Ignored atoms are not matched
+        center.ignore = True
+        self.assertEqual(len(self.vf2.find_subgraph_isomorphisms(molecule, group, None)), 1)
+        center.ignore = False
+
 
 ################################################################################
 
@@ -33,6 +33,7 @@ states).
 """
 
 import logging
+from collections import OrderedDict
 
 import cython
 import numpy as np
@@ -45,6 +46,11 @@ from rmgpy.statmech.conformer import get_density_of_states_forst
 from rmgpy.species import Species, TransitionState
 from rmgpy.transport import TransportData
 
+# The densities and sums of states of recently seen configurations, keyed by
+# the active modes and energy grain specification (see get_states_cache_key())
+STATES_CACHE_SIZE = 1000
+_states_cache = OrderedDict()
+
 ################################################################################
 
 
@@ -236,6 +242,16 @@ cdef class Configuration(object):
         self.active_j_rotor = active_j_rotor
         self.active_k_rotor = active_k_rotor
 
+        # Reuse the states computed for an identical configuration and grain
+        # specification, e.g. when a network is invalidated and rebuilt
+        key = get_states_cache_key(self.species, e_list, active_j_rotor, active_k_rotor, rmgmode)
+        if key in _states_cache:
+            _states_cache.move_to_end(key)
+            dens_states, sum_states = _states_cache[key]
+            self.dens_states = dens_states.copy()
+            self.sum_states = sum_states.copy() if sum_states is not None else None
+            return
+
         # Get the active rovibrational modes for each species in the configuration
         modes = []
         for i, species in enumerate(self.species):
@@ -344,6 +360,10 @@ cdef class Configuration(object):
         if self.dens_states is None:
             raise ValueError("Species {} has no active modes".format(species.label))
 
+        _states_cache[key] = (self.dens_states.copy(), self.sum_states.copy() if self.sum_states is not None else None)
+        if len(_states_cache) > STATES_CACHE_SIZE:
+            _states_cache.popitem(last=False)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     def map_density_of_states(self, np.ndarray[np.float64_t, ndim=1] e_list, np.ndarray[np.int_t, ndim=1] j_list=None):
@@ -481,3 +501,33 @@ cdef class Configuration(object):
                                 sum_states[r, s] += (2 * j1 + 1) * (2 * j2 + 1) * exp(f(e)) * d_j * d_j
 
         return sum_states
+
+################################################################################
+
+def get_states_cache_key(list species_list, np.ndarray e_list, bint active_j_rotor, bint active_k_rotor,
+                         bint rmgmode):
+    """
+    Return a hashable key identifying the density of states of a configuration
+    of the species in `species_list` on the energy grains `e_list`. The key
+    depends only on the molecular degrees of freedom, not the ground-state
+    energies, so it remains valid when a network is rebuilt or its energies
+    are perturbed.
+    """
+    species_keys = []
+    for spec in species_list:
+        conformer = spec.conformer
+        # Transition states have no molecular weight
+        molecular_weight = getattr(spec, 'molecular_weight', None)
+        species_keys.append((spec.label, repr(conformer.modes), conformer.spin_multiplicity,
+                             conformer.optical_isomers,
+                             molecular_weight.value_si if molecular_weight is not None else None))
+    return (tuple(species_keys), e_list.shape[0], float(e_list[0]), float(e_list[-1]),
+            active_j_rotor, active_k_rotor, rmgmode)
+
+
+def clear_states_cache():
+    """
+    Discard all densities and sums of states cached by
+    :meth:`Configuration.calculate_density_of_states`.
+    """
+    _states_cache.clear()
@@ -34,8 +34,10 @@ This script contains unit tests of the :mod:`rmgpy.pdep.network` module.
 
 import unittest
 
+import numpy as np
+
 from rmgpy.pdep.collision import SingleExponentialDown
-from rmgpy.pdep.configuration import Configuration
+from rmgpy.pdep.configuration import Configuration, clear_states_cache, get_states_cache_key
 from rmgpy.species import Species
 from rmgpy.statmech.conformer import Conformer
 from rmgpy.statmech.rotation import NonlinearRotor
@@ -161,6 +163,27 @@ class TestConfiguration(unittest.TestCase):
         for label in attributes:
             self.assertNotIn(label, output)
 
+    def test_calculate_density_of_states_cache(self):
+        """
+        Test that the densities of states of an identical configuration are
+        reused, but recomputed when the modes change.
+        """
+        clear_states_cache()
+        e_list = np.arange(0.0, 200000.0, 2000.0)
+        self.configuration.calculate_density_of_states(e_list, rmgmode=True)
+        dens_states = self.configuration.dens_states
+
+        configuration = Configuration(self.nC4H8, self.H2O)
+        configuration.calculate_density_of_states(e_list, rmgmode=True)
+        self.assertTrue(np.array_equal(configuration.dens_states, dens_states))
+        self.assertIsNot(configuration.dens_states, dens_states)
+
+        key = get_states_cache_key([self.nC4H8, self.H2O], e_list, True, True, True)
+        self.H2O.conformer.modes[2].frequencies = ([1500.0, 3771.85, 3867.85], "cm^-1")
+        self.assertNotEqual(get_states_cache_key([self.nC4H8, self.H2O], e_list, True, True, True), key)
+        configuration.calculate_density_of_states(e_list, rmgmode=True)
+        self.assertFalse(np.array_equal(configuration.dens_states, dens_states))
+
 
 ################################################################################
 
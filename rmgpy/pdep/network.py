@@ -236,6 +236,27 @@ class Network(object):
         logging.debug('Finished initialization for network {0}.'.format(self.label))
         logging.debug('The network now has values of {0}'.format(repr(self)))
 
+    def update_ground_state_energies(self):
+        """
+        Recompute the ground-state energies of each configuration from the
+        current species conformers without recalculating the densities of
+        states. The densities of states are stored relative to the ground state
+        of each configuration, so they remain valid when only E0 changes.
+        The current conditions are reset so that the next call to
+        :meth:`set_conditions` remaps the densities of states onto the new
+        energy grains and recomputes the microcanonical rate coefficients.
+        """
+        n_isom, n_reac, n_prod = len(self.isomers), len(self.reactants), len(self.products)
+        self.E0 = np.zeros((n_isom + n_reac + n_prod), np.float64)
+        for i in range(n_isom):
+            self.E0[i] = self.isomers[i].E0
+        for n in range(n_reac):
+            self.E0[n + n_isom] = self.reactants[n].E0
+        for n in range(n_prod):
+            self.E0[n + n_isom + n_reac] = self.products[n].E0
+        self.T = 0.0
+        self.P = 0.0
+
     def calculate_rate_coefficients(self, Tlist, Plist, method, error_check=True):
 
         n_isom = len(self.isomers)
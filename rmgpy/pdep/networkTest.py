@@ -254,6 +254,22 @@ class TestNetwork(unittest.TestCase):
         for label in attributes:
             self.assertNotIn(label, output)
 
+    def test_update_ground_state_energies(self):
+        """
+        Test that the ground-state energies follow the species conformers and that the conditions are reset.
+        """
+        self.network.T, self.network.P = 1000.0, 1e5
+        self.network.update_ground_state_energies()
+        self.assertEqual(len(self.network.E0), 2)
+        self.assertAlmostEqual(self.network.E0[0], self.nC4H10O.conformer.E0.value_si)
+        self.assertAlmostEqual(self.network.E0[1], self.network.products[0].E0)
+        self.assertEqual(self.network.T, 0.0)
+        self.assertEqual(self.network.P, 0.0)
+
+        self.nC4H10O.conformer.E0.value_si += 418.4
+        self.network.update_ground_state_energies()
+        self.assertAlmostEqual(self.network.E0[0], -317807.0 + 418.4)
+
     def test_collision_matrix_memory_handling(self):
         net = Network()
         net.e_list = [1] * 10000
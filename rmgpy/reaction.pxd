@@ -95,6 +95,8 @@ cdef class Reaction:
 
     cpdef double get_rate_coefficient(self, double T, double P=?)
 
+    cpdef np.ndarray get_rate_coefficients(self, Tlist, Plist=?)
+
     cpdef double get_surface_rate_coefficient(self, double T, double surface_site_density) except -2
 
     cpdef fix_barrier_height(self, bint force_positive=?)
@@ -643,6 +643,24 @@ class Reaction:
         else:
             return self.kinetics.get_rate_coefficient(T, P)
 
+    def get_rate_coefficients(self, Tlist, Plist=None):
+        """
+        Return the overall rate coefficients for the forward reaction at
+        temperatures `Tlist` in K and pressures `Plist` in Pa, including any
+        reaction path degeneracies. The temperatures and pressures are
+        broadcast against one another, and the returned array has the
+        broadcast shape.
+        """
+        cython.declare(k=np.ndarray, i=cython.int)
+        if diffusion_limiter.enabled:
+            T, P = np.broadcast_arrays(np.asarray(Tlist, np.float64), np.asarray(0.0 if Plist is None else Plist, np.float64))
+            k = np.empty(T.shape, np.float64)
+            for i in range(T.size):
+                k.flat[i] = self.get_rate_coefficient(T.flat[i], P.flat[i])
+            return k
+        else:
+            return self.kinetics.get_rate_coefficients(Tlist, Plist)
+
     def get_surface_rate_coefficient(self, T, surface_site_density):
         """
         Return the overall surface rate coefficient for the forward reaction at
@@ -519,8 +519,10 @@ def mb_sampled_reactor(temperature,
     rmg.reaction_systems.append(system)
 
 
-def simulator(atol, rtol, sens_atol=1e-6, sens_rtol=1e-4):
-    rmg.simulator_settings_list.append(SimulatorSettings(atol, rtol, sens_atol, sens_rtol))
+def simulator(atol, rtol, sens_atol=1e-6, sens_rtol=1e-4, snapshot_interval=0.0, snapshot_rtol=0.0, snapshot_points=0,
+              snapshot_memory=1e8):
+    rmg.simulator_settings_list.append(SimulatorSettings(atol, rtol, sens_atol, sens_rtol, snapshot_interval,
+                                                         snapshot_rtol, snapshot_points, snapshot_memory))
 
 
 def solvation(solvent):
@@ -717,7 +719,9 @@ def pressure_dependence(
 
 def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=False, units='si', saveRestartPeriod=None,
             generateOutputHTML=False, generatePlots=False, saveSimulationProfiles=False, verboseComments=False,
-            saveEdgeSpecies=False, keepIrreversible=False, trimolecularProductReversible=True, wallTime='00:00:00:00'):
+            saveEdgeSpecies=False, keepIrreversible=False, trimolecularProductReversible=True, wallTime='00:00:00:00',
+            statmechCache=None, incrementalOutput=False, checkpointInterval=0, simulationProfileFormat='csv',
+            databaseCache=None, pruneDatabaseByElements=False):
     if saveRestartPeriod:
         logging.warning("`saveRestartPeriod` flag was set in the input file, but this feature has been removed. Please "
                         "remove this line from the input file. This will throw an error after RMG-Py 3.1. For "
@@ -733,6 +737,10 @@ def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=Fals
     rmg.generate_output_html = generateOutputHTML
     rmg.generate_plots = generatePlots
     rmg.save_simulation_profiles = saveSimulationProfiles
+    if simulationProfileFormat not in ('csv', 'hdf5'):
+        raise InputError('Invalid simulationProfileFormat {0!r}; should be "csv" or "hdf5".'.format(
+            simulationProfileFormat))
+    rmg.simulation_profile_format = simulationProfileFormat
     rmg.verbose_comments = verboseComments
     if saveEdgeSpecies:
         logging.warning(
@@ -741,6 +749,11 @@ def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=Fals
     rmg.keep_irreversible = keepIrreversible
     rmg.trimolecular_product_reversible = trimolecularProductReversible
     rmg.walltime = wallTime
+    rmg.statmech_cache = statmechCache
+    rmg.database_cache = databaseCache
+    rmg.prune_database_by_elements = pruneDatabaseByElements
+    rmg.incremental_output = incrementalOutput
+    rmg.checkpoint_interval = checkpointInterval
 
 
 def generated_species_constraints(**kwargs):
@@ -1078,6 +1091,14 @@ def save_input_file(path, rmg):
     f.write('    rtol = {0:g},\n'.format(rmg.simulator_settings_list[0].rtol))
     f.write('    sens_atol = {0:g},\n'.format(rmg.simulator_settings_list[0].sens_atol))
     f.write('    sens_rtol = {0:g},\n'.format(rmg.simulator_settings_list[0].sens_rtol))
+    if rmg.simulator_settings_list[0].snapshot_interval:
+        f.write('    snapshot_interval = {0:g},\n'.format(rmg.simulator_settings_list[0].snapshot_interval))
+    if rmg.simulator_settings_list[0].snapshot_rtol:
+        f.write('    snapshot_rtol = {0:g},\n'.format(rmg.simulator_settings_list[0].snapshot_rtol))
+    if rmg.simulator_settings_list[0].snapshot_points:
+        f.write('    snapshot_points = {0:d},\n'.format(rmg.simulator_settings_list[0].snapshot_points))
+    if rmg.simulator_settings_list[0].snapshot_memory != 1e8:
+        f.write('    snapshot_memory = {0:g},\n'.format(rmg.simulator_settings_list[0].snapshot_memory))
     f.write(')\n\n')
 
     # Model
@@ -1148,11 +1169,23 @@ def save_input_file(path, rmg):
     f.write('    generateOutputHTML = {0},\n'.format(rmg.generate_output_html))
     f.write('    generatePlots = {0},\n'.format(rmg.generate_plots))
     f.write('    saveSimulationProfiles = {0},\n'.format(rmg.save_simulation_profiles))
+    if rmg.simulation_profile_format != 'csv':
+        f.write('    simulationProfileFormat = {0!r},\n'.format(rmg.simulation_profile_format))
     f.write('    saveEdgeSpecies = {0},\n'.format(rmg.save_edge_species))
     f.write('    keepIrreversible = {0},\n'.format(rmg.keep_irreversible))
     f.write('    trimolecularProductReversible = {0},\n'.format(rmg.trimolecular_product_reversible))
     f.write('    verboseComments = {0},\n'.format(rmg.verbose_comments))
     f.write('    wallTime = {0},\n'.format(rmg.walltime))
+    if rmg.statmech_cache:
+        f.write('    statmechCache = {0!r},\n'.format(rmg.statmech_cache))
+    if rmg.incremental_output:
+        f.write('    incrementalOutput = {0},\n'.format(rmg.incremental_output))
+    if rmg.checkpoint_interval:
+        f.write('    checkpointInterval = {0:d},\n'.format(rmg.checkpoint_interval))
+    if rmg.database_cache:
+        f.write('    databaseCache = {0!r},\n'.format(rmg.database_cache))
+    if rmg.prune_database_by_elements:
+        f.write('    pruneDatabaseByElements = {0},\n'.format(rmg.prune_database_by_elements))
     f.write(')\n\n')
 
     f.close()
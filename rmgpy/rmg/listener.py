@@ -31,6 +31,9 @@
 import csv
 import os
 
+import h5py
+import numpy as np
+
 from rmgpy.chemkin import get_species_identifier
 from rmgpy.tools.plot import SimulationPlot
 
@@ -41,6 +44,13 @@ class SimulationProfileWriter(object):
     and writes the species mole numbers as a function of the reaction time
     to a csv file.
 
+    If `file_format` is ``'hdf5'``, the profile is written to an HDF5 file
+    instead, as a compressed, chunked ``snapshots`` dataset with one column
+    per variable and a ``columns`` dataset holding the column headers. Set
+    the writer as the `profile_writer` of the reaction system to have the
+    snapshots written to the file in chunks while the simulation runs,
+    rather than collected in memory.
+
 
     A new instance of the class can be appended to a subject as follows:
     
@@ -58,12 +68,63 @@ class SimulationProfileWriter(object):
 
     """
 
-    def __init__(self, output_directory, reaction_sys_index, core_species):
+    def __init__(self, output_directory, reaction_sys_index, core_species, file_format='csv', chunk_size=1024):
         super(SimulationProfileWriter, self).__init__()
 
         self.output_directory = output_directory
         self.reaction_sys_index = reaction_sys_index
         self.core_species = core_species
+        if file_format not in ('csv', 'hdf5'):
+            raise ValueError('Invalid simulation profile format {0!r}; should be "csv" or "hdf5".'.format(file_format))
+        self.file_format = file_format
+        self.chunk_size = chunk_size
+        self.file = None
+
+    def get_header(self):
+        """
+        Return the list of column headers of the simulation profile.
+        """
+        header = ['Time (s)', 'Volume (m^3)']
+        for spc in self.core_species:
+            header.append(get_species_identifier(spc))
+        return header
+
+    def start(self, reaction_system):
+        """
+        Create the HDF5 file for the simulation about to be run by
+        `reaction_system`, to which the snapshots are then written using
+        :meth:`write`.
+        """
+        self.close()
+        header = self.get_header()
+        filename = get_simulation_profile_path(self.output_directory, self.reaction_sys_index,
+                                               len(self.core_species), self.file_format)
+        self.file = h5py.File(filename, 'w')
+        self.file.create_dataset('columns', data=np.array(header, dtype=h5py.string_dtype()))
+        self.file.create_dataset('snapshots', shape=(0, len(header)), maxshape=(None, len(header)),
+                                 dtype=np.float64, chunks=(self.chunk_size, len(header)),
+                                 compression='gzip', shuffle=True)
+
+    def write(self, rows):
+        """
+        Append the snapshots in the 2D array `rows`, each containing the time,
+        the volume and the number of moles of each core species, to the HDF5
+        file.
+        """
+        if len(rows) == 0:
+            return
+        dataset = self.file['snapshots']
+        n_rows = dataset.shape[0]
+        dataset.resize(n_rows + len(rows), axis=0)
+        dataset[n_rows:, :] = rows
+
+    def close(self):
+        """
+        Close the HDF5 file.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
 
     def update(self, reaction_system):
         """
@@ -74,19 +135,22 @@ class SimulationProfileWriter(object):
         Writes to a csv file:
             - header row with species names
             - each row with number of moles of the core species in the given reaction system.
+
+        In HDF5 format, the snapshots were already written to the file
+        during the simulation, unless the writer is not the `profile_writer`
+        of the reaction system, in which case they are written now.
         """
+        if self.file_format == 'hdf5':
+            if self.file is None:
+                self.start(reaction_system)
+                self.write(np.asarray(reaction_system.snapshots, np.float64))
+            self.close()
+            return
 
-        filename = os.path.join(
-            self.output_directory,
-            'solver',
-            'simulation_{0}_{1:d}.csv'.format(
-                self.reaction_sys_index + 1, len(self.core_species)
-            )
-        )
+        filename = get_simulation_profile_path(self.output_directory, self.reaction_sys_index,
+                                               len(self.core_species), self.file_format)
 
-        header = ['Time (s)', 'Volume (m^3)']
-        for spc in self.core_species:
-            header.append(get_species_identifier(spc))
+        header = self.get_header()
 
         with open(filename, 'w') as csvfile:
             worksheet = csv.writer(csvfile)
@@ -95,7 +159,7 @@ class SimulationProfileWriter(object):
             worksheet.writerow(header)
 
             # add mole fractions:
-            worksheet.writerows(reaction_system.snapshots)
+            worksheet.writerows(np.asarray(reaction_system.snapshots, np.float64).tolist())
 
 
 class SimulationProfilePlotter(object):
@@ -118,12 +182,13 @@ class SimulationProfilePlotter(object):
     reaction_system.detach(listener)
     """
 
-    def __init__(self, output_directory, reaction_sys_index, core_species):
+    def __init__(self, output_directory, reaction_sys_index, core_species, file_format='csv'):
         super(SimulationProfilePlotter, self).__init__()
 
         self.output_directory = output_directory
         self.reaction_sys_index = reaction_sys_index
         self.core_species = core_species
+        self.file_format = file_format
 
     def update(self, reaction_system):
         """
@@ -132,13 +197,8 @@ class SimulationProfilePlotter(object):
             - number of core species
         """
 
-        csv_file = os.path.join(
-            self.output_directory,
-            'solver',
-            'simulation_{0}_{1:d}.csv'.format(
-                self.reaction_sys_index + 1, len(self.core_species)
-            )
-        )
+        profile_file = get_simulation_profile_path(self.output_directory, self.reaction_sys_index,
+                                                   len(self.core_species), self.file_format)
 
         png_file = os.path.join(
             self.output_directory,
@@ -148,4 +208,15 @@ class SimulationProfilePlotter(object):
             )
         )
 
-        SimulationPlot(csv_file=csv_file, num_species=10, ylabel='Moles').plot(png_file)
+        SimulationPlot(csv_file=profile_file, num_species=10, ylabel='Moles').plot(png_file)
+
+
+def get_simulation_profile_path(output_directory, reaction_sys_index, num_core_species, file_format='csv'):
+    """
+    Return the path of the simulation profile of the reaction system with
+    index `reaction_sys_index` for a model core of `num_core_species`
+    species, written in `file_format`.
+    """
+    extension = '.h5' if file_format == 'hdf5' else '.csv'
+    return os.path.join(output_directory, 'solver',
+                        'simulation_{0}_{1:d}{2}'.format(reaction_sys_index + 1, num_core_species, extension))
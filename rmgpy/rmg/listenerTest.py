@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.rmg.listener` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from rmgpy.rmg.listener import SimulationProfileWriter, get_simulation_profile_path
+from rmgpy.species import Species
+from rmgpy.tools.plot import parse_csv_data, parse_hdf5_data
+
+
+################################################################################
+
+
+class MockReactionSystem(object):
+    """
+    A stand-in for a reaction system that only holds simulation snapshots.
+    """
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+
+
+class TestSimulationProfileWriter(unittest.TestCase):
+    """
+    Contains unit tests of the SimulationProfileWriter class.
+    """
+
+    def setUp(self):
+        self.output_directory = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.output_directory, 'solver'))
+        self.core_species = [Species(index=i + 1, label=label) for i, label in enumerate(['CH4', 'O2', 'CO2', 'H2O'])]
+        times = np.logspace(-8, 2, 50)
+        self.snapshots = [[t, 1.0, 1.0 / (1 + t), 2.0 / (1 + t), t / (1 + t), 2 * t / (1 + t)] for t in times]
+
+    def tearDown(self):
+        shutil.rmtree(self.output_directory)
+
+    def test_hdf5_profile_matches_csv(self):
+        """
+        Test that snapshots written to an HDF5 profile during a simulation read back like the CSV profile.
+        """
+        csv_writer = SimulationProfileWriter(self.output_directory, 0, self.core_species)
+        csv_writer.update(MockReactionSystem(self.snapshots))
+
+        reaction_system = MockReactionSystem([])
+        writer = SimulationProfileWriter(self.output_directory, 0, self.core_species, file_format='hdf5', chunk_size=16)
+        writer.start(reaction_system)
+        for i in range(0, len(self.snapshots), 16):
+            writer.write(np.array(self.snapshots[i:i + 16]))
+        writer.update(reaction_system)
+
+        csv_time, csv_data = parse_csv_data(get_simulation_profile_path(self.output_directory, 0, 4))
+        h5_time, h5_data = parse_hdf5_data(get_simulation_profile_path(self.output_directory, 0, 4, 'hdf5'))
+        self.assertEqual(h5_time.label, csv_time.label)
+        self.assertEqual(h5_time.units, csv_time.units)
+        self.assertTrue(np.allclose(h5_time.data, csv_time.data))
+        self.assertEqual([data.label for data in h5_data], [data.label for data in csv_data])
+        for h5, csv in zip(h5_data, csv_data):
+            self.assertEqual(h5.species, csv.species)
+            self.assertTrue(np.allclose(h5.data, csv.data))
+
+    def test_hdf5_profile_reads_top_species(self):
+        """
+        Test that only the columns of the requested species are read from an HDF5 profile.
+        """
+        writer = SimulationProfileWriter(self.output_directory, 0, self.core_species, file_format='hdf5', chunk_size=16)
+        writer.update(MockReactionSystem(self.snapshots))
+        path = get_simulation_profile_path(self.output_directory, 0, 4, 'hdf5')
+
+        time, data_list = parse_hdf5_data(path, num_species=2)
+        self.assertEqual(len(time.data), 50)
+        self.assertEqual([data.label for data in data_list], ['O2(2)', 'H2O(4)'])
+
+        time, data_list = parse_hdf5_data(path, labels=['CO2(3)'])
+        self.assertEqual([data.label for data in data_list], ['CO2(3)'])
+        self.assertTrue(np.allclose(data_list[0].data, [snapshot[4] for snapshot in self.snapshots]))
+
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
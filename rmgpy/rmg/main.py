@@ -37,6 +37,7 @@ import copy
 import gc
 import logging
 import os
+import pickle
 import resource
 import shutil
 import sys
@@ -57,11 +58,12 @@ from rmgpy.rmg.pdep import PDepNetwork
 from rmgpy import settings
 from rmgpy.chemkin import ChemkinWriter
 from rmgpy.constraints import fails_species_constraints
-from rmgpy.data.base import Entry
+from rmgpy.data.base import Entry, get_cache_key
 from rmgpy.data.kinetics.family import TemplateReaction
 from rmgpy.data.kinetics.library import KineticsLibrary, LibraryReaction
 from rmgpy.data.rmg import RMGDatabase
-from rmgpy.exceptions import ForbiddenStructureException, DatabaseError, CoreError
+from rmgpy.exceptions import ForbiddenStructureException, DatabaseError, CoreError, InputError
+from rmgpy.instrumentation import Timer
 from rmgpy.kinetics.diffusionLimited import diffusion_limiter
 from rmgpy.molecule import Molecule
 from rmgpy.qm.main import QMDatabaseWriter
@@ -72,7 +74,7 @@ from rmgpy.rmg.pdep import PDepReaction
 from rmgpy.rmg.settings import ModelSettings
 from rmgpy.solver.base import TerminationTime, TerminationConversion
 from rmgpy.solver.simple import SimpleReactor
-from rmgpy.stats import ExecutionStatsWriter
+from rmgpy.stats import ExecutionStatsWriter, InstrumentationWriter
 from rmgpy.thermo.thermoengine import submit
 from rmgpy.tools.plot import plot_sensitivity
 from rmgpy.tools.uncertainty import Uncertainty, process_local_results
@@ -90,6 +92,20 @@ solvent = None
 # Maximum number of user defined processors
 maxproc = 1
 
+# The react flags and thresholds of an RMG job which are saved in a checkpoint
+CHECKPOINT_FLAGS = ('unimolecular_react', 'bimolecular_react', 'trimolecular_react',
+                    'unimolecular_threshold', 'bimolecular_threshold', 'trimolecular_threshold')
+
+# The attributes of an RMG_Memory object which are saved in a checkpoint
+CHECKPOINT_MEMORY_ATTRIBUTES = ('condition_list', 'scaled_condition_list', 'ts', 'convs', 'Ns', 'rand_state')
+
+# The bath gases which are always added to the model as inert species
+BATH_GASES = (('Ar', '[Ar]'), ('He', '[He]'), ('Ne', '[Ne]'), ('N2', 'N#N'))
+
+# The species constraints on the number of atoms of each element in generated species
+ELEMENT_CONSTRAINTS = (('C', 'maximumCarbonAtoms'), ('O', 'maximumOxygenAtoms'), ('N', 'maximumNitrogenAtoms'),
+                       ('Si', 'maximumSiliconAtoms'), ('S', 'maximumSulfurAtoms'))
+
 
 class RMG(util.Subject):
     """
@@ -142,6 +158,12 @@ class RMG(util.Subject):
     `ml_settings`                       Settings for ML estimation
     `walltime`                          The maximum amount of CPU time in the form DD:HH:MM:SS to expend on this job; used to stop gracefully so we can still get profiling information
     `kinetics_datastore`                ``True`` if storing details of each kinetic database entry in text file, ``False`` otherwise
+    `statmech_cache`                    The path of a file used to reuse estimated statmech data between jobs, or ``None``
+    `database_cache`                    The path of a directory used to cache the loaded database between jobs, or ``None``
+    `prune_database_by_elements`        ``True`` to remove the parts of the database that cannot apply to the elements in the job, ``False`` otherwise
+    `incremental_output`                ``True`` to append only new core species and reactions to the output each iteration and write complete files at the end, ``False`` otherwise
+    `checkpoint_interval`               The number of iterations between checkpoints of the reaction model, or 0 to not write checkpoints
+    `simulation_profile_format`         The format of the saved simulation profiles, either ``'csv'`` or ``'hdf5'``
     ----------------------------------- ------------------------------------------------
     `initialization_time`               The time at which the job was initiated, in seconds since the epoch (i.e. from time.time())
     `done`                              Whether the job has completed (there is nothing new to add)
@@ -204,6 +226,7 @@ class RMG(util.Subject):
         self.generate_output_html = None
         self.generate_plots = None
         self.save_simulation_profiles = None
+        self.simulation_profile_format = 'csv'
         self.verbose_comments = None
         self.save_edge_species = None
         self.keep_irreversible = None
@@ -216,6 +239,12 @@ class RMG(util.Subject):
         self.walltime = '00:00:00:00'
         self.initialization_time = 0
         self.kinetics_datastore = None
+        self.statmech_cache = None
+        self.database_cache = None
+        self.prune_database_by_elements = False
+        self.incremental_output = False
+        self.checkpoint_interval = 0
+        self.checkpoint = None
         self.restart = False
         self.core_seed_path = None
         self.edge_seed_path = None
@@ -230,6 +259,7 @@ class RMG(util.Subject):
         self.uncertainty = None
 
         self.exec_time = []
+        self.instrumentation_writer = None
 
     def load_input(self, path=None):
         """
@@ -362,73 +392,192 @@ class RMG(util.Subject):
             kinetics_depositories=self.kinetics_depositories,
             # frequenciesLibraries = self.statmech_libraries,
             depository=False,  # Don't bother loading the depository information, as we don't use it
+            cache_directory=self.database_cache,
         )
 
-        # Turn off reversibility for families with three products if desired
-        if not self.trimolecular_product_reversible:
-            for family in self.database.kinetics.families.values():
-                if len(family.forward_template.products) > 2:
-                    family.reversible = False
-                    family.reverse_template = None
-                    family.reverse_recipe = None
-                    family.reverse = None
-
-        # Determine if trimolecular families are present
-        for family in self.database.kinetics.families.values():
-            if len(family.forward_template.reactants) > 2:
-                logging.info('Trimolecular reactions are turned on')
-                self.trimolecular = True
-                break
-        # Only check products if we want to react them
-        if not self.trimolecular and self.trimolecular_product_reversible:
-            for family in self.database.kinetics.families.values():
-                if len(family.forward_template.products) > 2:
-                    logging.info('Trimolecular reactions are turned on')
-                    self.trimolecular = True
-                    break
-
         # check libraries
         self.check_libraries()
 
         if self.binding_energies:
             self.database.thermo.set_delta_atomic_adsorption_energies(self.binding_energies)
 
+        if self.statmech_cache:
+            self.database.statmech.load_cache(self.statmech_cache)
+
         # set global variable solvent
         if self.solvent:
             global solvent
             solvent = self.solvent
 
+        # The kinetics families are prepared when first used, and cached once prepared
         if self.kinetics_estimator == 'rate rules':
             if '!training' not in self.kinetics_depositories:
-                logging.info('Adding rate rules from training set in kinetics families...')
+                logging.info('Rate rules from training set will be added in kinetics families when loaded...')
+            else:
+                logging.info('Training set explicitly not added to rate rules in kinetics families...')
+            logging.info('Rate rules in kinetics families will be filled in by averaging when loaded...')
+        self.database.kinetics.prepare_families(self.prepare_family, self.get_family_preparation_key())
+
+        # Determine if trimolecular families are present
+        for label, (num_reactants, num_products) in self.database.kinetics.template_sizes.items():
+            if num_reactants > 2:
+                logging.info('Trimolecular reactions are turned on')
+                self.trimolecular = True
+                break
+        # Only check products if we want to react them
+        if not self.trimolecular and self.trimolecular_product_reversible:
+            for label, (num_reactants, num_products) in self.database.kinetics.template_sizes.items():
+                if num_products > 2:
+                    logging.info('Trimolecular reactions are turned on')
+                    self.trimolecular = True
+                    break
+
+        # If requested by the user, write a text file for each kinetics family detailing the source of each entry
+        if self.kinetics_datastore and self.kinetics_estimator == 'rate rules' and \
+                '!training' not in self.kinetics_depositories:
+            for family in self.database.kinetics.families.values():
+                logging.info('Writing sources of kinetic entries in family {0} to text file'.format(family.label))
+                path = os.path.join(self.output_directory, 'kinetics_database', family.label + '.txt')
+                with open(path, 'w') as f:
+                    for template_label, entries in family.rules.entries.items():
+                        f.write("Template [{0}] uses the {1} following source(s):\n".format(template_label,
+                                                                                            str(len(entries))))
+                        for entry_index, entry in enumerate(entries):
+                            f.write(str(entry_index+1) + ". " + entry.short_desc + "\n" + entry.long_desc + "\n")
+                        f.write('\n')
+                    f.write('\n')
+
+    def prepare_family(self, family):
+        """
+        Prepare the kinetics `family` for reaction generation: turn off the
+        reversibility of families with three products if desired, and, when
+        estimating kinetics with rate rules, add the rate rules from the
+        training set and fill in the rest by averaging.
+        """
+        if not self.trimolecular_product_reversible:
+            if len(family.forward_template.products) > 2:
+                family.reversible = False
+                family.reverse_template = None
+                family.reverse_recipe = None
+                family.reverse = None
+
+        if self.kinetics_estimator == 'rate rules' and not family.auto_generated:
+            if '!training' not in self.kinetics_depositories:
+                logging.info('Adding rate rules from training set in kinetics family {0}...'.format(family.label))
                 # Temporarily remove species constraints for the training reactions
                 copy_species_constraints = copy.copy(self.species_constraints)
                 self.species_constraints = {}
-                for family in self.database.kinetics.families.values():
-                    if not family.auto_generated:
-                        family.add_rules_from_training(thermo_database=self.database.thermo)
+                try:
+                    family.add_rules_from_training(thermo_database=self.database.thermo)
+                finally:
+                    self.species_constraints = copy_species_constraints
+            logging.info('Filling in rate rules in kinetics family {0} by averaging...'.format(family.label))
+            family.fill_rules_by_averaging_up(verbose=self.verbose_comments)
 
-                    # If requested by the user, write a text file for each kinetics family detailing the source of each entry
-                    if self.kinetics_datastore:
-                        logging.info(
-                            'Writing sources of kinetic entries in family {0} to text file'.format(family.label))
-                        path = os.path.join(self.output_directory, 'kinetics_database', family.label + '.txt')
-                        with open(path, 'w') as f:
-                            for template_label, entries in family.rules.entries.items():
-                                f.write("Template [{0}] uses the {1} following source(s):\n".format(template_label,
-                                                                                                    str(len(entries))))
-                                for entry_index, entry in enumerate(entries):
-                                    f.write(str(entry_index+1) + ". " + entry.short_desc + "\n" + entry.long_desc + "\n")
-                                f.write('\n')
-                            f.write('\n')
-
-                self.species_constraints = copy_species_constraints
-            else:
-                logging.info('Training set explicitly not added to rate rules in kinetics families...')
-            logging.info('Filling in rate rules in kinetics families by averaging...')
-            for family in self.database.kinetics.families.values():
-                if not family.auto_generated:
-                    family.fill_rules_by_averaging_up(verbose=self.verbose_comments)
+    def get_family_preparation_key(self):
+        """
+        Return the key under which the kinetics families prepared by
+        :meth:`prepare_family` are cached, or ``None`` if they should not be
+        cached. The key covers the settings used and, since the training
+        reactions stored in the reverse direction need thermo, the thermo
+        database files and binding energies. Families are not cached when the
+        thermo comes from quantum mechanics or machine learning.
+        """
+        if self.database_cache is None or self.quantum_mechanics or self.ml_estimator:
+            return None
+        thermo_paths = []
+        if self.kinetics_estimator == 'rate rules' and '!training' not in self.kinetics_depositories:
+            thermo_path = os.path.join(self.database_directory, 'thermo')
+            thermo_paths = [os.path.join(root, f) for root, dirs, files in os.walk(os.path.join(thermo_path, 'groups'))
+                            for f in files if not f.endswith('.pyc')]
+            thermo_paths.extend(os.path.join(thermo_path, 'libraries', label + '.py')
+                                for label in self.thermo_libraries)
+            thermo_paths = [path for path in thermo_paths if os.path.exists(path)]
+        return get_cache_key(thermo_paths, self.trimolecular_product_reversible, self.kinetics_estimator,
+                             self.kinetics_depositories, self.verbose_comments, self.thermo_libraries,
+                             self.binding_energies)
+
+    def prune_database(self):
+        """
+        Remove the parts of the loaded database that cannot apply to the
+        species in this job, and report the memory and matching time saved.
+
+        The thermo, transport, solvation and kinetics library data are
+        pruned to the elements of the input species, seed mechanisms and bath
+        gases. Kinetics families and their group trees are pruned to the
+        elements of the species that can react: the reactive input species,
+        the seed mechanisms and the species of the kept reaction library
+        entries, without the elements that the species constraints forbid in
+        generated species.
+        """
+        elements, family_elements = self.get_database_elements()
+
+        num_families = len(self.database.kinetics.families)
+        removed_families, removed_entries = self.database.prune_elements(elements, family_elements)
+        memory = len(pickle.dumps((removed_families, [(entry.item, entry.data) for entry in removed_entries]),
+                                  pickle.HIGHEST_PROTOCOL))
+
+        # Time the matching of the input species against the removed families, which every new species would need
+        reactive_species = [spec for spec in self.initial_species if spec.reactive]
+        molecules = [molecule for spec in reactive_species for molecule in spec.molecule]
+        start_time = time.time()
+        for family in removed_families:
+            for template in [family.forward_template, family.reverse_template]:
+                if template is not None:
+                    for entry in template.reactants:
+                        for molecule in molecules:
+                            family._match_reactant_to_template(molecule, entry)
+        matching_time = time.time() - start_time
+
+        logging.info('Pruned the database to the elements {0} ({1} for kinetics families): removed {2} of {3} '
+                     'kinetics families and {4} groups and library entries, about {5:.1f} MB.'.format(
+                         ', '.join(sorted(elements)), ', '.join(sorted(family_elements)), len(removed_families),
+                         num_families, len(removed_entries), memory / 1e6))
+        if reactive_species:
+            logging.info('Matching the {0} reactive input species against the removed kinetics families took '
+                         '{1:.3f} s, about {2:.2f} ms per species.'.format(
+                             len(reactive_species), matching_time, 1000 * matching_time / len(reactive_species)))
+
+    def get_database_elements(self):
+        """
+        Return the elements that the database is pruned to by
+        :meth:`prune_database`, as two sets of element symbols: the elements
+        of the input species, seed mechanisms and bath gases, and the
+        elements that the kinetics families need to be able to react.
+        """
+        seed_species = []
+        for label in self.seed_mechanisms:
+            for entry in self.database.kinetics.libraries[label].entries.values():
+                seed_species.extend(entry.item.reactants + entry.item.products)
+        library_species = []
+        for label, option in self.reaction_libraries:
+            for entry in self.database.kinetics.libraries[label].entries.values():
+                library_species.extend(entry.item.reactants + entry.item.products)
+
+        elements = set()
+        family_elements = set()
+        for spec in self.initial_species:
+            symbols = set(atom.symbol for atom in spec.molecule[0].atoms)
+            elements.update(symbols)
+            if spec.reactive:
+                family_elements.update(symbols)
+        for spec in seed_species:
+            elements.update(atom.symbol for atom in spec.molecule[0].atoms)
+            family_elements.update(atom.symbol for atom in spec.molecule[0].atoms)
+        for label, smiles in BATH_GASES:
+            elements.update(atom.symbol for atom in Molecule().from_smiles(smiles).atoms)
+        # The species of the reaction library entries that are kept are added to the edge as reactive species
+        for spec in library_species:
+            symbols = set(atom.symbol for atom in spec.molecule[0].atoms)
+            if symbols <= elements:
+                family_elements.update(symbols)
+        for element, constraint in ELEMENT_CONSTRAINTS:
+            if self.species_constraints.get(constraint, -1) == 0:
+                family_elements.discard(element)
+        if self.species_constraints.get('maximumHeavyAtoms', -1) == 0:
+            family_elements.intersection_update(['H'])
+
+        return elements, family_elements
 
     def initialize(self, **kwargs):
         """
@@ -449,6 +598,9 @@ class RMG(util.Subject):
         self.load_input(self.input_file)
 
         if kwargs.get('restart', ''):
+            if kwargs.get('checkpoint', ''):
+                raise InputError('An RMG job can be restarted either from a seed mechanism or from a checkpoint, '
+                                 'but not both.')
             import rmgpy.rmg.input
             rmgpy.rmg.input.restart_from_seed(path=kwargs['restart'])
 
@@ -503,6 +655,14 @@ class RMG(util.Subject):
             self.seed_mechanisms.append('restart')
             self.reaction_libraries.append(('restart_edge', False))
 
+        # Remove the parts of the database that cannot apply to the elements in this job
+        if self.prune_database_by_elements:
+            self.prune_database()
+
+        # Load and prepare all kinetics families before generating reactions, so that they are shared by the
+        # processes generating reactions in parallel rather than loaded again by each of them
+        self.database.kinetics.families.load_all()
+
         # Set trimolecular reactant flags of reaction systems
         if self.trimolecular:
             for reaction_system in self.reaction_systems:
@@ -528,6 +688,15 @@ class RMG(util.Subject):
             raise ValueError('Invalid format for wall time {0}; should be DD:HH:MM:SS.'.format(self.walltime))
         self.walltime = int(data[-1]) + 60 * int(data[-2]) + 3600 * int(data[-3]) + 86400 * int(data[-4])
 
+        # Resume from a checkpoint (if specified); the reaction model is loaded as it was rather than regenerated
+        if kwargs.get('checkpoint', ''):
+            self.load_checkpoint(kwargs['checkpoint'])
+            if self.solvent is not None:
+                for reaction_system in self.reaction_systems:
+                    if reaction_system.const_spc_names is not None:
+                        reaction_system.get_const_spc_indices(self.reaction_model.core.species)
+            return
+
         # Initialize reaction model
 
         # Seed mechanisms: add species and reactions from seed mechanism
@@ -541,7 +710,7 @@ class RMG(util.Subject):
             self.reaction_model.add_reaction_library_to_edge(library)
 
         # Also always add in a few bath gases (since RMG-Java does)
-        for label, smiles in [('Ar', '[Ar]'), ('He', '[He]'), ('Ne', '[Ne]'), ('N2', 'N#N')]:
+        for label, smiles in BATH_GASES:
             molecule = Molecule().from_smiles(smiles)
             spec, is_new = self.reaction_model.make_new_species(molecule, label=label, reactive=False)
             if is_new:
@@ -622,24 +791,32 @@ class RMG(util.Subject):
         found in the RMG input file.
         """
 
-        self.attach(ChemkinWriter(self.output_directory))
-        self.attach(RMSWriter(self.output_directory))
+        self.attach(ChemkinWriter(self.output_directory, incremental=self.incremental_output))
+        self.attach(RMSWriter(self.output_directory, incremental=self.incremental_output))
 
         if self.generate_output_html:
-            self.attach(OutputHTMLWriter(self.output_directory))
+            self.attach(OutputHTMLWriter(self.output_directory, incremental=self.incremental_output))
 
         if self.quantum_mechanics:
             self.attach(QMDatabaseWriter())
 
         self.attach(ExecutionStatsWriter(self.output_directory))
 
+        # Not a listener, so that the time spent notifying the listeners is recorded before it is written
+        self.instrumentation_writer = InstrumentationWriter(self.output_directory)
+
         if self.save_simulation_profiles:
 
             for index, reaction_system in enumerate(self.reaction_systems):
-                reaction_system.attach(SimulationProfileWriter(
-                    self.output_directory, index, self.reaction_model.core.species))
+                writer = SimulationProfileWriter(self.output_directory, index, self.reaction_model.core.species,
+                                                 file_format=self.simulation_profile_format)
+                reaction_system.attach(writer)
+                if self.simulation_profile_format == 'hdf5':
+                    # Append the snapshots to the file during the simulation instead of keeping them in memory
+                    reaction_system.profile_writer = writer
                 reaction_system.attach(SimulationProfilePlotter(
-                    self.output_directory, index, self.reaction_model.core.species))
+                    self.output_directory, index, self.reaction_model.core.species,
+                    file_format=self.simulation_profile_format))
 
     def execute(self, **kwargs):
         """
@@ -672,6 +849,11 @@ class RMG(util.Subject):
         for index, reaction_system in enumerate(self.reaction_systems):
             # Initialize memory object to track conditions for ranged reactors
             self.rmg_memories.append(RMG_Memory(reaction_system, self.balance_species))
+            if self.checkpoint is not None:
+                # The initial reactions were generated before the checkpoint was saved
+                for attr, value in self.checkpoint['memories'][index].items():
+                    setattr(self.rmg_memories[index], attr, value)
+                continue
             self.rmg_memories[index].generate_cond()
             log_conditions(self.rmg_memories, index)
 
@@ -719,10 +901,15 @@ class RMG(util.Subject):
                 reaction_systems=self.reaction_systems
             )
 
-        if not np.isinf(self.model_settings_list[0].thermo_tol_keep_spc_in_edge):
-            self.reaction_model.thermo_filter_down(maximum_edge_species=self.model_settings_list[0].maximum_edge_species)
+        if self.checkpoint is not None:
+            logging.info('Resuming model generation stage {0} from iteration {1}.\n'.format(
+                self.checkpoint['stage'] + 1, self.reaction_model.iteration_num))
+        else:
+            if not np.isinf(self.model_settings_list[0].thermo_tol_keep_spc_in_edge):
+                self.reaction_model.thermo_filter_down(
+                    maximum_edge_species=self.model_settings_list[0].maximum_edge_species)
 
-        logging.info('Completed initial enlarge edge step.\n')
+            logging.info('Completed initial enlarge edge step.\n')
 
         self.save_everything()
 
@@ -732,6 +919,10 @@ class RMG(util.Subject):
         max_num_spcs_hit = False  # default
 
         for q, model_settings in enumerate(self.model_settings_list):
+            if self.checkpoint is not None and q < self.checkpoint['stage']:
+                # This stage was completed before the checkpoint was saved
+                continue
+
             if len(self.simulator_settings_list) > 1:
                 simulator_settings = self.simulator_settings_list[q]
             else:  # if they only provide one input for simulator use that everytime
@@ -748,6 +939,9 @@ class RMG(util.Subject):
                 if self.generate_seed_each_iteration:
                     self.make_seed_mech()
 
+                if self.checkpoint_interval > 0 and self.reaction_model.iteration_num % self.checkpoint_interval == 0:
+                    self.save_checkpoint(stage=q)
+
                 self.reaction_model.iteration_num += 1
                 self.done = True
 
@@ -941,6 +1135,7 @@ class RMG(util.Subject):
                         core_spec, core_reac, edge_spec, edge_reac = self.reaction_model.get_model_size()
                         logging.info('The current model core has %s species and %s reactions' % (core_spec, core_reac))
                         logging.info('The current model edge has %s species and %s reactions' % (edge_spec, edge_reac))
+                        self.save_output_files()
                         return
 
             if max_num_spcs_hit:  # resets maxNumSpcsHit and continues the settings for loop
@@ -949,6 +1144,8 @@ class RMG(util.Subject):
                 max_num_spcs_hit = False
                 continue
 
+        self.save_output_files()
+
         # Save the final seed mechanism
         if self.generate_seed_each_iteration:
             self.make_seed_mech()
@@ -984,6 +1181,9 @@ class RMG(util.Subject):
         logging.info('The final model core has %s species and %s reactions' % (core_spec, core_reac))
         logging.info('The final model edge has %s species and %s reactions' % (edge_spec, edge_reac))
 
+        if self.statmech_cache:
+            self.database.statmech.save_cache(self.statmech_cache)
+
         self.finish()
 
     def run_model_analysis(self, number=10):
@@ -1054,6 +1254,7 @@ class RMG(util.Subject):
             # Reload reaction families with verbose comments if necessary
             if not self.verbose_comments:
                 logging.info('Reloading kinetics families with verbose comments for uncertainty analysis...')
+                self.database.kinetics.prepare_families(None)
                 self.database.kinetics.load_families(os.path.join(self.database_directory, 'kinetics', 'families'),
                                                      self.kinetics_families, self.kinetics_depositories)
                 # Temporarily remove species constraints for the training reactions
@@ -1721,7 +1922,91 @@ class RMG(util.Subject):
         self.exec_time.append(time.time() - self.initialization_time)
 
         # Notify registered listeners:
-        self.notify()
+        with Timer('output writing'):
+            self.notify()
+
+        # Write the timers and counters of this iteration
+        if self.instrumentation_writer is not None:
+            self.instrumentation_writer.update(self)
+
+    def save_checkpoint(self, stage=0):
+        """
+        Save the state of the job to ``checkpoint.pkl`` in the output
+        directory: the species, reactions and pressure-dependent networks of
+        the reaction model with their thermo and kinetics, the react flags and
+        thresholds, the conditions sampled for the reaction systems, and the
+        index of the current model generation `stage`. The file is written to
+        a temporary file first and then renamed, so an interrupted job always
+        leaves a complete checkpoint behind.
+        """
+        path = os.path.join(self.output_directory, 'checkpoint.pkl')
+        logging.info('Saving checkpoint to {0}...'.format(path))
+        checkpoint = {
+            'reaction_model': self.reaction_model.get_checkpoint_state(),
+            'memories': [{attr: getattr(memory, attr) for attr in CHECKPOINT_MEMORY_ATTRIBUTES}
+                         for memory in self.rmg_memories],
+            'stage': stage,
+        }
+        for attr in CHECKPOINT_FLAGS:
+            checkpoint[attr] = getattr(self, attr)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(checkpoint, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+
+    def load_checkpoint(self, path):
+        """
+        Load the reaction model, react flags and thresholds from the
+        checkpoint file at `path`, as written by :meth:`save_checkpoint`. The
+        input species and the species referred to by the reaction systems are
+        replaced by the matching species of the loaded model. Called by
+        :meth:`initialize` in place of generating the reaction model from the
+        seed mechanisms, reaction libraries and input species.
+        """
+        logging.info('Loading checkpoint from {0}...'.format(path))
+        with open(path, 'rb') as f:
+            checkpoint = pickle.load(f)
+        if len(checkpoint['memories']) != len(self.reaction_systems):
+            raise InputError('Checkpoint {0} was saved for {1:d} reaction systems, but {2:d} are defined in the input '
+                             'file.'.format(path, len(checkpoint['memories']), len(self.reaction_systems)))
+        self.reaction_model.set_checkpoint_state(checkpoint['reaction_model'])
+        for attr in CHECKPOINT_FLAGS:
+            setattr(self, attr, checkpoint[attr])
+
+        species_map = {}
+        for spec in self.initial_species:
+            match = self.reaction_model.check_for_existing_species(spec.molecule[0])
+            if match is None:
+                raise InputError('Input species {0} is not part of the reaction model in checkpoint '
+                                 '{1}.'.format(spec.label, path))
+            species_map[spec] = match
+        self.initial_species = [species_map[spec] for spec in self.initial_species]
+
+        for reaction_system in self.reaction_systems:
+            for attr in ['initial_mole_fractions', 'initial_concentrations',
+                         'initial_gas_mole_fractions', 'initial_surface_coverages']:
+                values = getattr(reaction_system, attr, None)
+                if values:
+                    setattr(reaction_system, attr,
+                            {species_map.get(spec, spec): value for spec, value in values.items()})
+            for term in reaction_system.termination:
+                if isinstance(term, TerminationConversion):
+                    term.species = species_map.get(term.species, term.species)
+            if reaction_system.sensitive_species:
+                reaction_system.sensitive_species = [species_map.get(spec, spec)
+                                                     for spec in reaction_system.sensitive_species]
+
+        self.checkpoint = checkpoint
+
+    def save_output_files(self):
+        """
+        Write the complete output files of the listeners that only write new
+        entries each iteration when `incremental_output` is set.
+        """
+        if not self.incremental_output:
+            return
+        for observer in self._observers:
+            if isinstance(observer, (ChemkinWriter, RMSWriter, OutputHTMLWriter)):
+                observer.finish(self)
 
     def finish(self):
         """
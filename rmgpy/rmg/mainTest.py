@@ -38,8 +38,12 @@ from rmgpy.rmg.main import RMG
 from rmgpy.rmg.main import RMG_Memory
 from rmgpy import get_path
 from rmgpy import settings
+from rmgpy.data.base import Entry
+from rmgpy.data.kinetics import KineticsLibrary
 from rmgpy.data.rmg import RMGDatabase
+from rmgpy.reaction import Reaction
 from rmgpy.rmg.model import CoreEdgeReactionModel
+from rmgpy.species import Species
 
 ###################################################
 
@@ -348,3 +352,104 @@ CH3(4)              2     144.001     3.800     0.000     0.000     0.000    ! G
             # clean up
             os.chdir(originalPath)
             shutil.rmtree(self.dir_name)
+
+
+class TestPruneDatabase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """A function that is run ONCE before all unit tests in this class."""
+        cls.database = RMGDatabase()
+        cls.database.load(
+            path=os.path.join(settings['test_data.directory'], 'testing_database'),
+            thermo_libraries=['primaryThermoLibrary'],
+            reaction_libraries=['GRI-Mech3.0'],
+            seed_mechanisms=['ethane-oxidation'],
+            kinetics_families='all',
+            depository=False,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """A function that is run ONCE after all unit tests in this class."""
+        import rmgpy.data.rmg
+        rmgpy.data.rmg.database = None
+
+    def make_rmg(self, species, reaction_libraries=None, seed_mechanisms=None, species_constraints=None):
+        """
+        Return an RMG job using the testing database with the initial
+        `species`, given as (SMILES, reactive) tuples, and bath gases.
+        """
+        rmg = RMG()
+        rmg.database = self.database
+        rmg.initial_species = [Species(reactive=reactive).from_smiles(smiles) for smiles, reactive in species]
+        rmg.initial_species.extend(Species(reactive=False).from_smiles(smiles) for smiles in ['[Ar]', 'N#N'])
+        rmg.reaction_libraries = reaction_libraries or []
+        rmg.seed_mechanisms = seed_mechanisms or []
+        rmg.species_constraints = species_constraints or {}
+        return rmg
+
+    def test_get_database_elements(self):
+        """Test the elements that the database is pruned to"""
+        all_elements = {'C', 'H', 'O', 'N', 'Ar', 'He', 'Ne'}
+
+        # The elements of inert species only count for the families if they take part in a reaction library
+        rmg = self.make_rmg([('C', True), ('O', False)])
+        self.assertEqual(rmg.get_database_elements(), (all_elements, {'C', 'H'}))
+        rmg = self.make_rmg([('C', True), ('O', False)], reaction_libraries=[('GRI-Mech3.0', False)])
+        self.assertEqual(rmg.get_database_elements(), (all_elements, {'C', 'H', 'O'}))
+        rmg = self.make_rmg([('C', True), ('O', True)])
+        self.assertEqual(rmg.get_database_elements(), (all_elements, {'C', 'H', 'O'}))
+
+        # The species of seed mechanisms can react
+        rmg = self.make_rmg([('[H][H]', True)], seed_mechanisms=['ethane-oxidation'])
+        self.assertEqual(rmg.get_database_elements(), (all_elements, {'C', 'H', 'O'}))
+        rmg = self.make_rmg([('[H][H]', True)])
+        self.assertEqual(rmg.get_database_elements(), ({'H', 'N', 'Ar', 'He', 'Ne'}, {'H'}))
+
+        # Elements that the species constraints forbid are not needed by the families
+        rmg = self.make_rmg([('C', True), ('O', True)], species_constraints={'maximumOxygenAtoms': 0})
+        self.assertEqual(rmg.get_database_elements(), (all_elements, {'C', 'H'}))
+        rmg = self.make_rmg([('C', True), ('O', True)], species_constraints={'maximumCarbonAtoms': 2})
+        self.assertEqual(rmg.get_database_elements(), (all_elements, {'C', 'H', 'O'}))
+        rmg = self.make_rmg([('C', True), ('O', True)], species_constraints={'maximumHeavyAtoms': 0})
+        self.assertEqual(rmg.get_database_elements(), (all_elements, {'H'}))
+
+    def test_get_database_elements_library(self):
+        """Test that the elements of the kept reaction library species are needed by the families"""
+        all_elements = {'C', 'H', 'O', 'N', 'Ar', 'He', 'Ne'}
+        library = KineticsLibrary(label='ammonia')
+        for index, (reactants, products) in enumerate([(['N', '[OH]'], ['[NH2]', 'O']),
+                                                       (['S', '[OH]'], ['[SH]', 'O'])]):
+            reaction = Reaction(reactants=[Species(label=smiles).from_smiles(smiles) for smiles in reactants],
+                                products=[Species(label=smiles).from_smiles(smiles) for smiles in products])
+            library.entries[index + 1] = Entry(index=index + 1, label=reaction.to_labeled_str(), item=reaction)
+        self.database.kinetics.libraries['ammonia'] = library
+        try:
+            # The nitrogen of the library species can react, unlike the nitrogen of the bath gas, while the
+            # entry with sulfur is pruned from the library
+            rmg = self.make_rmg([('C', True), ('O', False)], reaction_libraries=[('ammonia', False)])
+            self.assertEqual(rmg.get_database_elements(), (all_elements, {'C', 'H', 'N', 'O'}))
+        finally:
+            del self.database.kinetics.libraries['ammonia']
+
+    def test_prune_database(self):
+        """Test pruning the database of a job to its elements"""
+        rmg = self.make_rmg([('C', True), ('O', False)], reaction_libraries=[('GRI-Mech3.0', False)])
+        rmg.database = RMGDatabase()
+        rmg.database.load(
+            path=os.path.join(settings['test_data.directory'], 'testing_database'),
+            thermo_libraries=['primaryThermoLibrary'],
+            reaction_libraries=['GRI-Mech3.0'],
+            kinetics_families='all',
+            depository=False,
+        )
+        families = set(rmg.database.kinetics.families)
+        num_groups = len(rmg.database.thermo.groups['group'].entries)
+        rmg.prune_database()
+        self.assertEqual(families - set(rmg.database.kinetics.families),
+                         {'Surface_Adsorption_Dissociative', 'Surface_Dissociation_vdW',
+                          'intra_substitutionS_isomerization'})
+        self.assertLess(len(rmg.database.thermo.groups['group'].entries), num_groups)
+        self.assertEqual(len(rmg.database.kinetics.libraries['GRI-Mech3.0'].entries),
+                         len(self.database.kinetics.libraries['GRI-Mech3.0'].entries))
@@ -48,13 +48,20 @@ from rmgpy.data.kinetics.library import KineticsLibrary, LibraryReaction
 from rmgpy.data.rmg import get_db
 from rmgpy.display import display
 from rmgpy.exceptions import ForbiddenStructureException
+from rmgpy.instrumentation import Timer, timed
 from rmgpy.kinetics import KineticsData, Arrhenius
 from rmgpy.quantity import Quantity
 from rmgpy.reaction import Reaction
 from rmgpy.rmg.pdep import PDepReaction, PDepNetwork
 from rmgpy.rmg.react import react_all
 from rmgpy.species import Species
-from rmgpy.thermo.thermoengine import submit
+from rmgpy.thermo.thermoengine import submit, submit_list
+
+# The attributes of a CoreEdgeReactionModel which are saved in a checkpoint
+CHECKPOINT_ATTRIBUTES = ('core', 'edge', 'surface', 'network_dict', 'network_list', 'network_count', 'species_dict',
+                         'reaction_dict', 'species_counter', 'reaction_counter', 'output_species_list',
+                         'output_reaction_list', 'index_species_dict', 'iteration_num', 'new_surface_spcs_add',
+                         'new_surface_rxns_add', 'new_surface_spcs_loss', 'new_surface_rxns_loss')
 
 
 ################################################################################
@@ -225,6 +232,28 @@ class CoreEdgeReactionModel:
         self.solvent_name = ''
         self.surface_site_density = None
 
+    def get_checkpoint_state(self):
+        """
+        Return a dictionary of the attributes describing the current state of
+        the model, i.e. the species, reactions, pressure-dependent networks and
+        counters generated so far, for saving in a checkpoint. Settings that
+        are read from the input file, such as the pressure dependence and
+        quantum mechanics options, and the attached reaction systems are not
+        included.
+        """
+        return {attr: getattr(self, attr) for attr in CHECKPOINT_ATTRIBUTES}
+
+    def set_checkpoint_state(self, state):
+        """
+        Restore the state of the model from the dictionary `state`, as
+        returned by :meth:`get_checkpoint_state`.
+        """
+        for attr in CHECKPOINT_ATTRIBUTES:
+            setattr(self, attr, state[attr])
+        self.species_cache = [None for i in range(4)]
+        self.new_species_list = []
+        self.new_reaction_list = []
+
     def check_for_existing_species(self, molecule):
         """
         Check to see if an existing species contains the same
@@ -299,7 +328,8 @@ class CoreEdgeReactionModel:
         spec.molecular_weight = Quantity(spec.molecule[0].get_molecular_weight() * 1000., "amu")
 
         if generate_thermo:
-            self.generate_thermo(spec)
+            with Timer('thermo estimation'):
+                self.generate_thermo(spec)
 
         # If the species still does not have a label, set initial label as the SMILES
         # This may change later after getting thermo in self.generate_thermo()
@@ -806,6 +836,7 @@ class CoreEdgeReactionModel:
                     if rxn in self.edge.reactions:
                         self.edge.reactions.remove(rxn)
 
+    @timed('thermo estimation')
     def apply_thermo_to_species(self, procnum):
         """
         Generate thermo for species. QM calculations are parallelized if requested.
@@ -816,9 +847,15 @@ class CoreEdgeReactionModel:
         if quantum_mechanics:
             quantum_mechanics.run_jobs(self.new_species_list, procnum=procnum)
 
-        # Serial thermo calculation for other methods
+        # Batched thermo calculation for other methods
+        species_list = [spc for spc in self.new_species_list if not spc.thermo]
+        submit_list(species_list, self.solvent_name)
+        for spc in species_list:
+            if spc.thermo and spc.thermo.label != '':  # check if thermo libraries have a name for it
+                logging.info('Species {0} renamed {1} based on thermo library name'.format(spc.label, spc.thermo.label))
+                spc.label = spc.thermo.label
         for spc in self.new_species_list:
-            self.generate_thermo(spc, rename=True)
+            self.generate_thermo(spc)
 
     def generate_thermo(self, spc, rename=False):
         """
@@ -833,6 +870,7 @@ class CoreEdgeReactionModel:
 
         spc.generate_energy_transfer_model()
 
+    @timed('kinetics estimation')
     def apply_kinetics_to_reaction(self, reaction):
         """
         retrieve the best kinetics for the reaction and apply it towards the forward 
@@ -1704,6 +1742,7 @@ class CoreEdgeReactionModel:
         # Add the path reaction to that network
         network.add_path_reaction(newReaction)
 
+    @timed('pressure dependence')
     def update_unimolecular_reaction_networks(self):
         """
         Iterate through all of the currently-existing unimolecular reaction
@@ -30,6 +30,7 @@
 
 import itertools
 import os
+import pickle
 import unittest
 
 import numpy as np
@@ -279,6 +280,42 @@ class TestCoreEdgeReactionModel(unittest.TestCase):
 
         self.assertEquals(counter, 3)
 
+    def test_checkpoint_state(self):
+        """
+        Test that the state of a CoreEdgeReactionModel can be pickled and restored into a new model.
+        """
+        spcA = Species().from_smiles('[OH]')
+        spcs = [Species().from_smiles('CC'), Species().from_smiles('[CH3]')]
+        spc_tuples = [((spcA, spc), ['H_Abstraction']) for spc in spcs]
+        rxns = list(itertools.chain.from_iterable(react(spc_tuples, 1)))
+
+        cerm = CoreEdgeReactionModel()
+        cerm.iteration_num = 3
+        for spc in [spcA] + spcs:
+            spc, is_new = cerm.make_new_species(spc, generate_thermo=False)
+            cerm.add_species_to_core(spc)
+        for rxn in rxns:
+            rxn, is_new = cerm.make_new_reaction(rxn, generate_thermo=False)
+            if is_new:
+                cerm.add_reaction_to_edge(rxn)
+
+        state = pickle.loads(pickle.dumps(cerm.get_checkpoint_state(), pickle.HIGHEST_PROTOCOL))
+        new_cerm = CoreEdgeReactionModel()
+        new_cerm.set_checkpoint_state(state)
+
+        self.assertEqual(new_cerm.iteration_num, 3)
+        self.assertEqual(new_cerm.species_counter, cerm.species_counter)
+        self.assertEqual(new_cerm.reaction_counter, cerm.reaction_counter)
+        self.assertEqual([spc.label for spc in new_cerm.core.species], [spc.label for spc in cerm.core.species])
+        self.assertEqual([spc.creation_iteration for spc in new_cerm.core.species], [3, 3, 3])
+        self.assertEqual(len(new_cerm.edge.reactions), len(cerm.edge.reactions))
+        # The reactions must refer to the same species objects as the restored model
+        new_species = set(itertools.chain.from_iterable(new_cerm.species_dict.values()))
+        for rxn in new_cerm.edge.reactions:
+            for spc in rxn.reactants + rxn.products:
+                self.assertIn(spc, new_species)
+        self.assertIs(new_cerm.check_for_existing_species(spcs[0].molecule[0]), new_cerm.core.species[1])
+
     def test_thermo_filter_species(self):
         """
         test that thermo_filter_species leaves species alone if if toleranceThermoKeepInEdge
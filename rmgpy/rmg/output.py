@@ -40,19 +40,22 @@ import textwrap
 
 from rmgpy.chemkin import get_species_identifier
 from rmgpy.exceptions import OutputError
+from rmgpy.molecule.translator import to_identifiers
 from rmgpy.util import make_output_subdirectory
 
 
 ################################################################################
 
-def save_output_html(path, reaction_model, part_core_edge='core'):
+def save_output_html(path, reaction_model, part_core_edge='core', procnum=1):
     """
     Save the current set of  species and reactions of `reactionModel` to
     an HTML file `path` on disk. As part of this process, drawings of all 
     species are created in the species folder (if they don't already exist)
     using the :mod:`rmgpy.molecule.draw` module. The :mod:`jinja`
     package is used to generate the HTML; if this package is not found, no
-    HTML will be generated (but the program will carry on).
+    HTML will be generated (but the program will carry on). The SMILES of
+    the species are generated up front, in a pool of `procnum` processes if
+    more than one is requested.
     """
 
     from rmgpy.rmg.model import PDepReaction
@@ -100,6 +103,7 @@ def save_output_html(path, reaction_model, part_core_edge='core'):
                 raise
         # spec.thermo.comment=
         # Text wrap the thermo comments
+    to_identifiers([spec.molecule[0] for spec in species], 'smiles', procnum=procnum)
     # We want to keep species sorted in the original order in which they were added to the RMG core.
     # Rather than ordered by index
     #    species.sort(key=lambda x: x.index)
@@ -1322,12 +1326,16 @@ def save_output(rmg):
     """
     Save the current reaction model to a pretty HTML file.
     """
+    # Determine number of parallel processes.
+    from rmgpy.rmg.main import determine_procnum_from_ram
+    procnum = determine_procnum_from_ram()
+
     logging.info('Saving current model core to HTML file...')
-    save_output_html(os.path.join(rmg.output_directory, 'output.html'), rmg.reaction_model, 'core')
+    save_output_html(os.path.join(rmg.output_directory, 'output.html'), rmg.reaction_model, 'core', procnum)
 
     if rmg.save_edge_species:
         logging.info('Saving current model edge to HTML file...')
-        save_output_html(os.path.join(rmg.output_directory, 'output_edge.html'), rmg.reaction_model, 'edge')
+        save_output_html(os.path.join(rmg.output_directory, 'output_edge.html'), rmg.reaction_model, 'edge', procnum)
 
 
 class OutputHTMLWriter(object):
@@ -1350,11 +1358,21 @@ class OutputHTMLWriter(object):
 
     rmg.detach(listener)
 
+    If `incremental` is ``True``, updates are skipped and the HTML file is
+    only written by :meth:`finish`.
     """
 
-    def __init__(self, output_directory=''):
+    def __init__(self, output_directory='', incremental=False):
         super(OutputHTMLWriter, self).__init__()
+        self.incremental = incremental
         make_output_subdirectory(output_directory, 'species')
 
     def update(self, rmg):
+        if not self.incremental:
+            save_output(rmg)
+
+    def finish(self, rmg):
+        """
+        Write the HTML file for the current state of the model.
+        """
         save_output(rmg)
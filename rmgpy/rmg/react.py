@@ -35,11 +35,13 @@ import logging
 from multiprocessing import Pool
 
 from rmgpy.data.rmg import get_db
+from rmgpy.instrumentation import timed
 
 
 ################################################################################
 
 
+@timed('reaction generation')
 def react(spc_fam_tuples, procnum=1):
     """
     Generate reactions between the species in the list of species-family tuples
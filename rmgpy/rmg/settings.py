@@ -125,10 +125,24 @@ class ModelSettings(object):
 class SimulatorSettings(object):
     """
     class for holding the parameters affecting the behavior of the solver
+
+    The `snapshot_interval`, `snapshot_rtol` and `snapshot_points` settings
+    reduce the number of simulation snapshots that are stored. A step is
+    kept only if at least `snapshot_interval` seconds passed since the last
+    stored snapshot, if some variable changed by more than `snapshot_rtol`
+    relative to it, and if it reached the next of `snapshot_points`
+    log-spaced times up to the termination time. Each setting is disabled
+    when zero. At most `snapshot_memory` bytes of snapshots are kept per
+    reactor, beyond which every other stored snapshot is dropped.
     """
 
-    def __init__(self, atol=1e-16, rtol=1e-8, sens_atol=1e-6, sens_rtol=1e-4):
+    def __init__(self, atol=1e-16, rtol=1e-8, sens_atol=1e-6, sens_rtol=1e-4, snapshot_interval=0.0,
+                 snapshot_rtol=0.0, snapshot_points=0, snapshot_memory=1e8):
         self.atol = atol
         self.rtol = rtol
         self.sens_atol = sens_atol
         self.sens_rtol = sens_rtol
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_rtol = snapshot_rtol
+        self.snapshot_points = snapshot_points
+        self.snapshot_memory = snapshot_memory
@@ -102,7 +102,12 @@ cdef class ReactionSystem(DASx):
     cdef public np.ndarray atol_array
     cdef public np.ndarray rtol_array
     
-    cdef public list snapshots
+    cdef public object snapshots
+    cdef public object profile_writer
+
+    # numbers of evaluations of the residual and Jacobian during the current simulation
+    cdef public long num_residual_evaluations
+    cdef public long num_jacobian_evaluations
 
     cdef public list termination
     
@@ -36,6 +36,7 @@ cdef extern from "math.h":
 import csv
 import itertools
 import logging
+from time import perf_counter
 
 import cython
 import numpy as np
@@ -52,6 +53,7 @@ else:
 
 import rmgpy.constants as constants
 cimport rmgpy.constants as constants
+import rmgpy.instrumentation as instrumentation
 from rmgpy.chemkin import get_species_identifier
 from rmgpy.reaction import Reaction
 from rmgpy.quantity import Quantity
@@ -172,6 +174,13 @@ cdef class ReactionSystem(DASx):
 
         self.termination = termination or []
 
+        # An optional listener to which the snapshots are passed during the simulation instead of being kept in
+        # self.snapshots, e.g. a SimulationProfileWriter writing them to disk
+        self.profile_writer = None
+
+        self.num_residual_evaluations = 0
+        self.num_jacobian_evaluations = 0
+
         # Flag to indicate whether or not reactions with 3 reactants are present 
         self.trimolecular = False
 
@@ -665,6 +674,10 @@ cdef class ReactionSystem(DASx):
         for index, spec in enumerate(core_species):
             species_index[spec] = index
 
+        start_time = perf_counter()
+        self.num_residual_evaluations = 0
+        self.num_jacobian_evaluations = 0
+
         self.initialize_model(core_species, core_reactions,
                               edge_species, edge_reactions,
                               surface_species, surface_reactions,
@@ -707,8 +720,22 @@ cdef class ReactionSystem(DASx):
         # Copy the initial conditions to use in evaluating conversions
         y0 = self.y.copy()
 
-        # a list with the time, Volume, number of moles of core species
-        self.snapshots = []
+        # a buffer with the time, Volume, number of moles of core species
+        t_end = max([term.time.value_si for term in self.termination if isinstance(term, TerminationTime)] or [0.0])
+        self.snapshots = SnapshotBuffer(num_core_species + 2,
+                                        max_bytes=simulator_settings.snapshot_memory,
+                                        time_interval=simulator_settings.snapshot_interval,
+                                        rtol=simulator_settings.snapshot_rtol,
+                                        num_points=simulator_settings.snapshot_points,
+                                        t_end=t_end,
+                                        writer=self.profile_writer)
+        if self.profile_writer is not None:
+            self.profile_writer.start(self)
+
+        if branch_factor != 0.0:
+            # the multiplicities of the core and edge species, for the branching numbers
+            multiplicities = np.array([spc.molecule[0].multiplicity for spc in core_species] +
+                                      [spc.molecule[0].multiplicity for spc in edge_species], np.int)
 
         if sensitivity:
             time_array = []
@@ -768,6 +795,7 @@ cdef class ReactionSystem(DASx):
                             invalid_objects.append(obj)
 
                     if invalid_objects != []:
+                        self.record_instrumentation(start_time)
                         return False, True, invalid_objects, surface_species, surface_reactions, self.t, conversion
                     else:
                         logging.error('Model Resurrection has failed')
@@ -801,9 +829,7 @@ cdef class ReactionSystem(DASx):
                             norm_sens[j] = 1/volume * (mole_sens[j*num_core_species+sens_species_indices[i]]-c*dVdk[j]) / c * 4184
                     norm_sens_array[i].append(norm_sens)
 
-            snapshot = [self.t, self.V]
-            snapshot.extend(y_core_species)
-            self.snapshots.append(snapshot)
+            self.snapshots.append(self.t, self.V, y_core_species)
 
             # Get the characteristic flux
             char_rate = sqrt(np.sum(self.core_species_rates * self.core_species_rates))
@@ -858,21 +884,12 @@ cdef class ReactionSystem(DASx):
                         reactant_side = self.product_indices[index + num_core_reactions, :]
                         product_side = self.reactant_indices[index + num_core_reactions, :]
 
-                    mults = []
-                    for i in product_side:
-                        if i == -1:
-                            continue
-                        elif i < num_core_species:
-                            mults.append(core_species[i].molecule[0].multiplicity)
-                        else:
-                            mults.append(edge_species[i - num_core_species].molecule[0].multiplicity)
-
-                    if max(mults) > 2:
+                    if np.max(multiplicities[product_side[product_side != -1]]) > 2:
                         continue
 
                     for spc_index in reactant_side:
                         if spc_index != -1 and spc_index < num_core_species:
-                            if core_species[spc_index].molecule[0].multiplicity != 2:
+                            if multiplicities[spc_index] != 2:
                                 continue
                             consumption = core_species_consumption_rates[spc_index]
                             if consumption != 0:  #if consumption = 0 ignore species
@@ -1248,7 +1265,8 @@ cdef class ReactionSystem(DASx):
                                                                            surface_reactions,
                                                                            edge_species)
 
-        # notify reaction system listeners
+        # write the remaining snapshots to the profile writer, if any, then notify reaction system listeners
+        self.snapshots.flush()
         self.notify()
 
         if sensitivity:
@@ -1279,10 +1297,21 @@ cdef class ReactionSystem(DASx):
         self.bimolecular_threshold = bimolecular_threshold
         self.trimolecular_threshold = trimolecular_threshold
 
+        self.record_instrumentation(start_time)
+
         # Return the invalid object (if the simulation was invalid) or None
         # (if the simulation was valid)
         return terminated, False, invalid_objects, surface_species, surface_reactions, self.t, conversion
 
+    def record_instrumentation(self, double start_time):
+        """
+        Record the time spent in the simulation started at `start_time` and
+        its numbers of residual and Jacobian evaluations.
+        """
+        instrumentation.add_time('reactor simulation', perf_counter() - start_time)
+        instrumentation.count('solver residual evaluations', self.num_residual_evaluations)
+        instrumentation.count('solver jacobian evaluations', self.num_jacobian_evaluations)
+
     cpdef log_rates(self, double char_rate, object species, double species_rate, double max_dif_ln_accum_num, object network,
                     double network_rate):
         """
@@ -1397,6 +1426,149 @@ cdef class ReactionSystem(DASx):
         return rate_deriv
 
 
+################################################################################
+
+class SnapshotBuffer(object):
+    """
+    A buffer of the snapshots of a simulation, each a row containing the
+    time, the volume and the number of moles of each core species. The rows
+    are stored in a preallocated float64 array which grows by doubling. The
+    attributes are:
+
+    ======================= ====================================================
+    Attribute               Description
+    ======================= ====================================================
+    `data`                  The array holding the stored snapshots
+    `size`                  The number of stored snapshots held in `data`
+    `count`                 The total number of stored snapshots, including those passed to the `writer`
+    `pending`               ``True`` if the most recent snapshot was not stored, in which case it follows the stored ones
+    `max_rows`              The maximum number of snapshots held, or 0 for no limit
+    `time_interval`         The minimum time in s between stored snapshots
+    `rtol`                  The minimum relative change of some variable between stored snapshots
+    `output_times`          The log-spaced times in s at which snapshots are stored, or ``None``
+    `stride`                Only every `stride`-th snapshot passing the other criteria is stored
+    `writer`                An optional listener to which the snapshots are written in chunks instead of being held
+    ======================= ====================================================
+
+    When `max_rows` snapshots are held, every other one is dropped and the
+    stride is doubled, so the memory used stays bounded while the whole
+    simulation remains covered. The most recent snapshot is always kept, even
+    if it does not meet the criteria for being stored, so the final state of
+    the simulation is never lost. If a `writer` is given, the full chunks of
+    snapshots are passed to its ``write()`` method and then discarded.
+    """
+
+    def __init__(self, num_columns, capacity=256, max_bytes=0, time_interval=0.0, rtol=0.0, num_points=0,
+                 t_start=1e-12, t_end=0.0, writer=None):
+        self.max_rows = max(int(max_bytes // (8 * num_columns)), 2) if max_bytes > 0 else 0
+        if self.max_rows > 0:
+            capacity = min(capacity, self.max_rows)
+        self.data = np.empty((capacity, num_columns), np.float64)
+        self.size = 0
+        self.count = 0
+        self.pending = False
+        self.last = np.empty(num_columns, np.float64)
+        self.time_interval = time_interval
+        self.rtol = rtol
+        if num_points > 0 and t_end > t_start:
+            self.output_times = np.logspace(np.log10(t_start), np.log10(t_end), num_points)
+        else:
+            self.output_times = None
+        self.next_output = 0
+        self.stride = 1
+        self.skipped = 0
+        self.writer = writer
+
+    def __len__(self):
+        return self.size + self.pending
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None:
+            return self.array.astype(dtype)
+        return self.array
+
+    @property
+    def array(self):
+        """
+        A view of the snapshots in the buffer, without copying them.
+        """
+        return self.data[:self.size + self.pending]
+
+    def append(self, t, V, y):
+        """
+        Offer the snapshot at time `t` with volume `V` and moles of the core
+        species `y`. Return ``True`` if it was stored or ``False`` if it is only
+        kept until the next snapshot replaces it.
+        """
+        if self.size == self.data.shape[0]:
+            self._make_room()
+        row = self.data[self.size]
+        row[0] = t
+        row[1] = V
+        row[2:] = y
+        if self.count > 0 and not self._accept(row):
+            self.pending = True
+            return False
+        self.last[:] = row
+        self.size += 1
+        self.count += 1
+        self.pending = False
+        return True
+
+    def flush(self):
+        """
+        Write the snapshots in the buffer to the writer, if there is one.
+        """
+        if self.writer is not None and len(self) > 0:
+            self.writer.write(self.array)
+            self.size = 0
+            self.pending = False
+
+    def _accept(self, row):
+        """
+        Return ``True`` if the snapshot `row` meets the criteria for being stored.
+        """
+        if self.time_interval > 0 and row[0] - self.last[0] < self.time_interval:
+            return False
+        if self.rtol > 0 and not np.any(np.abs(row[1:] - self.last[1:]) > self.rtol * np.abs(self.last[1:])):
+            return False
+        if self.output_times is not None:
+            if self.next_output >= self.output_times.shape[0] or row[0] < self.output_times[self.next_output]:
+                return False
+        if self.stride > 1:
+            self.skipped += 1
+            if self.skipped < self.stride:
+                return False
+            self.skipped = 0
+        if self.output_times is not None:
+            self.next_output = np.searchsorted(self.output_times, row[0], side='right')
+        return True
+
+    def _make_room(self):
+        """
+        Make room for another snapshot in a full buffer, by writing the
+        snapshots to the writer, growing the array or dropping every other
+        snapshot once `max_rows` are held.
+        """
+        if self.writer is not None:
+            self.writer.write(self.data[:self.size])
+            self.size = 0
+        elif self.max_rows > 0 and self.size >= self.max_rows:
+            n = (self.size + 1) // 2
+            self.data[:n] = self.data[0:self.size:2]
+            self.size = n
+            self.stride *= 2
+            self.skipped = 0
+        else:
+            capacity = 2 * self.data.shape[0]
+            if self.max_rows > 0:
+                capacity = min(capacity, self.max_rows)
+            data = np.empty((capacity, self.data.shape[1]), np.float64)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+        self.pending = False
+
+
 ################################################################################
 
 class TerminationTime:
@@ -32,8 +32,11 @@ import os.path
 import pickle
 import unittest
 
+import numpy as np
+
 import rmgpy
 from rmgpy.rmg.settings import ModelSettings, SimulatorSettings
+from rmgpy.solver.base import SnapshotBuffer
 from rmgpy.tools.loader import load_rmg_py_job
 
 
@@ -197,5 +200,75 @@ class ReactionSystemTest(unittest.TestCase):
         self.assertEqual(rxn_sys.termination[1].time.value_si, rxn_sys1.termination[1].time.value_si)
 
 
+class SnapshotBufferTest(unittest.TestCase):
+    """
+    Contains unit tests of the SnapshotBuffer class.
+    """
+
+    def test_growth(self):
+        """
+        Test that the buffer grows to hold every snapshot when there is no limit.
+        """
+        snapshots = SnapshotBuffer(4, capacity=8)
+        for i in range(100):
+            self.assertTrue(snapshots.append(float(i), 1.0, [i, 2 * i]))
+        data = np.asarray(snapshots)
+        self.assertEqual(data.shape, (100, 4))
+        self.assertTrue(np.shares_memory(data, snapshots.data))
+        self.assertEqual(list(data[-1]), [99.0, 1.0, 99.0, 198.0])
+
+    def test_memory_limit(self):
+        """
+        Test that the buffer thins out the snapshots to stay within its memory limit.
+        """
+        snapshots = SnapshotBuffer(4, max_bytes=8 * 4 * 100)
+        for i in range(10001):
+            snapshots.append(float(i), 1.0, [i, 2 * i])
+        data = snapshots.array
+        self.assertLessEqual(snapshots.data.nbytes, 8 * 4 * 100)
+        self.assertGreater(snapshots.stride, 1)
+        self.assertEqual(data[0, 0], 0.0)
+        self.assertEqual(data[-1, 0], 10000.0)
+        self.assertTrue(np.all(np.diff(data[:, 0]) > 0))
+
+    def test_decimation(self):
+        """
+        Test that only the snapshots meeting the decimation criteria are stored, besides the latest one.
+        """
+        snapshots = SnapshotBuffer(4, rtol=0.5)
+        for i in range(1, 100):
+            snapshots.append(float(i), 1.0, [i, 1.0])
+        self.assertEqual(list(snapshots.array[:, 2]), [1, 2, 4, 7, 11, 17, 26, 40, 61, 92, 99])
+
+        snapshots = SnapshotBuffer(4, num_points=11, t_start=1e-10, t_end=1.0)
+        t = 1e-12
+        while t < 1.0:
+            snapshots.append(t, 1.0, [1.0, 1.0])
+            t *= 1.3
+        # the first snapshot, one per output time and the latest snapshot
+        self.assertEqual(len(snapshots), 12)
+
+    def test_writer(self):
+        """
+        Test that the snapshots are passed to the writer in chunks rather than held.
+        """
+        class Writer(object):
+            def __init__(self):
+                self.rows = []
+
+            def write(self, rows):
+                self.rows.append(rows.copy())
+
+        writer = Writer()
+        snapshots = SnapshotBuffer(4, capacity=16, time_interval=2.0, writer=writer)
+        for i in range(101):
+            snapshots.append(float(i), 1.0, [i, 1.0])
+        self.assertEqual(snapshots.data.shape[0], 16)
+        snapshots.flush()
+        self.assertEqual(len(snapshots), 0)
+        data = np.vstack(writer.rows)
+        self.assertEqual(list(data[:, 0]), list(range(0, 101, 2)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -41,6 +41,7 @@ cimport rmgpy.constants as constants
 from rmgpy.quantity import Quantity
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
 from rmgpy.solver.base cimport ReactionSystem
+from rmgpy.thermo.table import get_equilibrium_constants
 
 
 cdef class LiquidReactor(ReactionSystem):
@@ -163,9 +164,14 @@ cdef class LiquidReactor(ReactionSystem):
         for rxn in itertools.chain(core_reactions, edge_reactions):
             j = self.reaction_index[rxn]
             self.kf[j] = rxn.get_rate_coefficient(self.T.value_si, self.P.value_si)
-            if rxn.reversible:
-                self.Keq[j] = rxn.get_equilibrium_constant(self.T.value_si)
-                self.kb[j] = self.kf[j] / self.Keq[j]
+
+        # Evaluate all equilibrium constants at once from the packed thermo
+        reversible = [rxn for rxn in itertools.chain(core_reactions, edge_reactions) if rxn.reversible]
+        Keq = get_equilibrium_constants(reversible, np.array([self.T.value_si]))[:, 0]
+        for rxn, K in zip(reversible, Keq):
+            j = self.reaction_index[rxn]
+            self.Keq[j] = K
+            self.kb[j] = self.kf[j] / self.Keq[j]
 
     def get_threshold_rate_constants(self, model_settings):
         """
@@ -229,6 +235,8 @@ cdef class LiquidReactor(ReactionSystem):
         cdef np.ndarray[np.float64_t, ndim=1] C
         cdef np.ndarray[np.float64_t, ndim=2] jacobian, dgdk
 
+        self.num_residual_evaluations += 1
+
         ir = self.reactant_indices
         ip = self.product_indices
         equilibrium_constants = self.Keq
@@ -406,6 +414,8 @@ cdef class LiquidReactor(ReactionSystem):
         cdef int num_core_reactions, num_core_species, i, j
         cdef double k, V, Ctot, deriv, corr
 
+        self.num_jacobian_evaluations += 1
+
         ir = self.reactant_indices
         ip = self.product_indices
 
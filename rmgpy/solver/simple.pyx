@@ -42,6 +42,7 @@ cimport rmgpy.constants as constants
 from rmgpy.quantity import Quantity
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
 from rmgpy.solver.base cimport ReactionSystem
+from rmgpy.thermo.table import get_equilibrium_constants
 
 
 cdef class SimpleReactor(ReactionSystem):
@@ -248,9 +249,13 @@ cdef class SimpleReactor(ReactionSystem):
             Peff = self.calculate_effective_pressure(rxn)
             self.kf[j] = rxn.get_rate_coefficient(self.T.value_si, Peff)
 
-            if rxn.reversible:
-                self.Keq[j] = rxn.get_equilibrium_constant(self.T.value_si)
-                self.kb[j] = self.kf[j] / self.Keq[j]
+        # Evaluate all equilibrium constants at once from the packed thermo
+        reversible = [rxn for rxn in itertools.chain(core_reactions, edge_reactions) if rxn.reversible]
+        Keq = get_equilibrium_constants(reversible, np.array([self.T.value_si]))[:, 0]
+        for rxn, K in zip(reversible, Keq):
+            j = self.reaction_index[rxn]
+            self.Keq[j] = K
+            self.kb[j] = self.kf[j] / self.Keq[j]
 
     def get_threshold_rate_constants(self, model_settings):
         """
@@ -345,6 +350,8 @@ cdef class SimpleReactor(ReactionSystem):
         cdef np.ndarray[np.int_t, ndim=1] pdep_collider_reaction_indices, pdep_specific_collider_reaction_indices
         cdef list pdep_collider_kinetics, pdep_specific_collider_kinetics
 
+        self.num_residual_evaluations += 1
+
         ir = self.reactant_indices
         ip = self.product_indices
 
@@ -548,6 +555,8 @@ cdef class SimpleReactor(ReactionSystem):
         cdef int num_core_reactions, num_core_species, i, j
         cdef double k, V, Ctot, deriv, corr
 
+        self.num_jacobian_evaluations += 1
+
         ir = self.reactant_indices
         ip = self.product_indices
 
@@ -353,6 +353,8 @@ cdef class SurfaceReactor(ReactionSystem):
         cdef np.ndarray[np.float64_t, ndim=1] C
         cdef np.ndarray[np.float64_t, ndim=2] jacobian, dgdk
 
+        self.num_residual_evaluations += 1
+
         ir = self.reactant_indices
         ip = self.product_indices
         equilibrium_constants = self.Keq
@@ -180,7 +180,8 @@ class Species(object):
         A helper function used when pickling an object.
         """
         return (Species, (self.index, self.label, self.thermo, self.conformer, self.molecule, self.transport_data,
-                          self.molecular_weight, self.energy_transfer_model, self.reactive, self.props))
+                          self.molecular_weight, self.energy_transfer_model, self.reactive, self.props, '', '',
+                          self.aug_inchi, self.symmetry_number, self.creation_iteration, self.explicitly_allowed))
 
     def __hash__(self):
         """
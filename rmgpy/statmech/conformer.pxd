@@ -52,6 +52,16 @@ cdef class Conformer(RMGObject):
 
     cpdef double get_free_energy(self, double T) except 100000000
 
+    cpdef np.ndarray get_partition_functions(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist)
+
     cpdef np.ndarray get_sum_of_states(self, np.ndarray e_list)
 
     cpdef np.ndarray get_density_of_states(self, np.ndarray e_list)
@@ -181,6 +181,58 @@ cdef class Conformer(RMGObject):
         """
         return self.get_enthalpy(T) - T * self.get_entropy(T)
 
+    cpdef np.ndarray get_partition_functions(self, np.ndarray Tlist):
+        """
+        Return the partition functions :math:`Q(T)` for the system at each of
+        the specified temperatures `Tlist` in K. Each mode is evaluated over
+        all of the temperatures in a single call.
+        """
+        cdef np.ndarray Q = np.ones(len(Tlist), np.float64)
+        cdef Mode mode
+        for mode in self.modes:
+            Q *= mode.get_partition_functions(Tlist)
+        return Q * self.spin_multiplicity * self.optical_isomers
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return the heat capacities in J/mol*K for the system at each of the
+        specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray Cp = np.zeros(len(Tlist), np.float64)
+        cdef Mode mode
+        for mode in self.modes:
+            Cp += mode.get_heat_capacities(Tlist)
+        return Cp
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol for the system at each of the specified
+        temperatures `Tlist` in K.
+        """
+        cdef np.ndarray H = np.zeros(len(Tlist), np.float64)
+        cdef Mode mode
+        for mode in self.modes:
+            H += mode.get_enthalpies(Tlist)
+        return H
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K for the system at each of the specified
+        temperatures `Tlist` in K.
+        """
+        cdef np.ndarray S = np.full(len(Tlist), log(self.spin_multiplicity * self.optical_isomers) * constants.R)
+        cdef Mode mode
+        for mode in self.modes:
+            S += mode.get_entropies(Tlist)
+        return S
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist):
+        """
+        Return the Gibbs free energies in J/mol for the system at each of the
+        specified temperatures `Tlist` in K.
+        """
+        return self.get_enthalpies(Tlist) - Tlist * self.get_entropies(Tlist)
+
     cpdef np.ndarray get_sum_of_states(self, np.ndarray e_list):
         """
         Return the sum of states :math:`N(E)` at the specified energies `e_list`
@@ -146,6 +146,24 @@ class TestConformer(unittest.TestCase):
             s_act = self.ethylene.get_entropy(temperature)
             self.assertAlmostEqual(s_exp, s_act, 3)
 
+    def test_get_thermo_arrays_ethylene(self):
+        """
+        Test that the StatMech array methods match the scalar methods for
+        ethylene.
+        """
+        t_list = np.array([300., 500., 1000., 1500., 2000.])
+        q_list = self.ethylene.get_partition_functions(t_list)
+        cv_list = self.ethylene.get_heat_capacities(t_list)
+        h_list = self.ethylene.get_enthalpies(t_list)
+        s_list = self.ethylene.get_entropies(t_list)
+        g_list = self.ethylene.get_free_energies(t_list)
+        for i, temperature in enumerate(t_list):
+            self.assertAlmostEqual(q_list[i] / self.ethylene.get_partition_function(temperature), 1.0, 8)
+            self.assertAlmostEqual(cv_list[i], self.ethylene.get_heat_capacity(temperature), 6)
+            self.assertAlmostEqual(h_list[i], self.ethylene.get_enthalpy(temperature), 6)
+            self.assertAlmostEqual(s_list[i], self.ethylene.get_entropy(temperature), 6)
+            self.assertAlmostEqual(g_list[i], self.ethylene.get_free_energy(temperature), 6)
+
     def test_get_sum_of_states_ethylene(self):
         """
         Test the StatMech.get_sum_of_states() method for ethylene.
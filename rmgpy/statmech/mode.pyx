@@ -105,6 +105,35 @@ cdef class Mode(RMGObject):
         raise NotImplementedError('Unexpected call to Mode.get_entropy(); '
                                   'you should be using a class derived from Mode.')
 
+    cpdef np.ndarray get_partition_functions(self, np.ndarray Tlist):
+        """
+        Return the values of the partition function at each of the specified
+        temperatures `Tlist` in K. Derived classes may override this to
+        evaluate all temperatures at once.
+        """
+        return np.array([self.get_partition_function(T) for T in Tlist], np.float64)
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return the heat capacities in J/mol*K for the degree of freedom at each
+        of the specified temperatures `Tlist` in K.
+        """
+        return np.array([self.get_heat_capacity(T) for T in Tlist], np.float64)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol for the degree of freedom at each of the
+        specified temperatures `Tlist` in K.
+        """
+        return np.array([self.get_enthalpy(T) for T in Tlist], np.float64)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K for the degree of freedom at each of the
+        specified temperatures `Tlist` in K.
+        """
+        return np.array([self.get_entropy(T) for T in Tlist], np.float64)
+
     cpdef np.ndarray get_sum_of_states(self, np.ndarray e_list, np.ndarray sum_states_0=None):
         """
         Return the sum of states :math:`N(E)` at the specified energies `e_list`
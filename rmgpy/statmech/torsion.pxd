@@ -69,6 +69,14 @@ cdef class HinderedRotor(Torsion):
 
     cpdef double get_entropy(self, double T) except -100000000
 
+    cpdef np.ndarray get_partition_functions(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist)
+
     cpdef np.ndarray get_sum_of_states(self, np.ndarray e_list, np.ndarray sum_states_0=?)
     
     cpdef np.ndarray get_density_of_states(self, np.ndarray e_list, np.ndarray dens_states_0=?)
@@ -166,6 +166,7 @@ cdef class HinderedRotor(Torsion):
             return self._inertia
         def __set__(self, value):
             self._inertia = quantity.Inertia(value)
+            self.energies = None
 
     property rotationalConstant:
         """The rotational constant of the rotor."""
@@ -178,6 +179,7 @@ cdef class HinderedRotor(Torsion):
             B = quantity.Frequency(B)
             I = constants.h / (8 * constants.pi * constants.pi * (B.value_si * constants.c * 100.))
             self._inertia = quantity.ScalarQuantity(I / (constants.amu * 1e-20), "amu*angstrom^2")
+            self.energies = None
 
     property fourier:
         """The :math:`2 x N` array of Fourier series coefficients."""
@@ -185,6 +187,7 @@ cdef class HinderedRotor(Torsion):
             return self._fourier
         def __set__(self, value):
             self._fourier = quantity.Energy(value)
+            self.energies = None
 
     property barrier:
         """The barrier height of the cosine potential."""
@@ -192,6 +195,7 @@ cdef class HinderedRotor(Torsion):
             return self._barrier
         def __set__(self, value):
             self._barrier = quantity.Energy(value)
+            self.energies = None
 
     cdef double get_rotational_constant_energy(self):
         """
@@ -431,6 +435,63 @@ cdef class HinderedRotor(Torsion):
                          log(self.get_partition_function(Tlow))) /
                     (Thigh - Tlow)) * constants.R
 
+    cpdef np.ndarray get_partition_functions(self, np.ndarray Tlist):
+        """
+        Return the values of the partition function :math:`Q(T)` at each of
+        the specified temperatures `Tlist` in K. For the quantum model the
+        cached energy levels are summed over all temperatures at once.
+        """
+        cdef np.ndarray T, e_kT
+        if not self.quantum:
+            return Mode.get_partition_functions(self, Tlist)
+        if self.energies is None: self.solve_schrodinger_equation()
+        T = np.asarray(Tlist, np.float64)
+        e_kT = np.exp(-self.energies[np.newaxis, :] / constants.R / T[:, np.newaxis])
+        return np.sum(e_kT, axis=1) / self.symmetry
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return the heat capacities in J/mol*K for the degree of freedom at each
+        of the specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray T, E, e_kT, Q, sumE
+        if not self.quantum:
+            return Mode.get_heat_capacities(self, Tlist)
+        if self.energies is None: self.solve_schrodinger_equation()
+        T = np.asarray(Tlist, np.float64)
+        E = self.energies
+        e_kT = np.exp(-E[np.newaxis, :] / constants.R / T[:, np.newaxis])
+        Q = np.sum(e_kT, axis=1)
+        sumE = np.dot(e_kT, E)
+        return (np.dot(e_kT, E * E) * Q - sumE * sumE) / (constants.R * T * T * Q * Q)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol for the degree of freedom at each of the
+        specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray T, e_kT
+        if not self.quantum:
+            return Mode.get_enthalpies(self, Tlist)
+        if self.energies is None: self.solve_schrodinger_equation()
+        T = np.asarray(Tlist, np.float64)
+        e_kT = np.exp(-self.energies[np.newaxis, :] / constants.R / T[:, np.newaxis])
+        return np.dot(e_kT, self.energies) / np.sum(e_kT, axis=1)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K for the degree of freedom at each of the
+        specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray T, e_kT, Q
+        if not self.quantum:
+            return Mode.get_entropies(self, Tlist)
+        if self.energies is None: self.solve_schrodinger_equation()
+        T = np.asarray(Tlist, np.float64)
+        e_kT = np.exp(-self.energies[np.newaxis, :] / constants.R / T[:, np.newaxis])
+        Q = np.sum(e_kT, axis=1)
+        return np.log(Q / self.symmetry) * constants.R + np.dot(e_kT, self.energies) / (T * Q)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cpdef np.ndarray get_sum_of_states(self, np.ndarray e_list, np.ndarray sum_states_0=None):
@@ -458,6 +458,52 @@ class TestHinderedRotor(unittest.TestCase):
         q_exp = self.mode.get_partition_function(temperature)
         self.assertAlmostEqual(q_exp, q_act, delta=1e-2 * q_exp)
 
+    def test_get_thermo_arrays_quantum(self):
+        """
+        Test that the HinderedRotor array methods match the scalar methods for
+        the quantum model.
+        """
+        t_list = np.array([300., 500., 1000., 1500., 2000.])
+        for fourier in (self.mode.fourier, None):
+            self.mode.fourier = fourier
+            q_list = self.mode.get_partition_functions(t_list)
+            cv_list = self.mode.get_heat_capacities(t_list)
+            h_list = self.mode.get_enthalpies(t_list)
+            s_list = self.mode.get_entropies(t_list)
+            # The energy levels are single precision, so only compare to ~1e-6
+            for i, temperature in enumerate(t_list):
+                self.assertAlmostEqual(q_list[i] / self.mode.get_partition_function(temperature), 1.0, 6)
+                self.assertAlmostEqual(cv_list[i] / self.mode.get_heat_capacity(temperature), 1.0, 6)
+                self.assertAlmostEqual(h_list[i] / self.mode.get_enthalpy(temperature), 1.0, 6)
+                self.assertAlmostEqual(s_list[i] / self.mode.get_entropy(temperature), 1.0, 6)
+
+    def test_get_thermo_arrays_classical(self):
+        """
+        Test that the HinderedRotor array methods match the scalar methods for
+        the classical model.
+        """
+        self.mode.quantum = False
+        t_list = np.array([300., 500., 1000.])
+        q_list = self.mode.get_partition_functions(t_list)
+        s_list = self.mode.get_entropies(t_list)
+        for i, temperature in enumerate(t_list):
+            self.assertAlmostEqual(q_list[i], self.mode.get_partition_function(temperature), 10)
+            self.assertAlmostEqual(s_list[i], self.mode.get_entropy(temperature), 10)
+
+    def test_energy_levels_reset(self):
+        """
+        Test that the cached energy levels are discarded when the potential
+        or moment of inertia changes.
+        """
+        self.mode.solve_schrodinger_equation()
+        self.assertIsNotNone(self.mode.energies)
+        self.mode.fourier = None
+        self.assertIsNone(self.mode.energies)
+        self.mode.get_partition_function(300.)
+        self.assertIsNotNone(self.mode.energies)
+        self.mode.inertia = (2 * self.inertia, "amu*angstrom^2")
+        self.assertIsNone(self.mode.energies)
+
     def test_repr(self):
         """
         Test that a HinderedRotor object can be reconstructed from its repr()
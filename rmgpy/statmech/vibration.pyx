@@ -192,6 +192,71 @@ cdef class HarmonicOscillator(Vibration):
             S += frequencies.shape[0]
         return S * constants.R
 
+    def _get_reduced_frequencies(self, np.ndarray Tlist):
+        """
+        Return the matrix of :math:`h \\nu / k_\\mathrm{B} T` with one row per
+        temperature in `Tlist` and one column per frequency.
+        """
+        cdef np.ndarray T = np.asarray(Tlist, np.float64)
+        cdef np.ndarray freq = self._frequencies.value_si * constants.c * 100.
+        return constants.h * freq[np.newaxis, :] / (constants.kB * T[:, np.newaxis])
+
+    cpdef np.ndarray get_partition_functions(self, np.ndarray Tlist):
+        """
+        Return the values of the partition function :math:`Q(T)` at each of
+        the specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray x = self._get_reduced_frequencies(Tlist)
+        if self.quantum:
+            return np.prod(1.0 / (1 - np.exp(-x)), axis=1)
+        else:
+            return np.prod(1.0 / x, axis=1)
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return the heat capacities in J/mol*K for the degree of freedom at each
+        of the specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray x, exp_x, Cv
+        if self.quantum:
+            x = self._get_reduced_frequencies(Tlist)
+            # exp(x) approaches infinity for x > 500, where x^2 exp(x)/(1-exp(x))^2 tends to zero
+            exp_x = np.exp(np.minimum(x, 500.0))
+            Cv = np.where(x > 500.0, 0.0, x * x * exp_x / (1 - exp_x) / (1 - exp_x))
+            return np.sum(Cv, axis=1) * constants.R
+        else:
+            return np.full(len(Tlist), self._frequencies.value_si.shape[0] * constants.R, np.float64)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol for the degree of freedom at each of the
+        specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray x, H
+        cdef np.ndarray T = np.asarray(Tlist, np.float64)
+        if self.quantum:
+            x = self._get_reduced_frequencies(T)
+            with np.errstate(over='ignore'):
+                H = np.sum(x / (np.exp(x) - 1), axis=1)
+        else:
+            H = np.full(T.shape[0], self._frequencies.value_si.shape[0], np.float64)
+        return H * constants.R * T
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K for the degree of freedom at each of the
+        specified temperatures `Tlist` in K.
+        """
+        cdef np.ndarray x, S
+        S = np.log(self.get_partition_functions(Tlist))
+        if self.quantum:
+            x = self._get_reduced_frequencies(Tlist)
+            with np.errstate(over='ignore'):
+                S += np.sum(x / (np.exp(x) - 1), axis=1)
+        else:
+            S += self._frequencies.value_si.shape[0]
+        return S * constants.R
+
     cpdef np.ndarray get_sum_of_states(self, np.ndarray e_list, np.ndarray sum_states_0=None):
         """
         Return the sum of states :math:`N(E)` at the specified energies `e_list`
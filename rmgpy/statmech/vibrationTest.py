@@ -154,6 +154,24 @@ class TestHarmonicOscillator(unittest.TestCase):
             s_act = self.mode.get_entropy(temperature)
             self.assertAlmostEqual(s_exp, s_act, delta=1e-4 * s_exp)
 
+    def test_get_thermo_arrays(self):
+        """
+        Test that the HarmonicOscillator array methods match the scalar
+        methods for both classical and quantum oscillators.
+        """
+        t_list = np.array([10., 300., 500., 1000., 2000.])
+        for quantum in (True, False):
+            self.mode.quantum = quantum
+            q_list = self.mode.get_partition_functions(t_list)
+            cv_list = self.mode.get_heat_capacities(t_list)
+            h_list = self.mode.get_enthalpies(t_list)
+            s_list = self.mode.get_entropies(t_list)
+            for i, temperature in enumerate(t_list):
+                self.assertAlmostEqual(q_list[i], self.mode.get_partition_function(temperature), 10)
+                self.assertAlmostEqual(cv_list[i], self.mode.get_heat_capacity(temperature), 10)
+                self.assertAlmostEqual(h_list[i], self.mode.get_enthalpy(temperature), 8)
+                self.assertAlmostEqual(s_list[i], self.mode.get_entropy(temperature), 10)
+
     def test_get_sum_of_states_classical(self):
         """
         Test the HarmonicOscillator.get_sum_of_states() method using a set of
@@ -28,6 +28,8 @@
 #                                                                             #
 ###############################################################################
 
+import csv
+import json
 import logging
 import os.path
 
@@ -38,6 +40,7 @@ except ImportError:
     logging.warning('Optional package dependency "xlwt" not loaded. Some output features will not work.')
     xlwt = None
 
+import rmgpy.instrumentation as instrumentation
 from rmgpy.util import make_output_subdirectory
 
 
@@ -213,3 +216,64 @@ class ExecutionStatsWriter(object):
         ax1.legend(['RAM'], loc=2)
         plt.savefig(os.path.join(rmg.output_directory, 'plot/memoryUse.svg'))
         plt.close()
+
+
+class InstrumentationWriter(object):
+    """
+    This class records the timers and counters of the
+    :mod:`rmgpy.instrumentation` module after each iteration of an RMG job,
+    and writes the time and calls of each timer and the events of each
+    counter during each iteration as a timeline to the files
+    `instrumentation.json` and `instrumentation.csv` in the output directory.
+
+    The JSON file holds a list with one dictionary per iteration, and the CSV
+    file one row per timer or counter and iteration.
+
+    rmg = ...
+    writer = InstrumentationWriter(rmg.output_directory)
+    writer.update(rmg)
+    """
+
+    def __init__(self, output_directory):
+        super(InstrumentationWriter, self).__init__()
+        self.output_directory = output_directory
+        self.timeline = []
+        self.previous = {'timers': {}, 'counters': {}}
+
+    def update(self, rmg):
+        statistics = instrumentation.get_statistics()
+
+        timers = {}
+        for name, timer in statistics['timers'].items():
+            previous = self.previous['timers'].get(name, {'calls': 0, 'time': 0.0})
+            timers[name] = {'calls': timer['calls'] - previous['calls'], 'time': timer['time'] - previous['time']}
+        counters = {}
+        for name, number in statistics['counters'].items():
+            counters[name] = number - self.previous['counters'].get(name, 0)
+        self.previous = statistics
+
+        self.timeline.append({
+            'iteration': len(self.timeline),
+            'execution time': rmg.exec_time[-1] if rmg.exec_time else 0.0,
+            'timers': timers,
+            'counters': counters,
+        })
+        self.save()
+
+    def save(self):
+        """
+        Write the timeline to `instrumentation.json` and the last iteration of
+        it to `instrumentation.csv`.
+        """
+        with open(os.path.join(self.output_directory, 'instrumentation.json'), 'w') as f:
+            json.dump(self.timeline, f, indent=1)
+
+        entry = self.timeline[-1]
+        with open(os.path.join(self.output_directory, 'instrumentation.csv'), 'w' if len(self.timeline) == 1 else 'a') as f:
+            writer = csv.writer(f)
+            if len(self.timeline) == 1:
+                writer.writerow(['Iteration', 'Execution time (s)', 'Name', 'Calls', 'Time (s)'])
+            for name, timer in sorted(entry['timers'].items()):
+                writer.writerow([entry['iteration'], entry['execution time'], name, timer['calls'], timer['time']])
+            for name, number in sorted(entry['counters'].items()):
+                writer.writerow([entry['iteration'], entry['execution time'], name, number, ''])
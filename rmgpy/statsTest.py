@@ -32,13 +32,16 @@
 This script contains unit tests of the :mod:`rmgpy.stats` module.
 """
 
+import csv
+import json
 import os
 import os.path
 import shutil
 import unittest
 
+import rmgpy.instrumentation as instrumentation
 from rmgpy.rmg.main import RMG, CoreEdgeReactionModel
-from rmgpy.stats import ExecutionStatsWriter
+from rmgpy.stats import ExecutionStatsWriter, InstrumentationWriter
 
 
 ################################################################################
@@ -76,5 +79,30 @@ class TestExecutionStatsWriter(unittest.TestCase):
 
         self.assertTrue(os.path.isfile(statsfile))
 
+    def test_save_instrumentation(self):
+        """
+        Tests that the timers and counters of each iteration are written to the instrumentation files.
+        """
+        folder = self.rmg.output_directory
+
+        writer = InstrumentationWriter(folder)
+        instrumentation.add_time('test timer', 1.0)
+        instrumentation.count('test counter', 2)
+        writer.update(self.rmg)
+        instrumentation.add_time('test timer', 0.5)
+        writer.update(self.rmg)
+
+        with open(os.path.join(folder, 'instrumentation.json')) as f:
+            timeline = json.load(f)
+        self.assertEqual(len(timeline), 2)
+        self.assertEqual(timeline[0]['counters']['test counter'], 2)
+        self.assertEqual(timeline[1]['counters']['test counter'], 0)
+        self.assertEqual(timeline[1]['timers']['test timer'], {'calls': 1, 'time': 0.5})
+
+        with open(os.path.join(folder, 'instrumentation.csv')) as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['Iteration', 'Execution time (s)', 'Name', 'Calls', 'Time (s)'])
+        self.assertIn(['1', str(timeline[1]['execution time']), 'test timer', '1', '0.5'], rows)
+
     def tearDown(self):
         shutil.rmtree(self.rmg.output_directory)
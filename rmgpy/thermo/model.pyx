@@ -27,6 +27,9 @@
 #                                                                             #
 ###############################################################################
 
+import numpy as np
+cimport numpy as np
+
 import rmgpy.quantity as quantity
 from rmgpy.rmgobject cimport RMGObject
 
@@ -152,6 +155,35 @@ cdef class HeatCapacityModel(RMGObject):
         """
         raise NotImplementedError('Unexpected call to HeatCapacityModel.get_free_energy(); you should be using a class derived from HeatCapacityModel.')
 
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K. Derived classes may override
+        this with a vectorized implementation.
+        """
+        return np.array([self.get_heat_capacity(T) for T in Tlist], np.float64)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        return np.array([self.get_enthalpy(T) for T in Tlist], np.float64)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        return np.array([self.get_entropy(T) for T in Tlist], np.float64)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        return self.get_enthalpies(Tlist) - Tlist * self.get_entropies(Tlist)
+
     cpdef bint is_similar_to(self, HeatCapacityModel other) except -2:
         """
         Returns ``True`` if `self` and `other` report similar thermo values
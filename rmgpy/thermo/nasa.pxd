@@ -69,6 +69,14 @@ cdef class NASA(HeatCapacityModel):
 
     cpdef double get_free_energy(self, double T) except 1000000000
 
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist)
+
     cpdef ThermoData to_thermo_data(self)
 
     cpdef Wilhoit to_wilhoit(self)
@@ -328,6 +328,38 @@ cdef class NASA(HeatCapacityModel):
         """
         return self.select_polynomial(T).get_free_energy(T)
 
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        from rmgpy.thermo.table import NASATable
+        return NASATable([self]).get_heat_capacities(Tlist)[0]
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        from rmgpy.thermo.table import NASATable
+        return NASATable([self]).get_enthalpies(Tlist)[0]
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        from rmgpy.thermo.table import NASATable
+        return NASATable([self]).get_entropies(Tlist)[0]
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the specified temperatures
+        `Tlist` in K.
+        """
+        from rmgpy.thermo.table import NASATable
+        return NASATable([self]).get_free_energies(Tlist)[0]
+
     cpdef ThermoData to_thermo_data(self):
         """
         Convert the NASAPolynomial model to a :class:`ThermoData` object.
@@ -179,6 +179,21 @@ class TestNASA(unittest.TestCase):
             g_act = self.nasa.get_free_energy(T)
             self.assertAlmostEqual(g_exp / g_act, 1.0, 4, '{0} != {1}'.format(g_exp, g_act))
 
+    def test_get_thermo_arrays(self):
+        """
+        Test that the NASA array methods match the scalar methods.
+        """
+        Tlist = np.array([400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000], np.float64)
+        cp_list = self.nasa.get_heat_capacities(Tlist)
+        h_list = self.nasa.get_enthalpies(Tlist)
+        s_list = self.nasa.get_entropies(Tlist)
+        g_list = self.nasa.get_free_energies(Tlist)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(cp_list[i] / self.nasa.get_heat_capacity(T), 1.0, 10)
+            self.assertAlmostEqual(h_list[i] / self.nasa.get_enthalpy(T), 1.0, 10)
+            self.assertAlmostEqual(s_list[i] / self.nasa.get_entropy(T), 1.0, 10)
+            self.assertAlmostEqual(g_list[i] / self.nasa.get_free_energy(T), 1.0, 10)
+
     def test_pickle(self):
         """
         Test that a NASA object can be pickled and unpickled with no loss of
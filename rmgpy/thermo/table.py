@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains a packed table of NASA polynomials, which evaluates the
+thermodynamic properties of many species at many temperatures at once, and
+helpers for computing equilibrium constants of many reactions from it.
+"""
+
+import itertools
+
+import numpy as np
+import scipy.sparse
+
+import rmgpy.constants as constants
+from rmgpy.exceptions import ReactionError
+from rmgpy.thermo.nasa import NASA
+
+################################################################################
+
+
+class NASATable(object):
+    """
+    A packed table of the NASA polynomials of a list of species. The
+    attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `coeffs`        An array of shape (n_species, n_polynomials, 9) containing the coefficients of each polynomial
+    `Tmin`          An array of shape (n_species, n_polynomials) of the minimum valid temperature of each polynomial in K
+    `Tmax`          An array of shape (n_species, n_polynomials) of the maximum valid temperature of each polynomial in K
+    =============== ============================================================
+
+    Seven-coefficient polynomials are stored with zero :math:`T^{-2}` and
+    :math:`T^{-1}` terms, so the coefficient order is that of the nine-
+    coefficient form. Species with fewer polynomials than the widest entry
+    are padded with polynomials that are never valid.
+    """
+
+    def __init__(self, thermo_list):
+        for nasa in thermo_list:
+            if not isinstance(nasa, NASA):
+                raise TypeError('NASATable requires NASA thermo models, not {0}.'.format(nasa.__class__.__name__))
+        polynomials = [nasa.polynomials for nasa in thermo_list]
+        n_species = len(thermo_list)
+        n_poly = max([len(polys) for polys in polynomials] or [1])
+        self.coeffs = np.zeros((n_species, n_poly, 9), np.float64)
+        self.Tmin = np.full((n_species, n_poly), np.inf)
+        self.Tmax = np.full((n_species, n_poly), -np.inf)
+        for i, polys in enumerate(polynomials):
+            for j, poly in enumerate(polys):
+                self.coeffs[i, j, :] = [poly.cm2, poly.cm1, poly.c0, poly.c1, poly.c2,
+                                        poly.c3, poly.c4, poly.c5, poly.c6]
+                self.Tmin[i, j] = poly.Tmin.value_si if poly.Tmin is not None else -np.inf
+                self.Tmax[i, j] = poly.Tmax.value_si if poly.Tmax is not None else np.inf
+
+    def __len__(self):
+        return self.coeffs.shape[0]
+
+    def select_coefficients(self, Tlist):
+        """
+        Return an array of shape (n_species, n_temperatures, 9) containing
+        the coefficients of the first polynomial of each species that is
+        valid at each temperature in `Tlist` in K. A :class:`ValueError` is
+        raised if any species has no valid polynomial at some temperature.
+        """
+        Tlist = np.asarray(Tlist, np.float64)
+        valid = (self.Tmin[:, :, np.newaxis] <= Tlist) & (Tlist <= self.Tmax[:, :, np.newaxis])
+        if not np.all(np.any(valid, axis=1)):
+            i, t = np.argwhere(~np.any(valid, axis=1))[0]
+            raise ValueError('No valid NASA polynomial for species {0:d} at temperature {1:g} K.'.format(i, Tlist[t]))
+        index = np.argmax(valid, axis=1)
+        return self.coeffs[np.arange(self.coeffs.shape[0])[:, np.newaxis], index]
+
+    def get_heat_capacities(self, Tlist):
+        """
+        Return an array of shape (n_species, n_temperatures) of the
+        constant-pressure heat capacities in J/mol*K at the specified
+        temperatures `Tlist` in K.
+        """
+        T = np.asarray(Tlist, np.float64)
+        c = self.select_coefficients(T)
+        return ((c[..., 0] / T + c[..., 1]) / T + c[..., 2]
+                + T * (c[..., 3] + T * (c[..., 4] + T * (c[..., 5] + c[..., 6] * T)))) * constants.R
+
+    def get_enthalpies(self, Tlist):
+        """
+        Return an array of shape (n_species, n_temperatures) of the
+        enthalpies in J/mol at the specified temperatures `Tlist` in K.
+        """
+        Tlist = np.asarray(Tlist, np.float64)
+        return self._get_enthalpies(self.select_coefficients(Tlist), Tlist)
+
+    def get_entropies(self, Tlist):
+        """
+        Return an array of shape (n_species, n_temperatures) of the entropies
+        in J/mol*K at the specified temperatures `Tlist` in K.
+        """
+        Tlist = np.asarray(Tlist, np.float64)
+        return self._get_entropies(self.select_coefficients(Tlist), Tlist)
+
+    def get_free_energies(self, Tlist):
+        """
+        Return an array of shape (n_species, n_temperatures) of the Gibbs
+        free energies in J/mol at the specified temperatures `Tlist` in K.
+        """
+        Tlist = np.asarray(Tlist, np.float64)
+        c = self.select_coefficients(Tlist)
+        return self._get_enthalpies(c, Tlist) - Tlist * self._get_entropies(c, Tlist)
+
+    def get_equilibrium_constants(self, stoichiometry, Tlist, type='Kc'):
+        """
+        Return an array of shape (n_reactions, n_temperatures) of the
+        equilibrium constants at the specified temperatures `Tlist` in K for
+        the reactions described by the (n_reactions, n_species) matrix
+        `stoichiometry`, such as the one returned by
+        :func:`get_stoichiometry_matrix`. The `type` parameter is as for
+        :meth:`Reaction.get_equilibrium_constant`.
+        """
+        Tlist = np.asarray(Tlist, np.float64)
+        dGrxn = stoichiometry.dot(self.get_free_energies(Tlist))
+        K = np.exp(-dGrxn / constants.R / Tlist)
+        # Convert Ka to Kc or Kp if specified
+        P0 = 1e5
+        dn = np.asarray(stoichiometry.sum(axis=1)).reshape(-1, 1)
+        if type == 'Kc':
+            # Convert from Ka to Kc; C0 is the reference concentration
+            C0 = P0 / constants.R / Tlist
+            K *= C0 ** dn
+        elif type == 'Kp':
+            # Convert from Ka to Kp; P0 is the reference pressure
+            K *= P0 ** dn
+        elif type != 'Ka' and type != '':
+            raise ReactionError('Invalid type "{0}" passed to NASATable.get_equilibrium_constants(); '
+                                'should be "Ka", "Kc", or "Kp".'.format(type))
+        return K
+
+    @staticmethod
+    def _get_enthalpies(c, T):
+        T2 = T * T
+        T4 = T2 * T2
+        return ((-c[..., 0] / T + c[..., 1] * np.log(T)) / T + c[..., 2] + c[..., 3] * T / 2. + c[..., 4] * T2 / 3.
+                + c[..., 5] * T2 * T / 4. + c[..., 6] * T4 / 5. + c[..., 7] / T) * constants.R * T
+
+    @staticmethod
+    def _get_entropies(c, T):
+        T2 = T * T
+        T4 = T2 * T2
+        return ((-c[..., 0] / T / 2. - c[..., 1]) / T + c[..., 2] * np.log(T) + c[..., 3] * T + c[..., 4] * T2 / 2.
+                + c[..., 5] * T2 * T / 3. + c[..., 6] * T4 / 4. + c[..., 8]) * constants.R
+
+
+def get_stoichiometry_matrix(reactions, species_index):
+    """
+    Return a sparse matrix of shape (n_reactions, n_species) containing the
+    stoichiometric coefficients of the `reactions`, where `species_index`
+    maps each species to its column. Reactants count as negative and
+    products as positive.
+    """
+    rows, cols, data = [], [], []
+    for i, reaction in enumerate(reactions):
+        for reactant in reaction.reactants:
+            rows.append(i)
+            cols.append(species_index[reactant])
+            data.append(-1.0)
+        for product in reaction.products:
+            rows.append(i)
+            cols.append(species_index[product])
+            data.append(1.0)
+    # Duplicate entries are summed when converting to CSR format
+    return scipy.sparse.coo_matrix((data, (rows, cols)), shape=(len(reactions), len(species_index))).tocsr()
+
+
+def get_equilibrium_constants(reactions, Tlist, type='Kc'):
+    """
+    Return an array of shape (n_reactions, n_temperatures) of the equilibrium
+    constants of the `reactions` at the specified temperatures `Tlist` in K.
+    If every species involved has NASA thermo, the free energies are
+    evaluated together in a :class:`NASATable` and combined through the
+    stoichiometry matrix; otherwise each reaction is evaluated on its own.
+    """
+    Tlist = np.asarray(Tlist, np.float64)
+    species_index = {}
+    for reaction in reactions:
+        for spec in itertools.chain(reaction.reactants, reaction.products):
+            species_index.setdefault(spec, len(species_index))
+    thermo_list = [getattr(spec, 'thermo', None) for spec in species_index]
+    if not all([isinstance(thermo, NASA) for thermo in thermo_list]):
+        K = np.zeros((len(reactions), Tlist.shape[0]), np.float64)
+        for i, reaction in enumerate(reactions):
+            K[i, :] = reaction.get_equilibrium_constants(Tlist, type)
+        return K
+
+    K = NASATable(thermo_list).get_equilibrium_constants(get_stoichiometry_matrix(reactions, species_index), Tlist, type)
+    if np.any(K == 0):
+        raise ReactionError('Got equilibrium constant of 0')
+    return K
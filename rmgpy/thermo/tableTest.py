@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.thermo.table` module.
+"""
+
+import unittest
+
+import numpy as np
+
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+from rmgpy.thermo.nasa import NASA, NASAPolynomial
+from rmgpy.thermo.table import NASATable, get_equilibrium_constants, get_stoichiometry_matrix
+from rmgpy.thermo.thermodata import ThermoData
+
+
+################################################################################
+
+
+class TestNASATable(unittest.TestCase):
+    """
+    Contains unit tests of the NASATable class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        # C2H6, C2H4 and H2
+        self.nasa_list = [
+            NASA(polynomials=[
+                NASAPolynomial(coeffs=[4.03055, -0.00214171, 4.90611e-05, -5.99027e-08, 2.38945e-11, -11257.6, 3.5613],
+                               Tmin=(300, 'K'), Tmax=(650.73, 'K')),
+                NASAPolynomial(coeffs=[-0.307954, 0.0245269, -1.2413e-05, 3.07724e-09, -3.01467e-13, -10693, 22.628],
+                               Tmin=(650.73, 'K'), Tmax=(3000, 'K')),
+            ], Tmin=(300, 'K'), Tmax=(3000, 'K')),
+            NASA(polynomials=[
+                NASAPolynomial(coeffs=[3.97471, -0.00477217, 4.0242e-05, -4.72312e-08, 1.8104e-11, 5145.39, 4.56714],
+                               Tmin=(100, 'K'), Tmax=(940.14, 'K')),
+                NASAPolynomial(coeffs=[5.09217, 0.00755638, -2.45001e-06, 4.14659e-10, -2.84004e-14, 4225.14, -5.48478],
+                               Tmin=(940.14, 'K'), Tmax=(5000, 'K')),
+            ], Tmin=(100, 'K'), Tmax=(5000, 'K')),
+            NASA(polynomials=[
+                NASAPolynomial(coeffs=[3.43536, 0.00021271, -2.78625e-07, 3.40267e-10, -7.76031e-14, -1031.36, -3.90842],
+                               Tmin=(298, 'K'), Tmax=(5000, 'K')),
+            ], Tmin=(298, 'K'), Tmax=(5000, 'K')),
+        ]
+        self.table = NASATable(self.nasa_list)
+        self.Tlist = np.array([300, 500, 650.73, 800, 1000, 1500, 2000, 3000], np.float64)
+
+    def test_packing(self):
+        """
+        Test that the NASA coefficients are packed with padding.
+        """
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.coeffs.shape, (3, 2, 9))
+        self.assertTrue(np.isinf(self.table.Tmin[2, 1]))
+        self.assertAlmostEqual(self.table.coeffs[1, 1, 2], 5.09217)
+
+    def test_get_thermo(self):
+        """
+        Test that the table matches the NASA objects for every species.
+        """
+        cp = self.table.get_heat_capacities(self.Tlist)
+        h = self.table.get_enthalpies(self.Tlist)
+        s = self.table.get_entropies(self.Tlist)
+        g = self.table.get_free_energies(self.Tlist)
+        self.assertEqual(cp.shape, (3, self.Tlist.shape[0]))
+        for i, nasa in enumerate(self.nasa_list):
+            for j, T in enumerate(self.Tlist):
+                self.assertAlmostEqual(cp[i, j] / nasa.get_heat_capacity(T), 1.0, 10)
+                self.assertAlmostEqual(h[i, j] / nasa.get_enthalpy(T), 1.0, 10)
+                self.assertAlmostEqual(s[i, j] / nasa.get_entropy(T), 1.0, 10)
+                self.assertAlmostEqual(g[i, j] / nasa.get_free_energy(T), 1.0, 10)
+
+    def test_invalid_temperature(self):
+        """
+        Test that a temperature outside every polynomial raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.table.get_heat_capacities(np.array([200.]))
+
+    def test_non_nasa(self):
+        """
+        Test that non-NASA thermo models are rejected.
+        """
+        with self.assertRaises(TypeError):
+            NASATable([ThermoData()])
+
+    def test_get_equilibrium_constants(self):
+        """
+        Test that the equilibrium constants match Reaction.get_equilibrium_constant().
+        """
+        ethane, ethylene, hydrogen = [Species(label=label, thermo=nasa)
+                                      for label, nasa in zip(['C2H6', 'C2H4', 'H2'], self.nasa_list)]
+        reactions = [
+            Reaction(reactants=[ethane], products=[ethylene, hydrogen]),
+            Reaction(reactants=[ethylene, hydrogen], products=[ethane]),
+            Reaction(reactants=[hydrogen, hydrogen], products=[hydrogen, hydrogen]),
+        ]
+        stoichiometry = get_stoichiometry_matrix(reactions, {ethane: 0, ethylene: 1, hydrogen: 2})
+        self.assertEqual(stoichiometry.toarray().tolist(), [[-1, 1, 1], [1, -1, -1], [0, 0, 0]])
+        for type in ['Ka', 'Kc', 'Kp']:
+            K = get_equilibrium_constants(reactions, self.Tlist, type)
+            self.assertEqual(K.shape, (3, self.Tlist.shape[0]))
+            for i, reaction in enumerate(reactions):
+                for j, T in enumerate(self.Tlist):
+                    self.assertAlmostEqual(K[i, j] / reaction.get_equilibrium_constant(T, type), 1.0, 8)
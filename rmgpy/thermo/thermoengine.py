@@ -37,6 +37,7 @@ import rmgpy.constants as constants
 from rmgpy.data.rmg import get_db
 from rmgpy.statmech import Conformer
 from rmgpy.thermo import Wilhoit, NASA, ThermoData
+from rmgpy.thermo.wilhoit import fit_wilhoits_to_data, wilhoits_to_nasa
 
 
 def process_thermo_data(spc, thermo0, thermo_class=NASA, solvent_name=''):
@@ -55,20 +56,8 @@ def process_thermo_data(spc, thermo0, thermo_class=NASA, solvent_name=''):
     else:
         wilhoit = thermo0.to_wilhoit()
 
-    # Add on solvation correction
-    solvation_database = get_db('solvation')
-    if not solvent_name or solvation_database is None:
-        logging.debug('Solvent database or solvent_name not found. Solvent effect was not utilized')
-        solvent_data = None
-    else:
-        solvent_data = solvation_database.get_solvent_data(solvent_name)
-    if solvent_data and not "Liquid thermo library" in thermo0.comment:
-        solvation_database = get_db('solvation')
-        solute_data = solvation_database.get_solute_data(spc)
-        solvation_correction = solvation_database.get_solvation_correction(solute_data, solvent_data)
-        # correction is added to the entropy and enthalpy
-        wilhoit.S0.value_si = (wilhoit.S0.value_si + solvation_correction.entropy)
-        wilhoit.H0.value_si = (wilhoit.H0.value_si + solvation_correction.enthalpy)
+    solvent_data = get_solvent_data(solvent_name)
+    apply_solvation_correction(spc, thermo0, wilhoit, solvent_data)
 
     # Compute E0 by extrapolation to 0 K
     if spc.conformer is None:
@@ -79,23 +68,9 @@ def process_thermo_data(spc, thermo0, thermo_class=NASA, solvent_name=''):
     if thermo_class is Wilhoit:
         thermo = wilhoit
     elif thermo_class is NASA:
-        if solvent_data:
-            # If liquid phase simulation keep the nasa polynomial if it comes from a liquid phase thermoLibrary.
-            # Otherwise convert wilhoit to NASA
-            if "Liquid thermo library" in thermo0.comment and isinstance(thermo0, NASA):
-                thermo = thermo0
-                if thermo.E0 is None:
-                    thermo.E0 = wilhoit.E0
-            else:
-                thermo = wilhoit.to_nasa(Tmin=100.0, Tmax=5000.0, Tint=1000.0)
-        else:
-            # gas phase with species matching thermo library keep the NASA from library or convert if group additivity
-            if "Thermo library" in thermo0.comment and isinstance(thermo0, NASA):
-                thermo = thermo0
-                if thermo.E0 is None:
-                    thermo.E0 = wilhoit.E0
-            else:
-                thermo = wilhoit.to_nasa(Tmin=100.0, Tmax=5000.0, Tint=1000.0)
+        thermo = get_library_nasa(thermo0, wilhoit, solvent_data)
+        if thermo is None:
+            thermo = wilhoit.to_nasa(Tmin=100.0, Tmax=5000.0, Tint=1000.0)
     else:
         raise Exception('thermo_class neither NASA nor Wilhoit.  Cannot process thermo data.')
 
@@ -111,6 +86,114 @@ def process_thermo_data(spc, thermo0, thermo_class=NASA, solvent_name=''):
     return thermo
 
 
+def process_thermo_data_list(species_list, thermo0_list, thermo_class=NASA, solvent_name=''):
+    """
+    Process the thermo data `thermo0_list` of the species in `species_list`
+    as :meth:`process_thermo_data` does for each of them, but fit the Wilhoit
+    models of all :class:`ThermoData` entries sharing the same temperatures
+    together and convert all of the Wilhoit models that require it to NASA
+    in a single batched fit.
+
+    The list of resulting thermo objects is returned.
+    """
+    if thermo_class is not NASA and thermo_class is not Wilhoit:
+        raise Exception('thermo_class neither NASA nor Wilhoit.  Cannot process thermo data.')
+    if len(species_list) == 1:
+        return [process_thermo_data(species_list[0], thermo0_list[0], thermo_class, solvent_name)]
+
+    # Always convert to Wilhoit so we can compute E0
+    wilhoits = [None] * len(thermo0_list)
+    groups = {}
+    for i, thermo0 in enumerate(thermo0_list):
+        if isinstance(thermo0, Wilhoit):
+            wilhoits[i] = thermo0
+        elif isinstance(thermo0, ThermoData) and 0.0 not in [thermo0.Cp0.value_si, thermo0.CpInf.value_si]:
+            groups.setdefault(tuple(thermo0.Tdata.value_si), []).append(i)
+        elif isinstance(thermo0, ThermoData):
+            wilhoits[i] = thermo0.to_wilhoit(B=1000.)
+        else:
+            wilhoits[i] = thermo0.to_wilhoit()
+    for Tdata, indices in groups.items():
+        data = [thermo0_list[i] for i in indices]
+        fitted = fit_wilhoits_to_data(np.array(Tdata, np.float64),
+                                      np.array([thermo0.Cpdata.value_si for thermo0 in data], np.float64),
+                                      np.array([thermo0.Cp0.value_si for thermo0 in data], np.float64),
+                                      np.array([thermo0.CpInf.value_si for thermo0 in data], np.float64),
+                                      np.array([thermo0.get_enthalpy(298) for thermo0 in data], np.float64),
+                                      np.array([thermo0.get_entropy(298) for thermo0 in data], np.float64),
+                                      B=1000.)
+        for i, thermo0, wilhoit in zip(indices, data, fitted):
+            wilhoit.label = thermo0.label
+            wilhoit.comment = thermo0.comment
+            wilhoits[i] = wilhoit
+
+    solvent_data = get_solvent_data(solvent_name)
+    for spc, thermo0, wilhoit in zip(species_list, thermo0_list, wilhoits):
+        apply_solvation_correction(spc, thermo0, wilhoit, solvent_data)
+        # Compute E0 by extrapolation to 0 K
+        if spc.conformer is None:
+            spc.conformer = Conformer()
+        spc.conformer.E0 = wilhoit.E0
+
+    # Convert to desired thermo class
+    if thermo_class is Wilhoit:
+        return wilhoits
+    thermo_list = [get_library_nasa(thermo0, wilhoit, solvent_data)
+                   for thermo0, wilhoit in zip(thermo0_list, wilhoits)]
+    indices = [i for i, thermo in enumerate(thermo_list) if thermo is None]
+    nasas = wilhoits_to_nasa([wilhoits[i] for i in indices], Tmin=100.0, Tmax=5000.0, Tint=1000.0)
+    for i, nasa in zip(indices, nasas):
+        thermo_list[i] = nasa
+    return thermo_list
+
+
+def get_solvent_data(solvent_name):
+    """
+    Return the solvent data for `solvent_name` from the solvation database,
+    or ``None`` if no solvent is used or the database is not loaded.
+    """
+    solvation_database = get_db('solvation')
+    if not solvent_name or solvation_database is None:
+        logging.debug('Solvent database or solvent_name not found. Solvent effect was not utilized')
+        return None
+    return solvation_database.get_solvent_data(solvent_name)
+
+
+def apply_solvation_correction(spc, thermo0, wilhoit, solvent_data):
+    """
+    Add the solvation correction of species `spc` in the solvent described by
+    `solvent_data` to the enthalpy and entropy of `wilhoit`, unless the
+    original thermo `thermo0` already comes from a liquid thermo library.
+    """
+    if solvent_data and not "Liquid thermo library" in thermo0.comment:
+        solvation_database = get_db('solvation')
+        solute_data = solvation_database.get_solute_data(spc)
+        solvation_correction = solvation_database.get_solvation_correction(solute_data, solvent_data)
+        # correction is added to the entropy and enthalpy
+        wilhoit.S0.value_si = (wilhoit.S0.value_si + solvation_correction.entropy)
+        wilhoit.H0.value_si = (wilhoit.H0.value_si + solvation_correction.enthalpy)
+
+
+def get_library_nasa(thermo0, wilhoit, solvent_data):
+    """
+    Return `thermo0` if it is a NASA object from a thermo library matching the
+    phase of the simulation, which is kept rather than refitted, setting its
+    `E0` from `wilhoit` if needed. Otherwise return ``None``.
+    """
+    if solvent_data:
+        # If liquid phase simulation keep the nasa polynomial if it comes from a liquid phase thermoLibrary.
+        # Otherwise convert wilhoit to NASA
+        library = "Liquid thermo library"
+    else:
+        # gas phase with species matching thermo library keep the NASA from library or convert if group additivity
+        library = "Thermo library"
+    if library in thermo0.comment and isinstance(thermo0, NASA):
+        if thermo0.E0 is None:
+            thermo0.E0 = wilhoit.E0
+        return thermo0
+    return None
+
+
 def generate_thermo_data(spc, thermo_class=NASA, solvent_name=''):
     """
     Generates thermo data, first checking Libraries, then using either QM or Database.
@@ -124,6 +207,18 @@ def generate_thermo_data(spc, thermo_class=NASA, solvent_name=''):
     Result stored in `spc.thermo` and returned.
     """
 
+    thermo0 = estimate_thermo_data(spc)
+    if thermo0 is None:
+        return None
+
+    return process_thermo_data(spc, thermo0, thermo_class, solvent_name)
+
+
+def estimate_thermo_data(spc):
+    """
+    Return the thermo data of `spc` from the thermo database, without any
+    further processing, or ``None`` if the database is not loaded.
+    """
     try:
         thermodb = get_db('thermo')
         if not thermodb: raise Exception
@@ -149,7 +244,27 @@ def generate_thermo_data(spc, thermo_class=NASA, solvent_name=''):
             and thermo_central_database.satisfy_registration_requirements(spc, thermo0, thermodb):
         thermo_central_database.register_in_central_thermo_db(spc)
 
-    return process_thermo_data(spc, thermo0, thermo_class, solvent_name)
+    return thermo0
+
+
+def generate_thermo_data_list(species_list, thermo_class=NASA, solvent_name=''):
+    """
+    Generate thermo data for each species in `species_list` as
+    :meth:`generate_thermo_data` does, processing the estimates of all of the
+    species together with :meth:`process_thermo_data_list`.
+
+    The list of results is returned, with ``None`` for any species whose
+    thermo data could not be estimated.
+    """
+    thermo0_list = [estimate_thermo_data(spc) for spc in species_list]
+    indices = [i for i, thermo0 in enumerate(thermo0_list) if thermo0 is not None]
+    thermo_list = [None] * len(species_list)
+    if indices:
+        processed = process_thermo_data_list([species_list[i] for i in indices],
+                                             [thermo0_list[i] for i in indices], thermo_class, solvent_name)
+        for i, thermo in zip(indices, processed):
+            thermo_list[i] = thermo
+    return thermo_list
 
 
 def evaluator(spc, solvent_name=''):
@@ -182,3 +297,15 @@ def submit(spc, solvent_name=''):
 
     """
     spc.thermo = evaluator(spc, solvent_name=solvent_name)
+
+
+def submit_list(species_list, solvent_name=''):
+    """
+    Submits a request to calculate chemical data for each Species object in
+    `species_list`, processing the thermo of all of them in one batch.
+    """
+    for spc in species_list:
+        logging.debug("Evaluating spc %s ", spc)
+        spc.generate_resonance_structures()
+    for spc, thermo in zip(species_list, generate_thermo_data_list(species_list, solvent_name=solvent_name)):
+        spc.thermo = thermo
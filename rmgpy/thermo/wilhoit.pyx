@@ -186,7 +186,50 @@ cdef class Wilhoit(HeatCapacityModel):
         in K.
         """
         return self.get_enthalpy(T) - T * self.get_entropy(T)
-    
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        specified temperatures `Tlist` in K.
+        """
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3
+        cdef np.ndarray y
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        y = Tlist / (Tlist + B)
+        return Cp0 + (CpInf - Cp0) * y * y * (
+            1 + (y - 1) * (a0 + y * (a1 + y * (a2 + y * a3)))
+        )
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3
+        cdef np.ndarray y
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        y = Tlist / (Tlist + B)
+        return self._H0.value_si + Cp0 * Tlist - (CpInf - Cp0) * Tlist * (
+            y * y * ((3 * a0 + a1 + a2 + a3) / 6. +
+                     (4 * a1 + a2 + a3) * y / 12. +
+                     (5 * a2 + a3) * y * y / 20. +
+                     a3 * y * y * y / 5.) +
+            (2 + a0 + a1 + a2 + a3) * (y / 2. - 1 + (1.0 / y - 1.) * np.log(B + Tlist))
+        )
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K at the specified temperatures `Tlist`
+        in K.
+        """
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3
+        cdef np.ndarray y
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        y = Tlist / (Tlist + B)
+        return self._S0.value_si + CpInf * np.log(Tlist) - (CpInf - Cp0) * (
+            np.log(y) + y * (1 + y * (a0 / 2. + y * (a1 / 3. + y * (a2 / 4. + y * a3 / 5.))))
+        )
+
     cpdef Wilhoit copy(self):
         """
         Return a copy of the Wilhoit object.
@@ -518,8 +561,6 @@ cdef class Wilhoit(HeatCapacityModel):
         cdef NASAPolynomial nasa_low, nasa_high
         cdef double iseUnw, rmsUnw, iseWei, rmsWei, T
         cdef str rmsStr
-        
-        from rmgpy.thermo.nasa import NASA
 
         # Scale the temperatures to kK
         Tmin /= 1000.
@@ -550,45 +591,53 @@ cdef class Wilhoit(HeatCapacityModel):
         #if (rmsUnw > 0.25 or rmsWei > 0.25):
         #    print("Poor Wilhoit-to-NASA fit quality: RMS error = {0:.3f}*R".format(rmsWei if weighting == 1 else rmsUnw))
     
-        # Restore to conventional units of K for Tint and units based on K rather than kK in NASA polynomial coefficients
-        Tint *= 1000.
-        Tmin *= 1000.
-        Tmax *= 1000.
-        nasa_low.c1 *= 1.0e-3
-        nasa_low.c2 *= 1.0e-6
-        nasa_low.c3 *= 1.0e-9
-        nasa_low.c4 *= 1.0e-12
-        nasa_high.c1 *= 1.0e-3
-        nasa_high.c2 *= 1.0e-6
-        nasa_high.c3 *= 1.0e-9
-        nasa_high.c4 *= 1.0e-12
-        
         # output comment
         # comment = 'NASA function fitted to Wilhoit function with B = {0:g} K. {1}\n{2}'.format(self.B.value_si, rmsStr, self.comment)
-    
-        # For the low polynomial, we want the results to match the Wilhoit value at 298 K
-        nasa_low.c5 = (self.get_enthalpy(298) - nasa_low.get_enthalpy(298)) / constants.R
-        nasa_low.c6 = (self.get_entropy(298) - nasa_low.get_entropy(298)) / constants.R
-        
-        # For the high polynomial, we want the results to match the low polynomial value at tint
-        nasa_high.c5 = (nasa_low.get_enthalpy(Tint) - nasa_high.get_enthalpy(Tint)) / constants.R
-        nasa_high.c6 = (nasa_low.get_entropy(Tint) - nasa_high.get_entropy(Tint)) / constants.R
-    
-        nasa = NASA(
-            polynomials = [nasa_low, nasa_high],
-            Tmin = nasa_low.Tmin,
-            Tmax = nasa_high.Tmax,
-            E0 = self.E0,
-            Cp0 = self.Cp0,
-            CpInf = self.CpInf,
-            label = self.label,
-            comment = self.comment,
-        )
-    
-        return nasa
+
+        return scaled_nasa_to_nasa(self, nasa_low, nasa_high, Tint * 1000.)
 
 ################################################################################
 
+cdef NASA scaled_nasa_to_nasa(Wilhoit wilhoit, NASAPolynomial nasa_low, NASAPolynomial nasa_high, double Tint):
+    """
+    Return the :class:`NASA` object built from the pair of NASA polynomials
+    fitted to `wilhoit` with scaled parameters, as returned by
+    :func:`wilhoit_to_nasa`. The coefficients are restored to units based
+    on K rather than kK, and the integration constants are set so that the
+    enthalpy and entropy match the Wilhoit values at 298 K and are
+    continuous at the intermediate temperature `Tint` in K.
+    """
+    from rmgpy.thermo.nasa import NASA
+
+    # Restore to units based on K rather than kK in NASA polynomial coefficients
+    nasa_low.c1 *= 1.0e-3
+    nasa_low.c2 *= 1.0e-6
+    nasa_low.c3 *= 1.0e-9
+    nasa_low.c4 *= 1.0e-12
+    nasa_high.c1 *= 1.0e-3
+    nasa_high.c2 *= 1.0e-6
+    nasa_high.c3 *= 1.0e-9
+    nasa_high.c4 *= 1.0e-12
+
+    # For the low polynomial, we want the results to match the Wilhoit value at 298 K
+    nasa_low.c5 = (wilhoit.get_enthalpy(298) - nasa_low.get_enthalpy(298)) / constants.R
+    nasa_low.c6 = (wilhoit.get_entropy(298) - nasa_low.get_entropy(298)) / constants.R
+
+    # For the high polynomial, we want the results to match the low polynomial value at tint
+    nasa_high.c5 = (nasa_low.get_enthalpy(Tint) - nasa_high.get_enthalpy(Tint)) / constants.R
+    nasa_high.c6 = (nasa_low.get_entropy(Tint) - nasa_high.get_entropy(Tint)) / constants.R
+
+    return NASA(
+        polynomials = [nasa_low, nasa_high],
+        Tmin = nasa_low.Tmin,
+        Tmax = nasa_high.Tmax,
+        E0 = wilhoit.E0,
+        Cp0 = wilhoit.Cp0,
+        CpInf = wilhoit.CpInf,
+        label = wilhoit.label,
+        comment = wilhoit.comment,
+    )
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cpdef wilhoit_to_nasa(Wilhoit wilhoit, double Tmin, double Tmax, double Tint, bint weighting, int cont_cons):
@@ -902,3 +951,330 @@ cpdef double wilhoit_to_nasa_t_int_opt_obj_fun_w(double Tint, Wilhoit wilhoit, d
                  +b10*(wilhoit.integral_T3(Tmax)-q3)+b5*(q3 - wilhoit.integral_T3(Tmin))))
 
     return result
+
+################################################################################
+
+def bounded_brent_minimize(f, np.ndarray lower, np.ndarray upper, double xtol=1e-5, int maxfun=500):
+    """
+    Minimize the vectorized function `f` independently for each element of
+    the bounds `lower` and `upper`, and return the array of minimizers. The
+    function `f` is called with an array of trial points, one per element,
+    and must return an array of the same shape. Each element follows the
+    same steps as Brent's bounded method in ``scipy.optimize.fminbound``
+    with the absolute tolerance `xtol`, so that the result matches a
+    separate call to ``fminbound`` for every element.
+    """
+    cdef double sqrt_eps = sqrt(2.2e-16)
+    cdef double golden_mean = 0.5 * (3.0 - sqrt(5.0))
+    a = lower.astype(np.float64)
+    b = upper.astype(np.float64)
+    fulc = a + golden_mean * (b - a)
+    nfc = fulc.copy()
+    xf = fulc.copy()
+    rat = np.zeros_like(a)
+    e = np.zeros_like(a)
+    fx = np.asarray(f(xf), np.float64)
+    ffulc = fx.copy()
+    fnfc = fx.copy()
+    num = np.ones(a.shape, np.int64)
+    xm = 0.5 * (a + b)
+    tol1 = sqrt_eps * np.abs(xf) + xtol / 3.0
+    tol2 = 2.0 * tol1
+    active = np.abs(xf - xm) > tol2 - 0.5 * (b - a)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        while np.any(active):
+            # Check for a parabolic fit step
+            parabolic = np.abs(e) > tol1
+            r = (xf - nfc) * (fx - ffulc)
+            q = (xf - fulc) * (fx - fnfc)
+            p = (xf - fulc) * q - (xf - nfc) * r
+            q = 2.0 * (q - r)
+            p = np.where(q > 0.0, -p, p)
+            q = np.abs(q)
+            golden = ~(parabolic & (np.abs(p) < np.abs(0.5 * q * e))
+                       & (p > q * (a - xf)) & (p < q * (b - xf)))
+            # Take the parabolic step, but not too close to the bounds
+            e = np.where(parabolic, rat, e)
+            rat = np.where(golden, rat, p / q)
+            x = xf + rat
+            si = np.sign(xm - xf) + ((xm - xf) == 0)
+            rat = np.where(golden | ((x - a >= tol2) & (b - x >= tol2)), rat, tol1 * si)
+            # Otherwise take a golden-section step
+            e = np.where(golden, np.where(xf >= xm, a - xf, b - xf), e)
+            rat = np.where(golden, golden_mean * e, rat)
+
+            si = np.sign(rat) + (rat == 0)
+            x = xf + si * np.maximum(np.abs(rat), tol1)
+            fu = np.where(active, f(np.where(active, x, xf)), fx)
+            num += active
+
+            # Update the brackets and the three best points of the active elements
+            better = active & (fu <= fx)
+            worse = active & ~better
+            a = np.where(better & (x >= xf), xf, np.where(worse & (x < xf), x, a))
+            b = np.where(better & (x < xf), xf, np.where(worse & (x >= xf), x, b))
+            shift = worse & ((fu <= fnfc) | (nfc == xf))
+            replace = worse & ~shift & ((fu <= ffulc) | (fulc == xf) | (fulc == nfc))
+            fulc = np.where(better | shift, nfc, np.where(replace, x, fulc))
+            ffulc = np.where(better | shift, fnfc, np.where(replace, fu, ffulc))
+            nfc = np.where(better, xf, np.where(shift, x, nfc))
+            fnfc = np.where(better, fx, np.where(shift, fu, fnfc))
+            xf = np.where(better, x, xf)
+            fx = np.where(better, fu, fx)
+
+            xm = 0.5 * (a + b)
+            tol1 = sqrt_eps * np.abs(xf) + xtol / 3.0
+            tol2 = 2.0 * tol1
+            active &= (np.abs(xf - xm) > tol2 - 0.5 * (b - a)) & (num < maxfun)
+
+    return xf
+
+cdef np.ndarray fit_wilhoit_coefficients(np.ndarray Tdata, np.ndarray Cpdata, np.ndarray Cp0, np.ndarray CpInf,
+                                         np.ndarray B):
+    """
+    Return the (n_species, 4) array of Wilhoit coefficients a0-a3 fitted to
+    the heat capacities `Cpdata` at the temperatures `Tdata` for the
+    characteristic temperatures `B`, as in
+    :meth:`Wilhoit.fit_to_data_for_constant_b`.
+    """
+    cdef np.ndarray y, A, b, x, constant
+    y = Tdata[np.newaxis, :] / (Tdata[np.newaxis, :] + B[:, np.newaxis])
+    A = (y * y * y - y * y)[:, :, np.newaxis] * y[:, :, np.newaxis] ** np.arange(4)
+    # The heat capacity is constant for species with Cp0 == CpInf (i.e. probably monatomic)
+    constant = Cp0 == CpInf
+    b = (Cpdata - Cp0[:, np.newaxis]) / np.where(constant, 1.0, CpInf - Cp0)[:, np.newaxis] - y * y
+    if np.all(B == B[0]):
+        # All species share one design matrix, so solve for them together
+        x = np.linalg.lstsq(A[0], b.T, rcond=RCOND)[0].T
+    else:
+        x = np.matmul(np.linalg.pinv(A), b[:, :, np.newaxis])[:, :, 0]
+    x[constant, :] = 0.0
+    return x
+
+cdef np.ndarray wilhoit_residuals(np.ndarray Tdata, np.ndarray Cpdata, np.ndarray Cp0, np.ndarray CpInf,
+                                  np.ndarray B):
+    """
+    Return the sum of squared heat capacity residuals of the Wilhoit models
+    fitted for the characteristic temperatures `B`, one per species.
+    """
+    cdef np.ndarray x, y, Cp
+    x = fit_wilhoit_coefficients(Tdata, Cpdata, Cp0, CpInf, B)
+    y = Tdata[np.newaxis, :] / (Tdata[np.newaxis, :] + B[:, np.newaxis])
+    Cp = Cp0[:, np.newaxis] + (CpInf - Cp0)[:, np.newaxis] * y * y * (
+        1 + (y - 1) * (x[:, 0:1] + y * (x[:, 1:2] + y * (x[:, 2:3] + y * x[:, 3:4])))
+    )
+    return np.sum((Cp - Cpdata) ** 2, axis=1)
+
+def fit_wilhoits_to_data(np.ndarray Tdata, np.ndarray Cpdata, np.ndarray Cp0, np.ndarray CpInf,
+                         np.ndarray H298, np.ndarray S298, B=None):
+    """
+    Fit Wilhoit models to the data of many species at once, returning a list
+    of :class:`Wilhoit` objects. The heat capacities `Cpdata` in J/mol*K are
+    an array of shape (n_species, n_temperatures) at the temperatures `Tdata`
+    in K shared by all species, while `Cp0`, `CpInf`, `H298` and `S298` hold
+    one value per species. If the characteristic temperature `B` in K is
+    given, the result matches :meth:`Wilhoit.fit_to_data_for_constant_b`;
+    otherwise `B` is chosen for each species by a vectorized search that
+    takes the same steps as :meth:`Wilhoit.fit_to_data`.
+    """
+    cdef Wilhoit wilhoit
+    cdef np.ndarray x
+    cdef list wilhoits
+    cdef int i, n
+    n = Cpdata.shape[0]
+    if n == 0:
+        return []
+    if B is None:
+        B = bounded_brent_minimize(lambda B: wilhoit_residuals(Tdata, Cpdata, Cp0, CpInf, B),
+                                   np.full(n, 300.0), np.full(n, 3000.0))
+    else:
+        B = np.full(n, B, np.float64)
+    x = fit_wilhoit_coefficients(Tdata, Cpdata, Cp0, CpInf, B)
+
+    wilhoits = []
+    for i in range(n):
+        wilhoit = Wilhoit(Cp0=(Cp0[i], "J/(mol*K)"), CpInf=(CpInf[i], "J/(mol*K)"),
+                          a0=x[i, 0], a1=x[i, 1], a2=x[i, 2], a3=x[i, 3],
+                          H0=(0.0, "kJ/mol"), S0=(0.0, "J/(mol*K)"), B=(float(B[i]), "K"))
+        wilhoit._H0.value_si = H298[i] - wilhoit.get_enthalpy(298)
+        wilhoit._S0.value_si = S298[i] - wilhoit.get_entropy(298)
+        wilhoits.append(wilhoit)
+    return wilhoits
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray wilhoit_integrals(list wilhoits, np.ndarray[np.float64_t, ndim=1] T, bint weighting):
+    """
+    Return the (n_species, 5) array of the integrals of each scaled Wilhoit
+    heat capacity times :math:`T^{-1}` to :math:`T^3` if `weighting` is set,
+    or :math:`T^0` to :math:`T^4` if not, evaluated at the temperatures `T`
+    in kK.
+    """
+    cdef np.ndarray[np.float64_t, ndim=2] P = np.empty((len(wilhoits), 5), np.float64)
+    cdef Wilhoit wilhoit
+    cdef int i
+    for i in range(len(wilhoits)):
+        wilhoit = wilhoits[i]
+        if weighting:
+            P[i, 0] = wilhoit.integral_TM1(T[i])
+        else:
+            P[i, 4] = wilhoit.integral_T4(T[i])
+        P[i, weighting] = wilhoit.integral_T0(T[i])
+        P[i, 1 + weighting] = wilhoit.integral_T1(T[i])
+        P[i, 2 + weighting] = wilhoit.integral_T2(T[i])
+        P[i, 3 + weighting] = wilhoit.integral_T3(T[i])
+    return P
+
+cdef np.ndarray wilhoit_integrals2(list wilhoits, double T, bint weighting):
+    """
+    Return the integrals of the square of each scaled Wilhoit heat capacity,
+    weighted by :math:`T^{-1}` if `weighting` is set, at the temperature `T`
+    in kK.
+    """
+    cdef Wilhoit wilhoit
+    if weighting:
+        return np.array([wilhoit.integral2_TM1(T) for wilhoit in wilhoits], np.float64)
+    else:
+        return np.array([wilhoit.integral2_T0(T) for wilhoit in wilhoits], np.float64)
+
+cdef np.ndarray nasa_integrals2(np.ndarray c, np.ndarray T, bint weighting):
+    """
+    Return the integrals of the square of the scaled NASA heat capacities
+    with coefficients `c` of shape (n_species, 5), weighted by
+    :math:`T^{-1}` if `weighting` is set, at the temperatures `T` in kK.
+    This is the vectorized form of :meth:`NASAPolynomial.integral2_TM1` and
+    :meth:`NASAPolynomial.integral2_T0`.
+    """
+    cdef np.ndarray c0, c1, c2, c3, c4, T2, T4, T8
+    c0, c1, c2, c3, c4 = c[:, 0], c[:, 1], c[:, 2], c[:, 3], c[:, 4]
+    T2 = T * T
+    T4 = T2 * T2
+    if weighting:
+        return (
+            c0*c0*np.log(T) + 2*c0*c1*T + c0*c2*T2 + 2./3.*c0*c3*T2*T + 0.5*c0*c4*T4 +
+            0.5*c1*c1*T2 + 2./3.*c1*c2*T2*T + 0.5*c1*c3*T4 + 0.4*c1*c4*T4*T +
+            0.25*c2*c2*T4 + 0.4*c2*c3*T4*T + c2*c4*T4*T2/3. +
+            c3*c3*T4*T2/6. + 2./7.*c3*c4*T4*T2*T +
+            c4*c4*T4*T4/8.
+        )
+    else:
+        T8 = T4 * T4
+        return (
+            c0*c0*T + c0*c1*T2 + 2./3.*c0*c2*T2*T + 0.5*c0*c3*T4 + 0.4*c0*c4*T4*T +
+            c1*c1*T2*T/3. + 0.5*c1*c2*T4 + 0.4*c1*c3*T4*T + c1*c4*T4*T2/3. +
+            0.2*c2*c2*T4*T + c2*c3*T4*T2/3. + 2./7.*c2*c4*T4*T2*T +
+            c3*c3*T4*T2*T/7. + 0.25*c3*c4*T8 +
+            c4*c4*T8*T/9.
+        )
+
+cdef np.ndarray wilhoit_to_nasa_matrices(double Tmin, double Tmax, np.ndarray Tint, bint weighting, int cont_cons):
+    """
+    Return the stacked symmetric matrices of the constrained least-squares
+    problems solved by :func:`wilhoit_to_nasa`, one for each intermediate
+    temperature in `Tint`. All temperatures are in kK.
+    """
+    cdef np.ndarray A
+    cdef int i, j, k, d, m, p, n
+    cdef double coeff
+    n = Tint.shape[0]
+    A = np.zeros((n, 10 + cont_cons, 10 + cont_cons), np.float64)
+    # Each 5*5 block is a Hankel matrix of integrals of T^(i+j), weighted by T^-1 if requested
+    for i in range(5):
+        for j in range(i, 5):
+            p = i + j if weighting else i + j + 1
+            if p == 0:
+                A[:, i, j] = 2 * np.log(Tint / Tmin)
+                A[:, 5 + i, 5 + j] = 2 * np.log(Tmax / Tint)
+            else:
+                A[:, i, j] = 2. * (Tint ** p - Tmin ** p) / p
+                A[:, 5 + i, 5 + j] = 2. * (Tmax ** p - Tint ** p) / p
+    # Column 10 + d constrains the d-th derivative of Cp(T) to be continuous at Tint
+    for d in range(cont_cons):
+        for k in range(d, 5):
+            coeff = 1.0
+            for m in range(k - d + 1, k + 1):
+                coeff *= m
+            A[:, k, 10 + d] = coeff * Tint ** (k - d)
+            A[:, 5 + k, 10 + d] = -coeff * Tint ** (k - d)
+    # make the matrices symmetric
+    return np.triu(A) + np.transpose(np.triu(A, 1), (0, 2, 1))
+
+def wilhoits_to_nasa(list wilhoits, double Tmin, double Tmax, double Tint, bint fixedTint=False,
+                     bint weighting=True, int continuity=3):
+    """
+    Convert many :class:`Wilhoit` objects to :class:`NASA` objects at once,
+    returning a list of the results. The parameters have the same meaning as
+    for :meth:`Wilhoit.to_nasa`. The constrained least-squares problems of
+    all species are stacked and solved together, and if `fixedTint` is
+    ``False`` the intermediate temperature of every species is optimized in
+    a single vectorized search that takes the same steps as the serial one.
+    """
+    cdef Wilhoit wilhoit, wilhoit_scaled
+    cdef NASAPolynomial nasa_low, nasa_high
+    cdef list scaled, nasas
+    cdef np.ndarray Tints, Pmin, Pmax, W2, x
+    cdef int i, n
+
+    n = len(wilhoits)
+    if n == 0:
+        return []
+
+    # Scale the temperatures to kK
+    Tmin /= 1000.
+    Tint /= 1000.
+    Tmax /= 1000.
+
+    # Make copies of the Wilhoit data with rescaled parameters
+    scaled = []
+    for wilhoit in wilhoits:
+        wilhoit_scaled = wilhoit.copy()
+        wilhoit_scaled._Cp0.value_si /= constants.R
+        wilhoit_scaled._CpInf.value_si /= constants.R
+        wilhoit_scaled._B.value_si /= 1000.
+        scaled.append(wilhoit_scaled)
+
+    Pmin = wilhoit_integrals(scaled, np.full(n, Tmin), weighting)
+    Pmax = wilhoit_integrals(scaled, np.full(n, Tmax), weighting)
+
+    def solve(Tints):
+        # Solve the stacked systems, returning the coefficients and the integrals at Tint
+        Pint = wilhoit_integrals(scaled, Tints, weighting)
+        b = np.zeros((n, 10 + continuity), np.float64)
+        b[:, 0:5] = 2 * (Pint - Pmin)
+        b[:, 5:10] = 2 * (Pmax - Pint)
+        A = wilhoit_to_nasa_matrices(Tmin, Tmax, Tints, weighting, continuity)
+        return np.linalg.solve(A, b[:, :, np.newaxis])[:, :, 0], Pint
+
+    if fixedTint:
+        Tints = np.full(n, Tint)
+    else:
+        W2 = wilhoit_integrals2(scaled, Tmax, weighting) - wilhoit_integrals2(scaled, Tmin, weighting)
+
+        def objective(Tints):
+            # The integral of the squared error, as in wilhoit_to_nasa_t_int_opt_obj_fun()
+            x, Pint = solve(Tints)
+            result = (W2
+                      + nasa_integrals2(x[:, 0:5], Tints, weighting) - nasa_integrals2(x[:, 0:5], np.full(n, Tmin), weighting)
+                      + nasa_integrals2(x[:, 5:10], np.full(n, Tmax), weighting) - nasa_integrals2(x[:, 5:10], Tints, weighting)
+                      - 2 * (np.sum(x[:, 5:10] * (Pmax - Pint), axis=1) + np.sum(x[:, 0:5] * (Pint - Pmin), axis=1)))
+            return np.maximum(result, 0)
+
+        Tints = bounded_brent_minimize(objective, np.full(n, Tmin), np.full(n, Tmax))
+
+    x = solve(Tints)[0]
+
+    nasas = []
+    for i in range(n):
+        nasa_low = NASAPolynomial(
+            [x[i, 0], x[i, 1], x[i, 2], x[i, 3], x[i, 4], 0.0, 0.0],
+            Tmin = (Tmin * 1000.,"K"),
+            Tmax = (Tints[i] * 1000.,"K"),
+        )
+        nasa_high = NASAPolynomial(
+            [x[i, 5], x[i, 6], x[i, 7], x[i, 8], x[i, 9], 0.0, 0.0],
+            Tmin = (Tints[i] * 1000.,"K"),
+            Tmax = (Tmax * 1000.,"K"),
+        )
+        nasas.append(scaled_nasa_to_nasa(wilhoits[i], nasa_low, nasa_high, Tints[i] * 1000.))
+    return nasas
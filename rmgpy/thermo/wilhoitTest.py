@@ -39,7 +39,7 @@ import numpy as np
 
 import rmgpy.constants as constants
 from rmgpy.quantity import ScalarQuantity
-from rmgpy.thermo.wilhoit import Wilhoit
+from rmgpy.thermo.wilhoit import Wilhoit, fit_wilhoits_to_data, wilhoits_to_nasa
 
 ################################################################################
 
@@ -218,6 +218,21 @@ class TestWilhoit(unittest.TestCase):
             g_act = self.wilhoit.get_free_energy(T)
             self.assertAlmostEqual(g_exp / g_act, 1.0, 4, '{0} != {1}'.format(g_exp, g_act))
 
+    def test_get_thermo_arrays(self):
+        """
+        Test that the Wilhoit array methods match the scalar methods.
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000], np.float64)
+        cp_list = self.wilhoit.get_heat_capacities(Tlist)
+        h_list = self.wilhoit.get_enthalpies(Tlist)
+        s_list = self.wilhoit.get_entropies(Tlist)
+        g_list = self.wilhoit.get_free_energies(Tlist)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(cp_list[i] / self.wilhoit.get_heat_capacity(T), 1.0, 10)
+            self.assertAlmostEqual(h_list[i] / self.wilhoit.get_enthalpy(T), 1.0, 10)
+            self.assertAlmostEqual(s_list[i] / self.wilhoit.get_entropy(T), 1.0, 10)
+            self.assertAlmostEqual(g_list[i] / self.wilhoit.get_free_energy(T), 1.0, 10)
+
     def test_pickle(self):
         """
         Test that a Wilhoit object can be pickled and unpickled with no loss
@@ -320,6 +335,84 @@ class TestWilhoit(unittest.TestCase):
         self.assertAlmostEqual(wilhoit.H0.value_si, self.wilhoit.H0.value_si, 0)
         self.assertAlmostEqual(wilhoit.S0.value_si, self.wilhoit.S0.value_si, 2)
 
+    def test_fit_wilhoits_to_data(self):
+        """
+        Test that fit_wilhoits_to_data() matches Wilhoit.fit_to_data_for_constant_b() and Wilhoit.fit_to_data().
+        """
+        Tdata = np.array([300., 400., 500., 600., 800., 1000., 1500.])
+        species = [self.wilhoit, self.wilhoit.copy(), self.wilhoit.copy()]
+        species[1].a1 = -14.0
+        species[2].Cp0 = species[2].CpInf
+        cp_data = np.array([[wilhoit.get_heat_capacity(T) for T in Tdata] for wilhoit in species])
+        cp_0 = np.array([wilhoit.Cp0.value_si for wilhoit in species])
+        cp_inf = np.array([wilhoit.CpInf.value_si for wilhoit in species])
+        h298 = np.array([wilhoit.get_enthalpy(298) for wilhoit in species])
+        s298 = np.array([wilhoit.get_entropy(298) for wilhoit in species])
+
+        for B in [1000., None]:
+            fitted = fit_wilhoits_to_data(Tdata, cp_data, cp_0, cp_inf, h298, s298, B=B)
+            self.assertEqual(len(fitted), len(species))
+            for i, wilhoit in enumerate(fitted):
+                if B is None:
+                    expected = Wilhoit().fit_to_data(Tdata, cp_data[i], cp_0[i], cp_inf[i], h298[i], s298[i])
+                else:
+                    expected = Wilhoit().fit_to_data_for_constant_b(Tdata, cp_data[i], cp_0[i], cp_inf[i],
+                                                                    h298[i], s298[i], B=B)
+                for T in Tdata:
+                    self.assertAlmostEqual(wilhoit.get_heat_capacity(T) / expected.get_heat_capacity(T), 1.0, 4)
+                    self.assertAlmostEqual(wilhoit.get_enthalpy(T) / expected.get_enthalpy(T), 1.0, 4)
+                    self.assertAlmostEqual(wilhoit.get_entropy(T) / expected.get_entropy(T), 1.0, 4)
+                if B is not None:
+                    self.assertAlmostEqual(wilhoit.a0, expected.a0, 6)
+                    self.assertAlmostEqual(wilhoit.a3, expected.a3, 6)
+                    self.assertEqual(wilhoit.B.value_si, expected.B.value_si)
+
+    def test_wilhoits_to_nasa(self):
+        """
+        Test that wilhoits_to_nasa() matches Wilhoit.to_nasa() for each Wilhoit.
+        """
+        other = self.wilhoit.copy()
+        other.a1 = -14.0
+        other.B.value_si = 800.
+        wilhoits = [self.wilhoit, other]
+        Tlist = np.array([300., 500., 900., 1200., 2000., 3000.])
+        for fixed_tint in [True, False]:
+            nasas = wilhoits_to_nasa(wilhoits, Tmin=300., Tmax=3000., Tint=1000., fixedTint=fixed_tint)
+            self.assertEqual(len(nasas), 2)
+            for wilhoit, nasa in zip(wilhoits, nasas):
+                expected = wilhoit.to_nasa(Tmin=300., Tmax=3000., Tint=1000., fixedTint=fixed_tint)
+                self.assertAlmostEqual(nasa.polynomials[0].Tmax.value_si, expected.polynomials[0].Tmax.value_si, 0)
+                self.assertEqual(nasa.Tmin.value_si, 300.)
+                self.assertEqual(nasa.Tmax.value_si, 3000.)
+                self.assertEqual(nasa.comment, wilhoit.comment)
+                for T in Tlist:
+                    self.assertAlmostEqual(nasa.get_heat_capacity(T) / expected.get_heat_capacity(T), 1.0, 4)
+                    self.assertAlmostEqual(nasa.get_enthalpy(T) / expected.get_enthalpy(T), 1.0, 4)
+                    self.assertAlmostEqual(nasa.get_entropy(T) / expected.get_entropy(T), 1.0, 4)
+        self.assertEqual(wilhoits_to_nasa([], Tmin=300., Tmax=3000., Tint=1000.), [])
+
+    def test_wilhoits_to_nasa_multimodal(self):
+        """
+        Test that wilhoits_to_nasa() finds the same intermediate temperature as Wilhoit.to_nasa() over the range
+        used for species thermo, where the objective has several local minima.
+        """
+        wilhoits = []
+        for a0, a1, a2, a3, B, cp_inf in [(0.680, 17.024, -25.738, -12.386, 354.6, 34.14),
+                                          (3.210, -16.116, 20.277, -12.117, 2936.4, 21.40),
+                                          (-3.506, 14.725, -20.250, 3.467, 634.3, 34.68)]:
+            wilhoit = self.wilhoit.copy()
+            wilhoit.a0, wilhoit.a1, wilhoit.a2, wilhoit.a3 = a0, a1, a2, a3
+            wilhoit.B.value_si = B
+            wilhoit.CpInf.value_si = cp_inf * constants.R
+            wilhoits.append(wilhoit)
+        Tlist = np.array([100., 300., 1000., 2000., 5000.])
+        nasas = wilhoits_to_nasa(wilhoits, Tmin=100., Tmax=5000., Tint=1000.)
+        for wilhoit, nasa in zip(wilhoits, nasas):
+            expected = wilhoit.to_nasa(Tmin=100., Tmax=5000., Tint=1000.)
+            self.assertAlmostEqual(nasa.polynomials[0].Tmax.value_si, expected.polynomials[0].Tmax.value_si, 0)
+            for T in Tlist:
+                self.assertAlmostEqual(nasa.get_heat_capacity(T) / expected.get_heat_capacity(T), 1.0, 4)
+
     def test_to_wilhoit(self):
         """
         Test if the entropy computed from other thermo implementations is close to what Wilhoit computes.
@@ -59,6 +59,7 @@ import math
 import os
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from rmgpy.chemkin import load_chemkin_file
 from rmgpy.rmg.model import ReactionModel
@@ -389,28 +390,15 @@ def execute(chemkin1, species_dict1, thermo1, chemkin2, species_dict2, thermo2,
             logging.info('    {0!s}'.format(spec))
 
         logging.info('{0:d} reactions were found in both models:'.format(len(common_reactions)))
+        Tlist = np.array([300, 400, 500, 600, 800, 1000, 1500, 2000], np.float64)
         for rxn1, rxn2 in common_reactions:
             logging.info('    {0!s}'.format(rxn1))
             if rxn1.kinetics and rxn2.kinetics:
                 logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f}'.format(
-                    math.log10(rxn1.kinetics.get_rate_coefficient(300, 1e5)),
-                    math.log10(rxn1.kinetics.get_rate_coefficient(400, 1e5)),
-                    math.log10(rxn1.kinetics.get_rate_coefficient(500, 1e5)),
-                    math.log10(rxn1.kinetics.get_rate_coefficient(600, 1e5)),
-                    math.log10(rxn1.kinetics.get_rate_coefficient(800, 1e5)),
-                    math.log10(rxn1.kinetics.get_rate_coefficient(1000, 1e5)),
-                    math.log10(rxn1.kinetics.get_rate_coefficient(1500, 1e5)),
-                    math.log10(rxn1.kinetics.get_rate_coefficient(2000, 1e5)),
+                    *np.log10(rxn1.kinetics.get_rate_coefficients(Tlist, 1e5))
                 ))
                 logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f}'.format(
-                    math.log10(rxn2.kinetics.get_rate_coefficient(300, 1e5)),
-                    math.log10(rxn2.kinetics.get_rate_coefficient(400, 1e5)),
-                    math.log10(rxn2.kinetics.get_rate_coefficient(500, 1e5)),
-                    math.log10(rxn2.kinetics.get_rate_coefficient(600, 1e5)),
-                    math.log10(rxn2.kinetics.get_rate_coefficient(800, 1e5)),
-                    math.log10(rxn2.kinetics.get_rate_coefficient(1000, 1e5)),
-                    math.log10(rxn2.kinetics.get_rate_coefficient(1500, 1e5)),
-                    math.log10(rxn2.kinetics.get_rate_coefficient(2000, 1e5)),
+                    *np.log10(rxn2.kinetics.get_rate_coefficients(Tlist, 1e5))
                 ))
         logging.info('{0:d} reactions were only found in the first model:'.format(len(unique_reactions1)))
         for rxn in unique_reactions1:
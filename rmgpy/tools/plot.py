@@ -29,6 +29,7 @@
 ###############################################################################
 
 import os
+import re
 
 import matplotlib as mpl
 
@@ -41,6 +42,12 @@ import numpy as np
 
 from rmgpy.tools.data import GenericData
 
+# Patterns for matching indices, units and sensitivities in column headers
+INDEX_PATTERN = re.compile(r'^\S+\(\d+\)$')
+UNITS_PATTERN = re.compile(r'\s\(.+\)$')
+RXN_SENS_PATTERN = re.compile(r'^dln\[\S+\]\/dln\[k\d+\]:\s\S+$')
+THERMO_SENS_PATTERN = re.compile(r'^dln\[\S+\]\/dG\[\S+\]$')
+
 
 def plot_sensitivity(output_directory, reaction_system_index, sensitive_species_list, number=10, fileformat='.png'):
     """
@@ -95,59 +102,103 @@ def parse_csv_data(csv_file):
     Where Time is returned as a GenericData object, and DataList is list of GenericData objects
     """
     import csv
-    import re
-
-    # Pattern for matching indices or units
-    index_pattern = re.compile(r'^\S+\(\d+\)$')
-    units_pattern = re.compile(r'\s\(.+\)$')
-    rxn_sens_pattern = re.compile(r'^dln\[\S+\]\/dln\[k\d+\]:\s\S+$')
-    thermo_sens_pattern = re.compile(r'^dln\[\S+\]\/dG\[\S+\]$')
 
-    time_data = []
-    data = {}
     f = csv.reader(open(csv_file, 'r'))
 
     columns = list(zip(*f))
-    time = GenericData(label=columns[0][0],
-                       data=np.array(columns[0][1:], dtype=np.float64),
-                       )
+    time = _parse_time_column(columns[0][0], np.array(columns[0][1:], dtype=np.float64))
+
+    data_list = []
+    for col in columns[1:]:
+        data_list.append(_parse_data_column(col[0], np.array(col[1:], dtype=np.float64)))
+
+    return time, data_list
+
+
+def parse_hdf5_data(h5_file, labels=None, num_species=None):
+    """
+    This function parses a simulation profile written in HDF5 format by the
+    :class:`SimulationProfileWriter`, and returns the data in the same form as
+    :func:`parse_csv_data`.
+
+    The file is read lazily: if `labels` is given, only the columns with those
+    headers are read, and if `num_species` is given, only the columns of the
+    `num_species` species with the largest maximum values are read. The
+    maxima are found by reading the profile one chunk of rows at a time.
+    """
+    import h5py
+
+    with h5py.File(h5_file, 'r') as f:
+        headers = [h.decode('utf-8') if isinstance(h, bytes) else h for h in f['columns'][:]]
+        dataset = f['snapshots']
+
+        if labels is not None:
+            indices = [i for i, header in enumerate(headers) if i > 0 and header in labels]
+        elif num_species is not None:
+            species_indices = [i for i, header in enumerate(headers) if i > 0 and INDEX_PATTERN.search(header)]
+            maxima = np.full(len(headers), -np.inf)
+            block_size = dataset.chunks[0] if dataset.chunks else 1024
+            for start in range(0, dataset.shape[0], block_size):
+                maxima = np.maximum(maxima, np.max(dataset[start:start + block_size, :], axis=0))
+            species_indices.sort(key=lambda i: maxima[i], reverse=True)
+            indices = sorted(species_indices[:num_species])
+        else:
+            indices = list(range(1, len(headers)))
+
+        time = _parse_time_column(headers[0], dataset[:, 0])
+        data_list = []
+        for i in indices:
+            data_list.append(_parse_data_column(headers[i], dataset[:, i]))
+
+    return time, data_list
+
+
+def _parse_time_column(header, values):
+    """
+    Return a GenericData object for the time column with the given `header`
+    and `values`, parsing the units from the header.
+    """
+    time = GenericData(label=header, data=values)
 
     # Parse the units from the Time header
-    if units_pattern.search(time.label):
+    if UNITS_PATTERN.search(time.label):
         label, sep, units = time.label[:-1].rpartition('(')
         time.label = label
         time.units = units
 
-    data_list = []
-    for col in columns[1:]:
-        header = col[0]
-        values = np.array(col[1:], dtype=np.float64)
-        data = GenericData(label=header, data=values)
-
-        # Parse the index or the label from the header
-        if index_pattern.search(data.label):
-            species, sep, index = data.label[:-1].rpartition('(')
-            # Save the species attribute if an index was found
-            data.species = species
-            data.index = int(index)
-        elif units_pattern.search(data.label):
-            label, sep, units = data.label[:-1].rpartition('(')
-            data.label = label
-            data.units = units
-        elif rxn_sens_pattern.search(data.label):
-            rxn = data.label.split()[1]
-            index = data.label.split()[0][:-2].rpartition('dln[k')[2]
-            data.reaction = rxn
-            data.index = int(index)
-        elif thermo_sens_pattern.search(data.label):
-            species = data.label[:-1].rpartition('dG[')[2]
-            data.species = species
-            if index_pattern.search(species):
-                data.index = int(species[:-1].rpartition('(')[2])
-
-        data_list.append(data)
+    return time
 
-    return time, data_list
+
+def _parse_data_column(header, values):
+    """
+    Return a GenericData object for the data column with the given `header`
+    and `values`, parsing the species, index, reaction or units from the
+    header.
+    """
+    data = GenericData(label=header, data=values)
+
+    # Parse the index or the label from the header
+    if INDEX_PATTERN.search(data.label):
+        species, sep, index = data.label[:-1].rpartition('(')
+        # Save the species attribute if an index was found
+        data.species = species
+        data.index = int(index)
+    elif UNITS_PATTERN.search(data.label):
+        label, sep, units = data.label[:-1].rpartition('(')
+        data.label = label
+        data.units = units
+    elif RXN_SENS_PATTERN.search(data.label):
+        rxn = data.label.split()[1]
+        index = data.label.split()[0][:-2].rpartition('dln[k')[2]
+        data.reaction = rxn
+        data.index = int(index)
+    elif THERMO_SENS_PATTERN.search(data.label):
+        species = data.label[:-1].rpartition('dG[')[2]
+        data.species = species
+        if INDEX_PATTERN.search(species):
+            data.index = int(species[:-1].rpartition('(')[2])
+
+    return data
 
 
 def find_nearest(array, value):
@@ -362,7 +413,8 @@ class SimulationPlot(GenericPlot):
     """
     A class for plotting simulations containing mole fraction vs time data. 
     Can plot the top species in generic simulation csv generated by RMG-Py
-    i.e. simulation_1_19.csv, found in the solver folder of an RMG job
+    i.e. simulation_1_19.csv, found in the solver folder of an RMG job,
+    or in the equivalent HDF5 file simulation_1_19.h5
     
     Use num_species as a flag to dictate how many species to plot.  
     This function will plot the top species, based on maximum mole fraction at
@@ -383,7 +435,14 @@ class SimulationPlot(GenericPlot):
 
     def load(self):
         if self.x_var is None and self.y_var is None:
-            time, data_list = parse_csv_data(self.csv_file)
+            if os.path.splitext(self.csv_file)[1] == '.h5':
+                # Only read the columns that will be plotted
+                if self.species:
+                    time, data_list = parse_hdf5_data(self.csv_file, labels=list(self.species.values()))
+                else:
+                    time, data_list = parse_hdf5_data(self.csv_file, num_species=self.num_species)
+            else:
+                time, data_list = parse_csv_data(self.csv_file)
         else:
             time = self.x_var
             data_list = self.y_var
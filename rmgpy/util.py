@@ -168,6 +168,8 @@ def parse_command_line_arguments(command_line_args=None):
     # Add restart option
     parser.add_argument('-r', '--restart', type=str, nargs=1, metavar='path/to/seed/', help='restart RMG from a seed',
                         default='')
+    parser.add_argument('-c', '--checkpoint', type=str, nargs=1, metavar='path/to/checkpoint.pkl',
+                        help='resume RMG from a checkpoint', default='')
 
     parser.add_argument('-p', '--profile', action='store_true',
                         help='run under cProfile to gather profiling statistics, and postprocess them if job completes')
@@ -201,6 +203,9 @@ def parse_command_line_arguments(command_line_args=None):
     if args.restart:
         args.restart = args.restart[0]
 
+    if args.checkpoint:
+        args.checkpoint = args.checkpoint[0]
+
     if args.maxproc != 1:
         args.maxproc = args.maxproc[0]
 
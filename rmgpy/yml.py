@@ -204,13 +204,26 @@ class RMSWriter(object):
 
     rmg.detach(listener)
 
+    If `incremental` is ``True``, updates are skipped and the rms file is
+    only written by :meth:`finish`.
     """
-    def __init__(self, output_directory=''):
+    def __init__(self, output_directory='', incremental=False):
         super(RMSWriter, self).__init__()
         self.output_directory = output_directory
+        self.incremental = incremental
         make_output_subdirectory(output_directory, 'rms')
 
     def update(self, rmg):
+        if not self.incremental:
+            self.write(rmg)
+
+    def finish(self, rmg):
+        """
+        Write the rms file for the current state of the model.
+        """
+        self.write(rmg)
+
+    def write(self, rmg):
         solvent_data = None
         if rmg.solvent:
             solvent_data = rmg.database.solvation.get_solvent_data(rmg.solvent)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+"""
+This script measures how long RMG spends reading and writing adjacency lists
+while loading a database. By default the testing database shipped with RMG-Py
+is used; another database can be given on the command line, e.g.
+
+    $ python benchmarkAdjacencyLists.py --database /path/to/RMG-database/input
+
+The database is loaded once while recording every adjacency list that is
+parsed. The recorded adjacency lists are then parsed again with the
+single-pass parser for the common format and with the general parser, and
+written back out, and the best time of several repeats is reported for each.
+These timings are taken with the cyclic garbage collector paused, as it is
+while loading a database, so that they measure the parsing and writing alone.
+"""
+
+import argparse
+import gc
+import logging
+import os.path
+import time
+
+import rmgpy
+import rmgpy.molecule.adjlist as adjlist_module
+from rmgpy.data.rmg import RMGDatabase
+from rmgpy.molecule.adjlist import from_adjacency_list, to_adjacency_list
+
+
+def load_database(path):
+    """
+    Load the database at `path`, returning the load time in seconds and a
+    list of ``(adjlist, group, saturate_h)`` tuples for every adjacency list
+    parsed along the way, along with the time spent parsing them.
+    """
+    recorded = []
+    parse_time = [0.0]
+
+    def recording_from_adjacency_list(adjlist, group=False, saturate_h=False, check_consistency=True):
+        t0 = time.perf_counter()
+        result = from_adjacency_list(adjlist, group=group, saturate_h=saturate_h,
+                                     check_consistency=check_consistency)
+        parse_time[0] += time.perf_counter() - t0
+        recorded.append((adjlist, group, saturate_h))
+        return result
+
+    adjlist_module.from_adjacency_list = recording_from_adjacency_list
+    try:
+        t0 = time.perf_counter()
+        database = RMGDatabase()
+        database.load(path, kinetics_families='all')
+        load_time = time.perf_counter() - t0
+    finally:
+        adjlist_module.from_adjacency_list = from_adjacency_list
+    return load_time, parse_time[0], recorded
+
+
+def time_parsing(recorded, repeat, check_consistency=True):
+    """
+    Return the best time over `repeat` runs to parse all `recorded` adjacency
+    lists, and the parsed structures of the last run.
+    """
+    best = None
+    for _ in range(repeat):
+        structures = None
+        gc.collect()
+        gc.disable()
+        t0 = time.perf_counter()
+        structures = [from_adjacency_list(adjlist, group=group, saturate_h=saturate_h,
+                                          check_consistency=check_consistency)
+                      for adjlist, group, saturate_h in recorded]
+        elapsed = time.perf_counter() - t0
+        gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, structures
+
+
+def time_writing(recorded, structures, repeat):
+    """
+    Return the best time over `repeat` runs to write all parsed `structures`
+    back to adjacency lists.
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        t0 = time.perf_counter()
+        for (adjlist, group, saturate_h), (atoms, multiplicity) in zip(recorded, structures):
+            to_adjacency_list(atoms, multiplicity if group else int(multiplicity), group=group)
+        elapsed = time.perf_counter() - t0
+        gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+################################################################################
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--database', metavar='DIR', type=str,
+                        default=os.path.join(os.path.dirname(rmgpy.__file__), 'test_data', 'testing_database'),
+                        help='the database to load (default: the RMG-Py testing database)')
+    parser.add_argument('--repeat', metavar='N', type=int, default=5,
+                        help='the number of times to repeat each timing (default: 5)')
+
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    load_time, load_parse_time, recorded = load_database(args.database)
+    n_groups = sum([1 for adjlist, group, saturate_h in recorded if group])
+    print('Loaded {0} in {1:.3f} s, of which {2:.3f} s parsing {3:d} adjacency lists '
+          '({4:d} groups, {5:d} molecules)'.format(args.database, load_time, load_parse_time, len(recorded),
+                                                   n_groups, len(recorded) - n_groups))
+
+    fast_time, structures = time_parsing(recorded, args.repeat)
+    print('Parse, single-pass parser:          {0:.3f} s'.format(fast_time))
+    unchecked_time, _ = time_parsing(recorded, args.repeat, check_consistency=False)
+    print('Parse, without consistency checks:  {0:.3f} s'.format(unchecked_time))
+
+    parse_common_atom_lines = adjlist_module._parse_common_atom_lines
+    adjlist_module._parse_common_atom_lines = lambda lines, group: None
+    try:
+        general_time, _ = time_parsing(recorded, args.repeat)
+    finally:
+        adjlist_module._parse_common_atom_lines = parse_common_atom_lines
+    print('Parse, general parser:              {0:.3f} s'.format(general_time))
+
+    write_time = time_writing(recorded, structures, args.repeat)
+    print('Write:                              {0:.3f} s'.format(write_time))
@@ -87,6 +87,7 @@ main_ext_modules = [
     Extension('rmgpy.molecule.symmetry', ['rmgpy/molecule/symmetry.py'], include_dirs=['.']),
     Extension('rmgpy.molecule.vf2', ['rmgpy/molecule/vf2.pyx'], include_dirs=['.']),
     Extension('rmgpy.molecule.converter', ['rmgpy/molecule/converter.py'], include_dirs=['.']),
+    Extension('rmgpy.molecule.compact', ['rmgpy/molecule/compact.py'], include_dirs=['.']),
     Extension('rmgpy.molecule.translator', ['rmgpy/molecule/translator.py'], include_dirs=['.']),
     Extension('rmgpy.molecule.util', ['rmgpy/molecule/util.py'], include_dirs=['.']),
     Extension('rmgpy.molecule.inchi', ['rmgpy/molecule/inchi.py'], include_dirs=['.']),